@@ -25,6 +25,7 @@ subpackage's top level, so downstream code can simply import from
 
 """
 
+from typing import TYPE_CHECKING
 from typing import Final
 
 import pyarrow as pa
@@ -39,14 +40,9 @@ from nautilus_trader.adapters.binance.common.types import BinanceTicker
 from nautilus_trader.adapters.binance.config import BinanceDataClientConfig
 from nautilus_trader.adapters.binance.config import BinanceExecClientConfig
 from nautilus_trader.adapters.binance.config import BinanceInstrumentProviderConfig
-from nautilus_trader.adapters.binance.factories import BinanceLiveDataClientFactory
-from nautilus_trader.adapters.binance.factories import BinanceLiveExecClientFactory
-from nautilus_trader.adapters.binance.factories import get_cached_binance_http_client
-from nautilus_trader.adapters.binance.futures.providers import BinanceFuturesInstrumentProvider
 from nautilus_trader.adapters.binance.futures.types import BinanceFuturesMarkPriceUpdate
-from nautilus_trader.adapters.binance.loaders import BinanceOrderBookDeltaDataLoader
-from nautilus_trader.adapters.binance.spot.providers import BinanceSpotInstrumentProvider
 from nautilus_trader.core import nautilus_pyo3
+from nautilus_trader.core.lazy import lazy_getattr
 from nautilus_trader.serialization import register_serializable_type
 from nautilus_trader.serialization.arrow.schema import NAUTILUS_ARROW_SCHEMA
 from nautilus_trader.serialization.arrow.serializer import make_dict_deserializer
@@ -55,6 +51,29 @@ from nautilus_trader.serialization.arrow.serializer import register_arrow
 from nautilus_trader.serialization.arrow.serializer import register_rust_custom_serializer
 
 
+if TYPE_CHECKING:
+    from nautilus_trader.adapters.binance.factories import BinanceLiveDataClientFactory
+    from nautilus_trader.adapters.binance.factories import BinanceLiveExecClientFactory
+    from nautilus_trader.adapters.binance.factories import get_cached_binance_http_client
+    from nautilus_trader.adapters.binance.futures.providers import BinanceFuturesInstrumentProvider
+    from nautilus_trader.adapters.binance.loaders import BinanceOrderBookDeltaDataLoader
+    from nautilus_trader.adapters.binance.spot.providers import BinanceSpotInstrumentProvider
+
+
+# The clients, providers and loaders import the HTTP and websocket stacks, which are only
+# needed once a node is built with this adapter
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "BinanceFuturesInstrumentProvider": "nautilus_trader.adapters.binance.futures.providers",
+        "BinanceLiveDataClientFactory": "nautilus_trader.adapters.binance.factories",
+        "BinanceLiveExecClientFactory": "nautilus_trader.adapters.binance.factories",
+        "BinanceOrderBookDeltaDataLoader": "nautilus_trader.adapters.binance.loaders",
+        "BinanceSpotInstrumentProvider": "nautilus_trader.adapters.binance.spot.providers",
+        "get_cached_binance_http_client": "nautilus_trader.adapters.binance.factories",
+    },
+)
+
 register_serializable_type(
     BinanceBar,
     BinanceBar.to_dict,
@@ -27,8 +27,6 @@ from nautilus_trader.adapters.binance.common.types import BinanceBar
 from nautilus_trader.adapters.binance.common.types import BinanceTicker
 from nautilus_trader.core.datetime import millis_to_nanos
 from nautilus_trader.model.data import BarType
-from nautilus_trader.model.data import BookOrder
-from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
@@ -139,29 +137,17 @@ class BinanceDepth(msgspec.Struct, frozen=True):
         instrument_id: InstrumentId,
         ts_init: int,
     ) -> OrderBookDeltas:
-        bids = [
-            BookOrder(OrderSide.BUY, Price.from_str(o[0]), Quantity.from_str(o[1]), 0)
-            for o in self.bids or []
-        ]
-        asks = [
-            BookOrder(OrderSide.SELL, Price.from_str(o[0]), Quantity.from_str(o[1]), 0)
-            for o in self.asks or []
-        ]
-
-        deltas = [OrderBookDelta.clear(instrument_id, self.lastUpdateId, ts_init, ts_init)]
-        deltas += [
-            OrderBookDelta(
-                instrument_id,
-                BookAction.ADD,
-                o,
-                flags=0,
-                sequence=self.lastUpdateId or 0,
-                ts_event=ts_init,  # No event timestamp
-                ts_init=ts_init,
-            )
-            for o in bids + asks
-        ]
-        return OrderBookDeltas(instrument_id=instrument_id, deltas=deltas)
+        return OrderBookDeltas.from_arrays(
+            instrument_id=instrument_id,
+            prices=[o[0] for o in self.bids] + [o[0] for o in self.asks],
+            sizes=[o[1] for o in self.bids] + [o[1] for o in self.asks],
+            sides=[OrderSide.BUY] * len(self.bids) + [OrderSide.SELL] * len(self.asks),
+            sequence=self.lastUpdateId or 0,
+            ts_event=ts_init,  # No event timestamp
+            ts_init=ts_init,
+            action=BookAction.ADD,
+            snapshot=True,
+        )
 
 
 class BinanceTrade(msgspec.Struct, frozen=True):
@@ -359,33 +345,6 @@ class BinanceOrderBookDelta(msgspec.Struct, array_like=True):
     price: str
     size: str
 
-    def parse_to_order_book_delta(
-        self,
-        instrument_id: InstrumentId,
-        side: OrderSide,
-        flags: int,
-        sequence: int,
-        ts_event: int,
-        ts_init: int,
-    ) -> OrderBookDelta:
-        size = Quantity.from_str(self.size)
-        order = BookOrder(
-            side=side,
-            price=Price.from_str(self.price),
-            size=Quantity.from_str(self.size),
-            order_id=0,
-        )
-
-        return OrderBookDelta(
-            instrument_id=instrument_id,
-            action=BookAction.UPDATE if size > 0 else BookAction.DELETE,
-            order=order,
-            flags=flags,
-            sequence=sequence,
-            ts_event=ts_event,
-            ts_init=ts_init,
-        )
-
 
 class BinanceOrderBookData(msgspec.Struct, frozen=True):
     """
@@ -415,51 +374,17 @@ class BinanceOrderBookData(msgspec.Struct, frozen=True):
     ) -> OrderBookDeltas:
         ts_event: int = millis_to_nanos(self.T) if self.T is not None else millis_to_nanos(self.E)
 
-        deltas: list[OrderBookDelta] = []
-
-        if snapshot:
-            deltas.append(OrderBookDelta.clear(instrument_id, 0, ts_event, ts_init))
-
-        bids_len = len(self.b)
-        asks_len = len(self.a)
-
-        for idx, bid in enumerate(self.b):
-            flags = 0
-
-            if idx == bids_len - 1 and asks_len == 0:
-                # F_LAST, 1 << 7
-                # Last message in the book event or packet from the venue for a given `instrument_id`
-                flags = RecordFlag.F_LAST
-
-            delta = bid.parse_to_order_book_delta(
-                instrument_id=instrument_id,
-                side=OrderSide.BUY,
-                flags=(RecordFlag.F_SNAPSHOT | flags) if snapshot else flags,
-                sequence=self.u,
-                ts_event=ts_event,
-                ts_init=ts_init,
-            )
-            deltas.append(delta)
-
-        for idx, ask in enumerate(self.a):
-            flags = 0
-
-            if idx == asks_len - 1:
-                # F_LAST, 1 << 7
-                # Last message in the book event or packet from the venue for a given `instrument_id`
-                flags = RecordFlag.F_LAST
-
-            delta = ask.parse_to_order_book_delta(
-                instrument_id=instrument_id,
-                side=OrderSide.SELL,
-                flags=(RecordFlag.F_SNAPSHOT | flags) if snapshot else flags,
-                sequence=self.u,
-                ts_event=ts_event,
-                ts_init=ts_init,
-            )
-            deltas.append(delta)
-
-        return OrderBookDeltas(instrument_id=instrument_id, deltas=deltas)
+        return OrderBookDeltas.from_arrays(
+            instrument_id=instrument_id,
+            prices=[level.price for level in self.b] + [level.price for level in self.a],
+            sizes=[level.size for level in self.b] + [level.size for level in self.a],
+            sides=[OrderSide.BUY] * len(self.b) + [OrderSide.SELL] * len(self.a),
+            sequence=self.u,
+            ts_event=ts_event,
+            ts_init=ts_init,
+            flags=RecordFlag.F_SNAPSHOT if snapshot else 0,
+            snapshot=snapshot,
+        )
 
 
 class BinanceOrderBookMsg(msgspec.Struct, frozen=True):
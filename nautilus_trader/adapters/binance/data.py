@@ -15,6 +15,7 @@
 
 import asyncio
 import decimal
+from collections.abc import Callable
 from decimal import Decimal
 
 import msgspec
@@ -94,6 +95,67 @@ from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.model.objects import Quantity
 
 
+_STREAM_PREFIX = b'{"stream":"'
+_STREAM_PREFIX_LEN = len(_STREAM_PREFIX)
+
+
+def parse_stream_type(stream: str) -> str:
+    """
+    Parse the stream type from the given Binance WebSocket stream name.
+
+    The stream type is the name without the symbol, interval, or update speed,
+    for example 'btcusdt@depth@100ms' -> 'depth', 'btcusdt@depth20@100ms' -> 'depth20',
+    and 'ethusdt@kline_1m' -> 'kline'. All market streams keep their leading name,
+    for example '!markPrice@arr@1s' -> '!markPrice@arr'.
+
+    Parameters
+    ----------
+    stream : str
+        The stream name to parse.
+
+    Returns
+    -------
+    str
+
+    """
+    name, _, rest = stream.partition("@")
+    stream_type = rest.partition("@")[0]
+
+    if name.startswith("!"):
+        return f"{name}@{stream_type}" if stream_type else name
+
+    return stream_type.partition("_")[0]
+
+
+def extract_stream_name(raw: bytes) -> str | None:
+    """
+    Extract the stream name from the given raw combined stream message without decoding
+    the entire message.
+
+    Binance combined stream messages are serialized with the stream name as the first
+    field, so this is a prefix scan. Returns ``None`` for any message not in this
+    form (such as control message responses), which should then be decoded.
+
+    Parameters
+    ----------
+    raw : bytes
+        The raw WebSocket message.
+
+    Returns
+    -------
+    str or ``None``
+
+    """
+    if not raw.startswith(_STREAM_PREFIX):
+        return None
+
+    end = raw.find(b'"', _STREAM_PREFIX_LEN)
+    if end == -1:
+        return None
+
+    return raw[_STREAM_PREFIX_LEN:end].decode()
+
+
 class BinanceCommonDataClient(LiveMarketDataClient):
     """
     Provides a data client of common methods for the Binance exchange.
@@ -212,19 +274,22 @@ class BinanceCommonDataClient(LiveMarketDataClient):
         self._log.info(f"Base url HTTP {self._http_client.base_url}", LogColor.BLUE)
         self._log.info(f"Base url WebSocket {base_url_ws}", LogColor.BLUE)
 
-        # Register common WebSocket message handlers
+        # Register common WebSocket message handlers (keyed by stream type)
         self._ws_handlers = {
-            "@bookTicker": self._handle_book_ticker,
-            "@ticker": self._handle_ticker,
-            "@kline": self._handle_kline,
-            "@trade": self._handle_trade,
-            "@aggTrade": self._handle_agg_trade,
-            "@depth@": self._handle_book_diff_update,
-            "@depth5": self._handle_book_partial_update,
-            "@depth10": self._handle_book_partial_update,
-            "@depth20": self._handle_book_partial_update,
+            "bookTicker": self._handle_book_ticker,
+            "ticker": self._handle_ticker,
+            "kline": self._handle_kline,
+            "trade": self._handle_trade,
+            "aggTrade": self._handle_agg_trade,
+            "depth": self._handle_book_diff_update,
+            "depth5": self._handle_book_partial_update,
+            "depth10": self._handle_book_partial_update,
+            "depth20": self._handle_book_partial_update,
         }
 
+        # Resolved handlers keyed by full stream name
+        self._ws_routes: dict[str, Callable[[bytes], None]] = {}
+
         # WebSocket msgspec decoders
         self._decoder_data_msg_wrapper = msgspec.json.Decoder(BinanceDataMsgWrapper)
         self._decoder_order_book_msg = msgspec.json.Decoder(BinanceOrderBookMsg)
@@ -962,20 +1027,22 @@ class BinanceCommonDataClient(LiveMarketDataClient):
 
     def _handle_ws_message(self, raw: bytes) -> None:
         try:
-            wrapper = self._decoder_data_msg_wrapper.decode(raw)
-            if not wrapper.stream:
-                return  # Control message response
-
-            handled = False
+            stream = extract_stream_name(raw)
+            if stream is None:
+                stream = self._decoder_data_msg_wrapper.decode(raw).stream
+                if not stream:
+                    return  # Control message response
+
+            handler = self._ws_routes.get(stream)
+            if handler is None:
+                handler = self._ws_handlers.get(parse_stream_type(stream))
+                if handler is None:
+                    self._log.error(f"Unrecognized websocket message type: {stream}")
+                    return
+                self._ws_routes[stream] = handler
 
-            for handler in self._ws_handlers:
-                if handler in wrapper.stream:
-                    self._ws_handlers[handler](raw)
-                    handled = True
-            if not handled:
-                self._log.error(
-                    f"Unrecognized websocket message type: {wrapper.stream}",
-                )
+            # The handler performs the only full decode of the message
+            handler(raw)
         except Exception as e:
             self._log.exception(f"Error handling websocket message {raw!r}", e)
 
@@ -112,7 +112,7 @@ class BinanceFuturesDataClient(BinanceCommonDataClient):
         )
 
         # Register additional futures websocket handlers
-        self._ws_handlers["@markPrice"] = self._handle_mark_price
+        self._ws_handlers["markPrice"] = self._handle_mark_price
         self._ws_handlers["!markPrice@arr"] = self._handle_mark_price_all
 
         # Websocket msgspec decoders
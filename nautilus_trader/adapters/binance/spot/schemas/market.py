@@ -21,13 +21,11 @@ from nautilus_trader.adapters.binance.common.schemas.market import BinanceOrderB
 from nautilus_trader.adapters.binance.common.schemas.market import BinanceRateLimit
 from nautilus_trader.adapters.binance.common.schemas.market import BinanceSymbolFilter
 from nautilus_trader.core.datetime import millis_to_nanos
-from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.enums import CurrencyType
 from nautilus_trader.model.enums import OrderSide
-from nautilus_trader.model.enums import RecordFlag
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import TradeId
 from nautilus_trader.model.objects import Currency
@@ -122,48 +120,16 @@ class BinanceSpotOrderBookPartialDepthData(msgspec.Struct):
         instrument_id: InstrumentId,
         ts_init: int,
     ) -> OrderBookDeltas:
-        deltas: list[OrderBookDelta] = [OrderBookDelta.clear(instrument_id, 0, ts_init, ts_init)]
-
-        bids_len = len(self.bids)
-        asks_len = len(self.asks)
-
-        for idx, bid in enumerate(self.bids):
-            flags = 0
-
-            if idx == bids_len - 1 and asks_len == 0:
-                # F_LAST, 1 << 7
-                # Last message in the book event or packet from the venue for a given `instrument_id`
-                flags = RecordFlag.F_LAST
-
-            delta = bid.parse_to_order_book_delta(
-                instrument_id=instrument_id,
-                side=OrderSide.BUY,
-                flags=flags,
-                sequence=self.lastUpdateId,
-                ts_event=ts_init,  # No event timestamp
-                ts_init=ts_init,
-            )
-            deltas.append(delta)
-
-        for idx, ask in enumerate(self.asks):
-            flags = 0
-
-            if idx == asks_len - 1:
-                # F_LAST, 1 << 7
-                # Last message in the book event or packet from the venue for a given `instrument_id`
-                flags = RecordFlag.F_LAST
-
-            delta = ask.parse_to_order_book_delta(
-                instrument_id=instrument_id,
-                side=OrderSide.SELL,
-                flags=flags,
-                sequence=self.lastUpdateId,
-                ts_event=ts_init,  # No event timestamp
-                ts_init=ts_init,
-            )
-            deltas.append(delta)
-
-        return OrderBookDeltas(instrument_id=instrument_id, deltas=deltas)
+        return OrderBookDeltas.from_arrays(
+            instrument_id=instrument_id,
+            prices=[level.price for level in self.bids] + [level.price for level in self.asks],
+            sizes=[level.size for level in self.bids] + [level.size for level in self.asks],
+            sides=[OrderSide.BUY] * len(self.bids) + [OrderSide.SELL] * len(self.asks),
+            sequence=self.lastUpdateId,
+            ts_event=ts_init,  # No event timestamp
+            ts_init=ts_init,
+            snapshot=True,
+        )
 
 
 class BinanceSpotOrderBookPartialDepthMsg(msgspec.Struct):
@@ -17,8 +17,11 @@ The `analysis` subpackage groups components relating to trading performance stat
 and analysis.
 """
 
+from typing import TYPE_CHECKING
+
 from nautilus_trader.analysis.analyzer import PortfolioAnalyzer
 from nautilus_trader.analysis.config import GridLayout
+from nautilus_trader.analysis.config import StreamingStatisticsConfig
 from nautilus_trader.analysis.config import TearsheetBarsWithFillsChart
 from nautilus_trader.analysis.config import TearsheetChart
 from nautilus_trader.analysis.config import TearsheetConfig
@@ -33,20 +36,10 @@ from nautilus_trader.analysis.config import TearsheetStatsTableChart
 from nautilus_trader.analysis.config import TearsheetYearlyReturnsChart
 from nautilus_trader.analysis.reporter import ReportProvider
 from nautilus_trader.analysis.statistic import PortfolioStatistic
-from nautilus_trader.analysis.tearsheet import create_drawdown_chart
-from nautilus_trader.analysis.tearsheet import create_equity_curve
-from nautilus_trader.analysis.tearsheet import create_monthly_returns_heatmap
-from nautilus_trader.analysis.tearsheet import create_returns_distribution
-from nautilus_trader.analysis.tearsheet import create_rolling_sharpe
-from nautilus_trader.analysis.tearsheet import create_tearsheet
-from nautilus_trader.analysis.tearsheet import create_tearsheet_from_stats
-from nautilus_trader.analysis.tearsheet import create_yearly_returns
-from nautilus_trader.analysis.tearsheet import get_chart
-from nautilus_trader.analysis.tearsheet import list_charts
-from nautilus_trader.analysis.tearsheet import register_chart
 from nautilus_trader.analysis.themes import get_theme
 from nautilus_trader.analysis.themes import list_themes
 from nautilus_trader.analysis.themes import register_theme
+from nautilus_trader.core.lazy import lazy_getattr
 from nautilus_trader.core.nautilus_pyo3 import CAGR
 from nautilus_trader.core.nautilus_pyo3 import Alpha
 from nautilus_trader.core.nautilus_pyo3 import AvgLoser
@@ -74,6 +67,39 @@ from nautilus_trader.core.nautilus_pyo3 import TreynorRatio
 from nautilus_trader.core.nautilus_pyo3 import WinRate
 
 
+if TYPE_CHECKING:
+    from nautilus_trader.analysis.tearsheet import create_drawdown_chart
+    from nautilus_trader.analysis.tearsheet import create_equity_curve
+    from nautilus_trader.analysis.tearsheet import create_monthly_returns_heatmap
+    from nautilus_trader.analysis.tearsheet import create_returns_distribution
+    from nautilus_trader.analysis.tearsheet import create_rolling_sharpe
+    from nautilus_trader.analysis.tearsheet import create_tearsheet
+    from nautilus_trader.analysis.tearsheet import create_tearsheet_from_stats
+    from nautilus_trader.analysis.tearsheet import create_yearly_returns
+    from nautilus_trader.analysis.tearsheet import get_chart
+    from nautilus_trader.analysis.tearsheet import list_charts
+    from nautilus_trader.analysis.tearsheet import register_chart
+
+
+# Tearsheets import plotly (if installed), which is slow to load and not needed to run
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "create_drawdown_chart": "nautilus_trader.analysis.tearsheet",
+        "create_equity_curve": "nautilus_trader.analysis.tearsheet",
+        "create_monthly_returns_heatmap": "nautilus_trader.analysis.tearsheet",
+        "create_returns_distribution": "nautilus_trader.analysis.tearsheet",
+        "create_rolling_sharpe": "nautilus_trader.analysis.tearsheet",
+        "create_tearsheet": "nautilus_trader.analysis.tearsheet",
+        "create_tearsheet_from_stats": "nautilus_trader.analysis.tearsheet",
+        "create_yearly_returns": "nautilus_trader.analysis.tearsheet",
+        "get_chart": "nautilus_trader.analysis.tearsheet",
+        "list_charts": "nautilus_trader.analysis.tearsheet",
+        "register_chart": "nautilus_trader.analysis.tearsheet",
+    },
+)
+
+
 __all__ = [
     "CAGR",
     "Alpha",
@@ -101,6 +127,7 @@ __all__ = [
     "RiskReturnRatio",
     "SharpeRatio",
     "SortinoRatio",
+    "StreamingStatisticsConfig",
     "TearsheetBarsWithFillsChart",
     "TearsheetChart",
     "TearsheetConfig",
@@ -22,7 +22,9 @@ from typing import Any
 
 import msgspec
 
+from nautilus_trader.common.config import ActorConfig
 from nautilus_trader.common.config import NautilusConfig
+from nautilus_trader.common.config import PositiveFloat
 from nautilus_trader.common.config import PositiveInt
 
 
@@ -37,9 +39,17 @@ class TearsheetChart(msgspec.Struct, frozen=True, kw_only=True):
     Concrete chart classes define which chart to render (via `name`) and can expose
     additional arguments (via `kwargs`) that are passed into the chart renderer.
 
+    Parameters
+    ----------
+    title : str, optional
+        The chart title override.
+    max_points : PositiveInt, optional
+        The point budget for this chart, overriding `TearsheetConfig.max_points`.
+
     """
 
     title: str | None = None
+    max_points: PositiveInt | None = None
 
     @property
     def name(self) -> str:  # pragma: no cover (implemented by subclasses)
@@ -206,6 +216,12 @@ class TearsheetConfig(NautilusConfig, frozen=True, kw_only=True):
         Total height of the tearsheet in pixels.
     show_logo : bool, default True
         Whether to display NautilusTrader logo in the tearsheet.
+    max_points : PositiveInt, optional, default 10_000
+        The default point budget per chart. Longer equity, drawdown and rolling Sharpe
+        series are downsampled with largest-triangle-three-buckets, and longer bar series
+        are re-bucketed into wider OHLC bars. Fill markers are never downsampled.
+        Individual charts can override this via `TearsheetChart.max_points`.
+        If None, every point is rendered.
 
     """
 
@@ -217,7 +233,48 @@ class TearsheetConfig(NautilusConfig, frozen=True, kw_only=True):
     benchmark_name: str = "Benchmark"
     height: PositiveInt = 1500
     show_logo: bool = True
+    max_points: PositiveInt | None = 10_000
 
     @property
     def chart_names(self) -> list[str]:
         return [c.name for c in self.charts]
+
+
+class StreamingStatisticsConfig(ActorConfig, frozen=True):
+    """
+    Configuration for ``StreamingStatisticsActor`` instances.
+
+    Each early termination rule is optional, when a rule is breached the actor
+    requests a system shutdown which stops the run.
+
+    Parameters
+    ----------
+    account_id : str, optional
+        The account ID to track. If None, the first account with a state event is tracked.
+    currency : str, optional
+        The balance currency to track. If None, the first balance currency is tracked.
+    period : PositiveInt, default 252
+        The number of daily returns per year used to annualize the ratios.
+    max_drawdown : PositiveFloat, optional
+        The maximum drawdown from peak balance as a fraction (e.g. 0.2 for 20%).
+    min_sharpe_ratio : float, optional
+        The minimum annualized Sharpe ratio, evaluated once `min_returns` daily returns
+        have completed.
+    min_returns : PositiveInt, default 30
+        The minimum daily returns before `min_sharpe_ratio` is evaluated.
+    min_win_rate : float, optional
+        The minimum win rate of closed positions, evaluated once `min_trades` positions
+        have closed.
+    min_trades : PositiveInt, default 20
+        The minimum closed positions before `min_win_rate` is evaluated.
+
+    """
+
+    account_id: str | None = None
+    currency: str | None = None
+    period: PositiveInt = 252
+    max_drawdown: PositiveFloat | None = None
+    min_sharpe_ratio: float | None = None
+    min_returns: PositiveInt = 30
+    min_win_rate: float | None = None
+    min_trades: PositiveInt = 20
@@ -13,16 +13,121 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from nautilus_trader.accounting.accounts.base import Account
-from nautilus_trader.core.datetime import unix_nanos_to_dt
+from nautilus_trader.model.enums import liquidity_side_to_str
+from nautilus_trader.model.enums import order_side_to_str
+from nautilus_trader.model.enums import order_type_to_str
+from nautilus_trader.model.enums import position_side_to_str
+from nautilus_trader.model.enums import time_in_force_to_str
 from nautilus_trader.model.events import AccountState
 from nautilus_trader.model.events import OrderFilled
 from nautilus_trader.model.orders import Order
 from nautilus_trader.model.position import Position
 
 
+# Fill report columns which hold few distinct values, dictionary encoded in Arrow tables
+_FILL_CATEGORICAL_COLUMNS = (
+    "trader_id",
+    "strategy_id",
+    "instrument_id",
+    "account_id",
+    "order_side",
+    "order_type",
+    "currency",
+    "commission_currency",
+    "liquidity_side",
+)
+
+# Order report columns which hold few distinct values, dictionary encoded in Arrow tables
+_ORDER_CATEGORICAL_COLUMNS = (
+    "trader_id",
+    "strategy_id",
+    "instrument_id",
+    "account_id",
+    "type",
+    "side",
+    "time_in_force",
+    "status",
+)
+
+# Position report columns which hold few distinct values, dictionary encoded in Arrow tables
+_POSITION_CATEGORICAL_COLUMNS = (
+    "trader_id",
+    "strategy_id",
+    "instrument_id",
+    "account_id",
+    "entry",
+    "side",
+    "settlement_currency",
+)
+
+_TIMESTAMP = pa.timestamp("ns", tz="UTC")
+
+
+def _nanos_to_datetimes(nanos) -> pd.DatetimeIndex:
+    # Converts UNIX nanosecond timestamps to UTC datetimes in a single vectorized cast
+    return pd.to_datetime(np.asarray(nanos, dtype=np.int64), unit="ns", utc=True)
+
+
+def _collect_fills(orders: list[Order]) -> list[OrderFilled]:
+    return [e for o in orders for e in o.events if isinstance(e, OrderFilled)]
+
+
+def _fill_columns(fills: list[OrderFilled]) -> dict[str, list]:
+    # Extracts each field directly into a column, avoiding a dict per fill event
+    return {
+        "trader_id": [f.trader_id.value for f in fills],
+        "strategy_id": [f.strategy_id.value for f in fills],
+        "instrument_id": [f.instrument_id.value for f in fills],
+        "client_order_id": [f.client_order_id.value for f in fills],
+        "venue_order_id": [f.venue_order_id.value for f in fills],
+        "account_id": [f.account_id.value for f in fills],
+        "trade_id": [f.trade_id.value for f in fills],
+        "position_id": [f.position_id.value if f.position_id else None for f in fills],
+        "order_side": [order_side_to_str(f.order_side) for f in fills],
+        "order_type": [order_type_to_str(f.order_type) for f in fills],
+        "last_qty": [f.last_qty for f in fills],
+        "last_px": [f.last_px for f in fills],
+        "currency": [f.currency.code for f in fills],
+        "commission": [f.commission for f in fills],
+        "liquidity_side": [liquidity_side_to_str(f.liquidity_side) for f in fills],
+        "event_id": [f.id.value for f in fills],
+        "ts_event": [f.ts_event for f in fills],
+        "ts_init": [f.ts_init for f in fills],
+        "info": [f.info for f in fills],
+        "reconciliation": [f.reconciliation for f in fills],
+    }
+
+
+def _to_arrow_table(
+    columns: dict[str, list],
+    types: dict[str, pa.DataType],
+    sort_keys: list[tuple[str, str]],
+    categorical: tuple[str, ...],
+) -> pa.Table:
+    # Columns absent from `types` are strings, and timestamp and duration columns are
+    # cast from UNIX nanoseconds. Sorting happens before dictionary encoding.
+    arrays = {}
+    for name, values in columns.items():
+        data_type = types.get(name, pa.string())
+        if pa.types.is_timestamp(data_type) or pa.types.is_duration(data_type):
+            arrays[name] = pa.array(values, pa.int64()).cast(data_type)
+        else:
+            arrays[name] = pa.array(values, data_type)
+
+    table = pa.table(arrays).sort_by(sort_keys)
+
+    for name in categorical:
+        index = table.schema.get_field_index(name)
+        table = table.set_column(index, name, table.column(name).dictionary_encode())
+
+    return table
+
+
 class ReportProvider:
     """
     Provides various portfolio analysis reports.
@@ -50,6 +155,77 @@ class ReportProvider:
 
         return pd.DataFrame(data=orders_all).set_index("client_order_id").sort_index()
 
+    @staticmethod
+    def generate_orders_table(orders: list[Order]) -> pa.Table:
+        """
+        Generate an orders report as an Arrow table.
+
+        This report provides a row per order. Unlike `generate_orders_report`, whose columns
+        depend on the order types present, the table has a fixed set of typed columns which
+        are extracted directly from the orders. Quantities and prices are typed as float64
+        (with `price`, `trigger_price`, `avg_px` and `slippage` null where they don't apply),
+        timestamps as UTC nanosecond timestamps, and low cardinality string columns are
+        dictionary encoded.
+
+        Parameters
+        ----------
+        orders : list[Order]
+            The orders for the report.
+
+        Returns
+        -------
+        pa.Table
+            The orders sorted by client order ID, or an empty table if there are no orders.
+
+        """
+        if not orders:
+            return pa.table({})
+
+        filled = [o.filled_qty.as_double() > 0.0 for o in orders]
+        columns = {
+            "trader_id": [o.trader_id.value for o in orders],
+            "strategy_id": [o.strategy_id.value for o in orders],
+            "instrument_id": [o.instrument_id.value for o in orders],
+            "client_order_id": [o.client_order_id.value for o in orders],
+            "venue_order_id": [
+                o.venue_order_id.value if o.venue_order_id else None for o in orders
+            ],
+            "position_id": [o.position_id.value if o.position_id else None for o in orders],
+            "account_id": [o.account_id.value if o.account_id else None for o in orders],
+            "type": [order_type_to_str(o.order_type) for o in orders],
+            "side": [order_side_to_str(o.side) for o in orders],
+            "quantity": [o.quantity.as_double() for o in orders],
+            "price": [o.price.as_double() if o.has_price else None for o in orders],
+            "trigger_price": [
+                o.trigger_price.as_double() if o.has_trigger_price else None for o in orders
+            ],
+            "time_in_force": [time_in_force_to_str(o.time_in_force) for o in orders],
+            "status": [o.status_string() for o in orders],
+            "filled_qty": [o.filled_qty.as_double() for o in orders],
+            "avg_px": [o.avg_px if f else None for o, f in zip(orders, filled, strict=True)],
+            "slippage": [o.slippage if f else None for o, f in zip(orders, filled, strict=True)],
+            "is_post_only": [o.is_post_only for o in orders],
+            "is_reduce_only": [o.is_reduce_only for o in orders],
+            "is_quote_quantity": [o.is_quote_quantity for o in orders],
+            "ts_init": [o.ts_init for o in orders],
+            "ts_last": [o.ts_last for o in orders],
+        }
+        types = dict.fromkeys(
+            ("quantity", "price", "trigger_price", "filled_qty", "avg_px", "slippage"),
+            pa.float64(),
+        )
+        types.update(
+            dict.fromkeys(("is_post_only", "is_reduce_only", "is_quote_quantity"), pa.bool_())
+        )
+        types.update(dict.fromkeys(("ts_init", "ts_last"), _TIMESTAMP))
+
+        return _to_arrow_table(
+            columns,
+            types,
+            sort_keys=[("client_order_id", "ascending")],
+            categorical=_ORDER_CATEGORICAL_COLUMNS,
+        )
+
     @staticmethod
     def generate_order_fills_report(orders: list[Order]) -> pd.DataFrame:
         """
@@ -75,8 +251,8 @@ class ReportProvider:
             return pd.DataFrame()
 
         report = pd.DataFrame(data=filled_orders).set_index("client_order_id").sort_index()
-        report["ts_last"] = [unix_nanos_to_dt(ts_last or 0) for ts_last in report["ts_last"]]
-        report["ts_init"] = [unix_nanos_to_dt(ts_init) for ts_init in report["ts_init"]]
+        report["ts_last"] = _nanos_to_datetimes(report["ts_last"].fillna(0))
+        report["ts_init"] = _nanos_to_datetimes(report["ts_init"])
 
         return report
 
@@ -100,19 +276,71 @@ class ReportProvider:
         if not orders:
             return pd.DataFrame()
 
-        fills = [
-            OrderFilled.to_dict(e) for o in orders for e in o.events if isinstance(e, OrderFilled)
-        ]
-
+        fills = _collect_fills(orders)
         if not fills:
             return pd.DataFrame()
 
-        report = pd.DataFrame(data=fills).set_index("client_order_id").sort_index()
-        report["ts_event"] = [unix_nanos_to_dt(ts_last or 0) for ts_last in report["ts_event"]]
-        report["ts_init"] = [unix_nanos_to_dt(ts_init) for ts_init in report["ts_init"]]
-        del report["type"]
+        columns = _fill_columns(fills)
+        columns["last_qty"] = [str(qty) for qty in columns["last_qty"]]
+        columns["last_px"] = [str(px) for px in columns["last_px"]]
+        columns["commission"] = [str(commission) for commission in columns["commission"]]
+        columns["ts_event"] = _nanos_to_datetimes(columns["ts_event"])
+        columns["ts_init"] = _nanos_to_datetimes(columns["ts_init"])
 
-        return report
+        return pd.DataFrame(data=columns).set_index("client_order_id").sort_index()
+
+    @staticmethod
+    def generate_fills_table(orders: list[Order]) -> pa.Table:
+        """
+        Generate a fills report as an Arrow table.
+
+        This report provides a row per individual fill event, with the same columns as
+        `generate_fills_report` except for `info`, and with an additional
+        `commission_currency` column. Quantities, prices and commissions are typed as
+        float64, timestamps as UTC nanosecond timestamps, and low cardinality string
+        columns are dictionary encoded, which keeps large reports compact.
+
+        The table converts without copying to other Arrow based dataframe libraries,
+        for example with `polars.from_arrow`.
+
+        Parameters
+        ----------
+        orders : list[Order]
+            The orders for the report.
+
+        Returns
+        -------
+        pa.Table
+            The fills sorted by client order ID, or an empty table if there are no fills.
+
+        """
+        fills = _collect_fills(orders)
+        if not fills:
+            return pa.table({})
+
+        columns = {}
+        for name, values in _fill_columns(fills).items():
+            if name == "info":
+                continue
+            elif name in ("last_qty", "last_px"):
+                columns[name] = [value.as_double() for value in values]
+            elif name == "commission":
+                # The commission currency can differ from the fill currency (e.g. BNB fees)
+                columns[name] = [value.as_double() for value in values]
+                columns["commission_currency"] = [value.currency.code for value in values]
+            else:
+                columns[name] = values
+
+        types = dict.fromkeys(("last_qty", "last_px", "commission"), pa.float64())
+        types.update(dict.fromkeys(("ts_event", "ts_init"), _TIMESTAMP))
+        types["reconciliation"] = pa.bool_()
+
+        return _to_arrow_table(
+            columns,
+            types,
+            sort_keys=[("client_order_id", "ascending")],
+            categorical=_FILL_CATEGORICAL_COLUMNS,
+        )
 
     @staticmethod
     def generate_positions_report(
@@ -157,17 +385,103 @@ class ReportProvider:
         del report["quote_currency"]
         del report["base_currency"]
         del report["settlement_currency"]
-        report["ts_opened"] = [unix_nanos_to_dt(ts_opened) for ts_opened in report["ts_opened"]]
-        report["ts_closed"] = [
-            unix_nanos_to_dt(ts_closed) if not pd.isna(ts_closed) else pd.NA
-            for ts_closed in report["ts_closed"]
-        ]
+        report["ts_opened"] = _nanos_to_datetimes(report["ts_opened"])
+        report["ts_closed"] = pd.to_datetime(report["ts_closed"], unit="ns", utc=True)
 
         # Add is_snapshot column
         report["is_snapshot"] = report.index.isin(snapshot_ids)
 
         return report
 
+    @staticmethod
+    def generate_positions_table(
+        positions: list[Position],
+        snapshots: list[Position] | None = None,
+    ) -> pa.Table:
+        """
+        Generate a positions report as an Arrow table.
+
+        This report provides a row per position (and position snapshot), with typed columns
+        extracted directly from the positions. Quantities, prices and the realized PnL (in
+        the `settlement_currency`) are typed as float64, timestamps as UTC nanosecond
+        timestamps, the duration as a nanosecond duration, and low cardinality string
+        columns are dictionary encoded.
+
+        Parameters
+        ----------
+        positions : list[Position]
+            The positions for the report.
+        snapshots : list[Position], optional
+            The position snapshots to include in the report.
+            These will be marked with an 'is_snapshot' column.
+
+        Returns
+        -------
+        pa.Table
+            The positions sorted by opened time, closed time and position ID, or an empty
+            table if there are no positions.
+
+        """
+        all_positions = positions + (snapshots or [])
+        if not all_positions:
+            return pa.table({})
+
+        snapshot_ids = {p.id.value for p in snapshots or []}
+        columns = {
+            "position_id": [p.id.value for p in all_positions],
+            "trader_id": [p.trader_id.value for p in all_positions],
+            "strategy_id": [p.strategy_id.value for p in all_positions],
+            "instrument_id": [p.instrument_id.value for p in all_positions],
+            "account_id": [p.account_id.value for p in all_positions],
+            "opening_order_id": [p.opening_order_id.value for p in all_positions],
+            "closing_order_id": [
+                p.closing_order_id.value if p.closing_order_id else None for p in all_positions
+            ],
+            "entry": [order_side_to_str(p.entry) for p in all_positions],
+            "side": [position_side_to_str(p.side) for p in all_positions],
+            "quantity": [p.quantity.as_double() for p in all_positions],
+            "peak_qty": [p.peak_qty.as_double() for p in all_positions],
+            "ts_init": [p.ts_init for p in all_positions],
+            "ts_opened": [p.ts_opened for p in all_positions],
+            "ts_last": [p.ts_last for p in all_positions],
+            "ts_closed": [p.ts_closed or None for p in all_positions],
+            "duration_ns": [p.duration_ns or None for p in all_positions],
+            "avg_px_open": [p.avg_px_open for p in all_positions],
+            "avg_px_close": [p.avg_px_close or None for p in all_positions],
+            "realized_return": [p.realized_return for p in all_positions],
+            "realized_pnl": [
+                p.realized_pnl.as_double() if p.realized_pnl is not None else None
+                for p in all_positions
+            ],
+            "settlement_currency": [p.settlement_currency.code for p in all_positions],
+            "is_snapshot": [p.id.value in snapshot_ids for p in all_positions],
+        }
+        types = dict.fromkeys(
+            (
+                "quantity",
+                "peak_qty",
+                "avg_px_open",
+                "avg_px_close",
+                "realized_return",
+                "realized_pnl",
+            ),
+            pa.float64(),
+        )
+        types.update(dict.fromkeys(("ts_init", "ts_opened", "ts_last", "ts_closed"), _TIMESTAMP))
+        types["duration_ns"] = pa.duration("ns")
+        types["is_snapshot"] = pa.bool_()
+
+        return _to_arrow_table(
+            columns,
+            types,
+            sort_keys=[
+                ("ts_opened", "ascending"),
+                ("ts_closed", "ascending"),
+                ("position_id", "ascending"),
+            ],
+            categorical=_POSITION_CATEGORICAL_COLUMNS,
+        )
+
     @staticmethod
     def generate_account_report(account: Account) -> pd.DataFrame:
         """
@@ -199,7 +513,7 @@ class ReportProvider:
             return pd.DataFrame()
 
         report = pd.DataFrame(data=balances).set_index("ts_event").sort_index()
-        report.index = [unix_nanos_to_dt(ts_event) for ts_event in report.index]
+        report.index = _nanos_to_datetimes(report.index)
         del report["ts_init"]
         del report["type"]
         del report["event_id"]
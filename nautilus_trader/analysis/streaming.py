@@ -0,0 +1,463 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+"""
+Online portfolio statistics which update incrementally while a run is in progress.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from nautilus_trader.analysis.config import StreamingStatisticsConfig
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.model.events import AccountState
+from nautilus_trader.model.events import PositionClosed
+from nautilus_trader.model.objects import Currency
+
+
+_NANOS_PER_DAY = 86_400_000_000_000
+
+
+class StreamingStatistics:
+    """
+    Provides portfolio statistics which are updated incrementally in O(1) time and
+    memory per update.
+
+    Account balances are binned into UTC calendar days and daily returns feed running
+    Sharpe and Sortino accumulators, matching the daily binning of the post-run
+    statistics (days without a balance update contribute a zero return). Drawdown is
+    tracked on every balance update, so it is never smaller than the post-run value.
+    Realized PnLs of closed positions feed the trade statistics.
+
+    Parameters
+    ----------
+    period : int, default 252
+        The number of periods per year used to annualize the ratios.
+
+    Raises
+    ------
+    ValueError
+        If `period` is not positive.
+
+    """
+
+    def __init__(self, period: int = 252) -> None:
+        PyCondition.positive_int(period, "period")
+
+        self._period = period
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset all accumulated state.
+        """
+        # Balances
+        self._starting_balance: float | None = None
+        self._balance: float | None = None
+        self._peak_balance = 0.0
+        self._max_drawdown = 0.0
+        self._day: int | None = None
+        self._prev_day_close: float | None = None
+
+        # Daily returns (Welford accumulators)
+        self._returns_count = 0
+        self._returns_mean = 0.0
+        self._returns_m2 = 0.0
+        self._returns_downside_sq = 0.0
+
+        # Trades
+        self._trade_count = 0
+        self._winners = 0
+        self._gross_profit = 0.0
+        self._gross_loss = 0.0
+
+    @property
+    def balance(self) -> float | None:
+        """
+        Return the latest account balance.
+
+        Returns
+        -------
+        float or ``None``
+
+        """
+        return self._balance
+
+    @property
+    def returns_count(self) -> int:
+        """
+        Return the count of completed daily returns.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._returns_count
+
+    @property
+    def trade_count(self) -> int:
+        """
+        Return the count of closed positions.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._trade_count
+
+    @property
+    def total_return(self) -> float:
+        """
+        Return the total return since the first balance update.
+
+        Returns
+        -------
+        float
+
+        """
+        if not self._starting_balance or self._balance is None:
+            return 0.0
+
+        return self._balance / self._starting_balance - 1.0
+
+    @property
+    def current_drawdown(self) -> float:
+        """
+        Return the current drawdown from the peak balance (zero or negative).
+
+        Returns
+        -------
+        float
+
+        """
+        if self._balance is None or self._peak_balance <= 0.0:
+            return 0.0
+
+        return -(self._peak_balance - self._balance) / self._peak_balance
+
+    @property
+    def max_drawdown(self) -> float:
+        """
+        Return the maximum drawdown from the peak balance (zero or negative).
+
+        Returns
+        -------
+        float
+
+        """
+        return -self._max_drawdown
+
+    @property
+    def sharpe_ratio(self) -> float:
+        """
+        Return the annualized Sharpe ratio of the completed daily returns.
+
+        Returns
+        -------
+        float
+            NaN if fewer than two returns or zero volatility.
+
+        """
+        if self._returns_count < 2:
+            return math.nan
+
+        std = math.sqrt(self._returns_m2 / (self._returns_count - 1))
+        if std < 2.220446049250313e-16:
+            return math.nan
+
+        return self._returns_mean / std * math.sqrt(self._period)
+
+    @property
+    def sortino_ratio(self) -> float:
+        """
+        Return the annualized Sortino ratio of the completed daily returns.
+
+        Returns
+        -------
+        float
+            NaN if there are no returns or no downside deviation.
+
+        """
+        if self._returns_count == 0:
+            return math.nan
+
+        downside = math.sqrt(self._returns_downside_sq / self._returns_count)
+        if downside < 2.220446049250313e-16:
+            return math.nan
+
+        return self._returns_mean / downside * math.sqrt(self._period)
+
+    @property
+    def win_rate(self) -> float:
+        """
+        Return the ratio of winning closed positions.
+
+        Returns
+        -------
+        float
+            NaN if no positions have closed.
+
+        """
+        if self._trade_count == 0:
+            return math.nan
+
+        return self._winners / self._trade_count
+
+    @property
+    def profit_factor(self) -> float:
+        """
+        Return the gross profit divided by the gross loss of closed positions.
+
+        Returns
+        -------
+        float
+            NaN if there are no losing positions.
+
+        """
+        if self._gross_loss == 0.0:
+            return math.nan
+
+        return self._gross_profit / self._gross_loss
+
+    def update_balance(self, ts_event: int, balance: float) -> None:
+        """
+        Update the statistics with the given account balance.
+
+        Parameters
+        ----------
+        ts_event : int
+            UNIX timestamp (nanoseconds) of the balance.
+        balance : float
+            The total account balance.
+
+        """
+        day = ts_event // _NANOS_PER_DAY
+
+        if self._day is None:
+            self._starting_balance = balance
+        elif day > self._day:
+            # Close the previous day and fill any days without updates
+            if self._prev_day_close:
+                self._add_return(self._balance / self._prev_day_close - 1.0)
+            for _ in range(day - self._day - 1):
+                self._add_return(0.0)
+            self._prev_day_close = self._balance
+
+        if self._day is None or day > self._day:
+            self._day = day
+
+        self._balance = balance
+
+        if balance > self._peak_balance:
+            self._peak_balance = balance
+        elif self._peak_balance > 0.0:
+            self._max_drawdown = max(
+                self._max_drawdown,
+                (self._peak_balance - balance) / self._peak_balance,
+            )
+
+    def update_realized_pnl(self, realized_pnl: float) -> None:
+        """
+        Update the trade statistics with the realized PnL of a closed position.
+
+        Parameters
+        ----------
+        realized_pnl : float
+            The realized PnL of the closed position.
+
+        """
+        self._trade_count += 1
+
+        if realized_pnl > 0.0:
+            self._winners += 1
+            self._gross_profit += realized_pnl
+        else:
+            self._gross_loss += -realized_pnl
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return a dictionary snapshot of the current statistics.
+
+        Returns
+        -------
+        dict[str, Any]
+
+        """
+        return {
+            "balance": self.balance,
+            "total_return": self.total_return,
+            "current_drawdown": self.current_drawdown,
+            "max_drawdown": self.max_drawdown,
+            "sharpe_ratio": self.sharpe_ratio,
+            "sortino_ratio": self.sortino_ratio,
+            "returns_count": self.returns_count,
+            "trade_count": self.trade_count,
+            "win_rate": self.win_rate,
+            "profit_factor": self.profit_factor,
+        }
+
+    def _add_return(self, value: float) -> None:
+        self._returns_count += 1
+        delta = value - self._returns_mean
+        self._returns_mean += delta / self._returns_count
+        self._returns_m2 += delta * (value - self._returns_mean)
+
+        if value < 0.0:
+            self._returns_downside_sq += value * value
+
+
+class StreamingStatisticsActor(Actor):
+    """
+    Provides an actor which maintains `StreamingStatistics` from account state and
+    position closed events while a run is in progress.
+
+    When an early termination rule from the config is breached the actor requests
+    a system shutdown, which stops a backtest run (and any remaining data chunks)
+    so a losing configuration in a parameter sweep does not run to completion.
+
+    Parameters
+    ----------
+    config : StreamingStatisticsConfig, optional
+        The configuration for the actor.
+
+    """
+
+    def __init__(self, config: StreamingStatisticsConfig | None = None) -> None:
+        if config is None:
+            config = StreamingStatisticsConfig()
+        PyCondition.type(config, StreamingStatisticsConfig, "config")
+        super().__init__(config=config)
+
+        self._account_id = config.account_id
+        self._currency: Currency | None = (
+            Currency.from_str(config.currency) if config.currency else None
+        )
+        self._max_drawdown = config.max_drawdown
+        self._min_sharpe_ratio = config.min_sharpe_ratio
+        self._min_win_rate = config.min_win_rate
+        self._min_returns = config.min_returns
+        self._min_trades = config.min_trades
+        self._statistics = StreamingStatistics(period=config.period)
+        self._stop_reason: str | None = None
+
+    @property
+    def statistics(self) -> StreamingStatistics:
+        """
+        Return the streaming statistics.
+
+        Returns
+        -------
+        StreamingStatistics
+
+        """
+        return self._statistics
+
+    @property
+    def stop_reason(self) -> str | None:
+        """
+        Return the reason an early termination rule stopped the run (if any).
+
+        Returns
+        -------
+        str or ``None``
+
+        """
+        return self._stop_reason
+
+    def on_start(self) -> None:
+        self.msgbus.subscribe(topic="events.account.*", handler=self._handle_account_state)
+        self.msgbus.subscribe(topic="events.position.*", handler=self._handle_position_event)
+
+    def on_stop(self) -> None:
+        self.msgbus.unsubscribe(topic="events.account.*", handler=self._handle_account_state)
+        self.msgbus.unsubscribe(topic="events.position.*", handler=self._handle_position_event)
+
+    def on_reset(self) -> None:
+        self._statistics.reset()
+        self._stop_reason = None
+
+    def _handle_account_state(self, event: AccountState) -> None:
+        if self._account_id is None:
+            self._account_id = event.account_id.value  # Track the first account seen
+        elif event.account_id.value != self._account_id:
+            return
+
+        for balance in event.balances:
+            if self._currency is None:
+                self._currency = balance.currency
+            if balance.currency != self._currency:
+                continue
+
+            self._statistics.update_balance(event.ts_event, balance.total.as_double())
+            self._check_rules()
+            return
+
+    def _handle_position_event(self, event: Any) -> None:
+        if not isinstance(event, PositionClosed):
+            return
+
+        if self._account_id is not None and event.account_id.value != self._account_id:
+            return
+
+        realized_pnl = event.realized_pnl
+        if realized_pnl is None:
+            return
+
+        if self._currency is not None and realized_pnl.currency != self._currency:
+            return
+
+        self._statistics.update_realized_pnl(realized_pnl.as_double())
+        self._check_rules()
+
+    def _check_rules(self) -> None:
+        if self._stop_reason is not None:
+            return  # Already stopping
+
+        stats = self._statistics
+        reason: str | None = None
+
+        if self._max_drawdown is not None and -stats.max_drawdown > self._max_drawdown:
+            reason = (
+                f"max drawdown {-stats.max_drawdown:.2%} exceeded limit {self._max_drawdown:.2%}"
+            )
+        elif (
+            self._min_sharpe_ratio is not None
+            and stats.returns_count >= self._min_returns
+            and stats.sharpe_ratio < self._min_sharpe_ratio
+        ):
+            reason = (
+                f"Sharpe ratio {stats.sharpe_ratio:.3f} below minimum {self._min_sharpe_ratio} "
+                f"after {stats.returns_count} daily returns"
+            )
+        elif (
+            self._min_win_rate is not None
+            and stats.trade_count >= self._min_trades
+            and stats.win_rate < self._min_win_rate
+        ):
+            reason = (
+                f"win rate {stats.win_rate:.2%} below minimum {self._min_win_rate:.2%} "
+                f"after {stats.trade_count} trades"
+            )
+
+        if reason is None:
+            return
+
+        self._stop_reason = reason
+        self.log.warning(f"Early termination: {reason}")
+        self.shutdown_system(reason)
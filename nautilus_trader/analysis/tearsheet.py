@@ -29,13 +29,13 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from nautilus_trader.analysis import TearsheetChart
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.datetime import format_optional_iso8601
 from nautilus_trader.core.nautilus_pyo3 import NAUTILUS_VERSION
-from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarType
 
 
@@ -58,6 +58,7 @@ except ImportError:
 
 # Constants
 TRADING_DAYS_PER_YEAR = 252  # Standard number of trading days for annualization
+DEFAULT_MAX_POINTS = 10_000  # Default point budget per chart before downsampling
 
 _STATIC_IMAGE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".webp", ".svg", ".pdf"})
 
@@ -167,6 +168,105 @@ def _calculate_drawdown(returns: pd.Series) -> pd.Series:
     return (cumulative - running_max) / running_max * 100
 
 
+def _downsample_series(series: pd.Series, max_points: int | None) -> pd.Series:
+    """
+    Downsample a series for line rendering using Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept, and each bucket in between keeps the
+    point forming the largest triangle with its neighbors, which preserves the visual
+    shape (peaks and troughs) of the series. NaN values are dropped before sampling.
+
+    Parameters
+    ----------
+    series : pd.Series
+        The series to downsample.
+    max_points : int, optional
+        The maximum number of points to keep. If None, the series is returned unchanged.
+
+    Returns
+    -------
+    pd.Series
+
+    """
+    if max_points is None or len(series) <= max_points:
+        return series
+
+    series = series.dropna()
+    count = len(series)
+    if count <= max_points or max_points < 3:
+        return series
+
+    index = series.index
+    if isinstance(index, pd.DatetimeIndex):
+        x = (index.asi8 - index.asi8[0]).astype(np.float64)
+    else:
+        x = np.arange(count, dtype=np.float64)
+
+    y = series.to_numpy(dtype=np.float64)
+
+    bucket_size = (count - 2) / (max_points - 2)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = count - 1
+
+    a = 0
+    for i in range(max_points - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+
+        # Average of the next bucket is the third vertex of each triangle
+        next_start = end
+        next_end = min(int((i + 2) * bucket_size) + 1, count)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]),
+        )
+        a = start + int(np.argmax(areas))
+        selected[i + 1] = a
+
+    return series.iloc[selected]
+
+
+def _downsample_ohlc(bars_df: pd.DataFrame, max_points: int | None) -> pd.DataFrame:
+    """
+    Downsample OHLC bars by re-bucketing consecutive bars into larger bars.
+
+    Each bucket keeps the first open and timestamp, the highest high, the lowest low
+    and the last close, so no price extremes are lost.
+
+    Parameters
+    ----------
+    bars_df : pd.DataFrame
+        The bars with `ts_init`, `open`, `high`, `low` and `close` columns.
+    max_points : int, optional
+        The maximum number of bars to keep. If None, the bars are returned unchanged.
+
+    Returns
+    -------
+    pd.DataFrame
+
+    """
+    count = len(bars_df)
+    if max_points is None or count <= max_points:
+        return bars_df
+
+    bucket_size = -(-count // max_points)  # Ceiling division
+    starts = np.arange(0, count, bucket_size)
+    ends = np.minimum(starts + bucket_size, count) - 1
+
+    return pd.DataFrame(
+        {
+            "ts_init": bars_df["ts_init"].to_numpy()[starts],
+            "open": bars_df["open"].to_numpy()[starts],
+            "high": np.maximum.reduceat(bars_df["high"].to_numpy(), starts),
+            "low": np.minimum.reduceat(bars_df["low"].to_numpy(), starts),
+            "close": bars_df["close"].to_numpy()[ends],
+        },
+    )
+
+
 def register_chart(name: str, func: Callable | None = None) -> Callable | None:
     """
     Register a custom chart function for use in tearsheets.
@@ -704,6 +804,7 @@ def create_tearsheet_from_stats(
             benchmark_name=config.benchmark_name,
             height=config.height,
             show_logo=config.show_logo,
+            max_points=config.max_points,
         )
 
     # Create figure with subplots
@@ -735,6 +836,7 @@ def create_equity_curve(
     title: str = "Equity Curve",
     benchmark_returns: pd.Series | None = None,
     benchmark_name: str = "Benchmark",
+    max_points: int | None = DEFAULT_MAX_POINTS,
 ) -> go.Figure:
     """
     Create an interactive equity curve plot with optional benchmark overlay.
@@ -752,6 +854,9 @@ def create_equity_curve(
         curve will be overlaid on the chart.
     benchmark_name : str, default "Benchmark"
         Display name for the benchmark in the legend.
+    max_points : int, optional
+        The maximum number of points to render per line, larger series are downsampled
+        (default 10,000). If None, every point is rendered.
 
     Returns
     -------
@@ -772,7 +877,7 @@ def create_equity_curve(
         raise ImportError(msg)
 
     # Calculate cumulative returns (equity curve)
-    equity = (1 + returns).cumprod()
+    equity = _downsample_series((1 + returns).cumprod(), max_points)
 
     fig = go.Figure()
     fig.add_trace(
@@ -788,7 +893,7 @@ def create_equity_curve(
 
     # Add benchmark if provided
     if benchmark_returns is not None:
-        benchmark_equity = (1 + benchmark_returns).cumprod()
+        benchmark_equity = _downsample_series((1 + benchmark_returns).cumprod(), max_points)
         fig.add_trace(
             go.Scatter(
                 x=benchmark_equity.index,
@@ -821,6 +926,7 @@ def create_drawdown_chart(
     output_path: str | None = None,
     title: str = "Drawdown",
     theme: str = "plotly_white",
+    max_points: int | None = DEFAULT_MAX_POINTS,
 ) -> go.Figure:
     """
     Create an interactive drawdown chart.
@@ -835,6 +941,9 @@ def create_drawdown_chart(
         Plot title.
     theme : str, default "plotly_white"
         Theme name for styling.
+    max_points : int, optional
+        The maximum number of points to render per line, larger series are downsampled
+        (default 10,000). If None, every point is rendered.
 
     Returns
     -------
@@ -857,7 +966,7 @@ def create_drawdown_chart(
     from nautilus_trader.analysis.themes import get_theme
 
     theme_config = _normalize_theme_config(get_theme(theme))
-    drawdown = _calculate_drawdown(returns)
+    drawdown = _downsample_series(_calculate_drawdown(returns), max_points)
     neg_color = theme_config["colors"]["negative"]
     fig = go.Figure()
     fig.add_trace(
@@ -1060,6 +1169,7 @@ def create_rolling_sharpe(
     window: int = 60,
     output_path: str | None = None,
     title: str = "Rolling Sharpe Ratio (60-day)",
+    max_points: int | None = DEFAULT_MAX_POINTS,
 ) -> go.Figure:
     """
     Create an interactive rolling Sharpe ratio chart.
@@ -1074,6 +1184,9 @@ def create_rolling_sharpe(
         Path to save HTML plot. If None, plot is not saved.
     title : str, default "Rolling Sharpe Ratio (60-day)"
         Plot title.
+    max_points : int, optional
+        The maximum number of points to render per line, larger series are downsampled
+        (default 10,000). If None, every point is rendered.
 
     Returns
     -------
@@ -1108,6 +1221,7 @@ def create_rolling_sharpe(
     rolling_sharpe = (rolling_mean / rolling_std.replace(0, float("nan"))) * (
         TRADING_DAYS_PER_YEAR**0.5
     )
+    rolling_sharpe = _downsample_series(rolling_sharpe, max_points)
 
     fig = go.Figure()
     fig.add_trace(
@@ -1327,8 +1441,13 @@ def _create_tearsheet_figure(
             # Get renderer function
             renderer = _TEARSHEET_CHART_SPECS[chart_name]["renderer"]
 
-            # Get chart-specific arguments
-            chart_kwargs = chart.kwargs()
+            # Get chart-specific arguments, chart arguments take precedence
+            chart_kwargs = {
+                "max_points": (
+                    chart.max_points if chart.max_points is not None else config.max_points
+                ),
+                **chart.kwargs(),
+            }
 
             # Call renderer with all available data
             renderer(
@@ -1570,6 +1689,7 @@ def _render_equity(
     theme_config: dict[str, Any],
     benchmark_returns: pd.Series | None = None,
     benchmark_name: str = "Benchmark",
+    max_points: int | None = None,
     **kwargs: Any,
 ) -> None:
     """
@@ -1578,7 +1698,7 @@ def _render_equity(
     if returns.empty:
         return
 
-    equity = (1 + returns).cumprod()
+    equity = _downsample_series((1 + returns).cumprod(), max_points)
     fig.add_trace(
         go.Scatter(
             x=equity.index,
@@ -1593,7 +1713,7 @@ def _render_equity(
     )
 
     if benchmark_returns is not None and not benchmark_returns.empty:
-        benchmark_equity = (1 + benchmark_returns).cumprod()
+        benchmark_equity = _downsample_series((1 + benchmark_returns).cumprod(), max_points)
         fig.add_trace(
             go.Scatter(
                 x=benchmark_equity.index,
@@ -1617,12 +1737,13 @@ def _render_drawdown(
     col: int,
     returns: pd.Series,
     theme_config: dict[str, Any],
+    max_points: int | None = None,
     **kwargs: Any,
 ) -> None:
     """
     Render drawdown chart.
     """
-    drawdown = _calculate_drawdown(returns)
+    drawdown = _downsample_series(_calculate_drawdown(returns), max_points)
     neg_color = theme_config["colors"]["negative"]
 
     fig.add_trace(
@@ -1739,6 +1860,7 @@ def _render_rolling_sharpe(
     returns: pd.Series,
     theme_config: dict[str, Any],
     window: int = 60,
+    max_points: int | None = None,
     **kwargs: Any,
 ) -> None:
     """
@@ -1752,6 +1874,7 @@ def _render_rolling_sharpe(
     rolling_sharpe = (rolling_mean / rolling_std.replace(0, float("nan"))) * (
         TRADING_DAYS_PER_YEAR**0.5
     )
+    rolling_sharpe = _downsample_series(rolling_sharpe, max_points)
 
     fig.add_trace(
         go.Scatter(
@@ -1815,6 +1938,7 @@ def create_bars_with_fills(
     title: str | None = None,
     theme: str = "plotly_white",
     output_path: str | None = None,
+    max_points: int | None = DEFAULT_MAX_POINTS,
 ) -> go.Figure:
     """
     Create a candlestick chart with order fills overlaid as bar charts.
@@ -1834,6 +1958,10 @@ def create_bars_with_fills(
         Theme name for styling.
     output_path : str, optional
         Path to save HTML plot. If None, plot is not saved.
+    max_points : int, optional
+        The maximum number of candles to render, larger bar series are re-bucketed into
+        wider OHLC bars (default 10,000). Fill markers are always rendered exactly.
+        If None, every bar is rendered.
 
     Returns
     -------
@@ -1887,6 +2015,7 @@ def create_bars_with_fills(
         bar_type=bar_type,
         title=title,
         theme_config=theme_config,
+        max_points=max_points,
     )
 
     # Update layout
@@ -1912,7 +2041,7 @@ def create_bars_with_fills(
     return fig
 
 
-def _render_bars_with_fills(  # noqa: C901
+def _render_bars_with_fills(
     fig: go.Figure,
     row: int,
     col: int,
@@ -1920,6 +2049,7 @@ def _render_bars_with_fills(  # noqa: C901
     bar_type=None,
     title: str | None = None,
     theme_config: dict[str, Any] | None = None,
+    max_points: int | None = None,
     **kwargs: Any,
 ) -> None:
     """
@@ -1941,6 +2071,8 @@ def _render_bars_with_fills(  # noqa: C901
         Chart title override.
     theme_config : dict[str, Any], optional
         Theme configuration dictionary. If None, defaults to plotly_white theme.
+    max_points : int, optional
+        The maximum number of candles to render. Fill markers are never downsampled.
     **kwargs : Any
         Additional keyword arguments (ignored).
 
@@ -1975,12 +2107,16 @@ def _render_bars_with_fills(  # noqa: C901
         return
 
     # Convert bars to DataFrame
-    bars_df = pd.DataFrame(Bar.to_dict(bar) for bar in bars)
-    bars_df["ts_init"] = pd.to_datetime(bars_df["ts_init"])
-
-    # Convert price columns to float
-    for column in ("open", "high", "low", "close"):
-        bars_df[column] = bars_df[column].astype(float)
+    bars_df = pd.DataFrame(
+        {
+            "ts_init": pd.to_datetime(np.fromiter((b.ts_init for b in bars), np.int64, len(bars))),
+            "open": np.fromiter((b.open.as_double() for b in bars), np.float64, len(bars)),
+            "high": np.fromiter((b.high.as_double() for b in bars), np.float64, len(bars)),
+            "low": np.fromiter((b.low.as_double() for b in bars), np.float64, len(bars)),
+            "close": np.fromiter((b.close.as_double() for b in bars), np.float64, len(bars)),
+        },
+    )
+    bars_df = _downsample_ohlc(bars_df, max_points)
 
     # Get order fills and filter by instrument_id
     fills_df = engine.trader.generate_fills_report()
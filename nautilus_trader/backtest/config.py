@@ -234,6 +234,16 @@ class BacktestDataConfig(NautilusConfig, frozen=True):
     optimize_file_loading : bool, default False
         If True, registers entire directories with the query backend for efficient
         loading. If False, registers each file individually (e.g. for precise file control).
+    shared_store : str, optional
+        The name of a host-wide `SharedDataStore` to source the instruments and data from,
+        instead of reading the catalog. The data is streamed from memory-mapped buffers
+        shared with all other processes attached to the store. Any catalog files for the
+        configuration not yet in the store are published on first use (built-in data types only).
+        Streaming runs (with a `chunk_size`) only source instruments from the store, and read
+        their data through the catalog. Cannot be combined with `filter_expr` or `metadata`.
+    shared_store_root : str, optional
+        The root directory for the shared store. If ``None`` then uses the default
+        shared memory location.
 
     """
 
@@ -252,6 +262,8 @@ class BacktestDataConfig(NautilusConfig, frozen=True):
     instrument_ids: list[str] | None = None
     bar_types: list[str] | None = None
     optimize_file_loading: bool = False
+    shared_store: str | None = None
+    shared_store_root: str | None = None
 
     @property
     def data_type(self) -> type:
@@ -380,6 +392,23 @@ class BacktestEngineConfig(NautilusKernelConfig, frozen=True):
         If logging should be bypassed.
     run_analysis : bool, default True
         If post backtest performance analysis should be run.
+    batch_data_dispatch : bool, default False
+        If consecutive data sharing the same `ts_init` should be dispatched as a batch.
+        When enabled, data is routed to the simulated exchanges through a per-type dispatch
+        table and venues are settled once per timestamp group (after the last data point with
+        that timestamp), rather than after every individual data point. Trading commands
+        submitted from data callbacks within a group are therefore processed against the
+        market state at the end of the group, and their fills are received after the data
+        callbacks for the rest of the group. Results only match the default mode when no
+        command is submitted before the last data point of its timestamp group.
+    uuid_seed : NonNegativeInt, optional
+        The seed for deterministic `UUID4` generation (must fit in 64 bits). When set, every
+        `UUID4` (event, command and component IDs) is drawn from a seeded counter-based
+        generator instead of the OS random source, which is cheaper and makes event logs
+        from repeated runs of identically configured engines directly comparable. The
+        generator is owned by the engine and only active while it is built and running, and
+        each run after a reset restarts the sequence. If ``None`` then random UUIDs are
+        generated (the default, and the only behavior for live).
 
     """
 
@@ -390,6 +419,8 @@ class BacktestEngineConfig(NautilusKernelConfig, frozen=True):
     risk_engine: RiskEngineConfig | None = RiskEngineConfig()
     exec_engine: ExecEngineConfig | None = ExecEngineConfig()
     run_analysis: bool = True
+    batch_data_dispatch: bool = False
+    uuid_seed: NonNegativeInt | None = None
 
     def __post_init__(self):
         if isinstance(self.trader_id, str):
@@ -123,14 +123,21 @@ cdef class BacktestEngine:
     cdef uint64_t _last_ns
     cdef uint64_t _end_ns
     cdef bint _sorted
+    cdef bint _batch_data_dispatch
+    cdef dict[type, int] _dispatch_table
     cdef dict[str, RequestData] _data_requests
     cdef set[str] _backtest_subscription_names
     cdef dict[str, uint64_t] _last_subscription_ts
     cdef list[Data] _response_data
+    cdef tuple _uuid4_start_state
+    cdef tuple _uuid4_state
 
+    cdef tuple _enter_uuid4_state(self)
+    cdef void _exit_uuid4_state(self, tuple previous_state)
     cdef CVec _advance_time(self, uint64_t ts_now)
     cdef bint _process_next_timer(self)
     cdef void _process_and_settle_venues(self, uint64_t ts_now)
+    cdef void _dispatch_to_exchange(self, Data data)
     cdef void _flush_accumulator_events(self, uint64_t ts_now)
     cdef void _process_raw_time_event_handlers(
         self,
@@ -365,6 +372,10 @@ cdef class OrderMatchingEngine:
     cdef MessageBus _msgbus
     cdef OrderBook _book
     cdef FillModel _fill_model
+    cdef bint _fill_model_is_pure
+    cdef dict _fill_sim_books
+    cdef PriceRaw _fill_sim_bid_raw
+    cdef PriceRaw _fill_sim_ask_raw
     cdef FeeModel _fee_model
     cdef InstrumentClose _instrument_close
     cdef bint _instrument_has_expiration
@@ -437,6 +448,7 @@ cdef class OrderMatchingEngine:
     cdef int _position_count
     cdef int _order_count
     cdef int _execution_count
+    cdef uint64_t _trade_id_hash_prefix
 
     cpdef void reset(self)
     cpdef void set_fill_model(self, FillModel fill_model)
@@ -523,6 +535,8 @@ cdef class OrderMatchingEngine:
     cpdef list[tuple[Price, Quantity]] determine_market_price_and_volume(self, Order order)
     cdef list[tuple[Price, Quantity]] determine_market_fills_with_simulation(self, Order order)
     cdef list[tuple[Price, Quantity]] determine_limit_fills_with_simulation(self, Order order)
+    cdef OrderBook _get_fill_simulation_book(self, Order order, Price best_bid, Price best_ask)
+    cdef void _clear_fill_simulation_cache(self)
     cdef void _seed_trade_consumption(self, PriceRaw trade_price_raw, QuantityRaw trade_size_raw, uint64_t trade_ts_event, AggressorSide aggressor_side)
     cdef list[tuple[Price, Quantity]] _apply_liquidity_consumption(self, list fills, OrderSide order_side, QuantityRaw max_qty_raw=*, list[Price] book_prices=*)
     cdef Quantity determine_trade_fill_qty(self, Order order)
@@ -132,6 +132,9 @@ from nautilus_trader.core.rust.model cimport trade_id_new
 from nautilus_trader.core.rust.model cimport vec_drop_book_levels
 from nautilus_trader.core.string cimport pystr_to_cstr
 from nautilus_trader.core.uuid cimport UUID4
+from nautilus_trader.core.uuid cimport restore_uuid4_seed_state
+from nautilus_trader.core.uuid cimport set_uuid4_seed
+from nautilus_trader.core.uuid cimport uuid4_seed_state
 from nautilus_trader.data.messages cimport DataCommand
 from nautilus_trader.data.messages cimport DataResponse
 from nautilus_trader.data.messages cimport SubscribeData
@@ -214,6 +217,42 @@ from nautilus_trader.portfolio.base cimport PortfolioFacade
 from nautilus_trader.trading.strategy cimport Strategy
 
 
+# Exchange routing codes for the batched data dispatch table
+cdef int _ROUTE_NONE = 0
+cdef int _ROUTE_INSTRUMENT = 1
+cdef int _ROUTE_DELTA = 2
+cdef int _ROUTE_DELTAS = 3
+cdef int _ROUTE_DEPTH10 = 4
+cdef int _ROUTE_QUOTE = 5
+cdef int _ROUTE_TRADE = 6
+cdef int _ROUTE_BAR = 7
+cdef int _ROUTE_INSTRUMENT_CLOSE = 8
+cdef int _ROUTE_INSTRUMENT_STATUS = 9
+
+
+cdef int _resolve_exchange_route(Data data):
+    if isinstance(data, Instrument):
+        return _ROUTE_INSTRUMENT
+    elif isinstance(data, OrderBookDelta):
+        return _ROUTE_DELTA
+    elif isinstance(data, OrderBookDeltas):
+        return _ROUTE_DELTAS
+    elif isinstance(data, OrderBookDepth10):
+        return _ROUTE_DEPTH10
+    elif isinstance(data, QuoteTick):
+        return _ROUTE_QUOTE
+    elif isinstance(data, TradeTick):
+        return _ROUTE_TRADE
+    elif isinstance(data, Bar):
+        return _ROUTE_BAR
+    elif isinstance(data, InstrumentClose):
+        return _ROUTE_INSTRUMENT_CLOSE
+    elif isinstance(data, InstrumentStatus):
+        return _ROUTE_INSTRUMENT_STATUS
+    else:
+        return _ROUTE_NONE
+
+
 cdef class BacktestEngine:
     """
     Provides a backtest engine to run a portfolio of strategies over historical
@@ -255,6 +294,8 @@ cdef class BacktestEngine:
         self._last_ns : uint64_t = 0
         self._end_ns : uint64_t = 0
         self._sorted: bint = True
+        self._batch_data_dispatch: bint = config.batch_data_dispatch
+        self._dispatch_table: dict[type, int] = {}
 
         # Timing
         self._run_started: pd.Timestamp | None = None
@@ -262,8 +303,25 @@ cdef class BacktestEngine:
         self._backtest_start: pd.Timestamp | None = None
         self._backtest_end: pd.Timestamp | None = None
 
+        # Seed ID generation while building the kernel so component IDs are reproducible.
+        # The engine keeps its own generator state, and the process-wide state is restored
+        # afterwards so other engines and user code are unaffected.
+        self._uuid4_start_state: tuple | None = None
+        self._uuid4_state: tuple | None = None
+        previous_uuid4_state = uuid4_seed_state()
+        if config.uuid_seed is not None:
+            set_uuid4_seed(config.uuid_seed)
+
         # Build core system kernel
-        self._kernel = NautilusKernel(name=type(self).__name__, config=config)
+        try:
+            self._kernel = NautilusKernel(name=type(self).__name__, config=config)
+        finally:
+            if config.uuid_seed is not None:
+                # Each run restarts the sequence from here, so reset runs reproduce IDs
+                self._uuid4_start_state = uuid4_seed_state()
+                self._uuid4_state = self._uuid4_start_state
+            restore_uuid4_seed_state(previous_uuid4_state)
+
         self._instance_id = self._kernel.instance_id
         self._log = Logger(type(self).__name__)
 
@@ -1371,12 +1429,20 @@ cdef class BacktestEngine:
         - The engine validates this requirement and will raise `RuntimeError` if unsorted data is detected.
 
         """
-        self._run(start, end, run_config_id, streaming)
+        if self._uuid4_start_state is not None and self._iteration == 0:
+            # Restart the seeded ID sequence for each new run
+            self._uuid4_state = self._uuid4_start_state
 
-        # Finalize on non-streaming runs, or when a shutdown was triggered at
-        # any point during the run so the trader and engines actually stop
-        if not streaming or FORCE_STOP:
-            self.end()
+        cdef tuple previous_uuid4_state = self._enter_uuid4_state()
+        try:
+            self._run(start, end, run_config_id, streaming)
+
+            # Finalize on non-streaming runs, or when a shutdown was triggered at
+            # any point during the run so the trader and engines actually stop
+            if not streaming or FORCE_STOP:
+                self._end()
+        finally:
+            self._exit_uuid4_state(previous_uuid4_state)
 
     def end(self):
         """
@@ -1387,6 +1453,29 @@ cdef class BacktestEngine:
         Only required if you have previously been running with streaming.
 
         """
+        cdef tuple previous_uuid4_state = self._enter_uuid4_state()
+        try:
+            self._end()
+        finally:
+            self._exit_uuid4_state(previous_uuid4_state)
+
+    cdef tuple _enter_uuid4_state(self):
+        # Swap in the engine's seeded ID generator, returning the process-wide state
+        if self._uuid4_state is None:
+            return None
+
+        cdef tuple previous_state = uuid4_seed_state()
+        restore_uuid4_seed_state(self._uuid4_state)
+        return previous_state
+
+    cdef void _exit_uuid4_state(self, tuple previous_state):
+        if previous_state is None:
+            return
+
+        self._uuid4_state = uuid4_seed_state()
+        restore_uuid4_seed_state(previous_state)
+
+    def _end(self):
         # Flush remaining timer events to the backtest end boundary so that
         # tail alerts/expiries scheduled after the last data point still fire.
         # Must run before stopping engines since DataEngine.stop() cancels
@@ -1650,6 +1739,7 @@ cdef class BacktestEngine:
 
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
         cdef uint64_t raw_handlers_count = 0
+        cdef uint64_t ts_batch = 0
         cdef CVec raw_handlers
         cdef bint done
         raw_handlers.ptr = NULL
@@ -1692,6 +1782,28 @@ cdef class BacktestEngine:
                     raw_handlers = self._advance_time(data.ts_init)
                     raw_handlers_count = raw_handlers.len
 
+                if self._batch_data_dispatch:
+                    self._dispatch_to_exchange(data)
+                    self._data_engine.process(data)
+
+                    # Settle venues once all data for the timestamp has been dispatched
+                    ts_batch = data.ts_init
+                    data = self._data_iterator.next()
+                    if data is None or data.ts_init > ts_batch:
+                        self._process_and_settle_venues(ts_batch)
+                        self._process_raw_time_event_handlers(
+                            raw_handlers,
+                            self._last_ns,
+                            only_now=True,
+                        )
+                        if raw_handlers.ptr != NULL:
+                            vec_time_event_handlers_drop(raw_handlers)
+
+                        raw_handlers_count = 0
+
+                    self._iteration += 1
+                    continue
+
                 # Process data through exchange
                 if isinstance(data, Instrument):
                     exchange = self._venues[data.id.venue]
@@ -1929,6 +2041,47 @@ cdef class BacktestEngine:
                 module.process(ts_now)
             exchange._process_instrument_expirations(ts_now)
 
+    cdef void _dispatch_to_exchange(self, Data data):
+        # Route data to its simulated exchange using the per-type dispatch table,
+        # resolving and caching the route on the first occurrence of each type
+        cdef type data_cls = type(data)
+        cdef object route = self._dispatch_table.get(data_cls)
+        if route is None:
+            route = _resolve_exchange_route(data)
+            self._dispatch_table[data_cls] = route
+
+        cdef int code = route
+        cdef SimulatedExchange exchange
+        if code == _ROUTE_NONE:
+            return
+        elif code == _ROUTE_QUOTE:
+            exchange = self._venues[(<QuoteTick>data).instrument_id.venue]
+            exchange.process_quote_tick(<QuoteTick>data)
+        elif code == _ROUTE_TRADE:
+            exchange = self._venues[(<TradeTick>data).instrument_id.venue]
+            exchange.process_trade_tick(<TradeTick>data)
+        elif code == _ROUTE_DELTAS:
+            exchange = self._venues[(<OrderBookDeltas>data).instrument_id.venue]
+            exchange.process_order_book_deltas(<OrderBookDeltas>data)
+        elif code == _ROUTE_DELTA:
+            exchange = self._venues[(<OrderBookDelta>data).instrument_id.venue]
+            exchange.process_order_book_delta(<OrderBookDelta>data)
+        elif code == _ROUTE_DEPTH10:
+            exchange = self._venues[(<OrderBookDepth10>data).instrument_id.venue]
+            exchange.process_order_book_depth10(<OrderBookDepth10>data)
+        elif code == _ROUTE_BAR:
+            exchange = self._venues[(<Bar>data).bar_type.instrument_id.venue]
+            exchange.process_bar(<Bar>data)
+        elif code == _ROUTE_INSTRUMENT:
+            exchange = self._venues[(<Instrument>data).id.venue]
+            exchange.update_instrument(<Instrument>data)
+        elif code == _ROUTE_INSTRUMENT_CLOSE:
+            exchange = self._venues[(<InstrumentClose>data).instrument_id.venue]
+            exchange.process_instrument_close(<InstrumentClose>data)
+        elif code == _ROUTE_INSTRUMENT_STATUS:
+            exchange = self._venues[(<InstrumentStatus>data).instrument_id.venue]
+            exchange.process_instrument_status(<InstrumentStatus>data)
+
     cdef void _flush_accumulator_events(self, uint64_t ts_now):
         cdef list[TestClock] clocks = get_component_clocks(self._instance_id)
 
@@ -4018,6 +4171,7 @@ cdef class OrderMatchingEngine:
         self.venue = instrument.id.venue
         self.instrument = instrument
         self.raw_id = raw_id
+        self._trade_id_hash_prefix = _fnv1a_trade_id_prefix_hash(self.venue.to_str(), raw_id)
         self.book_type = book_type
         self.oms_type = oms_type
         self.account_type = account_type
@@ -4043,6 +4197,10 @@ cdef class OrderMatchingEngine:
         self._price_protection_points = price_protection_points if price_protection_points is not None else 0
 
         self._fill_model = fill_model
+        self._fill_model_is_pure = fill_model is not None and fill_model.is_pure()
+        self._fill_sim_books = {}
+        self._fill_sim_bid_raw = 0
+        self._fill_sim_ask_raw = 0
         self._fee_model = fee_model
         self._book = OrderBook(
             instrument_id=instrument.id,
@@ -4121,6 +4279,7 @@ cdef class OrderMatchingEngine:
         self._execution_bar_types.clear()
         self._execution_bar_deltas.clear()
         self._cached_filled_qty.clear()
+        self._clear_fill_simulation_cache()
         self._core.reset()
         self._target_bid = 0
         self._target_ask = 0
@@ -4166,6 +4325,8 @@ cdef class OrderMatchingEngine:
         Condition.not_none(fill_model, "fill_model")
 
         self._fill_model = fill_model
+        self._fill_model_is_pure = fill_model.is_pure()
+        self._clear_fill_simulation_cache()
         self._core.set_fill_limit_inside_spread(fill_model.fill_limit_inside_spread())
 
         self._log.debug(f"Changed `FillModel` to {self._fill_model}")
@@ -4192,6 +4353,7 @@ cdef class OrderMatchingEngine:
         self.instrument = instrument
         self._price_prec = instrument.price_precision
         self._size_prec = instrument.size_precision
+        self._clear_fill_simulation_cache()
 
         self._log.debug(f"Updated instrument definition for {instrument.id}")
 
@@ -6318,9 +6480,7 @@ cdef class OrderMatchingEngine:
             return []  # No market available
 
         # Try to get simulated OrderBook from FillModel
-        cdef OrderBook simulated_book = self._fill_model.get_orderbook_for_fill_simulation(
-            self.instrument, order, best_bid, best_ask
-        )
+        cdef OrderBook simulated_book = self._get_fill_simulation_book(order, best_bid, best_ask)
         if simulated_book is not None:
             # Use simulated OrderBook for fill determination
             fills = simulated_book.simulate_fills(
@@ -6770,9 +6930,7 @@ cdef class OrderMatchingEngine:
             return []  # No market available
 
         # Try to get simulated OrderBook from FillModel
-        cdef OrderBook simulated_book = self._fill_model.get_orderbook_for_fill_simulation(
-            self.instrument, order, best_bid, best_ask
-        )
+        cdef OrderBook simulated_book = self._get_fill_simulation_book(order, best_bid, best_ask)
         if simulated_book is not None:
             # Use simulated OrderBook for fill determination
             return simulated_book.simulate_fills(
@@ -6785,6 +6943,38 @@ cdef class OrderMatchingEngine:
             # Fall back to standard logic
             return self.determine_limit_price_and_volume(order)
 
+    cdef OrderBook _get_fill_simulation_book(self, Order order, Price best_bid, Price best_ask):
+        if not self._fill_model_is_pure:
+            return self._fill_model.get_orderbook_for_fill_simulation(
+                self.instrument, order, best_bid, best_ask
+            )
+
+        # Pure models produce the same book for the same book state and key inputs,
+        # the cache is scoped to the current best bid/ask so it stays small
+        if (
+            best_bid._mem.raw != self._fill_sim_bid_raw
+            or best_ask._mem.raw != self._fill_sim_ask_raw
+        ):
+            self._fill_sim_books.clear()
+            self._fill_sim_bid_raw = best_bid._mem.raw
+            self._fill_sim_ask_raw = best_ask._mem.raw
+
+        cdef object key = self._fill_model.fill_simulation_key(order)
+        cdef OrderBook book
+        try:
+            return self._fill_sim_books[key]
+        except KeyError:
+            book = self._fill_model.get_orderbook_for_fill_simulation(
+                self.instrument, order, best_bid, best_ask
+            )
+            self._fill_sim_books[key] = book  # Also caches None (use default fill logic)
+            return book
+
+    cdef void _clear_fill_simulation_cache(self):
+        self._fill_sim_books.clear()
+        self._fill_sim_bid_raw = 0
+        self._fill_sim_ask_raw = 0
+
     cdef Quantity determine_trade_fill_qty(self, Order order):
         """
         Determine the fill quantity for trade execution mode.
@@ -7274,7 +7464,7 @@ cdef class OrderMatchingEngine:
         if order.time_in_force == TimeInForce.FOK:
             # Check FOK requirement
             for fill in fills:
-                fill_px, fill_qty = fill
+                fill_qty = fill[1]
                 total_size_raw += fill_qty._mem.raw
 
             if order.leaves_qty._mem.raw > total_size_raw:
@@ -7694,7 +7884,7 @@ cdef class OrderMatchingEngine:
             # Generate unique trade ID for the leg fill: reuse the bounded hash
             # format from `_generate_trade_id_str` and append the leg position
             # so legs sharing an execution step remain distinguishable.
-            leg_hash = _fnv1a_trade_id_hash(self.venue.to_str(), self.raw_id, ts_now)
+            leg_hash = _fnv1a_fold_bytes(self._trade_id_hash_prefix, ts_now, 8)
             leg_trade_id = TradeId(f"T-{leg_hash:016x}-{self._execution_count:03d}-{leg_position}")
             leg_fill = OrderFilled(
                 trader_id=order.trader_id,
@@ -7855,13 +8045,12 @@ cdef class OrderMatchingEngine:
 
         order.liquidity_side = liquidity_side
 
+        # Work on raw values and only allocate a new `Quantity` when the fill is clamped
         cdef Quantity cached_filled_qty = self._cached_filled_qty.get(order.client_order_id)
-        cdef Quantity leaves_qty = None
         cdef Quantity total_filled_qty = None
+        cdef QuantityRaw leaves_raw
         if cached_filled_qty is None:
-            # Clamp the first fill to the order quantity to avoid over-filling
-            last_qty = Quantity.from_raw_c(min(order.quantity._mem.raw, last_qty._mem.raw), size_prec)
-            self._cached_filled_qty[order.client_order_id] = Quantity.from_raw_c(last_qty._mem.raw, size_prec)
+            leaves_raw = order.quantity._mem.raw
         else:
             if order.quantity._mem.raw <= cached_filled_qty._mem.raw:
                 self._core.delete_order(order)
@@ -7869,14 +8058,21 @@ cdef class OrderMatchingEngine:
                     self._cached_filled_qty.pop(order.client_order_id, None)
                 return
 
-            leaves_qty = Quantity.from_raw_c(order.quantity._mem.raw - cached_filled_qty._mem.raw, size_prec)
-            last_qty = Quantity.from_raw_c(min(leaves_qty._mem.raw, last_qty._mem.raw), size_prec)
+            leaves_raw = order.quantity._mem.raw - cached_filled_qty._mem.raw
+
+        # Clamp the fill to the leaves quantity to avoid over-filling
+        if last_qty._mem.raw > leaves_raw:
+            last_qty = Quantity.from_raw_c(leaves_raw, size_prec)
+
+        if cached_filled_qty is None:
+            self._cached_filled_qty[order.client_order_id] = Quantity.from_raw_c(last_qty._mem.raw, size_prec)
+        else:
             cached_filled_qty._mem.raw += last_qty._mem.raw
 
         # Nothing to fill when adjusted last_qty <= 0.
         # Update _cached_filled_qty first to absorb duplicate or out-of-order fills
         # (seen in sandbox/async environments) and avoid emitting zero/negative fills.
-        if last_qty <= 0:
+        if last_qty._mem.raw <= 0:
             return
 
         # Calculate commission
@@ -8105,7 +8301,7 @@ cdef class OrderMatchingEngine:
         # close ticks in bar-driven matching as well as fill generation)
         # advances it, matching the Rust `IdsGenerator::generate_trade_id`.
         self._execution_count += 1
-        cdef uint64_t h = _fnv1a_trade_id_hash(self.venue.to_str(), self.raw_id, ts_init)
+        cdef uint64_t h = _fnv1a_fold_bytes(self._trade_id_hash_prefix, ts_init, 8)
         return f"T-{h:016x}-{self._execution_count:03d}"
 
 # -- EVENT HANDLING -------------------------------------------------------------------------------
@@ -8546,16 +8742,27 @@ cdef uint64_t _FNV_OFFSET_BASIS = 0xcbf29ce484222325
 cdef uint64_t _FNV_PRIME = 0x100000001b3
 
 
-cdef uint64_t _fnv1a_trade_id_hash(str venue, uint32_t raw_id, uint64_t ts_init_ns):
+cdef inline uint64_t _fnv1a_fold_bytes(uint64_t h, uint64_t value, int n) noexcept nogil:
+    # Folds the `n` low-order bytes of `value` (little-endian) into the hash,
+    # uint64 multiplication wraps modulo 2^64 as FNV-1a requires
+    cdef int i
+    for i in range(n):
+        h ^= (value >> (8 * i)) & 0xFF
+        h *= _FNV_PRIME
+    return h
+
+
+cdef uint64_t _fnv1a_trade_id_prefix_hash(str venue, uint32_t raw_id):
+    # Hash of the fixed `(venue, raw_id)` prefix, computed once per matching engine
+    # so each trade ID only folds in the `ts_init` bytes
     cdef uint64_t h = _FNV_OFFSET_BASIS
     cdef bytes venue_bytes = venue.encode("ascii")
-    cdef bytes raw_id_bytes = raw_id.to_bytes(4, "little")
-    cdef bytes ts_bytes = ts_init_ns.to_bytes(8, "little")
-    cdef bytes b
     cdef int i
 
-    for b in (venue_bytes, b"\x1f", raw_id_bytes, b"\x1f", ts_bytes):
-        for i in range(len(b)):
-            h ^= b[i]
-            h = (h * _FNV_PRIME) & 0xFFFFFFFFFFFFFFFF
-    return h
+    for i in range(len(venue_bytes)):
+        h ^= venue_bytes[i]
+        h *= _FNV_PRIME
+
+    h = _fnv1a_fold_bytes(h, 0x1f, 1)
+    h = _fnv1a_fold_bytes(h, raw_id, 4)
+    return _fnv1a_fold_bytes(h, 0x1f, 1)
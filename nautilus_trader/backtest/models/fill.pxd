@@ -38,12 +38,15 @@ cdef class FillModel:
         Price best_bid,
         Price best_ask,
     )
+    cpdef bint is_pure(self)
+    cpdef object fill_simulation_key(self, Order order)
 
     cdef bint _event_success(self, double probability)
 
 
 cdef class BestPriceFillModel(FillModel):
     cpdef bint fill_limit_inside_spread(self)
+    cpdef bint is_pure(self)
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
         Instrument instrument,
@@ -54,6 +57,8 @@ cdef class BestPriceFillModel(FillModel):
 
 
 cdef class OneTickSlippageFillModel(FillModel):
+    cpdef bint is_pure(self)
+    cpdef object fill_simulation_key(self, Order order)
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
         Instrument instrument,
@@ -64,6 +69,8 @@ cdef class OneTickSlippageFillModel(FillModel):
 
 
 cdef class TwoTierFillModel(FillModel):
+    cpdef bint is_pure(self)
+    cpdef object fill_simulation_key(self, Order order)
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
         Instrument instrument,
@@ -84,6 +91,8 @@ cdef class ProbabilisticFillModel(FillModel):
 
 
 cdef class SizeAwareFillModel(FillModel):
+    cpdef bint is_pure(self)
+    cpdef object fill_simulation_key(self, Order order)
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
         Instrument instrument,
@@ -94,6 +103,8 @@ cdef class SizeAwareFillModel(FillModel):
 
 
 cdef class LimitOrderPartialFillModel(FillModel):
+    cpdef bint is_pure(self)
+    cpdef object fill_simulation_key(self, Order order)
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
         Instrument instrument,
@@ -104,6 +115,8 @@ cdef class LimitOrderPartialFillModel(FillModel):
 
 
 cdef class ThreeTierFillModel(FillModel):
+    cpdef bint is_pure(self)
+    cpdef object fill_simulation_key(self, Order order)
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
         Instrument instrument,
@@ -116,6 +129,8 @@ cdef class ThreeTierFillModel(FillModel):
 cdef class MarketHoursFillModel(FillModel):
     cdef bint _is_low_liquidity
 
+    cpdef bint is_pure(self)
+    cpdef object fill_simulation_key(self, Order order)
     cpdef bint is_low_liquidity_period(self)
     cpdef void set_low_liquidity_period(self, bint is_low_liquidity)
     cpdef OrderBook get_orderbook_for_fill_simulation(
@@ -130,6 +145,8 @@ cdef class MarketHoursFillModel(FillModel):
 cdef class VolumeSensitiveFillModel(FillModel):
     cdef double _recent_volume
 
+    cpdef bint is_pure(self)
+    cpdef object fill_simulation_key(self, Order order)
     cpdef void set_recent_volume(self, double volume)
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
@@ -143,6 +160,8 @@ cdef class VolumeSensitiveFillModel(FillModel):
 cdef class CompetitionAwareFillModel(FillModel):
     cdef double liquidity_factor
 
+    cpdef bint is_pure(self)
+    cpdef object fill_simulation_key(self, Order order)
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
         Instrument instrument,
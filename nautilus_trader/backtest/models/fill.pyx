@@ -156,6 +156,52 @@ cdef class FillModel:
         """
         return None  # Default implementation - use existing fill logic
 
+    cpdef bint is_pure(self):
+        """
+        Return whether the simulated books from this model are pure.
+
+        A model is pure when `get_orderbook_for_fill_simulation` is deterministic and
+        depends only on the instrument, the best bid/ask, the model parameters, and the
+        inputs captured by `fill_simulation_key`. The matching engine will then reuse a
+        simulated book for all orders evaluated against the same book state, rather than
+        rebuilding it for every fill evaluation.
+
+        The default implementation returns False (no caching), override to return True
+        in deterministic fill models.
+
+        Returns
+        -------
+        bool
+
+        """
+        return False
+
+    cpdef object fill_simulation_key(self, Order order):
+        """
+        Return the cache key for the order and model state inputs of a simulated book.
+
+        Only used when `is_pure` returns True. The default implementation keys on all
+        order inputs (side, type, price and quantity), override to narrow the key to
+        the inputs the model actually uses (increasing reuse), and to include any
+        mutable model state which affects the simulated book.
+
+        Parameters
+        ----------
+        order : Order
+            The order to simulate fills for.
+
+        Returns
+        -------
+        Hashable
+
+        """
+        return (
+            order.side,
+            order.order_type,
+            order.price if order.has_price_c() else None,
+            order.quantity,
+        )
+
     cdef bint _event_success(self, double probability):
         # Return a result indicating whether an event occurred based on the
         # given probability of the event occurring [0, 1].
@@ -179,6 +225,9 @@ cdef class BestPriceFillModel(FillModel):
     cpdef bint fill_limit_inside_spread(self):
         return True
 
+    cpdef bint is_pure(self):
+        return True
+
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
         Instrument instrument,
@@ -250,6 +299,12 @@ cdef class OneTickSlippageFillModel(FillModel):
 
     """
 
+    cpdef bint is_pure(self):
+        return True
+
+    cpdef object fill_simulation_key(self, Order order):
+        return ()  # Book does not depend on the order
+
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
         Instrument instrument,
@@ -301,6 +356,12 @@ cdef class TwoTierFillModel(FillModel):
     of basic market impact for small to medium orders.
     """
 
+    cpdef bint is_pure(self):
+        return True
+
+    cpdef object fill_simulation_key(self, Order order):
+        return ()  # Book does not depend on the order
+
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
         Instrument instrument,
@@ -437,6 +498,12 @@ cdef class SizeAwareFillModel(FillModel):
 
     """
 
+    cpdef bint is_pure(self):
+        return True
+
+    cpdef object fill_simulation_key(self, Order order):
+        return order.quantity
+
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
         Instrument instrument,
@@ -533,6 +600,12 @@ cdef class LimitOrderPartialFillModel(FillModel):
 
     """
 
+    cpdef bint is_pure(self):
+        return True
+
+    cpdef object fill_simulation_key(self, Order order):
+        return ()  # Book does not depend on the order
+
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
         Instrument instrument,
@@ -604,6 +677,12 @@ cdef class ThreeTierFillModel(FillModel):
 
     """
 
+    cpdef bint is_pure(self):
+        return True
+
+    cpdef object fill_simulation_key(self, Order order):
+        return ()  # Book does not depend on the order
+
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
         Instrument instrument,
@@ -716,6 +795,12 @@ cdef class MarketHoursFillModel(FillModel):
         """
         self._is_low_liquidity = is_low_liquidity
 
+    cpdef bint is_pure(self):
+        return True
+
+    cpdef object fill_simulation_key(self, Order order):
+        return self._is_low_liquidity
+
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
         Instrument instrument,
@@ -797,6 +882,12 @@ cdef class VolumeSensitiveFillModel(FillModel):
         """
         self._recent_volume = volume
 
+    cpdef bint is_pure(self):
+        return True
+
+    cpdef object fill_simulation_key(self, Order order):
+        return self._recent_volume
+
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
         Instrument instrument,
@@ -878,6 +969,12 @@ cdef class CompetitionAwareFillModel(FillModel):
         super().__init__(prob_fill_on_limit, prob_slippage, random_seed)
         self.liquidity_factor = liquidity_factor
 
+    cpdef bint is_pure(self):
+        return True
+
+    cpdef object fill_simulation_key(self, Order order):
+        return ()  # Book does not depend on the order
+
     cpdef OrderBook get_orderbook_for_fill_simulation(
         self,
         Instrument instrument,
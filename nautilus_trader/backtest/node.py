@@ -13,8 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from __future__ import annotations
+
 import json
 from decimal import Decimal
+from typing import TYPE_CHECKING
 
 import pandas as pd
 
@@ -71,11 +74,15 @@ from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Currency
 from nautilus_trader.model.objects import Money
-from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
 from nautilus_trader.persistence.catalog.types import CatalogDataResult
 from nautilus_trader.persistence.config import DataCatalogConfig
 
 
+if TYPE_CHECKING:
+    from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+    from nautilus_trader.persistence.shared import SharedDataStore
+
+
 class BacktestNode:
     """
     Provides a node for orchestrating groups of backtest runs.
@@ -175,6 +182,13 @@ class BacktestNode:
 
         for config in configs:
             for data_config in config.data:
+                if data_config.shared_store is not None and (
+                    data_config.filter_expr is not None or data_config.metadata is not None
+                ):
+                    raise InvalidConfiguration(
+                        "`filter_expr` and `metadata` are not supported with a `shared_store`",
+                    )
+
                 used_instrument_ids: list[InstrumentId] = get_instrument_ids(data_config)
 
                 if len(used_instrument_ids) == 0:
@@ -422,13 +436,23 @@ class BacktestNode:
         # Add instruments
         for data_config in data_configs:
             if is_nautilus_class(data_config.data_type):
-                catalog = self.load_catalog(data_config)
                 used_instrument_ids = get_instrument_ids(data_config)
 
                 # None to query all instruments
-                instruments = catalog.instruments(
-                    instrument_ids=(used_instrument_ids if len(used_instrument_ids) > 0 else None),
-                )
+                if data_config.shared_store is not None:
+                    store = self.load_shared_store(data_config, publish_data=False)
+                    instruments = store.instruments(
+                        instrument_ids=(
+                            [str(i) for i in used_instrument_ids] if used_instrument_ids else None
+                        ),
+                    )
+                else:
+                    catalog = self.load_catalog(data_config)
+                    instruments = catalog.instruments(
+                        instrument_ids=(
+                            used_instrument_ids if len(used_instrument_ids) > 0 else None
+                        ),
+                    )
 
                 for instrument in instruments or []:
                     if instrument.id not in engine.cache.instrument_ids():
@@ -674,6 +698,9 @@ class BacktestNode:
         start: str | int | None = None,
         end: str | int | None = None,
     ) -> CatalogDataResult:
+        if config.shared_store is not None and is_nautilus_class(config.data_type):
+            return cls._load_shared_data_config(config, start, end)
+
         catalog: ParquetDataCatalog = cls.load_catalog(config)
         used_instrument_ids = get_instrument_ids(config)
         instruments = (
@@ -704,8 +731,110 @@ class BacktestNode:
             client_id=ClientId(config.client_id) if config.client_id else None,
         )
 
+    @classmethod
+    def _load_shared_data_config(
+        cls,
+        config: BacktestDataConfig,
+        start: str | int | None = None,
+        end: str | int | None = None,
+    ) -> CatalogDataResult:
+        # Instruments are published when the engine is created, so only the data is published here
+        store = cls.load_shared_store(config, publish_instruments=False)
+        used_instrument_ids = [str(i) for i in get_instrument_ids(config)]
+        instruments = (
+            store.instruments(instrument_ids=used_instrument_ids) if used_instrument_ids else None
+        )
+
+        if used_instrument_ids and not instruments:
+            store.publish_instruments(cls.load_catalog(config), instrument_ids=used_instrument_ids)
+            instruments = store.instruments(instrument_ids=used_instrument_ids)
+
+        if used_instrument_ids and not instruments:
+            return CatalogDataResult(data_cls=config.data_type, data=[])
+
+        config_query = config.query
+        used_start = config_query["start"]
+        used_end = config_query["end"]
+
+        if used_start is not None or start is not None:
+            result = max_date(used_start, start)
+            used_start = result.isoformat() if result else None
+
+        if used_end is not None or end is not None:
+            result = min_date(used_end, end)
+            used_end = result.isoformat() if result else None
+
+        data = store.query(
+            data_cls=config.data_type,
+            identifiers=config_query["identifiers"] or None,
+            start=used_start,
+            end=used_end,
+        )
+
+        return CatalogDataResult(
+            data_cls=config.data_type,
+            data=data,
+            instruments=instruments,
+            client_id=ClientId(config.client_id) if config.client_id else None,
+        )
+
+    @classmethod
+    def load_shared_store(
+        cls,
+        config: BacktestDataConfig,
+        publish_instruments: bool = True,
+        publish_data: bool = True,
+    ) -> SharedDataStore:
+        """
+        Return the shared data store for the given data configuration.
+
+        The store is created if needed, and any catalog files for the configuration
+        which have not yet been published are published to the store.
+
+        Parameters
+        ----------
+        config : BacktestDataConfig
+            The data configuration with a `shared_store` name.
+        publish_instruments : bool, default True
+            If the instruments for the configuration should be published.
+        publish_data : bool, default True
+            If the data for the configuration should be published. Streaming runs read
+            their data through the catalog, so only publish data which is read from the store.
+
+        Returns
+        -------
+        SharedDataStore
+
+        """
+        PyCondition.not_none(config.shared_store, "config.shared_store")
+
+        # Imported here as the store loads `fsspec` and Parquet, only needed when sharing data
+        from nautilus_trader.persistence.shared import SharedDataStore
+
+        store = SharedDataStore.create(config.shared_store, root=config.shared_store_root)
+        catalog = cls.load_catalog(config)
+
+        if publish_data:
+            config_query = config.query
+            store.publish(
+                catalog=catalog,
+                data_cls=config.data_type,
+                identifiers=config_query["identifiers"] or None,
+                start=config_query["start"],
+                end=config_query["end"],
+            )
+
+        if publish_instruments:
+            used_instrument_ids = [str(i) for i in get_instrument_ids(config)]
+            store.publish_instruments(catalog, instrument_ids=used_instrument_ids or None)
+
+        return store
+
     @classmethod
     def load_catalog(cls, config: BacktestDataConfig) -> ParquetDataCatalog:
+        # Imported here as the catalog loads `fsspec` and Parquet, only needed when loading data
+        from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+
         return ParquetDataCatalog(
             path=config.catalog_path,
             fs_protocol=config.catalog_fs_protocol,
@@ -117,6 +117,7 @@ cdef class Cache(CacheFacade):
     cdef set _index_strategies
     cdef set _index_exec_algorithms
     cdef bint _drop_instruments_on_reset
+    cdef int _event_history_limit
     cdef Venue _specific_venue
 
     cdef readonly bint has_backing
@@ -111,6 +111,7 @@ cdef class Cache(CacheFacade):
 
         # Configuration
         self._drop_instruments_on_reset = config.drop_instruments_on_reset
+        self._event_history_limit = config.event_history_limit or 0
         self._specific_venue = None
         self.has_backing = database is not None
         self.persist_account_events = config.persist_account_events
@@ -400,6 +401,8 @@ cdef class Cache(CacheFacade):
         # Assign position IDs to contingent orders
         cdef Order order
         for order in self._orders.values():
+            if self._event_history_limit > 0:
+                order.set_event_history_limit(self._event_history_limit)
             if order.contingency_type == ContingencyType.OTO and order.position_id is not None:
                 self._assign_position_id_to_contingencies(order)
 
@@ -458,6 +461,11 @@ cdef class Cache(CacheFacade):
         else:
             self._positions = {}
 
+        cdef Position position
+        if self._event_history_limit > 0:
+            for position in self._positions.values():
+                position.set_event_history_limit(self._event_history_limit)
+
         cdef int count = len(self._positions)
         self._log.info(
             f"Cached {count} position{'' if count == 1 else 's'} from database",
@@ -2190,6 +2198,9 @@ cdef class Cache(CacheFacade):
             Condition.not_in(order.client_order_id, self._index_order_position, "order.client_order_id", "_index_order_position")
             Condition.not_in(order.client_order_id, self._index_order_strategy, "order.client_order_id", "_index_order_strategy")
 
+        if self._event_history_limit > 0:
+            order.set_event_history_limit(self._event_history_limit)
+
         self._orders[order.client_order_id] = order
         self._index_orders.add(order.client_order_id)
         self._index_order_strategy[order.client_order_id] = order.strategy_id
@@ -2373,6 +2384,9 @@ cdef class Cache(CacheFacade):
             Condition.not_in(position.id, self._index_positions, "position.id", "_index_positions")
             Condition.not_in(position.id, self._index_positions_open, "position.id", "_index_positions_open")
 
+        if self._event_history_limit > 0:
+            position.set_event_history_limit(self._event_history_limit)
+
         self._positions[position.id] = position
         self._index_positions.add(position.id)
         self._index_positions_open.add(position.id)
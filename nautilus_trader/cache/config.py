@@ -57,6 +57,11 @@ class CacheConfig(NautilusConfig, frozen=True):
         The maximum length for internal tick dequeues.
     bar_capacity : PositiveInt, default 10_000
         The maximum length for internal bar dequeues.
+    event_history_limit : PositiveInt, optional
+        The maximum number of recent events held in memory for each order and position.
+        Running aggregates and trade ID duplicate detection still cover the full history,
+        and full event histories are still written to the backing database (if configured).
+        If `None` then event histories are unbounded.
 
     """
 
@@ -72,3 +77,4 @@ class CacheConfig(NautilusConfig, frozen=True):
     drop_instruments_on_reset: bool = True
     tick_capacity: PositiveInt = 10_000
     bar_capacity: PositiveInt = 10_000
+    event_history_limit: PositiveInt | None = None
@@ -50,6 +50,9 @@ from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.common.component cimport is_logging_initialized
 from nautilus_trader.common.data_topics cimport TopicCache
+from nautilus_trader.common.profiling cimport HotPathProfiler
+from nautilus_trader.common.profiling cimport LatencyTracer
+from nautilus_trader.common.profiling cimport TraceStage
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.message cimport Event
@@ -4416,6 +4419,13 @@ cdef class Actor(Component):
         """
         Condition.not_none(tick, "tick")
 
+        cdef HotPathProfiler profiler
+        cdef LatencyTracer tracer = self._get_tracer()
+        cdef uint64_t start_ns
+
+        if tracer is not None and not historical:
+            tracer.stamp(TraceStage.STRATEGY)
+
         # Update indicators
         cdef list indicators = self._indicators_for_quotes.get(tick.instrument_id)
         if indicators:
@@ -4424,16 +4434,28 @@ cdef class Actor(Component):
         if historical:
             self.handle_historical_data(tick)
         elif self._fsm.state == ComponentState.RUNNING:
+            profiler = self._get_profiler()
+            start_ns = profiler.start_c() if profiler is not None else 0
             try:
                 self.on_quote_tick(tick)
             except Exception as e:
                 self.log.exception(f"Error on handling {repr(tick)}", e)
                 raise
+            if start_ns:
+                profiler.stop_c("callback", self.id.to_str(), "on_quote_tick", start_ns)
 
     cpdef void _handle_indicators_for_quote(self, list indicators, QuoteTick tick):
+        cdef HotPathProfiler profiler = self._get_profiler()
         cdef Indicator indicator
+        cdef uint64_t start_ns
         for indicator in indicators:
+            if profiler is None:
+                indicator.handle_quote_tick(tick)
+                continue
+            start_ns = profiler.start_c()
             indicator.handle_quote_tick(tick)
+            if start_ns:
+                profiler.stop_c("indicator", self.id.to_str(), repr(indicator), start_ns)
 
     cpdef void handle_historical_trade_tick(self, TradeTick tick):
         self.handle_trade_tick(tick, True)
@@ -4456,6 +4478,13 @@ cdef class Actor(Component):
         """
         Condition.not_none(tick, "tick")
 
+        cdef HotPathProfiler profiler
+        cdef LatencyTracer tracer = self._get_tracer()
+        cdef uint64_t start_ns
+
+        if tracer is not None and not historical:
+            tracer.stamp(TraceStage.STRATEGY)
+
         # Update indicators
         cdef list indicators = self._indicators_for_trades.get(tick.instrument_id)
         if indicators:
@@ -4464,16 +4493,28 @@ cdef class Actor(Component):
         if historical:
             self.handle_historical_data(tick)
         elif self._fsm.state == ComponentState.RUNNING:
+            profiler = self._get_profiler()
+            start_ns = profiler.start_c() if profiler is not None else 0
             try:
                 self.on_trade_tick(tick)
             except Exception as e:
                 self.log.exception(f"Error on handling {repr(tick)}", e)
                 raise
+            if start_ns:
+                profiler.stop_c("callback", self.id.to_str(), "on_trade_tick", start_ns)
 
     cpdef void _handle_indicators_for_trade(self, list indicators, TradeTick tick):
+        cdef HotPathProfiler profiler = self._get_profiler()
         cdef Indicator indicator
+        cdef uint64_t start_ns
         for indicator in indicators:
+            if profiler is None:
+                indicator.handle_trade_tick(tick)
+                continue
+            start_ns = profiler.start_c()
             indicator.handle_trade_tick(tick)
+            if start_ns:
+                profiler.stop_c("indicator", self.id.to_str(), repr(indicator), start_ns)
 
     cpdef void handle_mark_price(self, MarkPriceUpdate mark_price):
         """
@@ -4576,6 +4617,13 @@ cdef class Actor(Component):
         """
         Condition.not_none(bar, "bar")
 
+        cdef HotPathProfiler profiler
+        cdef LatencyTracer tracer = self._get_tracer()
+        cdef uint64_t start_ns
+
+        if tracer is not None and not historical:
+            tracer.stamp(TraceStage.STRATEGY)
+
         # Update indicators
         cdef list indicators = self._indicators_for_bars.get(bar.bar_type.id_spec_key())
         if indicators:
@@ -4584,16 +4632,28 @@ cdef class Actor(Component):
         if historical:
             self.handle_historical_data(bar)
         elif self._fsm.state == ComponentState.RUNNING:
+            profiler = self._get_profiler()
+            start_ns = profiler.start_c() if profiler is not None else 0
             try:
                 self.on_bar(bar)
             except Exception as e:
                 self.log.exception(f"Error on handling {repr(bar)}", e)
                 raise
+            if start_ns:
+                profiler.stop_c("callback", self.id.to_str(), "on_bar", start_ns)
 
     cpdef void _handle_indicators_for_bar(self, list indicators, Bar bar):
+        cdef HotPathProfiler profiler = self._get_profiler()
         cdef Indicator indicator
+        cdef uint64_t start_ns
         for indicator in indicators:
+            if profiler is None:
+                indicator.handle_bar(bar)
+                continue
+            start_ns = profiler.start_c()
             indicator.handle_bar(bar)
+            if start_ns:
+                profiler.stop_c("indicator", self.id.to_str(), repr(indicator), start_ns)
 
     cpdef void handle_option_greeks(self, OptionGreeks option_greeks):
         """
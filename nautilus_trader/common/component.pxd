@@ -22,6 +22,8 @@ from libc.stdint cimport int64_t
 from libc.stdint cimport uint32_t
 from libc.stdint cimport uint64_t
 
+from nautilus_trader.common.profiling cimport HotPathProfiler
+from nautilus_trader.common.profiling cimport LatencyTracer
 from nautilus_trader.core.fsm cimport FiniteStateMachine
 from nautilus_trader.core.message cimport Event
 from nautilus_trader.core.message cimport Request
@@ -237,6 +239,8 @@ cdef class Component:
 
     cdef void _change_clock(self, Clock clock)
     cdef void _change_msgbus(self, MessageBus msgbus)
+    cdef HotPathProfiler _get_profiler(self)
+    cdef LatencyTracer _get_tracer(self)
 
 # -- ABSTRACT METHODS -----------------------------------------------------------------------------
 
@@ -297,6 +301,10 @@ cdef class MessageBus:
     """The count of responses processed by the bus.\n\n:returns: `uint64_t`"""
     cdef readonly uint64_t pub_count
     """The count of messages published by the bus.\n\n:returns: `uint64_t`"""
+    cdef readonly HotPathProfiler profiler
+    """The hot-path profiler for the bus (if profiling is enabled).\n\n:returns: `HotPathProfiler` or ``None``"""
+    cdef readonly LatencyTracer tracer
+    """The tick-to-trade latency tracer for the bus (if tracing is enabled).\n\n:returns: `LatencyTracer` or ``None``"""
 
     cpdef list endpoints(self)
     cpdef list topics(self)
@@ -308,6 +316,8 @@ cdef class MessageBus:
     cpdef bint is_streaming_type(self, type cls)
 
     cpdef void dispose(self)
+    cpdef void set_profiler(self, HotPathProfiler profiler)
+    cpdef void set_tracer(self, LatencyTracer tracer)
     cpdef void register(self, str endpoint, handler)
     cpdef void deregister(self, str endpoint, handler)
     cpdef void add_streaming_type(self, type cls)
@@ -44,6 +44,8 @@ from libc.stdint cimport uint64_t
 
 from nautilus_trader.common.messages cimport ComponentStateChanged
 from nautilus_trader.common.messages cimport ShutdownSystem
+from nautilus_trader.common.profiling cimport HotPathProfiler
+from nautilus_trader.common.profiling cimport LatencyTracer
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport dt_to_unix_nanos
 from nautilus_trader.core.datetime cimport maybe_dt_to_unix_nanos
@@ -1891,6 +1893,18 @@ cdef class Component:
         self._msgbus = msgbus
         self._initialize()
 
+    cdef HotPathProfiler _get_profiler(self):
+        if self._msgbus is None:
+            return None
+
+        return self._msgbus.profiler
+
+    cdef LatencyTracer _get_tracer(self):
+        if self._msgbus is None:
+            return None
+
+        return self._msgbus.tracer
+
 # -- ABSTRACT METHODS -----------------------------------------------------------------------------
 
     cpdef void _start(self):
@@ -2351,6 +2365,9 @@ cdef class MessageBus:
         self.res_count = 0
         self.pub_count = 0
 
+        self.profiler = None
+        self.tracer = None
+
     cpdef list endpoints(self):
         """
         Return all endpoint addresses registered with the message bus.
@@ -2500,6 +2517,36 @@ cdef class MessageBus:
 
         self._log.info("Closed message bus")
 
+    cpdef void set_profiler(self, HotPathProfiler profiler):
+        """
+        Set the hot-path profiler for the bus.
+
+        Once set, subscription and endpoint handler calls are timed (sampled) by the
+        profiler, as are the callbacks of components registered with the bus.
+
+        Parameters
+        ----------
+        profiler : HotPathProfiler, optional
+            The profiler to set. If ``None`` then profiling is disabled.
+
+        """
+        self.profiler = profiler
+
+    cpdef void set_tracer(self, LatencyTracer tracer):
+        """
+        Set the tick-to-trade latency tracer for the bus.
+
+        Once set, sampled quote and trade ticks are traced through the data engine,
+        strategies, and the risk and execution engines.
+
+        Parameters
+        ----------
+        tracer : LatencyTracer, optional
+            The tracer to set. If ``None`` then tracing is disabled.
+
+        """
+        self.tracer = tracer
+
     cpdef void register(self, str endpoint, handler: Callable[[Any], None]):
         """
         Register the given `handler` to receive messages at the `endpoint` address.
@@ -2611,7 +2658,16 @@ cdef class MessageBus:
             )
             return  # Cannot send
 
-        handler(msg)
+        cdef HotPathProfiler profiler = self.profiler
+        cdef uint64_t start_ns
+        if profiler is None:
+            handler(msg)
+        else:
+            start_ns = profiler.start_c()
+            handler(msg)
+            if start_ns:
+                profiler.stop_handler_c("endpoint", endpoint, handler, start_ns)
+
         self.sent_count += 1
 
     cpdef void request(self, str endpoint, Request request):
@@ -2648,7 +2704,16 @@ cdef class MessageBus:
             )
             return  # Cannot handle
 
-        handler(request)
+        cdef HotPathProfiler profiler = self.profiler
+        cdef uint64_t start_ns
+        if profiler is None:
+            handler(request)
+        else:
+            start_ns = profiler.start_c()
+            handler(request)
+            if start_ns:
+                profiler.stop_handler_c("endpoint", endpoint, handler, start_ns)
+
         self.req_count += 1
 
     cpdef void response(self, Response response):
@@ -2829,9 +2894,19 @@ cdef class MessageBus:
         cdef:
             int i
             Subscription sub
-        for i in range(len(subs)):
-            sub = subs[i]
-            sub.handler(msg)
+            HotPathProfiler profiler = self.profiler
+            uint64_t start_ns
+        if profiler is None:
+            for i in range(len(subs)):
+                sub = subs[i]
+                sub.handler(msg)
+        else:
+            for i in range(len(subs)):
+                sub = subs[i]
+                start_ns = profiler.start_c()
+                sub.handler(msg)
+                if start_ns:
+                    profiler.stop_handler_c("handler", topic, sub.handler, start_ns)
 
         # Publish externally (if configured)
         cdef bytes payload_bytes = None
@@ -689,6 +689,80 @@ class LoggingConfig(NautilusConfig, frozen=True):
     buffered_stdout: bool = False
 
 
+class ProfilingConfig(NautilusConfig, frozen=True):
+    """
+    Configuration for the hot-path profiler of a ``NautilusKernel`` instance.
+
+    When configured, time spent in message bus handlers (by topic and endpoint),
+    actor and strategy callbacks, indicator updates, and engine entry points is
+    sampled into latency histograms, along with live engine queue waits.
+
+    Parameters
+    ----------
+    sample_rate : PositiveInt, default 1
+        Time one in every `sample_rate` profiled calls on average, sampled at random
+        (1 times every call).
+    log_report : bool, default True
+        If a report of the histograms with the most total time should be logged
+        when the kernel is disposed.
+    report_limit : PositiveInt, default 20
+        The maximum number of handler rows in the logged report.
+    output_path : str, optional
+        The file path to write a JSON snapshot of all histograms to when the kernel
+        is disposed. If ``None`` then no snapshot is written.
+
+    Notes
+    -----
+    Live engine queue waits are only available for engines configured with
+    `use_ring_buffer_queues` and `queue_latency_histograms` enabled.
+
+    """
+
+    sample_rate: PositiveInt = 1
+    log_report: bool = True
+    report_limit: PositiveInt = 20
+    output_path: str | None = None
+
+
+class LatencyTracingConfig(NautilusConfig, frozen=True):
+    """
+    Configuration for tick-to-trade latency tracing of a ``NautilusKernel`` instance.
+
+    When configured, sampled quote and trade ticks are stamped at each stage boundary
+    from their `ts_init` through the data engine, message bus, strategy, risk engine,
+    execution engine and execution client send, with the latency of each stage
+    aggregated into histograms.
+
+    Parameters
+    ----------
+    sample_rate : PositiveInt, default 1
+        Trace one in every `sample_rate` quote and trade ticks on each thread (1 traces every tick).
+    max_pending : PositiveInt, default 10_000
+        The maximum number of traced orders awaiting their execution client send.
+    log_report : bool, default True
+        If a report of the per-stage latencies should be logged when the kernel is
+        disposed.
+    output_path : str, optional
+        The file path to write a JSON snapshot of the per-stage latencies to when the
+        kernel is disposed. If ``None`` then no snapshot is written.
+    catalog_name : str, optional
+        The name of the kernel data catalog to write the per-stage latencies to (as
+        Parquet) when the kernel is disposed. If ``None`` then none are written.
+
+    Notes
+    -----
+    Stages are stamped with the kernel clock relative to the tick `ts_init`, so the
+    latencies are only meaningful for live trading.
+
+    """
+
+    sample_rate: PositiveInt = 1
+    max_pending: PositiveInt = 10_000
+    log_report: bool = True
+    output_path: str | None = None
+    catalog_name: str | None = None
+
+
 class ImportableFactoryConfig(NautilusConfig, frozen=True):
     """
     Represents an importable (JSON) factory config.
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.model.identifiers cimport ClientOrderId
 from nautilus_trader.model.identifiers cimport OrderListId
@@ -23,12 +25,16 @@ from nautilus_trader.model.identifiers cimport StrategyId
 cdef class IdentifierGenerator:
     cdef Clock _clock
     cdef str _id_tag_trader
+    cdef str _datetime_tag
+    cdef uint64_t _datetime_tag_secs
 
     cdef str _get_datetime_tag(self)
 
 
 cdef class ClientOrderIdGenerator(IdentifierGenerator):
     cdef str _id_tag_strategy
+    cdef str _prefix
+    cdef str _prefix_datetime_tag
 
     cdef readonly int count
     """The count of IDs generated.\n\n:returns: `int`"""
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from cpython.datetime cimport datetime
+from libc.stdint cimport uint64_t
 
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.core.correctness cimport Condition
@@ -39,18 +40,27 @@ cdef class IdentifierGenerator:
     def __init__(self, TraderId trader_id not None, Clock clock not None):
         self._clock = clock
         self._id_tag_trader = trader_id.get_tag()
+        self._datetime_tag = None
+        self._datetime_tag_secs = 0
 
     cdef str _get_datetime_tag(self):
         """
         Return the tag string for the current timestamp (UTC).
 
+        The tag has a resolution of one second, so it is cached and only
+        rebuilt when the clock moves into a new second.
+
         Returns
         -------
         str
 
         """
+        cdef uint64_t secs = self._clock.timestamp_ns() // 1_000_000_000
+        if self._datetime_tag is not None and secs == self._datetime_tag_secs:
+            return self._datetime_tag
+
         cdef datetime now = self._clock.utc_now()
-        return (
+        self._datetime_tag = (
             f"{now.year}"
             f"{now.month:02d}"
             f"{now.day:02d}-"
@@ -58,6 +68,8 @@ cdef class IdentifierGenerator:
             f"{now.minute:02d}"
             f"{now.second:02d}"
         )
+        self._datetime_tag_secs = secs
+        return self._datetime_tag
 
 
 cdef class ClientOrderIdGenerator(IdentifierGenerator):
@@ -98,6 +110,8 @@ cdef class ClientOrderIdGenerator(IdentifierGenerator):
         super().__init__(trader_id, clock)
 
         self._id_tag_strategy = strategy_id.get_tag()
+        self._prefix = None
+        self._prefix_datetime_tag = None
         self.count = initial_count
         self.use_uuids = use_uuids
         self.use_hyphens = use_hyphens
@@ -132,23 +146,25 @@ cdef class ClientOrderIdGenerator(IdentifierGenerator):
                 client_order_id_value = client_order_id_value.replace("-", "")
         else:
             self.count += 1
-            if not self.use_hyphens:
-                datetime_tag = self._get_datetime_tag().replace("-", "")
-                client_order_id_value = (
-                    f"O"
-                    f"{datetime_tag}"
-                    f"{self._id_tag_trader}"
-                    f"{self._id_tag_strategy}"
-                    f"{self.count}"
-                )
-            else:
-                client_order_id_value = (
-                    f"O-"
-                    f"{self._get_datetime_tag()}-"
-                    f"{self._id_tag_trader}-"
-                    f"{self._id_tag_strategy}-"
-                    f"{self.count}"
-                )
+            datetime_tag = self._get_datetime_tag()
+            if datetime_tag is not self._prefix_datetime_tag:
+                # Rebuild the cached prefix when the datetime tag changes
+                self._prefix_datetime_tag = datetime_tag
+                if not self.use_hyphens:
+                    self._prefix = (
+                        f"O"
+                        f"{datetime_tag.replace('-', '')}"
+                        f"{self._id_tag_trader}"
+                        f"{self._id_tag_strategy}"
+                    )
+                else:
+                    self._prefix = (
+                        f"O-"
+                        f"{datetime_tag}-"
+                        f"{self._id_tag_trader}-"
+                        f"{self._id_tag_strategy}-"
+                    )
+            client_order_id_value = f"{self._prefix}{self.count}"
 
         return ClientOrderId(client_order_id_value)
 
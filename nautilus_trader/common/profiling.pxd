@@ -0,0 +1,100 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.model.identifiers cimport ClientOrderId
+
+
+cpdef enum TraceStage:
+    TS_INIT = 0
+    DATA_ENGINE = 1
+    MSGBUS = 2
+    STRATEGY = 3
+    SUBMIT_ORDER = 4
+    RISK_ENGINE = 5
+    EXEC_ENGINE = 6
+    EXEC_CLIENT = 7
+
+
+cdef class LatencyHistogram:
+    cdef uint64_t _buckets[64]
+
+    cdef readonly uint64_t count
+    """The count of recorded durations.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t total_ns
+    """The total of recorded durations (nanoseconds).\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t min_ns
+    """The minimum recorded duration (nanoseconds).\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t max_ns
+    """The maximum recorded duration (nanoseconds).\n\n:returns: `uint64_t`"""
+
+    cdef void record_c(self, uint64_t duration_ns)
+    cpdef void record(self, uint64_t duration_ns)
+    cpdef void merge(self, LatencyHistogram other)
+    cpdef uint64_t percentile(self, double q)
+    cpdef dict buckets(self)
+    cpdef dict to_dict(self)
+    cpdef void reset(self)
+
+
+cdef class HotPathProfiler:
+    cdef uint64_t _rng_state
+    cdef dict _histograms
+    cdef dict _handler_keys
+    cdef list _queue_sources
+
+    cdef readonly uint64_t sample_rate
+    """The profiler sample rate (one in every `sample_rate` calls is timed on average).\n\n:returns: `uint64_t`"""
+
+    cdef uint64_t start_c(self)
+    cdef void stop_c(self, str kind, str source, str name, uint64_t start_ns)
+    cdef void stop_handler_c(self, str kind, str source, handler, uint64_t start_ns)
+
+    cpdef void call(self, str kind, str source, str name, handler, msg)
+    cpdef void record(self, str kind, str source, str name, uint64_t duration_ns)
+    cpdef void add_queue_source(self, str source, histograms)
+    cpdef LatencyHistogram histogram(self, str kind, str source, str name)
+    cpdef list snapshot(self)
+    cpdef str report(self, int limit=*)
+    cpdef void dump(self, str path)
+    cpdef void reset(self)
+
+
+cdef class LatencyTracer:
+    cdef object _clock
+    cdef object _buffer
+    cdef list _buffers
+    cdef dict _pending
+    cdef object _lock
+
+    cdef readonly uint64_t sample_rate
+    """The tracer sample rate (one in every `sample_rate` ticks on each thread is traced).\n\n:returns: `uint64_t`"""
+    cdef readonly int max_pending
+    """The maximum number of traced orders awaiting their execution client send.\n\n:returns: `int`"""
+
+    cdef void _stamp(self, dict histograms, list trace, int stage)
+
+    cpdef bint begin(self, uint64_t ts_init)
+    cpdef void stamp(self, TraceStage stage)
+    cpdef void end(self)
+    cpdef void attach(self, ClientOrderId client_order_id)
+    cpdef void stamp_order(self, ClientOrderId client_order_id, TraceStage stage)
+    cpdef LatencyHistogram histogram(self, str stage)
+    cpdef list snapshot(self)
+    cpdef str report(self)
+    cpdef void dump(self, str path)
+    cpdef void write_catalog(self, catalog, str name)
+    cpdef void reset(self)
@@ -0,0 +1,904 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import threading
+from operator import itemgetter
+from pathlib import Path
+from time import perf_counter_ns
+
+import msgspec
+
+from libc.math cimport ceil
+from libc.stdint cimport uint64_t
+from libc.string cimport memset
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.model.identifiers cimport ClientOrderId
+
+
+cdef int _BUCKETS = 64
+cdef uint64_t _UINT64_MAX = 0xFFFFFFFFFFFFFFFF
+cdef uint64_t _RNG_SEED = 0x9E3779B97F4A7C15
+cdef uint64_t _RNG_MULTIPLIER = 0x2545F4914F6CDD1D
+
+
+cdef inline int _bucket_index(uint64_t duration_ns) noexcept nogil:
+    # Bucket `i` counts durations in (2^(i - 1), 2^i] nanoseconds, matching the
+    # live engine queue latency histograms
+    cdef uint64_t value = duration_ns - 1 if duration_ns > 0 else 0
+    cdef int index = 0
+    while value:
+        value >>= 1
+        index += 1
+    return index if index < _BUCKETS else _BUCKETS - 1
+
+
+cdef class LatencyHistogram:
+    """
+    Provides a histogram of durations with power of two nanosecond buckets.
+
+    Recording is O(1) with a fixed memory footprint, percentiles are resolved to the
+    upper bound of the bucket they fall in (capped at the maximum recorded duration).
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"count={self.count}, "
+            f"mean_ns={self.mean_ns:.1f}, "
+            f"p50_ns={self.percentile(0.5)}, "
+            f"p99_ns={self.percentile(0.99)}, "
+            f"max_ns={self.max_ns})"
+        )
+
+    @property
+    def mean_ns(self) -> float:
+        """
+        Return the mean recorded duration (nanoseconds).
+
+        Returns
+        -------
+        float
+
+        """
+        if self.count == 0:
+            return 0.0
+
+        return self.total_ns / self.count
+
+    cdef void record_c(self, uint64_t duration_ns):
+        self._buckets[_bucket_index(duration_ns)] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+
+        if duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+    cpdef void record(self, uint64_t duration_ns):
+        """
+        Record the given duration.
+
+        Parameters
+        ----------
+        duration_ns : uint64_t
+            The duration (nanoseconds) to record.
+
+        """
+        self.record_c(duration_ns)
+
+    cpdef void merge(self, LatencyHistogram other):
+        """
+        Merge the durations recorded by the given histogram into this histogram.
+
+        Parameters
+        ----------
+        other : LatencyHistogram
+            The histogram to merge.
+
+        """
+        Condition.not_none(other, "other")
+
+        if other.count == 0:
+            return
+
+        cdef int i
+        for i in range(_BUCKETS):
+            self._buckets[i] += other._buckets[i]
+
+        self.count += other.count
+        self.total_ns += other.total_ns
+
+        if other.min_ns < self.min_ns:
+            self.min_ns = other.min_ns
+        if other.max_ns > self.max_ns:
+            self.max_ns = other.max_ns
+
+    cpdef uint64_t percentile(self, double q):
+        """
+        Return the approximate duration at the given percentile.
+
+        Parameters
+        ----------
+        q : double
+            The percentile in the range [0, 1].
+
+        Returns
+        -------
+        uint64_t
+
+        Raises
+        ------
+        ValueError
+            If `q` is not in range [0, 1].
+
+        """
+        Condition.in_range(q, 0.0, 1.0, "q")
+
+        if self.count == 0:
+            return 0
+
+        cdef uint64_t rank = <uint64_t>ceil(q * self.count)
+        if rank == 0:
+            return self.min_ns
+
+        cdef uint64_t cumulative = 0
+        cdef uint64_t upper_bound
+        cdef int i
+        for i in range(_BUCKETS):
+            cumulative += self._buckets[i]
+            if cumulative >= rank:
+                upper_bound = (<uint64_t>1) << i
+                return upper_bound if upper_bound < self.max_ns else self.max_ns
+
+        return self.max_ns
+
+    cpdef dict buckets(self):
+        """
+        Return the non-empty buckets.
+
+        The keys are the upper bounds of each bucket in nanoseconds (powers of two).
+
+        Returns
+        -------
+        dict[int, int]
+
+        """
+        cdef int i
+        return {(<uint64_t>1) << i: self._buckets[i] for i in range(_BUCKETS) if self._buckets[i]}
+
+    cpdef dict to_dict(self):
+        """
+        Return a dictionary summary of the histogram.
+
+        Returns
+        -------
+        dict[str, object]
+
+        """
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "mean_ns": self.mean_ns,
+            "min_ns": self.min_ns if self.count else 0,
+            "p50_ns": self.percentile(0.5),
+            "p90_ns": self.percentile(0.9),
+            "p99_ns": self.percentile(0.99),
+            "max_ns": self.max_ns,
+        }
+
+    cpdef void reset(self):
+        """
+        Reset the histogram, clearing all recorded durations.
+        """
+        memset(self._buckets, 0, sizeof(self._buckets))
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = _UINT64_MAX
+        self.max_ns = 0
+
+
+cdef class HotPathProfiler:
+    """
+    Provides low-overhead timing of hot-path handlers and callbacks, aggregated into
+    a `LatencyHistogram` per (kind, source, name) key.
+
+    The profiler is attached to the `MessageBus`, and timings are sampled for:
+     - ``handler``: each subscription handler by topic (on publish).
+     - ``endpoint``: each registered endpoint handler (on send and request).
+     - ``callback``: actor and strategy data and event callbacks.
+     - ``indicator``: indicator updates registered by actors and strategies.
+     - ``engine``: the data, risk and execution engine entry points.
+     - ``queue``: live engine internal queue waits (when latency histograms are enabled).
+
+    Timings are inclusive of any nested handlers (e.g. a strategy submitting an order
+    from `on_quote_tick` includes the risk and execution engine handling).
+
+    Parameters
+    ----------
+    sample_rate : int, default 1
+        Time one in every `sample_rate` profiled calls on average (1 times every call).
+
+    Raises
+    ------
+    ValueError
+        If `sample_rate` is not positive.
+
+    Notes
+    -----
+    Calls are sampled at random (with a fixed seed) rather than every Nth call, so a
+    call site whose calls recur with a period sharing a factor with `sample_rate`
+    (e.g. handlers always called in the same order) is not over or under sampled.
+
+    """
+
+    def __init__(self, int sample_rate = 1) -> None:
+        Condition.positive_int(sample_rate, "sample_rate")
+
+        self.sample_rate = sample_rate
+
+        self._rng_state = _RNG_SEED
+        self._histograms: dict[tuple[str, str, str], LatencyHistogram] = {}
+        self._handler_keys: dict[tuple[str, str, int], tuple] = {}
+        self._queue_sources: list[tuple[str, object]] = []
+
+    cdef uint64_t start_c(self):
+        if self.sample_rate == 1:
+            return perf_counter_ns()
+
+        # xorshift64* step, cheap enough for the hot path
+        self._rng_state ^= self._rng_state >> 12
+        self._rng_state ^= self._rng_state << 25
+        self._rng_state ^= self._rng_state >> 27
+        if (self._rng_state * _RNG_MULTIPLIER) % self.sample_rate:
+            return 0  # Not sampled
+
+        return perf_counter_ns()
+
+    cdef void stop_c(self, str kind, str source, str name, uint64_t start_ns):
+        cdef uint64_t duration_ns = perf_counter_ns() - start_ns
+        self.record(kind, source, name, duration_ns)
+
+    cdef void stop_handler_c(self, str kind, str source, handler, uint64_t start_ns):
+        cdef uint64_t duration_ns = perf_counter_ns() - start_ns
+
+        # Handler names are resolved once, the cache holds the handler so its ID
+        # cannot be reused while the entry exists
+        cdef tuple handler_key = (kind, source, id(handler))
+        cdef tuple entry = self._handler_keys.get(handler_key)
+        if entry is None:
+            entry = ((kind, source, _handler_name(handler)), handler)
+            self._handler_keys[handler_key] = entry
+
+        cdef tuple key = entry[0]
+        cdef LatencyHistogram histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self._histograms[key] = histogram
+
+        histogram.record_c(duration_ns)
+
+    cpdef void call(self, str kind, str source, str name, handler, msg):
+        """
+        Call the given handler with the message, timing the call if sampled.
+
+        Parameters
+        ----------
+        kind : str
+            The kind of the profiled call.
+        source : str
+            The source of the profiled call (e.g. a topic or component ID).
+        name : str
+            The name of the profiled call.
+        handler : Callable[[Any], None]
+            The handler to call.
+        msg : object
+            The message for the handler.
+
+        """
+        cdef uint64_t start_ns = self.start_c()
+        handler(msg)
+        if start_ns:
+            self.stop_c(kind, source, name, start_ns)
+
+    cpdef void record(self, str kind, str source, str name, uint64_t duration_ns):
+        """
+        Record the given duration for the key.
+
+        Parameters
+        ----------
+        kind : str
+            The kind of the profiled call.
+        source : str
+            The source of the profiled call (e.g. a topic or component ID).
+        name : str
+            The name of the profiled call.
+        duration_ns : uint64_t
+            The duration (nanoseconds) to record.
+
+        """
+        cdef tuple key = (kind, source, name)
+        cdef LatencyHistogram histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self._histograms[key] = histogram
+
+        histogram.record_c(duration_ns)
+
+    cpdef void add_queue_source(self, str source, histograms):
+        """
+        Add the given source of queue latency histograms.
+
+        Parameters
+        ----------
+        source : str
+            The source of the queues (e.g. an engine component ID).
+        histograms : Callable[[], dict[str, dict[int, int]]]
+            The callable which returns the current queue latency histograms keyed by
+            queue name (e.g. `LiveDataEngine.queue_latency_histograms`).
+
+        """
+        Condition.valid_string(source, "source")
+        Condition.callable(histograms, "histograms")
+
+        self._queue_sources.append((source, histograms))
+
+    cpdef LatencyHistogram histogram(self, str kind, str source, str name):
+        """
+        Return the histogram for the given key (if found).
+
+        Parameters
+        ----------
+        kind : str
+            The kind of the profiled call.
+        source : str
+            The source of the profiled call (e.g. a topic or component ID).
+        name : str
+            The name of the profiled call.
+
+        Returns
+        -------
+        LatencyHistogram or ``None``
+
+        """
+        return self._histograms.get((kind, source, name))
+
+    cpdef list snapshot(self):
+        """
+        Return a snapshot of all histograms, ordered by total time descending.
+
+        Queue rows are derived from the live engine queue histograms, which only
+        record bucket counts, so their total, mean and minimum are ``None``.
+
+        Returns
+        -------
+        list[dict[str, object]]
+
+        """
+        cdef list rows = []
+
+        cdef tuple key
+        cdef LatencyHistogram histogram
+        for key, histogram in self._histograms.items():
+            row = {"kind": key[0], "source": key[1], "name": key[2]}
+            row.update(histogram.to_dict())
+            rows.append(row)
+
+        rows.sort(key=itemgetter("total_ns"), reverse=True)
+
+        cdef list queue_rows = []
+        for source, histograms in self._queue_sources:
+            for name, counts in histograms().items():
+                queue_rows.append(_queue_row(source, name, counts))
+
+        queue_rows.sort(key=itemgetter("count"), reverse=True)
+
+        return rows + queue_rows
+
+    cpdef str report(self, int limit = 20):
+        """
+        Return a formatted report of the histograms with the most total time.
+
+        Parameters
+        ----------
+        limit : int, default 20
+            The maximum number of handler rows (queue rows are always included).
+
+        Returns
+        -------
+        str
+
+        """
+        Condition.positive_int(limit, "limit")
+
+        cdef list rows = self.snapshot()
+        cdef list timed = [r for r in rows if r["kind"] != "queue"][:limit]
+        cdef list queues = [r for r in rows if r["kind"] == "queue"]
+
+        cdef list lines = [
+            f"{'kind':<10} {'source':<32} {'name':<40} {'count':>10} "
+            f"{'total_ms':>10} {'mean_us':>10} {'p50_us':>10} {'p99_us':>10} {'max_us':>10}",
+        ]
+        for row in timed + queues:
+            lines.append(
+                f"{row['kind']:<10} {_truncate(row['source'], 32):<32} "
+                f"{_truncate(row['name'], 40):<40} {row['count']:>10} "
+                f"{_fmt(row['total_ns'], 1_000_000, 3):>10} {_fmt(row['mean_ns'], 1_000):>10} "
+                f"{_fmt(row['p50_ns'], 1_000):>10} {_fmt(row['p99_ns'], 1_000):>10} "
+                f"{_fmt(row['max_ns'], 1_000):>10}",
+            )
+
+        return "\n".join(lines)
+
+    cpdef void dump(self, str path):
+        """
+        Write a JSON snapshot of all histograms to the given file path.
+
+        Parameters
+        ----------
+        path : str
+            The file path to write to (parent directories are created).
+
+        """
+        Condition.valid_string(path, "path")
+
+        file_path = Path(path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(msgspec.json.encode(self.snapshot()))
+
+    cpdef void reset(self):
+        """
+        Reset the profiler, clearing all histograms.
+        """
+        self._rng_state = _RNG_SEED
+        self._histograms.clear()
+        self._handler_keys.clear()
+
+
+_STAGE_NAMES = (
+    "ts_init",
+    "data_engine",
+    "msgbus",
+    "strategy",
+    "submit_order",
+    "risk_engine",
+    "exec_engine",
+    "exec_client",
+    "tick_to_trade",
+)
+cdef int _TICK_TO_TRADE = 8
+
+
+class _TraceBuffer(threading.local):
+    # Per-thread trace state, sample counter and histograms, so stamping a tick
+    # never contends on a lock
+
+    def __init__(self, list registry) -> None:
+        self.trace = None
+        self.counter = 0
+        self.histograms = {}
+        registry.append(self.histograms)
+
+
+cdef class LatencyTracer:
+    """
+    Provides tick-to-trade latency tracing across the live data and execution paths.
+
+    A sampled quote or trade tick starts a trace which is stamped at each stage
+    boundary, with the latency of each stage (from the previous stamped stage)
+    recorded into a `LatencyHistogram`:
+     - ``data_engine``: from the tick `ts_init` to the `DataEngine` handler (adapter and queue).
+     - ``msgbus``: from the `DataEngine` handler to the `MessageBus` publish.
+     - ``strategy``: from the publish to the actor or strategy data handler.
+     - ``submit_order``: from the data handler to `Strategy.submit_order`.
+     - ``risk_engine``: from the submit to the `RiskEngine` command handler.
+     - ``exec_engine``: from the `RiskEngine` to the `ExecutionEngine` command handler.
+     - ``exec_client``: from the `ExecutionEngine` to the execution client send.
+     - ``tick_to_trade``: from the tick `ts_init` to the execution client send.
+
+    The active trace, sample counter and histograms are held per thread, so the
+    stages of a tick are stamped without locking. A trace is carried from the
+    strategy to the engines by client order ID for orders submitted directly to
+    the `RiskEngine` (emulated and exec algorithm orders are not traced). These
+    pending order traces are shared across threads and guarded by a lock, with
+    the order stages recorded into the histograms of the thread which handles the
+    order command. The `histogram`, `snapshot` and `report` methods merge the
+    histograms across all threads.
+
+    Parameters
+    ----------
+    clock : Clock
+        The clock for stamping, should be the same clock which initializes data.
+    sample_rate : int, default 1
+        Trace one in every `sample_rate` ticks on each thread (1 traces every tick).
+    max_pending : int, default 10_000
+        The maximum number of traced orders awaiting their execution client send,
+        the oldest are discarded beyond this (e.g. orders denied by risk checks).
+
+    Raises
+    ------
+    ValueError
+        If `sample_rate` is not positive.
+    ValueError
+        If `max_pending` is not positive.
+
+    """
+
+    def __init__(
+        self,
+        clock not None,
+        int sample_rate = 1,
+        int max_pending = 10_000,
+    ) -> None:
+        Condition.positive_int(sample_rate, "sample_rate")
+        Condition.positive_int(max_pending, "max_pending")
+
+        self.sample_rate = sample_rate
+        self.max_pending = max_pending
+
+        self._clock = clock
+        self._buffers: list[dict[int, LatencyHistogram]] = []
+        self._buffer = _TraceBuffer(self._buffers)
+        self._pending: dict[ClientOrderId, list[int]] = {}
+        self._lock = threading.Lock()
+
+    cdef void _stamp(self, dict histograms, list trace, int stage):
+        cdef uint64_t now = self._clock.timestamp_ns()
+        trace[stage] = now
+
+        # Stages may be skipped (e.g. a tick handled by a component without a
+        # data handler stamp), so measure from the previous stamped stage
+        cdef int previous = stage - 1
+        while previous > TraceStage.TS_INIT and trace[previous] == 0:
+            previous -= 1
+
+        cdef uint64_t previous_ns = trace[previous]
+        cdef LatencyHistogram histogram = histograms.get(stage)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            histograms[stage] = histogram
+
+        histogram.record_c(now - previous_ns if now > previous_ns else 0)
+
+    cpdef bint begin(self, uint64_t ts_init):
+        """
+        Begin a trace for a tick on the current thread (if sampled).
+
+        A trace is not started if one is already active on the thread (e.g. for
+        synthetic instrument ticks derived from the traced tick).
+
+        Parameters
+        ----------
+        ts_init : uint64_t
+            The UNIX timestamp (nanoseconds) when the tick was initialized.
+
+        Returns
+        -------
+        bool
+            True if a trace was started (and so should be ended by the caller).
+
+        """
+        buffer = self._buffer
+        if buffer.trace is not None:
+            return False
+
+        buffer.counter += 1
+        if buffer.counter < self.sample_rate:
+            return False  # Not sampled
+
+        buffer.counter = 0
+
+        cdef list trace = [0] * _TICK_TO_TRADE
+        trace[TraceStage.TS_INIT] = ts_init
+        buffer.trace = trace
+
+        self._stamp(buffer.histograms, trace, TraceStage.DATA_ENGINE)
+        return True
+
+    cpdef void stamp(self, TraceStage stage):
+        """
+        Stamp the given stage of the active trace on the current thread (if any).
+
+        Parameters
+        ----------
+        stage : TraceStage
+            The stage reached.
+
+        """
+        buffer = self._buffer
+        cdef list trace = buffer.trace
+        if trace is None:
+            return
+
+        self._stamp(buffer.histograms, trace, stage)
+
+    cpdef void end(self):
+        """
+        End the active trace on the current thread.
+        """
+        self._buffer.trace = None
+
+    cpdef void attach(self, ClientOrderId client_order_id):
+        """
+        Attach the active trace on the current thread to the given order.
+
+        The ``submit_order`` stage is stamped, and the trace is then carried to the
+        engines by the client order ID.
+
+        Parameters
+        ----------
+        client_order_id : ClientOrderId
+            The client order ID of the submitted order.
+
+        """
+        buffer = self._buffer
+        cdef list trace = buffer.trace
+        if trace is None:
+            return
+
+        # Copy as several orders may be submitted for the same tick
+        trace = list(trace)
+        self._stamp(buffer.histograms, trace, TraceStage.SUBMIT_ORDER)
+
+        with self._lock:
+            self._pending[client_order_id] = trace
+            if len(self._pending) > self.max_pending:
+                self._pending.pop(next(iter(self._pending)))  # Discard oldest
+
+    cpdef void stamp_order(self, ClientOrderId client_order_id, TraceStage stage):
+        """
+        Stamp the given stage of the trace attached to the order (if any).
+
+        The stage is recorded into the histograms of the current thread, and stamping
+        the ``exec_client`` stage completes the trace.
+
+        Parameters
+        ----------
+        client_order_id : ClientOrderId
+            The client order ID for the trace.
+        stage : TraceStage
+            The stage reached.
+
+        """
+        cdef list trace
+        with self._lock:
+            if stage == TraceStage.EXEC_CLIENT:
+                trace = self._pending.pop(client_order_id, None)
+            else:
+                trace = self._pending.get(client_order_id)
+
+        if trace is None:
+            return
+
+        # The stages of an order are handled in sequence, so the trace is only
+        # stamped by one thread at a time
+        cdef dict histograms = self._buffer.histograms
+        self._stamp(histograms, trace, stage)
+
+        if stage != TraceStage.EXEC_CLIENT:
+            return
+
+        cdef uint64_t ts_init = trace[TraceStage.TS_INIT]
+        cdef uint64_t now = trace[TraceStage.EXEC_CLIENT]
+        cdef LatencyHistogram histogram = histograms.get(_TICK_TO_TRADE)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            histograms[_TICK_TO_TRADE] = histogram
+
+        histogram.record_c(now - ts_init if now > ts_init else 0)
+
+    cpdef LatencyHistogram histogram(self, str stage):
+        """
+        Return the histogram for the given stage, merged across all threads.
+
+        Parameters
+        ----------
+        stage : str
+            The stage name (e.g. 'risk_engine' or 'tick_to_trade').
+
+        Returns
+        -------
+        LatencyHistogram
+
+        Raises
+        ------
+        KeyError
+            If `stage` is not a valid stage name.
+
+        """
+        Condition.is_in(stage, _STAGE_NAMES[TraceStage.DATA_ENGINE:], "stage", "stages")
+
+        cdef int index = _STAGE_NAMES.index(stage)
+        cdef LatencyHistogram merged = LatencyHistogram()
+
+        cdef dict histograms
+        cdef LatencyHistogram histogram
+        for histograms in list(self._buffers):
+            histogram = histograms.get(index)
+            if histogram is not None:
+                merged.merge(histogram)
+
+        return merged
+
+    cpdef list snapshot(self):
+        """
+        Return a snapshot of the per-stage latencies, in stage order.
+
+        Only stages with recorded latencies are included.
+
+        Returns
+        -------
+        list[dict[str, object]]
+
+        """
+        cdef list rows = []
+
+        cdef LatencyHistogram histogram
+        for stage in _STAGE_NAMES[TraceStage.DATA_ENGINE:]:
+            histogram = self.histogram(stage)
+            if histogram.count == 0:
+                continue
+
+            row = {"stage": stage}
+            row.update(histogram.to_dict())
+            rows.append(row)
+
+        return rows
+
+    cpdef str report(self):
+        """
+        Return a formatted report of the per-stage latencies.
+
+        Returns
+        -------
+        str
+
+        """
+        cdef list lines = [
+            f"{'stage':<14} {'count':>10} {'mean_us':>10} {'p50_us':>10} "
+            f"{'p90_us':>10} {'p99_us':>10} {'max_us':>10}",
+        ]
+        for row in self.snapshot():
+            lines.append(
+                f"{row['stage']:<14} {row['count']:>10} {_fmt(row['mean_ns'], 1_000):>10} "
+                f"{_fmt(row['p50_ns'], 1_000):>10} {_fmt(row['p90_ns'], 1_000):>10} "
+                f"{_fmt(row['p99_ns'], 1_000):>10} {_fmt(row['max_ns'], 1_000):>10}",
+            )
+
+        return "\n".join(lines)
+
+    cpdef void dump(self, str path):
+        """
+        Write a JSON snapshot of the per-stage latencies to the given file path.
+
+        Parameters
+        ----------
+        path : str
+            The file path to write to (parent directories are created).
+
+        """
+        Condition.valid_string(path, "path")
+
+        file_path = Path(path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(msgspec.json.encode(self.snapshot()))
+
+    cpdef void write_catalog(self, catalog, str name):
+        """
+        Write the per-stage latencies to the given data catalog as a Parquet file.
+
+        The file is written to ``{catalog.path}/latency/{name}.parquet`` using the
+        catalogs filesystem.
+
+        Parameters
+        ----------
+        catalog : ParquetDataCatalog
+            The catalog to write to.
+        name : str
+            The file name (without extension), e.g. the trader and instance ID.
+
+        """
+        Condition.not_none(catalog, "catalog")
+        Condition.valid_string(name, "name")
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        directory = f"{catalog.path}/latency"
+        catalog.fs.mkdirs(directory, exist_ok=True)
+        pq.write_table(
+            pa.Table.from_pylist(self.snapshot()),
+            f"{directory}/{name}.parquet",
+            filesystem=catalog.fs,
+        )
+
+    cpdef void reset(self):
+        """
+        Reset the tracer, clearing all histograms and pending order traces.
+
+        The sample counter is reset for the current thread only.
+        """
+        self._buffer.counter = 0
+        with self._lock:
+            self._pending.clear()
+
+        cdef dict histograms
+        for histograms in list(self._buffers):
+            histograms.clear()
+
+
+cdef str _handler_name(handler):
+    name = getattr(handler, "__name__", None) or type(handler).__name__
+    owner = getattr(handler, "__self__", None)
+    if owner is None:
+        return getattr(handler, "__qualname__", name)
+
+    owner_id = getattr(owner, "id", None)
+    if owner_id is None or callable(owner_id):
+        owner_id = type(owner).__name__
+
+    return f"{owner_id}.{name}"
+
+
+cdef dict _queue_row(str source, str name, dict counts):
+    cdef uint64_t total = sum(counts.values())
+    cdef list bounds = sorted([b for b, c in counts.items() if c])
+
+    cdef dict row = {
+        "kind": "queue",
+        "source": source,
+        "name": name,
+        "count": total,
+        "total_ns": None,
+        "mean_ns": None,
+        "min_ns": None,
+        "p50_ns": _bounds_percentile(counts, total, 0.5),
+        "p90_ns": _bounds_percentile(counts, total, 0.9),
+        "p99_ns": _bounds_percentile(counts, total, 0.99),
+        "max_ns": bounds[-1] if bounds else 0,
+    }
+    return row
+
+
+cdef uint64_t _bounds_percentile(dict counts, uint64_t total, double q):
+    if total == 0:
+        return 0
+
+    cdef uint64_t rank = max(1, <uint64_t>ceil(q * total))
+    cdef uint64_t cumulative = 0
+    for bound in sorted(counts):
+        cumulative += counts[bound]
+        if cumulative >= rank:
+            return bound
+
+    return 0
+
+
+cdef str _truncate(str value, int width):
+    if len(value) <= width:
+        return value
+
+    return value[:width - 3] + "..."
+
+
+cdef str _fmt(value, int divisor, int precision = 1):
+    if value is None:
+        return "-"
+
+    return f"{value / divisor:.{precision}f}"
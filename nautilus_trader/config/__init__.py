@@ -44,6 +44,7 @@ from nautilus_trader.common.config import ImportableActorConfig
 from nautilus_trader.common.config import ImportableConfig
 from nautilus_trader.common.config import InstrumentProviderConfig
 from nautilus_trader.common.config import InvalidConfiguration
+from nautilus_trader.common.config import LatencyTracingConfig
 from nautilus_trader.common.config import LoggingConfig
 from nautilus_trader.common.config import MessageBusConfig
 from nautilus_trader.common.config import NautilusConfig
@@ -52,6 +53,7 @@ from nautilus_trader.common.config import NonNegativeInt
 from nautilus_trader.common.config import OrderEmulatorConfig
 from nautilus_trader.common.config import PositiveFloat
 from nautilus_trader.common.config import PositiveInt
+from nautilus_trader.common.config import ProfilingConfig
 from nautilus_trader.common.config import msgspec_decoding_hook
 from nautilus_trader.common.config import msgspec_encoding_hook
 from nautilus_trader.common.config import register_config_decoding
@@ -117,6 +119,7 @@ __all__ = [
     "InvalidConfiguration",
     "LatencyModelConfig",
     "LatencyModelFactory",
+    "LatencyTracingConfig",
     "LiveDataClientConfig",
     "LiveDataEngineConfig",
     "LiveExecClientConfig",
@@ -134,6 +137,7 @@ __all__ = [
     "PortfolioConfig",
     "PositiveFloat",
     "PositiveInt",
+    "ProfilingConfig",
     "RiskEngineConfig",
     "RoutingConfig",
     "SimulationModuleConfig",
@@ -0,0 +1,60 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_getattr(package: str, attributes: dict[str, str]) -> Callable[[str], Any]:
+    """
+    Return a module level `__getattr__` which imports the given attributes on first access.
+
+    This allows a package to re-export symbols from modules with heavy dependencies
+    (such as plotting, file systems or venue clients) without importing those modules
+    when the package itself is imported. Once imported an attribute is set on the
+    package, so later lookups do not go through `__getattr__`.
+
+    Parameters
+    ----------
+    package : str
+        The name of the package (i.e. `__name__`).
+    attributes : dict[str, str]
+        The lazily imported attribute names mapped to the modules which define them.
+
+    Returns
+    -------
+    Callable[[str], Any]
+
+    Examples
+    --------
+    >>> __getattr__ = lazy_getattr(
+    ...     __name__,
+    ...     {"create_tearsheet": "nautilus_trader.analysis.tearsheet"},
+    ... )
+
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = attributes.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(module), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
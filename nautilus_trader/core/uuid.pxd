@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.core.rust.core cimport UUID4_t
 
 
@@ -26,3 +28,13 @@ cdef class UUID4:
 
     @staticmethod
     cdef UUID4 from_str_c(str value)
+
+
+cdef bint UUID4_SEEDED
+cdef uint64_t _UUID4_STATE
+
+cpdef void set_uuid4_seed(uint64_t seed)
+cpdef void clear_uuid4_seed()
+cpdef bint is_uuid4_seeded()
+cpdef tuple uuid4_seed_state()
+cpdef void restore_uuid4_seed_state(tuple state)
@@ -15,6 +15,8 @@
 
 import uuid
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.core cimport UUID4_t
 from nautilus_trader.core.rust.core cimport uuid4_eq
@@ -37,7 +39,10 @@ cdef class UUID4:
     """
 
     def __init__(self):
-        self._mem = uuid4_new()
+        if UUID4_SEEDED:
+            self._mem = _seeded_uuid4_mem()
+        else:
+            self._mem = uuid4_new()
 
     def __getstate__(self):
         return self.to_str()
@@ -104,3 +109,125 @@ cdef class UUID4:
 
         """
         return UUID4.from_str_c(value)
+
+
+# Global seeded UUID4 generation state
+UUID4_SEEDED = False
+_UUID4_STATE = 0
+
+cdef const char* _HEX_DIGITS = b"0123456789abcdef"
+
+# splitmix64 constants (see https://prng.di.unimi.it/splitmix64.c)
+cdef uint64_t _SPLITMIX64_GAMMA = 0x9E3779B97F4A7C15
+cdef uint64_t _SPLITMIX64_MUL1 = 0xBF58476D1CE4E5B9
+cdef uint64_t _SPLITMIX64_MUL2 = 0x94D049BB133111EB
+cdef uint64_t _UUID4_VERSION_MASK = 0xFFFFFFFFFFFF0FFF
+cdef uint64_t _UUID4_VERSION_BITS = 0x0000000000004000
+cdef uint64_t _UUID4_VARIANT_MASK = 0x3FFFFFFFFFFFFFFF
+cdef uint64_t _UUID4_VARIANT_BITS = 0x8000000000000000
+
+
+cpdef void set_uuid4_seed(uint64_t seed):
+    """
+    Switch `UUID4` generation to a seeded counter-based generator.
+
+    Subsequent `UUID4` values are produced by a splitmix64 sequence from `seed`
+    rather than the OS random source, so the same sequence of calls produces
+    the same values. The values remain valid version 4 RFC 4122 UUIDs.
+
+    This is process-wide and intended for backtests only, where reproducible
+    IDs allow event logs to be diffed between runs. Do not use for live trading.
+
+    Parameters
+    ----------
+    seed : uint64_t
+        The seed for the generator.
+
+    """
+    global UUID4_SEEDED, _UUID4_STATE
+    UUID4_SEEDED = True
+    _UUID4_STATE = seed
+
+
+cpdef void clear_uuid4_seed():
+    """
+    Switch `UUID4` generation back to the OS random source (the default).
+    """
+    global UUID4_SEEDED
+    UUID4_SEEDED = False
+
+
+cpdef bint is_uuid4_seeded():
+    """
+    Return whether `UUID4` generation is seeded.
+
+    Returns
+    -------
+    bool
+
+    """
+    return UUID4_SEEDED
+
+
+cpdef tuple uuid4_seed_state():
+    """
+    Return the current `UUID4` generation state.
+
+    The state can be passed to `restore_uuid4_seed_state` to resume the seeded
+    sequence (or random generation) from this point.
+
+    Returns
+    -------
+    tuple[bool, int]
+        Whether generation is seeded, and the seeded generator state.
+
+    """
+    return (UUID4_SEEDED, _UUID4_STATE)
+
+
+cpdef void restore_uuid4_seed_state(tuple state):
+    """
+    Restore a `UUID4` generation state returned by `uuid4_seed_state`.
+
+    Parameters
+    ----------
+    state : tuple[bool, int]
+        The generation state to restore.
+
+    """
+    global UUID4_SEEDED, _UUID4_STATE
+    UUID4_SEEDED, _UUID4_STATE = state
+
+
+cdef inline uint64_t _splitmix64_next():
+    global _UUID4_STATE
+    _UUID4_STATE += _SPLITMIX64_GAMMA
+    cdef uint64_t z = _UUID4_STATE
+    z = (z ^ (z >> 30)) * _SPLITMIX64_MUL1
+    z = (z ^ (z >> 27)) * _SPLITMIX64_MUL2
+    return z ^ (z >> 31)
+
+
+cdef UUID4_t _seeded_uuid4_mem():
+    cdef uint64_t hi = _splitmix64_next()
+    cdef uint64_t lo = _splitmix64_next()
+
+    # Set the version (4) and RFC 4122 variant (0b10) bits
+    hi = (hi & _UUID4_VERSION_MASK) | _UUID4_VERSION_BITS
+    lo = (lo & _UUID4_VARIANT_MASK) | _UUID4_VARIANT_BITS
+
+    cdef UUID4_t mem
+    cdef uint64_t word
+    cdef int pos = 0
+    cdef int i
+    for i in range(32):
+        if pos == 8 or pos == 13 or pos == 18 or pos == 23:
+            mem.value[pos] = 45  # Hyphen
+            pos += 1
+
+        word = hi if i < 16 else lo
+        mem.value[pos] = _HEX_DIGITS[(word >> (60 - 4 * (i % 16))) & 0xF]
+        pos += 1
+
+    mem.value[36] = 0  # Null terminator
+    return mem
@@ -70,6 +70,7 @@ cdef class BarBuilder:
 
     cpdef void update(self, Price price, Quantity size, uint64_t ts_init)
     cpdef void update_bar(self, Bar bar, Quantity volume, uint64_t ts_init)
+    cpdef void merge(self, BarBuilder other)
     cpdef void set_adjustment(self, object adjustment, object mode = *)
     cpdef Bar build_now(self)
     cpdef Bar build(self, uint64_t ts_event, uint64_t ts_init)
@@ -156,6 +157,30 @@ cdef class RenkoBarAggregator(BarAggregator):
     cdef object _last_close
 
 
+cdef class TimeBarAggregator
+
+
+cdef class TimeBarScheduler:
+    cdef Clock _clock
+    cdef str _timer_name
+    cdef dict _aggregators
+    cdef dict _due
+    cdef list _close_times
+    cdef uint64_t _alert_ns
+
+    cdef readonly uint64_t batch_count
+    """The number of bar close batches processed.\n\n:returns: `int`"""
+
+    cpdef void add(self, TimeBarAggregator aggregator)
+    cpdef void remove(self, TimeBarAggregator aggregator)
+    cpdef void clear(self)
+    cpdef int aggregator_count(self)
+    cpdef int pending_close_count(self)
+    cdef void _schedule(self, TimeBarAggregator aggregator)
+    cdef void _set_next_alert(self)
+    cpdef void _close_due(self, TimeEvent event)
+
+
 cdef class TimeBarAggregator(BarAggregator):
     cdef Clock _clock
 
@@ -174,14 +199,33 @@ cdef class TimeBarAggregator(BarAggregator):
     cdef object _time_bars_origin_offset
     cdef list _historical_events
     cdef object _historical_event_at_ts_init
+    cdef TimeBarScheduler _scheduler
+    cdef list _cascade
+    cdef list _cascade_pending
+    cdef int _cascade_pending_count
+    cdef uint64_t _cascade_rolled_up_ns
+
+    cdef readonly TimeBarAggregator cascade_parent
+    """The aggregator this aggregator's bars are rolled up from (if cascaded).\n\n:returns: `TimeBarAggregator` or ``None``"""
 
     cpdef void set_clock(self, Clock clock)
+    cpdef void set_scheduler(self, TimeBarScheduler scheduler)
+    cdef bint _is_scheduled(self)
     cdef uint64_t _get_interval_ns(self)
     cpdef void start_timer(self)
     cpdef void stop_timer(self)
+    cpdef bint is_cascadable(self, TimeBarAggregator aggregator)
+    cpdef void add_cascade(self, TimeBarAggregator aggregator)
+    cpdef void remove_cascade(self, TimeBarAggregator aggregator)
+    cpdef list cascade(self)
     cdef void _pre_process_historical_events(self, uint64_t ts_init)
     cdef void _post_process_historical_events(self)
     cpdef void _build_bar(self, TimeEvent event)
+    cdef void _build_time_bar(self, TimeEvent event)
+    cdef void _update_pending_count(self, int delta)
+    cdef void _feed_cascade(self, Price price, Quantity size, uint64_t ts_init)
+    cdef void _feed_cascade_bar(self, Bar bar, Quantity volume, uint64_t ts_init)
+    cdef void _roll_up_cascade(self, uint64_t close_ns)
 
 
 cdef class SpreadQuoteAggregator:
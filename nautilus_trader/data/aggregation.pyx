@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import heapq
 from decimal import ROUND_HALF_EVEN
 from decimal import Decimal
 from typing import Callable
@@ -48,6 +49,7 @@ from nautilus_trader.core.rust.model cimport PriceRaw
 from nautilus_trader.core.rust.model cimport QuantityRaw
 from nautilus_trader.core.rust.model cimport price_as_f64
 from nautilus_trader.core.rust.model cimport price_new
+from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport BarAggregation
 from nautilus_trader.model.data cimport BarType
@@ -198,6 +200,42 @@ cdef class BarBuilder:
         self.count += 1
         self.ts_last = ts_init
 
+    cpdef void merge(self, BarBuilder other):
+        """
+        Merge the current (not yet built) bar state of the given builder into this builder.
+
+        The merge is equivalent to applying every update of `other` to this builder,
+        with the volume summed at full (unrounded) precision.
+
+        Parameters
+        ----------
+        other : BarBuilder
+            The builder to merge. Must cover a later period than this builder's updates.
+
+        """
+        Condition.not_none(other, "other")
+
+        if other._open is None:
+            return  # No updates to merge
+
+        if self._open is None:
+            # Initialize builder
+            self._open = other._open
+            self._high = other._high
+            self._low = other._low
+            self.initialized = True
+        else:
+            if other._high._mem.raw > self._high._mem.raw:
+                self._high = other._high
+
+            if other._low._mem.raw < self._low._mem.raw:
+                self._low = other._low
+
+        self._close = other._close
+        self.volume._mem.raw += other.volume._mem.raw
+        self.count += other.count
+        self.ts_last = max(self.ts_last, other.ts_last)
+
     cpdef void set_adjustment(self, object adjustment, object mode = None):
         # Adjustment applies at ingress on subsequent update()/update_bar() calls,
         # so running OHLC state is always in the adjusted (common) frame.
@@ -1457,6 +1495,12 @@ cdef class TimeBarAggregator(BarAggregator):
     When the time reaches the next time interval of the bar specification, then
     a bar is created and sent to the handler.
 
+    Coarser aggregators for the same instrument and price type can be cascaded from
+    this aggregator with `add_cascade`. A cascaded aggregator has no data subscription
+    of its own, its bar in progress is rolled up from the unbuilt state of this
+    aggregator at each close. It keeps its own timer, so bars closing at the same time
+    are emitted in timer name order as with independent aggregators.
+
     Parameters
     ----------
     instrument : Instrument
@@ -1482,6 +1526,9 @@ cdef class TimeBarAggregator(BarAggregator):
         The origin time offset.
     bar_build_delay : int, default 0
         The time delay (microseconds) before building and emitting a composite bar type.
+    scheduler : TimeBarScheduler, optional
+        The shared bar close scheduler. If ``None``, then the aggregator registers its
+        own clock timer.
 
     Raises
     ------
@@ -1501,6 +1548,7 @@ cdef class TimeBarAggregator(BarAggregator):
         bint build_with_no_updates = True,
         object time_bars_origin_offset: pd.Timedelta | pd.DateOffset = None,
         int bar_build_delay = 0,
+        TimeBarScheduler scheduler = None,
     ) -> None:
         super().__init__(
             instrument=instrument,
@@ -1508,6 +1556,7 @@ cdef class TimeBarAggregator(BarAggregator):
             handler=handler,
         )
         self._clock = clock
+        self._scheduler = scheduler
         self._timestamp_on_close = timestamp_on_close
         self._skip_first_non_full_bar = skip_first_non_full_bar
         self._build_with_no_updates = build_with_no_updates
@@ -1522,6 +1571,11 @@ cdef class TimeBarAggregator(BarAggregator):
         self.historical_mode = False
         self._historical_events = []
         self._historical_event_at_ts_init = None
+        self._cascade = []  # Sorted by interval (finest first)
+        self._cascade_pending = []  # Receive updates directly until the next close
+        self._cascade_pending_count = 0  # Pending aggregators anywhere down the cascade
+        self._cascade_rolled_up_ns = 0
+        self.cascade_parent = None
 
         if interval_type == "left-open":
             self._is_left_open = True
@@ -1541,6 +1595,28 @@ cdef class TimeBarAggregator(BarAggregator):
     cpdef void set_clock(self, Clock clock):
         self._clock = clock
 
+    cpdef void set_scheduler(self, TimeBarScheduler scheduler):
+        """
+        Set the shared bar close scheduler for the aggregator.
+
+        The scheduler takes effect from the next call to `start_timer`.
+
+        Parameters
+        ----------
+        scheduler : TimeBarScheduler, optional
+            The scheduler. If ``None``, then the aggregator registers its own clock timer.
+
+        """
+        self._scheduler = scheduler
+
+    cdef bint _is_scheduled(self):
+        # Monthly and yearly bars have no regular interval, so always use their own alerts
+        return (
+            self._scheduler is not None
+            and self.bar_type.spec.aggregation != BarAggregation.MONTH
+            and self.bar_type.spec.aggregation != BarAggregation.YEAR
+        )
+
     cpdef void start_timer(self):
         # Computing start_time
         cdef datetime now = self._clock.utc_now()
@@ -1574,7 +1650,10 @@ cdef class TimeBarAggregator(BarAggregator):
         if self._skip_first_non_full_bar:
             self.first_close_ns = self.next_close_ns
 
-        if self.bar_type.spec.aggregation in (BarAggregation.MONTH, BarAggregation.YEAR):
+        if self._is_scheduled():
+            # The scheduler closes the bar at `next_close_ns` (including a fire immediately close)
+            self._scheduler.add(self)
+        elif self.bar_type.spec.aggregation in (BarAggregation.MONTH, BarAggregation.YEAR):
             # The monthly/yearly alert time is defined iteratively at each alert time as there is no regular interval
             self._clock.set_time_alert(
                 name=self._timer_name,
@@ -1601,10 +1680,151 @@ cdef class TimeBarAggregator(BarAggregator):
                         f"next_close_ns={unix_nanos_to_dt(self.next_close_ns)}")
 
     cpdef void stop_timer(self):
+        if self._scheduler is not None:
+            self._scheduler.remove(self)
+
         cdef str timer_name = self._timer_name
         if timer_name in self._clock.timer_names:
             self._clock.cancel_timer(timer_name)
 
+    cpdef bint is_cascadable(self, TimeBarAggregator aggregator):
+        """
+        Return whether the bars of the given aggregator can be rolled up from this aggregator.
+
+        The aggregator must be for the same instrument and price type, with an interval
+        which is a multiple of this aggregator's interval, and with every close time
+        (including origin offset and build delay) falling on a close of this aggregator.
+        Both aggregators must have started their timers, be in live mode, and have no
+        price adjustment. Monthly and yearly bars are never cascadable.
+
+        Parameters
+        ----------
+        aggregator : TimeBarAggregator
+            The aggregator to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        Condition.not_none(aggregator, "aggregator")
+
+        if aggregator is self or aggregator.cascade_parent is not None:
+            return False
+
+        if (
+            aggregator.bar_type.instrument_id != self.bar_type.instrument_id
+            or aggregator.bar_type.spec.price_type != self.bar_type.spec.price_type
+        ):
+            return False
+
+        if (
+            self.bar_type.spec.aggregation in (BarAggregation.MONTH, BarAggregation.YEAR)
+            or aggregator.bar_type.spec.aggregation in (BarAggregation.MONTH, BarAggregation.YEAR)
+        ):
+            return False
+
+        if self.historical_mode or aggregator.historical_mode:
+            return False
+
+        if self._builder._adjustment_active or aggregator._builder._adjustment_active:
+            return False
+
+        if self.next_close_ns == 0 or aggregator.next_close_ns < self.next_close_ns:
+            return False  # Timers not started or closes not aligned
+
+        return (
+            aggregator.interval_ns > self.interval_ns
+            and aggregator.interval_ns % self.interval_ns == 0
+            and (aggregator.next_close_ns - self.next_close_ns) % self.interval_ns == 0
+        )
+
+    cpdef void add_cascade(self, TimeBarAggregator aggregator):
+        """
+        Add the given aggregator to be rolled up from this aggregator's bars.
+
+        The aggregator keeps its own timer, so bars closing at the same time are still
+        emitted in timer name order, however its bar in progress is rolled up from this
+        aggregator's bars. Until this aggregator's next close the aggregator receives
+        this aggregator's updates directly, so the bars it builds are identical to
+        independent aggregation. The caller is responsible for no longer sending data
+        to the aggregator.
+
+        Parameters
+        ----------
+        aggregator : TimeBarAggregator
+            The aggregator to add.
+
+        Raises
+        ------
+        ValueError
+            If `aggregator` is not cascadable from this aggregator.
+
+        """
+        Condition.not_none(aggregator, "aggregator")
+        Condition.is_true(self.is_cascadable(aggregator), f"{aggregator.bar_type} was not cascadable")
+
+        aggregator.cascade_parent = self
+
+        # Finer aggregators are rolled up first
+        cdef int index = 0
+        while index < len(self._cascade) and self._cascade[index].interval_ns <= aggregator.interval_ns:
+            index += 1
+
+        self._cascade.insert(index, aggregator)
+        self._cascade_pending.append(aggregator)
+        self._update_pending_count(1 + aggregator._cascade_pending_count)
+
+    cpdef void remove_cascade(self, TimeBarAggregator aggregator):
+        """
+        Remove the given cascaded aggregator.
+
+        The updates not yet rolled up to the aggregator are merged into its bar in
+        progress. The caller is responsible for sending data to the aggregator again.
+
+        Parameters
+        ----------
+        aggregator : TimeBarAggregator
+            The aggregator to remove.
+
+        Raises
+        ------
+        ValueError
+            If `aggregator` is not cascaded from this aggregator.
+
+        """
+        Condition.not_none(aggregator, "aggregator")
+        Condition.is_true(aggregator.cascade_parent is self, f"{aggregator.bar_type} was not cascaded")
+
+        # Walk up the cascade until the updates were received directly
+        cdef TimeBarAggregator child = aggregator
+        cdef TimeBarAggregator parent = self
+        while parent is not None and child not in parent._cascade_pending:
+            aggregator._builder.merge(parent._builder)
+            child = parent
+            parent = parent.cascade_parent
+
+        cdef int pending_count = aggregator._cascade_pending_count
+        if aggregator in self._cascade_pending:
+            self._cascade_pending.remove(aggregator)
+            pending_count += 1
+
+        self._cascade.remove(aggregator)
+        self._update_pending_count(-pending_count)
+
+        aggregator.cascade_parent = None
+
+    cpdef list cascade(self):
+        """
+        Return the aggregators cascaded directly from this aggregator.
+
+        Returns
+        -------
+        list[TimeBarAggregator]
+
+        """
+        return self._cascade.copy()
+
     def get_start_time(self, now: datetime) -> datetime:
         """
         Return the start time for the aggregator's next bar.
@@ -1692,6 +1912,9 @@ cdef class TimeBarAggregator(BarAggregator):
 
         self._builder.update(price, size, ts_init)
 
+        if self._cascade_pending_count:
+            self._feed_cascade(price, size, ts_init)
+
         if self.historical_mode:
             self._post_process_historical_events()
 
@@ -1701,6 +1924,9 @@ cdef class TimeBarAggregator(BarAggregator):
 
         self._builder.update_bar(bar, volume, ts_init)
 
+        if self._cascade_pending_count:
+            self._feed_cascade_bar(bar, volume, ts_init)
+
         if self.historical_mode:
             self._post_process_historical_events()
 
@@ -1727,6 +1953,12 @@ cdef class TimeBarAggregator(BarAggregator):
             self._historical_event_at_ts_init = None
 
     cpdef void _build_bar(self, TimeEvent event):
+        if self._cascade or self.cascade_parent is not None:
+            self._roll_up_cascade(event.ts_event)
+
+        self._build_time_bar(event)
+
+    cdef void _build_time_bar(self, TimeEvent event):
         if not self._builder.initialized:
             return
 
@@ -1764,10 +1996,56 @@ cdef class TimeBarAggregator(BarAggregator):
                 override=True,
             )
             self.next_close_ns = dt_to_unix_nanos(alert_time)
-        else:
+        elif not self._is_scheduled():
             # On receiving this event, timer should now have a new `next_time_ns`
             self.next_close_ns = self._clock.next_time_ns(self._timer_name)
 
+    cdef void _update_pending_count(self, int delta):
+        cdef TimeBarAggregator aggregator = self
+        while aggregator is not None:
+            aggregator._cascade_pending_count += delta
+            aggregator = aggregator.cascade_parent
+
+    cdef void _feed_cascade(self, Price price, Quantity size, uint64_t ts_init):
+        # Pending aggregators receive the updates of the aggregator receiving the data
+        cdef TimeBarAggregator aggregator
+        for aggregator in self._cascade:
+            if aggregator in self._cascade_pending:
+                aggregator._apply_update(price, size, ts_init)
+            elif aggregator._cascade_pending_count:
+                aggregator._feed_cascade(price, size, ts_init)
+
+    cdef void _feed_cascade_bar(self, Bar bar, Quantity volume, uint64_t ts_init):
+        cdef TimeBarAggregator aggregator
+        for aggregator in self._cascade:
+            if aggregator in self._cascade_pending:
+                aggregator._apply_update_bar(bar, volume, ts_init)
+            elif aggregator._cascade_pending_count:
+                aggregator._feed_cascade_bar(bar, volume, ts_init)
+
+    cdef void _roll_up_cascade(self, uint64_t close_ns):
+        # Must be called before the bar in progress is built and reset. Bars closing at
+        # the same time are built in timer name order (as with independent timers), so
+        # a coarser aggregator may close before the finer aggregators it is rolled up
+        # from, in which case it rolls them up first. Each close is only rolled up once.
+        if self._cascade_rolled_up_ns == close_ns:
+            return
+
+        self._cascade_rolled_up_ns = close_ns
+
+        if self.cascade_parent is not None:
+            self.cascade_parent._roll_up_cascade(close_ns)
+
+        cdef TimeBarAggregator aggregator
+        for aggregator in self._cascade:
+            if aggregator not in self._cascade_pending:
+                aggregator._builder.merge(self._builder)
+
+        # Pending aggregators are rolled up from the next bar
+        if self._cascade_pending:
+            self._update_pending_count(-len(self._cascade_pending))
+            self._cascade_pending.clear()
+
     cdef void _build_and_send(self, uint64_t ts_event, uint64_t ts_init):
         if self._skip_first_non_full_bar and ts_init <= self.first_close_ns:
             self._builder.reset()
@@ -1794,6 +2072,196 @@ def find_closest_smaller_time(
     return closest_time
 
 
+cdef class TimeBarScheduler:
+    """
+    Provides a shared bar close scheduler for the time bar aggregators on a clock.
+
+    Rather than each `TimeBarAggregator` registering its own clock timer, the scheduler
+    holds the pending close time of every aggregator and sets a single time alert for
+    the earliest one. When the alert fires, all aggregators due at that time are closed
+    in one batch pass, in timer name order (the same order as independent timers firing
+    at the same timestamp), and are then rescheduled for their next close.
+
+    Close times already include the origin offset and `bar_build_delay` of each
+    aggregator, so aggregators with the same interval and offset share every batch.
+    Monthly and yearly aggregators always use their own time alerts.
+
+    Timers on the same clock at the same timestamp fire in timer name order. The default
+    alert name 'TIME_BAR_' sorts immediately before every 'TIME_BAR_{bar_type}' aggregator
+    timer name, so a batch fires in the same order relative to all other timers as the
+    independent aggregator timers would. The exception is other 'TIME_BAR_' timers at the
+    same timestamp (e.g. monthly aggregators), which fire after the whole batch rather than
+    interleaved with it by bar type.
+
+    Parameters
+    ----------
+    clock : Clock
+        The clock for the scheduler.
+    timer_name : str, default 'TIME_BAR_'
+        The name for the scheduler time alert (must be unique for the clock).
+
+    Raises
+    ------
+    ValueError
+        If `timer_name` is not a valid string.
+    """
+
+    def __init__(
+        self,
+        Clock clock not None,
+        str timer_name = "TIME_BAR_",
+    ) -> None:
+        Condition.valid_string(timer_name, "timer_name")
+
+        self._clock = clock
+        self._timer_name = timer_name
+        self._aggregators = {}  # Keyed by aggregator timer name
+        self._due = {}  # Sets of aggregator timer names keyed by close time
+        self._close_times = []  # Min-heap of the close times in `_due`
+        self._alert_ns = 0
+        self.batch_count = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"aggregators={len(self._aggregators)}, "
+            f"close_times={len(self._close_times)})"
+        )
+
+    cpdef void add(self, TimeBarAggregator aggregator):
+        """
+        Add the given aggregator to be closed at its `next_close_ns`.
+
+        Parameters
+        ----------
+        aggregator : TimeBarAggregator
+            The aggregator to add.
+
+        """
+        Condition.not_none(aggregator, "aggregator")
+
+        self._aggregators[aggregator._timer_name] = aggregator
+        self._schedule(aggregator)
+        self._set_next_alert()
+
+    cpdef void remove(self, TimeBarAggregator aggregator):
+        """
+        Remove the given aggregator from the scheduler.
+
+        Parameters
+        ----------
+        aggregator : TimeBarAggregator
+            The aggregator to remove.
+
+        """
+        Condition.not_none(aggregator, "aggregator")
+
+        # Pending close entries for the aggregator are skipped when they fall due
+        if self._aggregators.get(aggregator._timer_name) is aggregator:
+            del self._aggregators[aggregator._timer_name]
+
+        if not self._aggregators:
+            self.clear()
+
+    cpdef void clear(self):
+        """
+        Clear all aggregators and cancel the scheduler time alert.
+
+        """
+        self._aggregators.clear()
+        self._due.clear()
+        self._close_times.clear()
+
+        if self._timer_name in self._clock.timer_names:
+            self._clock.cancel_timer(self._timer_name)
+
+        self._alert_ns = 0
+
+    cpdef int aggregator_count(self):
+        """
+        Return the number of aggregators on the scheduler.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._aggregators)
+
+    cpdef int pending_close_count(self):
+        """
+        Return the number of distinct pending close times.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._close_times)
+
+    cdef void _schedule(self, TimeBarAggregator aggregator):
+        cdef uint64_t close_ns = aggregator.next_close_ns
+        cdef set timer_names = self._due.get(close_ns)
+        if timer_names is None:
+            timer_names = set()
+            self._due[close_ns] = timer_names
+            heapq.heappush(self._close_times, close_ns)
+
+        # An aggregator restarted within the same interval keeps its pending entry
+        timer_names.add(aggregator._timer_name)
+
+    cdef void _set_next_alert(self):
+        if not self._close_times:
+            return
+
+        cdef uint64_t next_close_ns = self._close_times[0]
+        if next_close_ns == self._alert_ns:
+            return  # Alert already set
+
+        if self._clock.next_time_ns(self._timer_name) > 0:
+            self._clock.cancel_timer(self._timer_name)
+
+        self._clock.set_time_alert_ns(
+            name=self._timer_name,
+            alert_time_ns=next_close_ns,
+            callback=self._close_due,
+            allow_past=True,
+        )
+        self._alert_ns = next_close_ns
+
+    cpdef void _close_due(self, TimeEvent event):
+        self._alert_ns = 0
+
+        cdef:
+            uint64_t close_ns
+            list timer_names
+            str timer_name
+            TimeBarAggregator aggregator
+            TimeEvent close_event
+        # A past alert fires at the current time, so close every time up to the event
+        while self._close_times and self._close_times[0] <= event.ts_event:
+            close_ns = heapq.heappop(self._close_times)
+            timer_names = sorted(self._due.pop(close_ns))
+
+            if close_ns == event.ts_event:
+                close_event = event
+            else:
+                close_event = TimeEvent(event.name, UUID4(), close_ns, close_ns)
+
+            for timer_name in timer_names:
+                aggregator = self._aggregators.get(timer_name)
+                if aggregator is None or aggregator.next_close_ns != close_ns:
+                    continue  # Removed or rescheduled since
+
+                aggregator._build_bar(close_event)
+                aggregator.next_close_ns = close_ns + aggregator.interval_ns
+                self._schedule(aggregator)
+
+            self.batch_count += 1
+
+        self._set_next_alert()
+
+
 cdef class SpreadQuoteAggregator:
     """
     Provides a spread quote generator for creating synthetic quotes from leg instruments.
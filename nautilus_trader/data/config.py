@@ -42,6 +42,25 @@ class DataEngineConfig(NautilusConfig, frozen=True):
         The time delay (microseconds) before building and emitting a bar.
         This can be useful in a backtest context to ensure data at bar boundary
         timestamps is processed before the bar close timer fires.
+    time_bars_shared_scheduler : bool, default False
+        If time bar aggregators will share a single bar close scheduler, rather than each
+        registering its own clock timer. All bars due at the same time are then closed in
+        one batch pass, in the same order as with independent timers. Relative to other
+        timers at the same timestamp the batch fires as the first bar close would, except
+        for other time bar timers (e.g. monthly bars) which fire after the whole batch.
+    time_bars_cascade : bool, default False
+        If subscribed time bars for the same instrument and price type will be cascaded,
+        so that only the finest bars are aggregated from the market data and coarser
+        bars are rolled up from finer bars (when the coarser interval is a multiple of,
+        and aligned to, the finer interval). The bars are identical to independent
+        aggregation, and are emitted in the same order (timer name order for bars
+        closing at the same time).
+    vectorized_bar_aggregation : bool, default False
+        If historical bars requested for aggregation from quote or trade ticks will be
+        aggregated in one columnar pass over the response, rather than tick by tick.
+        Supported for time, tick, volume and value bars (otherwise, or where the ticks
+        cannot be aggregated exactly, the streaming aggregators are used). The bars are
+        published after the ticks of the response.
     validate_data_sequence : bool, default False
         If data objects timestamp sequencing will be validated and handled.
     buffer_deltas : bool, default False
@@ -65,6 +84,9 @@ class DataEngineConfig(NautilusConfig, frozen=True):
     time_bars_build_with_no_updates: bool = True
     time_bars_origin_offset: dict | None = None
     time_bars_build_delay: int = 0
+    time_bars_shared_scheduler: bool = False
+    time_bars_cascade: bool = False
+    vectorized_bar_aggregation: bool = False
     validate_data_sequence: bool = False
     buffer_deltas: bool = False
     emit_quotes_from_book: bool = False
@@ -28,6 +28,8 @@ from nautilus_trader.core.rust.model cimport MarketStatusAction
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.data.aggregation cimport BarAggregator
 from nautilus_trader.data.aggregation cimport SpreadQuoteAggregator
+from nautilus_trader.data.aggregation cimport TimeBarAggregator
+from nautilus_trader.data.aggregation cimport TimeBarScheduler
 from nautilus_trader.data.client cimport DataClient
 from nautilus_trader.data.client cimport MarketDataClient
 from nautilus_trader.data.messages cimport DataCommand
@@ -105,6 +107,7 @@ cdef class DataEngine(Component):
     cdef readonly dict _order_book_intervals
     cdef readonly dict[tuple[BarType, UUID4], BarAggregator] _bar_aggregators
     cdef readonly dict[tuple[InstrumentId, UUID4], SpreadQuoteAggregator] _spread_quote_aggregators
+    cdef readonly dict[BarType, TimeBarAggregator] _cascadable_bar_aggregators
     cdef readonly dict[InstrumentId, list] _spread_quote_aggregator_handlers
     cdef readonly dict[InstrumentId, list[SyntheticInstrument]] _synthetic_quote_feeds
     cdef readonly dict[InstrumentId, list[SyntheticInstrument]] _synthetic_trade_feeds
@@ -140,6 +143,9 @@ cdef class DataEngine(Component):
     cdef readonly bint _time_bars_build_with_no_updates
     cdef readonly dict[BarAggregation, object] _time_bars_origin_offset # pd.Timedelta or pd.DateOffset
     cdef readonly int _time_bars_build_delay
+    cdef readonly TimeBarScheduler _time_bar_scheduler
+    cdef readonly bint _time_bars_cascade
+    cdef readonly bint _vectorized_bar_aggregation
     cdef readonly bint _validate_data_sequence
     cdef readonly bint _buffer_deltas
     cdef readonly bint _emit_quotes_from_book
@@ -340,7 +346,11 @@ cdef class DataEngine(Component):
     cpdef void _setup_bar_aggregator(self, BarType bar_type, bint historical = *, UUID4 request_id = *, bint subscribe_source = *)
     cpdef void _subscribe_bar_aggregator(self, MarketDataClient client, SubscribeBars command)
     cpdef void _finalize_aggregated_bars_request(self, DataResponse response)
+    cdef list _aggregate_bars_vectorized(self, UUID4 request_id, list data, type data_cls)
     cpdef void _stop_bar_aggregator(self, MarketDataClient client, UnsubscribeBars command)
+    cdef void _cascade_bar_aggregator(self, TimeBarAggregator aggregator)
+    cdef void _release_bar_aggregator_cascade(self, TimeBarAggregator aggregator)
+    cdef void _subscribe_bar_aggregator_ticks(self, TimeBarAggregator aggregator)
     cpdef void _dispose_bar_aggregator(self, BarType bar_type, bint historical = *, UUID4 request_id = *)
     cpdef void _unsubscribe_bar_aggregator(self, MarketDataClient client, UnsubscribeBars command)
     cpdef bint _should_request_aggregated_bars(self, RequestData request)
@@ -29,6 +29,7 @@ Alternative implementations can be written on top of the generic engine - which
 just need to override the `execute`, `process`, `send` and `receive` methods.
 """
 
+import heapq
 from dataclasses import dataclass
 from decimal import Decimal
 from decimal import InvalidOperation
@@ -41,9 +42,12 @@ from nautilus_trader.core import nautilus_pyo3
 from nautilus_trader.core.datetime import min_date
 from nautilus_trader.core.datetime import time_object_to_dt
 from nautilus_trader.data.config import DataEngineConfig
+from nautilus_trader.data.vectorized import aggregate_bars
+from nautilus_trader.data.vectorized import is_vectorizable
 from nautilus_trader.model.enums import RecordFlag
 from nautilus_trader.persistence.catalog import BaseDataCatalog
 from nautilus_trader.persistence.funcs import parse_filters_expr
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
 
 from cpython.datetime cimport datetime
 
@@ -62,6 +66,9 @@ from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.common.component cimport TestClock
 from nautilus_trader.common.component cimport TimeEvent
 from nautilus_trader.common.data_topics cimport TopicCache
+from nautilus_trader.common.profiling cimport HotPathProfiler
+from nautilus_trader.common.profiling cimport LatencyTracer
+from nautilus_trader.common.profiling cimport TraceStage
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.datetime cimport dt_to_unix_nanos
@@ -84,6 +91,7 @@ from nautilus_trader.data.aggregation cimport TickBarAggregator
 from nautilus_trader.data.aggregation cimport TickImbalanceBarAggregator
 from nautilus_trader.data.aggregation cimport TickRunsBarAggregator
 from nautilus_trader.data.aggregation cimport TimeBarAggregator
+from nautilus_trader.data.aggregation cimport TimeBarScheduler
 from nautilus_trader.data.aggregation cimport ValueBarAggregator
 from nautilus_trader.data.aggregation cimport ValueImbalanceBarAggregator
 from nautilus_trader.data.aggregation cimport ValueRunsBarAggregator
@@ -213,6 +221,7 @@ cdef class DataEngine(Component):
         self._order_book_intervals: dict[tuple[InstrumentId, int], list[Callable[[OrderBook], None]]] = {}
         self._bar_aggregators: dict[tuple[BarType, UUID4], BarAggregator] = {}
         self._spread_quote_aggregators: dict[tuple[InstrumentId, UUID4], SpreadQuoteAggregator] = {}
+        self._cascadable_bar_aggregators: dict[BarType, TimeBarAggregator] = {}
         self._synthetic_quote_feeds: dict[InstrumentId, list[SyntheticInstrument]] = {}
         self._synthetic_trade_feeds: dict[InstrumentId, list[SyntheticInstrument]] = {}
         self._subscribed_synthetic_quotes: list[InstrumentId] = []
@@ -250,6 +259,9 @@ cdef class DataEngine(Component):
         self._time_bars_build_with_no_updates = config.time_bars_build_with_no_updates
         self._time_bars_origin_offset = config.time_bars_origin_offset or {}
         self._time_bars_build_delay = config.time_bars_build_delay
+        self._time_bar_scheduler = TimeBarScheduler(clock) if config.time_bars_shared_scheduler else None
+        self._time_bars_cascade = config.time_bars_cascade
+        self._vectorized_bar_aggregation = config.vectorized_bar_aggregation
         self._validate_data_sequence = config.validate_data_sequence
         self._buffer_deltas = config.buffer_deltas
         self._emit_quotes_from_book = config.emit_quotes_from_book
@@ -784,6 +796,11 @@ cdef class DataEngine(Component):
 
         self._order_book_intervals.clear()
         self._bar_aggregators.clear()
+        self._cascadable_bar_aggregators.clear()
+
+        if self._time_bar_scheduler is not None:
+            self._time_bar_scheduler.clear()
+
         self._spread_quote_aggregators.clear()
         self._synthetic_quote_feeds.clear()
         self._synthetic_trade_feeds.clear()
@@ -842,7 +859,15 @@ cdef class DataEngine(Component):
         """
         Condition.not_none(command, "command")
 
+        cdef HotPathProfiler profiler = self._get_profiler()
+        if profiler is None:
+            self._execute_command(command)
+            return
+
+        cdef uint64_t start_ns = profiler.start_c()
         self._execute_command(command)
+        if start_ns:
+            profiler.stop_c("engine", "DataEngine", "_execute_command", start_ns)
 
     cpdef void process(self, Data data, bint historical = False):
         """
@@ -856,7 +881,15 @@ cdef class DataEngine(Component):
         """
         Condition.not_none(data, "data")
 
+        cdef HotPathProfiler profiler = self._get_profiler()
+        if profiler is None:
+            self._handle_data(data, historical)
+            return
+
+        cdef uint64_t start_ns = profiler.start_c()
         self._handle_data(data, historical)
+        if start_ns:
+            profiler.stop_c("engine", "DataEngine", "_handle_data", start_ns)
 
     cpdef void process_historical(self, Data data):
         """
@@ -881,7 +914,15 @@ cdef class DataEngine(Component):
         """
         Condition.not_none(request, "request")
 
+        cdef HotPathProfiler profiler = self._get_profiler()
+        if profiler is None:
+            self._handle_request(request)
+            return
+
+        cdef uint64_t start_ns = profiler.start_c()
         self._handle_request(request)
+        if start_ns:
+            profiler.stop_c("engine", "DataEngine", "_handle_request", start_ns)
 
     cpdef void response(self, DataResponse response):
         """
@@ -895,7 +936,15 @@ cdef class DataEngine(Component):
         """
         Condition.not_none(response, "response")
 
+        cdef HotPathProfiler profiler = self._get_profiler()
+        if profiler is None:
+            self._handle_response(response)
+            return
+
+        cdef uint64_t start_ns = profiler.start_c()
         self._handle_response(response)
+        if start_ns:
+            profiler.stop_c("engine", "DataEngine", "_handle_response", start_ns)
 
 # -- COMMAND HANDLERS -----------------------------------------------------------------------------
 
@@ -2712,6 +2761,9 @@ cdef class DataEngine(Component):
                     self._handle_quote_tick(quote_tick)
 
     cpdef void _handle_quote_tick(self, QuoteTick tick, bint historical = False):
+        cdef LatencyTracer tracer = None if historical else self._get_tracer()
+        cdef bint traced = tracer is not None and tracer.begin(tick.ts_init)
+
         if not (historical and self._disable_historical_cache):
             self._cache.add_quote_tick(tick)
 
@@ -2725,16 +2777,26 @@ cdef class DataEngine(Component):
         cdef str topic = self._topic_cache.get_quotes_topic(instrument_id, historical)
         if self.debug or historical:
             self._log.debug(f"Publishing quote tick to topic: {topic}, historical={historical}, instrument={instrument_id}")
-        self._msgbus.publish_c(
-            topic=topic,
-            msg=tick,
-        )
+
+        if traced:
+            tracer.stamp(TraceStage.MSGBUS)
+        try:
+            self._msgbus.publish_c(
+                topic=topic,
+                msg=tick,
+            )
+        finally:
+            if traced:
+                tracer.end()
 
         # Feed to option chain manager (if applicable)
         if not historical:
             self._feed_quote_to_option_chain(tick)
 
     cpdef void _handle_trade_tick(self, TradeTick tick, bint historical = False):
+        cdef LatencyTracer tracer = None if historical else self._get_tracer()
+        cdef bint traced = tracer is not None and tracer.begin(tick.ts_init)
+
         if not (historical and self._disable_historical_cache):
             self._cache.add_trade_tick(tick)
 
@@ -2745,10 +2807,16 @@ cdef class DataEngine(Component):
         if synthetics is not None:
             self._update_synthetics_with_trade(synthetics, tick)
 
-        self._msgbus.publish_c(
-            topic=self._topic_cache.get_trades_topic(instrument_id, historical),
-            msg=tick,
-        )
+        if traced:
+            tracer.stamp(TraceStage.MSGBUS)
+        try:
+            self._msgbus.publish_c(
+                topic=self._topic_cache.get_trades_topic(instrument_id, historical),
+                msg=tick,
+            )
+        finally:
+            if traced:
+                tracer.end()
 
     cpdef void _handle_mark_price(self, MarkPriceUpdate mark_price, bint historical = False):
         if not (historical and self._disable_historical_cache):
@@ -3067,9 +3135,21 @@ cdef class DataEngine(Component):
 
                 final_data = []
             else:
+                vectorized_bars = None
+                if self._vectorized_bar_aggregation and grouped_response.correlation_id in self._bar_types_params:
+                    vectorized_bars = self._aggregate_bars_vectorized(
+                        grouped_response.correlation_id,
+                        response_data,
+                        grouped_response.data_type.type,
+                    )
+
                 for data in response_data:
                     self.process_historical(data)
 
+                if vectorized_bars:
+                    for data in vectorized_bars:
+                        self.process_historical(data)
+
                 if grouped_response.correlation_id in self._bar_types_params:
                     self._finalize_aggregated_bars_request(grouped_response)
 
@@ -3581,6 +3661,73 @@ cdef class DataEngine(Component):
         if not self._cleanup_request_bar_aggregators(response.correlation_id):
             self._log.error(f"No stored params to finalize aggregated bars for request id {response.correlation_id}.")
 
+    cdef list _aggregate_bars_vectorized(self, UUID4 request_id, list data, type data_cls):
+        # Aggregate the bars for each request aggregator which would be fed directly by the
+        # response ticks in one columnar pass, and dispose of those aggregators so they
+        # don't also aggregate tick by tick. Returns the bars merged in `ts_init` order.
+        cdef dict params = self._bar_types_params[request_id]
+        if params.get("update_subscriptions", False) or not data:
+            return None  # Aggregators carry state across requests
+
+        if data_cls is not QuoteTick and data_cls is not TradeTick:
+            return None
+
+        cdef InstrumentId instrument_id = data[0].instrument_id
+        if data[-1].instrument_id != instrument_id:
+            return None  # Mixed instrument response
+
+        cdef Instrument instrument = self._cache.instrument(instrument_id)
+        if instrument is None:
+            return None
+
+        cdef list results = []
+        cdef object table = None
+        cdef BarType bar_type
+        cdef BarAggregator aggregator
+        cdef TimeBarAggregator time_aggregator
+        for bar_type in params.get("bar_types", ()):
+            if not is_vectorizable(bar_type) or bar_type.instrument_id != instrument_id:
+                continue
+
+            if (bar_type.spec.price_type == PriceType.LAST) != (data_cls is TradeTick):
+                continue
+
+            key = self._get_bar_aggregator_key(bar_type, request_id)
+            aggregator = self._bar_aggregators.get(key)
+            if aggregator is None or aggregator._builder.initialized or aggregator._builder._adjustment_active:
+                continue
+
+            options = {}
+            if isinstance(aggregator, TimeBarAggregator):
+                time_aggregator = aggregator
+                options = {
+                    "interval_type": "left-open" if time_aggregator._is_left_open else "right-open",
+                    "timestamp_on_close": time_aggregator._timestamp_on_close,
+                    "skip_first_non_full_bar": time_aggregator._skip_first_non_full_bar,
+                    "build_with_no_updates": time_aggregator._build_with_no_updates,
+                    "time_bars_origin_offset": time_aggregator._time_bars_origin_offset,
+                    "bar_build_delay": time_aggregator._bar_build_delay,
+                }
+
+            if table is None:
+                table = ArrowSerializer.serialize_batch(data, data_cls)
+
+            try:
+                bars = aggregate_bars(table, instrument, aggregator.bar_type, **options)
+            except ValueError as e:
+                self._log.debug(f"Aggregating {bar_type} bars tick by tick: {e}")
+                continue
+
+            # Bars are published from the result, so the aggregator no longer takes the ticks
+            self._dispose_bar_aggregator(bar_type, historical=True, request_id=request_id)
+            self._bar_aggregators.pop(key, None)
+            results.append(bars)
+
+        if not results:
+            return None
+
+        return list(heapq.merge(*results, key=_bar_ts_init))
+
     cpdef void _start_bar_aggregator(self, MarketDataClient client, SubscribeBars command):
         key = self._get_bar_aggregator_key(command.bar_type)
 
@@ -3595,6 +3742,14 @@ cdef class DataEngine(Component):
         self._setup_bar_aggregator(command.bar_type)
         self._subscribe_bar_aggregator(client, command)
 
+        aggregator = self._bar_aggregators.get(key)
+        if (
+            self._time_bars_cascade
+            and isinstance(aggregator, TimeBarAggregator)
+            and not command.bar_type.is_composite()
+        ):
+            self._cascade_bar_aggregator(aggregator)
+
     cpdef void _stop_bar_aggregator(self, MarketDataClient client, UnsubscribeBars command):
         key = self._get_bar_aggregator_key(command.bar_type)
         aggregator = self._bar_aggregators.get(key)
@@ -3607,6 +3762,7 @@ cdef class DataEngine(Component):
             return
 
         if isinstance(aggregator, TimeBarAggregator):
+            self._release_bar_aggregator_cascade(aggregator)
             aggregator.stop_timer()
 
         self._dispose_bar_aggregator(command.bar_type)
@@ -3615,6 +3771,59 @@ cdef class DataEngine(Component):
         self._bar_aggregators.pop(key, None)
         self._log.debug(f"Removed aggregator for {key=}")
 
+    cdef void _cascade_bar_aggregator(self, TimeBarAggregator aggregator):
+        cdef TimeBarAggregator parent = None
+        cdef TimeBarAggregator other
+
+        # Roll up from the coarsest aggregator the bars can be cascaded from
+        for other in self._cascadable_bar_aggregators.values():
+            if other.is_cascadable(aggregator) and (parent is None or other.interval_ns > parent.interval_ns):
+                parent = other
+
+        if parent is not None:
+            self._dispose_bar_aggregator(aggregator.bar_type)
+            parent.add_cascade(aggregator)
+            self._log.debug(f"Cascaded {aggregator.bar_type} from {parent.bar_type}")
+
+        # Roll up any coarser aggregators still receiving the market data
+        for other in list(self._cascadable_bar_aggregators.values()):
+            if aggregator.is_cascadable(other):
+                self._dispose_bar_aggregator(other.bar_type)
+                aggregator.add_cascade(other)
+                self._log.debug(f"Cascaded {other.bar_type} from {aggregator.bar_type}")
+
+        self._cascadable_bar_aggregators[aggregator.bar_type] = aggregator
+
+    cdef void _release_bar_aggregator_cascade(self, TimeBarAggregator aggregator):
+        if self._cascadable_bar_aggregators.pop(aggregator.bar_type, None) is None:
+            return  # Not cascadable
+
+        # Cascaded aggregators resume from the market data, or from another aggregator
+        cdef TimeBarAggregator child
+        for child in aggregator.cascade():
+            aggregator.remove_cascade(child)
+            self._subscribe_bar_aggregator_ticks(child)
+            self._cascade_bar_aggregator(child)
+
+        if aggregator.cascade_parent is not None:
+            aggregator.cascade_parent.remove_cascade(aggregator)
+            self._subscribe_bar_aggregator_ticks(aggregator)  # Unsubscribed on dispose
+
+    cdef void _subscribe_bar_aggregator_ticks(self, TimeBarAggregator aggregator):
+        cdef BarType bar_type = aggregator.bar_type
+        if bar_type.spec.price_type == PriceType.LAST:
+            self._msgbus.subscribe(
+                topic=self._topic_cache.get_trades_topic(bar_type.instrument_id),
+                handler=aggregator.handle_trade_tick,
+                priority=5,
+            )
+        else:
+            self._msgbus.subscribe(
+                topic=self._topic_cache.get_quotes_topic(bar_type.instrument_id),
+                handler=aggregator.handle_quote_tick,
+                priority=5,
+            )
+
     cpdef void _create_bar_aggregator(self, BarType bar_type, dict params, UUID4 request_id = None):
         key = self._get_bar_aggregator_key(bar_type, request_id)
         if key in self._bar_aggregators:
@@ -3646,6 +3855,7 @@ cdef class DataEngine(Component):
                 build_with_no_updates=self._time_bars_build_with_no_updates,
                 time_bars_origin_offset=time_bars_origin_offset,
                 bar_build_delay=self._time_bars_build_delay,
+                scheduler=self._time_bar_scheduler,
             )
         elif bar_type.spec.aggregation == BarAggregation.TICK:
             aggregator = TickBarAggregator(
@@ -3745,6 +3955,7 @@ cdef class DataEngine(Component):
             if isinstance(aggregator, TimeBarAggregator):
                 test_clock = TestClock()
                 aggregator.set_clock(test_clock)
+                aggregator.set_scheduler(None)  # Closes on its own clock
 
             aggregator.set_historical_mode(historical, self.process_historical)
         else:
@@ -3755,6 +3966,7 @@ cdef class DataEngine(Component):
             if isinstance(aggregator, TimeBarAggregator):
                 aggregator.stop_timer()
                 aggregator.set_clock(self._clock)
+                aggregator.set_scheduler(self._time_bar_scheduler)
 
             aggregator.set_historical_mode(historical, self.process)
 
@@ -5253,6 +5465,10 @@ class ContinuousFutureSubscriptionState:
     timer_name: str | None = None
 
 
+def _bar_ts_init(Bar bar) -> int:
+    return bar.ts_init
+
+
 TimeRangeGenerator = Callable[[int, dict[str, Any]], Generator[int, bool, None]]
 
 
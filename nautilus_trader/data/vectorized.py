@@ -0,0 +1,816 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+"""
+Vectorized (columnar) aggregation of historical bars from Arrow tick tables.
+
+The functions in this module produce exactly the same bars as the streaming bar
+aggregators in `nautilus_trader.data.aggregation` would for the same ticks, without
+creating a tick object per row. Input which cannot be reproduced exactly raises a
+`ValueError`, so callers can fall back to the streaming aggregators.
+
+"""
+
+from __future__ import annotations
+
+from decimal import ROUND_FLOOR
+from decimal import Decimal
+from decimal import getcontext
+from decimal import localcontext
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Final
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.datetime import time_object_to_dt
+from nautilus_trader.data.aggregation import TimeBarAggregator
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import FIXED_PRECISION
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+
+
+if TYPE_CHECKING:
+    from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+    from nautilus_trader.persistence.catalog.parquet import TimestampLike
+
+
+_TIME_AGGREGATIONS: Final[frozenset[BarAggregation]] = frozenset(
+    {
+        BarAggregation.MILLISECOND,
+        BarAggregation.SECOND,
+        BarAggregation.MINUTE,
+        BarAggregation.HOUR,
+        BarAggregation.DAY,
+        BarAggregation.WEEK,
+    },
+)
+
+VECTORIZED_AGGREGATIONS: Final[frozenset[BarAggregation]] = _TIME_AGGREGATIONS | {
+    BarAggregation.TICK,
+    BarAggregation.VOLUME,
+    BarAggregation.VALUE,
+}
+
+# Integers below this bound are exactly representable as a double
+_FLOAT_EXACT_MAX: Final[int] = 2**53
+
+# Headroom bound for int64 accumulations
+_INT_SAFE_MAX: Final[int] = 2**62
+
+
+def is_vectorizable(bar_type: BarType) -> bool:
+    """
+    Return whether bars of the given type can be aggregated by `aggregate_bars`.
+
+    Parameters
+    ----------
+    bar_type : BarType
+        The bar type to check.
+
+    Returns
+    -------
+    bool
+
+    """
+    return not bar_type.is_composite() and bar_type.spec.aggregation in VECTORIZED_AGGREGATIONS
+
+
+def aggregate_bars(
+    table: pa.Table,
+    instrument: Instrument,
+    bar_type: BarType,
+    interval_type: str = "left-open",
+    timestamp_on_close: bool = True,
+    skip_first_non_full_bar: bool = False,
+    build_with_no_updates: bool = True,
+    time_bars_origin_offset: pd.Timedelta | pd.DateOffset | None = None,
+    bar_build_delay: int = 0,
+) -> list[Bar]:
+    """
+    Aggregate bars from the given Arrow table of quote or trade ticks.
+
+    The table must have the catalog (Arrow) schema for `QuoteTick` (for BID, ASK and
+    MID price types) or `TradeTick` (for the LAST price type), with rows sorted by
+    `ts_init`. The bars are identical to those the equivalent streaming aggregator
+    would produce from the same ticks in historical mode, including the trailing
+    partial bar being left unbuilt.
+
+    Parameters
+    ----------
+    table : pa.Table
+        The tick table to aggregate.
+    instrument : Instrument
+        The instrument for the bars.
+    bar_type : BarType
+        The bar type to aggregate.
+    interval_type : str, default 'left-open'
+        The time bar interval type, either 'left-open' or 'right-open'.
+    timestamp_on_close : bool, default True
+        If time bar `ts_event` timestamps should be the bar close.
+    skip_first_non_full_bar : bool, default False
+        If the first time bar should be skipped when its interval started before the
+        first tick.
+    build_with_no_updates : bool, default True
+        If time bars should be built for intervals with no ticks.
+    time_bars_origin_offset : pd.Timedelta or pd.DateOffset, optional
+        The origin offset for time bar intervals.
+    bar_build_delay : int, default 0
+        The time bar build delay (microseconds).
+
+    Returns
+    -------
+    list[Bar]
+
+    Raises
+    ------
+    ValueError
+        If `bar_type` is not vectorizable (see `is_vectorizable`).
+    ValueError
+        If the table rows are not sorted by `ts_init`.
+    ValueError
+        If the table values cannot be aggregated exactly (such as MID prices beyond
+        double precision, or value bars with non-positive prices).
+
+    """
+    PyCondition.equal(
+        instrument.id,
+        bar_type.instrument_id,
+        "instrument.id",
+        "bar_type.instrument_id",
+    )
+
+    if not is_vectorizable(bar_type):
+        raise ValueError(f"Cannot aggregate {bar_type} bars with the vectorized aggregator")
+
+    if table.num_rows == 0:
+        return []
+
+    price_type = bar_type.spec.price_type
+    ts_init, prices, sizes, price_precision, size_precision = _tick_columns(
+        table,
+        price_type,
+        instrument,
+    )
+
+    if np.any(ts_init[1:] < ts_init[:-1]):
+        raise ValueError("Tick table rows must be sorted by `ts_init`")
+
+    aggregation = bar_type.spec.aggregation
+    if aggregation == BarAggregation.TICK:
+        columns = _aggregate_tick(bar_type.spec.step, ts_init, prices, sizes)
+    elif aggregation == BarAggregation.VOLUME:
+        columns = _aggregate_volume(bar_type.spec.step, ts_init, prices, sizes, size_precision)
+    elif aggregation == BarAggregation.VALUE:
+        columns = _ValueBars(
+            step=bar_type.spec.step,
+            ts_init=ts_init,
+            prices=prices,
+            sizes=sizes,
+            price_precision=price_precision,
+            size_precision=size_precision,
+        ).aggregate()
+    else:
+        clock = TestClock()
+        clock.set_time(int(ts_init[0]))
+        aggregator = TimeBarAggregator(
+            instrument=instrument,
+            bar_type=bar_type,
+            handler=_discard,
+            clock=clock,
+            interval_type=interval_type,
+            timestamp_on_close=timestamp_on_close,
+            skip_first_non_full_bar=skip_first_non_full_bar,
+            build_with_no_updates=build_with_no_updates,
+            time_bars_origin_offset=time_bars_origin_offset,
+            bar_build_delay=bar_build_delay,
+        )
+        columns = _aggregate_time(
+            aggregator,
+            ts_init.astype(np.int64),
+            prices,
+            sizes,
+            is_left_open=interval_type == "left-open",
+            timestamp_on_close=timestamp_on_close,
+            skip_first_non_full_bar=skip_first_non_full_bar,
+            build_with_no_updates=build_with_no_updates,
+        )
+
+    return _to_bars(
+        bar_type,
+        columns,
+        price_precision=price_precision,
+        size_precision=size_precision,
+        volume_precision=instrument.size_precision,
+    )
+
+
+def aggregate_catalog_bars(
+    catalog: ParquetDataCatalog,
+    bar_type: BarType,
+    start: TimestampLike | None = None,
+    end: TimestampLike | None = None,
+    write: bool = True,
+    **kwargs: Any,
+) -> list[Bar]:
+    """
+    Aggregate bars for the given bar type from the tick data in the catalog.
+
+    The tick files are read as one Arrow table and aggregated with `aggregate_bars`,
+    without decoding any ticks to objects.
+
+    Parameters
+    ----------
+    catalog : ParquetDataCatalog
+        The catalog to read the ticks from (and write the bars to).
+    bar_type : BarType
+        The bar type to aggregate. Quotes are read for BID, ASK and MID price types,
+        and trades for the LAST price type.
+    start : TimestampLike, optional
+        The start (inclusive) `ts_init` for the ticks.
+    end : TimestampLike, optional
+        The end (inclusive) `ts_init` for the ticks.
+    write : bool, default True
+        If the bars should be written back to the catalog.
+    **kwargs : Any
+        The time bar options passed to `aggregate_bars`.
+
+    Returns
+    -------
+    list[Bar]
+
+    Raises
+    ------
+    ValueError
+        If the instrument for `bar_type` is not in the catalog.
+
+    """
+    instrument_id = bar_type.instrument_id.value
+    instruments = catalog.instruments(instrument_ids=[instrument_id])
+    if not instruments:
+        raise ValueError(f"No instrument {instrument_id} found in the catalog")
+
+    # Imported here as `pyarrow.dataset` is slow to load and only needed for catalog queries
+    import pyarrow.dataset as pds
+
+    data_cls = TradeTick if bar_type.spec.price_type == PriceType.LAST else QuoteTick
+    files = catalog._query_files(data_cls, [instrument_id], start, end)
+    if not files:
+        return []
+
+    used_start = time_object_to_dt(start)
+    used_end = time_object_to_dt(end)
+    ts_filter = None
+    if used_start is not None:
+        ts_filter = pds.field("ts_init") >= pa.scalar(used_start.value, pa.uint64())
+
+    if used_end is not None:
+        end_filter = pds.field("ts_init") <= pa.scalar(used_end.value, pa.uint64())
+        ts_filter = end_filter if ts_filter is None else ts_filter & end_filter
+
+    dataset = pds.dataset(files, filesystem=catalog.fs)
+    table = dataset.to_table(filter=ts_filter).replace_schema_metadata(dataset.schema.metadata)
+
+    # Files are only sorted individually, so sort when their ranges were read out of order
+    ts_init = table.column("ts_init").to_numpy()
+    if np.any(ts_init[1:] < ts_init[:-1]):
+        table = table.sort_by("ts_init")
+
+    bars = aggregate_bars(table, instruments[0], bar_type, **kwargs)
+
+    if write and bars:
+        catalog.write_data(bars)
+
+    return bars
+
+
+def _discard(bar: Bar) -> None:
+    pass  # Handler for the aggregator used only to resolve time bar intervals
+
+
+def _tick_columns(
+    table: pa.Table,
+    price_type: PriceType,
+    instrument: Instrument,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, int, int]:
+    # Return the ts_init, price and size columns with prices and sizes as integer
+    # units of the returned precisions
+    metadata = table.schema.metadata or {}
+    price_precision = int(metadata.get(b"price_precision", instrument.price_precision))
+    size_precision = int(metadata.get(b"size_precision", instrument.size_precision))
+    ts_init = table.column("ts_init").to_numpy()
+
+    if price_type == PriceType.LAST:
+        prices = _decode_units(table.column("price"), price_precision, "price")
+        sizes = _decode_units(table.column("size"), size_precision, "size")
+    elif price_type == PriceType.BID:
+        prices = _decode_units(table.column("bid_price"), price_precision, "bid_price")
+        sizes = _decode_units(table.column("bid_size"), size_precision, "bid_size")
+    elif price_type == PriceType.ASK:
+        prices = _decode_units(table.column("ask_price"), price_precision, "ask_price")
+        sizes = _decode_units(table.column("ask_size"), size_precision, "ask_size")
+    elif price_type == PriceType.MID:
+        # The streaming path halves the raw sums in double precision at one more digit of
+        # precision, which is only reproducible while those sums are exact doubles
+        bid_prices = _decode_units(table.column("bid_price"), price_precision, "bid_price")
+        ask_prices = _decode_units(table.column("ask_price"), price_precision, "ask_price")
+        bid_sizes = _decode_units(table.column("bid_size"), size_precision, "bid_size")
+        ask_sizes = _decode_units(table.column("ask_size"), size_precision, "ask_size")
+        price_sums = bid_prices + ask_prices
+        size_sums = bid_sizes + ask_sizes
+        _check_mid_exact(price_sums, price_precision, "price")
+        _check_mid_exact(size_sums, size_precision, "size")
+        prices = price_sums * 5
+        sizes = size_sums * 5
+        price_precision += 1
+        size_precision += 1
+    else:
+        raise ValueError(f"Cannot aggregate bars for price type {price_type}")
+
+    if np.any(sizes < 0):
+        raise ValueError("Tick sizes must not be negative")
+
+    return ts_init, prices, sizes, price_precision, size_precision
+
+
+def _decode_units(column: pa.ChunkedArray, precision: int, name: str) -> np.ndarray:
+    # Decode the fixed-point raw values to integer units of the given precision, with
+    # sub-precision digits rounded half away from zero (the same as the Rust decoder)
+    array = column.combine_chunks()
+    width = array.type.byte_width
+    data = np.frombuffer(array.buffers()[1], dtype=np.uint8)
+    data = data[array.offset * width : (array.offset + len(array)) * width]
+    words = data.view("<i8").reshape(len(array), width // 8)
+    raw = words[:, 0]
+
+    if width == 16 and not np.array_equal(words[:, 1], raw >> 63):
+        raise ValueError(f"Column '{name}' has raw values beyond 64 bits")
+
+    if precision >= FIXED_PRECISION:
+        return raw.copy()
+
+    scale = 10 ** (FIXED_PRECISION - precision)
+    units = (np.abs(raw) + scale // 2) // scale
+    return np.where(raw < 0, -units, units)
+
+
+def _check_mid_exact(sums: np.ndarray, precision: int, name: str) -> None:
+    largest = int(np.abs(sums).max()) if len(sums) else 0
+    if largest * 5 ** (FIXED_PRECISION - precision) >= _FLOAT_EXACT_MAX:
+        raise ValueError(f"MID {name} values exceed double precision")
+
+
+def _segment_reduce(
+    ufunc: np.ufunc,
+    values: np.ndarray,
+    starts: np.ndarray,
+    stops: np.ndarray,
+) -> np.ndarray:
+    # Reduce each non-empty [start, stop) segment, with segments possibly non-contiguous
+    indices = np.empty(2 * len(starts), dtype=np.intp)
+    indices[0::2] = starts
+    indices[1::2] = stops
+    padded = np.append(values, values[-1:])  # Stops may equal the length
+    return ufunc.reduceat(padded, indices)[0::2]
+
+
+def _aggregate_tick(
+    step: int,
+    ts_init: np.ndarray,
+    prices: np.ndarray,
+    sizes: np.ndarray,
+) -> tuple[np.ndarray, ...]:
+    count = len(prices) // step
+    rows = count * step
+    grouped_prices = prices[:rows].reshape(count, step)
+    ts_last = ts_init[step - 1 : rows : step]
+
+    return (
+        grouped_prices[:, 0],
+        grouped_prices.max(axis=1),
+        grouped_prices.min(axis=1),
+        grouped_prices[:, -1],
+        sizes[:rows].reshape(count, step).sum(axis=1),
+        ts_last,
+        ts_last,
+    )
+
+
+def _aggregate_volume(
+    step: int,
+    ts_init: np.ndarray,
+    prices: np.ndarray,
+    sizes: np.ndarray,
+    size_precision: int,
+) -> tuple[np.ndarray, ...]:
+    # Zero size ticks never update the streaming aggregator
+    mask = sizes > 0
+    ts_init = ts_init[mask]
+    prices = prices[mask]
+    sizes = sizes[mask]
+
+    step_units = step * 10**size_precision
+    if step_units >= _INT_SAFE_MAX or float(sizes.sum(dtype=np.float64)) >= _INT_SAFE_MAX:
+        raise ValueError("Volume bar sizes exceed the int64 range")
+
+    if len(sizes) == 0:
+        return _empty_columns()
+
+    cumulative = np.cumsum(sizes)
+    count = int(cumulative[-1]) // step_units
+    if count == 0:
+        return _empty_columns()
+
+    thresholds = np.arange(count + 1, dtype=np.int64) * step_units
+
+    # A tick which completes a bar (or several) contributes its remainder to the next bar
+    starts = np.searchsorted(cumulative, thresholds[:-1], side="right")
+    lasts = np.searchsorted(cumulative, thresholds[1:], side="left")
+
+    return (
+        prices[starts],
+        _segment_reduce(np.maximum, prices, starts, lasts + 1),
+        _segment_reduce(np.minimum, prices, starts, lasts + 1),
+        prices[lasts],
+        np.full(count, step_units, dtype=np.int64),
+        ts_init[lasts],
+        ts_init[lasts],
+    )
+
+
+def _aggregate_time(
+    aggregator: TimeBarAggregator,
+    ts_init: np.ndarray,
+    prices: np.ndarray,
+    sizes: np.ndarray,
+    is_left_open: bool,
+    timestamp_on_close: bool,
+    skip_first_non_full_bar: bool,
+    build_with_no_updates: bool,
+) -> tuple[np.ndarray, ...]:
+    # Resolve the interval grid from the aggregator itself, so alignment, origin offsets
+    # and build delays always match the streaming path
+    aggregator.start_timer()
+    aggregator.stop_timer()
+    first_close = aggregator.next_close_ns
+    first_open = aggregator.stored_open_ns
+    interval = aggregator.interval_ns
+    skip_until = aggregator.first_close_ns if skip_first_non_full_bar else -1
+
+    last = int(ts_init[-1])
+    if last < first_close:
+        return _empty_columns()
+
+    count = (last - first_close) // interval + 1
+
+    # Ticks up to and including a close time belong to that bar, except a repeated
+    # timestamp on a close time, which arrives after the bar was built
+    offsets = ts_init - first_close
+    bar_ids = np.where(offsets <= 0, 0, (offsets + interval - 1) // interval)
+    repeated = np.zeros(len(ts_init), dtype=np.bool_)
+    repeated[1:] = ts_init[1:] == ts_init[:-1]
+    bar_ids += (offsets >= 0) & (offsets % interval == 0) & repeated
+
+    ids = np.arange(count, dtype=np.int64)
+    starts = np.searchsorted(bar_ids, ids, side="left")
+    stops = np.searchsorted(bar_ids, ids, side="right")
+    has_updates = stops > starts
+    closes_ns = first_close + ids * interval
+
+    opens = np.zeros(count, dtype=np.int64)
+    highs = np.zeros(count, dtype=np.int64)
+    lows = np.zeros(count, dtype=np.int64)
+    closes = np.zeros(count, dtype=np.int64)
+    volumes = np.zeros(count, dtype=np.int64)
+
+    segments = starts[has_updates]
+    segment_stops = stops[has_updates]
+    opens[has_updates] = prices[segments]
+    highs[has_updates] = _segment_reduce(np.maximum, prices, segments, segment_stops)
+    lows[has_updates] = _segment_reduce(np.minimum, prices, segments, segment_stops)
+    closes[has_updates] = prices[segment_stops - 1]
+    cumulative = np.concatenate(([0], np.cumsum(sizes)))
+    volumes[has_updates] = cumulative[segment_stops] - cumulative[segments]
+
+    # Intervals without ticks are skipped entirely (the open time is not advanced)
+    # unless building with no updates, where they repeat the last built close
+    processed = np.ones(count, dtype=np.bool_) if build_with_no_updates else has_updates
+    built = processed & (closes_ns > skip_until)
+    source = np.maximum.accumulate(np.where(built & has_updates, ids, -1))
+    built &= source >= 0
+    source = np.maximum(source, 0)
+
+    opens = np.where(has_updates, opens, closes[source])
+    highs = np.where(has_updates, highs, closes[source])
+    lows = np.where(has_updates, lows, closes[source])
+    closes = np.where(has_updates, closes, closes[source])
+
+    last_processed = np.maximum.accumulate(np.where(processed, ids, -1))
+    previous = np.concatenate(([-1], last_processed[:-1]))
+    opens_ns = np.where(previous >= 0, first_close + previous * interval, first_open)
+    ts_event = closes_ns if is_left_open and timestamp_on_close else opens_ns
+
+    return (
+        opens[built],
+        highs[built],
+        lows[built],
+        closes[built],
+        volumes[built],
+        ts_event[built],
+        closes_ns[built],
+    )
+
+
+class _ValueBars:
+    # Replays `ValueBarAggregator` over integer columns.
+    #
+    # The streaming aggregator accumulates a `Decimal` value which is rounded to the
+    # context precision on each addition. Values are integers on the grid of 10^-exponent,
+    # so the running value is held as integer units (advanced with vectorized prefix sums)
+    # plus a sub-unit tail, which only arises from the divided value left over after a
+    # bar is built. Additions can only round the tail once the units reach a new power of
+    # ten, so rows are replayed one at a time only at those points and where a bar is
+    # completed, the latter with the same `Decimal` operations as the streaming path.
+
+    def __init__(
+        self,
+        step: int,
+        ts_init: np.ndarray,
+        prices: np.ndarray,
+        sizes: np.ndarray,
+        price_precision: int,
+        size_precision: int,
+    ) -> None:
+        # Zero size ticks never update the streaming aggregator
+        mask = sizes > 0
+        self._ts_init = ts_init[mask]
+        self._prices = prices[mask]
+        self._sizes = sizes[mask]
+
+        if np.any(self._prices <= 0):
+            raise ValueError("Value bars require positive prices")
+
+        max_value = float(np.max(self._prices * self._sizes.astype(np.float64), initial=0.0))
+        if max_value >= _INT_SAFE_MAX:
+            raise ValueError("Value bar tick values exceed the int64 range")
+
+        self._values = self._prices * self._sizes
+        self._exponent = price_precision + size_precision
+        self._step = step
+        self._step_units = step * 10**self._exponent
+        self._context_prec = getcontext().prec
+        if self._step_units >= _INT_SAFE_MAX:
+            raise ValueError("Value bar step exceeds the int64 range")
+
+        if len(str(self._step_units + int(max_value))) >= self._context_prec:
+            raise ValueError("Value bar step exceeds the decimal context precision")
+
+        self._chunk_rows = max(1, _INT_SAFE_MAX // max(1, int(max_value)))
+        self._price_precision = price_precision
+        self._size_precision = size_precision
+        self._price_scale = 10 ** (FIXED_PRECISION - price_precision)
+        self._size_scale = 10 ** (FIXED_PRECISION - size_precision)
+        self._unit = Decimal(1).scaleb(-self._exponent)
+
+        # Running cumulative value
+        self._units = 0
+        self._tail = Decimal(0)
+        self._rounding_units = self._step_units
+
+        # Builder state
+        self._open: int | None = None
+        self._high = 0
+        self._low = 0
+        self._close = 0
+        self._volume = 0
+        self._ts_last = 0
+        self._rows: list[tuple[int, int, int, int, int, int]] = []
+
+    def aggregate(self) -> tuple[np.ndarray, ...]:
+        count = len(self._values)
+        for chunk_start in range(0, count, self._chunk_rows):
+            chunk_stop = min(count, chunk_start + self._chunk_rows)
+            self._aggregate_chunk(chunk_start, chunk_stop)
+
+        if not self._rows:
+            return _empty_columns()
+
+        columns = np.array(self._rows, dtype=np.int64).T
+        ts_last = columns[5].astype(np.uint64)
+        return (*columns[:5], ts_last, ts_last)
+
+    def _aggregate_chunk(self, chunk_start: int, chunk_stop: int) -> None:
+        prefix = np.cumsum(self._values[chunk_start:chunk_stop])
+        chunk_total = int(prefix[-1])
+        index = chunk_start
+
+        while index < chunk_stop:
+            base = int(prefix[index - chunk_start - 1]) if index > chunk_start else 0
+            target = max(min(self._step_units, self._rounding_units), self._units + 1)
+            needed = target - self._units + base
+            if needed > chunk_total:
+                # No bar completes and the tail cannot round within the rest of the chunk
+                self._update_range(index, chunk_stop)
+                self._units += chunk_total - base
+                return
+
+            event = chunk_start + int(np.searchsorted(prefix, needed, side="left"))
+            if event > index:
+                self._update_range(index, event)
+                self._units += int(prefix[event - chunk_start - 1]) - base
+
+            self._apply_row(event)
+            index = event + 1
+
+    def _apply_row(self, index: int) -> None:
+        units = self._units + int(self._values[index])
+        tail = self._tail
+
+        if tail != 0 and units >= self._rounding_units:
+            # The sum has more digits than the context precision, round the tail
+            exponent = len(str(units)) - self._exponent - self._context_prec
+            tail = tail.quantize(Decimal(1).scaleb(exponent))
+            if tail >= self._unit:
+                units += 1
+                tail -= self._unit
+
+        if units >= self._step_units:
+            self._apply_crossing(index)
+            return
+
+        self._units = units
+        self._set_tail(tail)
+        self._update(
+            int(self._prices[index]),
+            int(self._sizes[index]),
+            int(self._ts_init[index]),
+        )
+
+    def _apply_crossing(self, index: int) -> None:
+        with localcontext() as context:
+            context.prec = 2 * self._context_prec
+            cum_value = Decimal(self._units).scaleb(-self._exponent) + self._tail
+
+        price_units = int(self._prices[index])
+        price = Price.from_raw(price_units * self._price_scale, self._price_precision)
+        size_update = Quantity.from_raw(
+            int(self._sizes[index]) * self._size_scale,
+            self._size_precision,
+        )
+        ts_init = int(self._ts_init[index])
+
+        # The same operations as `ValueBarAggregator._apply_update`
+        while size_update > 0:
+            value_update = price * size_update
+            if cum_value + value_update < self._step:
+                cum_value = cum_value + value_update
+                self._update(price_units, self._size_units(size_update), ts_init)
+                break
+
+            value_diff = self._step - cum_value
+            size_diff = size_update * (value_diff / value_update)
+            if _is_below_min_size(size_diff, self._size_precision):
+                if _is_below_min_size(size_update, self._size_precision):
+                    break
+
+                size_diff = Decimal(10) ** -self._size_precision
+
+            self._update(price_units, self._size_units(size_diff), ts_init)
+            self._build()
+            cum_value = Decimal(0)
+            size_update -= size_diff
+
+        with localcontext() as context:
+            context.prec = 2 * self._context_prec
+            scaled = cum_value.scaleb(self._exponent)
+            units = int(scaled.to_integral_value(rounding=ROUND_FLOOR))
+            tail = (scaled - units).scaleb(-self._exponent)
+
+        self._units = units
+        self._set_tail(tail)
+
+    def _set_tail(self, tail: Decimal) -> None:
+        self._tail = tail
+        if tail == 0:
+            self._rounding_units = self._step_units
+            return
+
+        # Units from which a sum has more digits than the context precision
+        tail_exponent = tail.normalize().as_tuple().exponent
+        self._rounding_units = 10 ** max(0, tail_exponent + self._exponent + self._context_prec)
+
+    def _size_units(self, size: Any) -> int:
+        return Quantity(size, precision=self._size_precision).raw // self._size_scale
+
+    def _update(self, price: int, size: int, ts_init: int) -> None:
+        if self._open is None:
+            self._open = price
+            self._high = price
+            self._low = price
+        elif price > self._high:
+            self._high = price
+        elif price < self._low:
+            self._low = price
+
+        self._close = price
+        self._volume += size
+        self._ts_last = ts_init
+
+    def _update_range(self, start: int, stop: int) -> None:
+        prices = self._prices[start:stop]
+        high = int(prices.max())
+        low = int(prices.min())
+        if self._open is None:
+            self._open = int(prices[0])
+            self._high = high
+            self._low = low
+        else:
+            self._high = max(self._high, high)
+            self._low = min(self._low, low)
+
+        self._close = int(prices[-1])
+        self._volume += int(self._sizes[start:stop].sum())
+        self._ts_last = int(self._ts_init[stop - 1])
+
+    def _build(self) -> None:
+        self._rows.append(
+            (self._open, self._high, self._low, self._close, self._volume, self._ts_last),
+        )
+        self._open = None
+        self._volume = 0
+
+
+def _is_below_min_size(size: Decimal, precision: int) -> bool:
+    return Quantity(float(size), precision=precision).raw == 0
+
+
+def _empty_columns() -> tuple[np.ndarray, ...]:
+    empty = np.array([], dtype=np.int64)
+    return (empty, empty, empty, empty, empty, empty, empty)
+
+
+def _to_bars(
+    bar_type: BarType,
+    columns: tuple[np.ndarray, ...],
+    price_precision: int,
+    size_precision: int,
+    volume_precision: int,
+) -> list[Bar]:
+    price_scale = 10 ** (FIXED_PRECISION - price_precision)
+    size_scale = 10 ** (FIXED_PRECISION - size_precision)
+    opens, highs, lows, closes, volumes, ts_events, ts_inits = (c.tolist() for c in columns)
+
+    bars: list[Bar] = []
+    for open_, high, low, close, volume, ts_event, ts_init in zip(
+        opens,
+        highs,
+        lows,
+        closes,
+        volumes,
+        ts_events,
+        ts_inits,
+        strict=True,
+    ):
+        # Volumes are rounded to the instrument size precision (the same as `BarBuilder`)
+        volume_raw = Quantity(
+            Quantity.from_raw(volume * size_scale, size_precision),
+            volume_precision,
+        ).raw
+        bars.append(
+            Bar.from_raw(
+                bar_type,
+                open_ * price_scale,
+                high * price_scale,
+                low * price_scale,
+                close * price_scale,
+                price_precision,
+                volume_raw,
+                volume_precision,
+                ts_event,
+                ts_init,
+            ),
+        )
+
+    return bars
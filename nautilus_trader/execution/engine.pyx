@@ -50,6 +50,9 @@ from nautilus_trader.common.component cimport LogColor
 from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.common.component cimport TimeEvent
 from nautilus_trader.common.generators cimport PositionIdGenerator
+from nautilus_trader.common.profiling cimport HotPathProfiler
+from nautilus_trader.common.profiling cimport LatencyTracer
+from nautilus_trader.common.profiling cimport TraceStage
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.fsm cimport InvalidStateTrigger
 from nautilus_trader.core.message cimport Command
@@ -875,7 +878,15 @@ cdef class ExecutionEngine(Component):
         """
         Condition.not_none(command, "command")
 
+        cdef HotPathProfiler profiler = self._get_profiler()
+        if profiler is None:
+            self._execute_command(command)
+            return
+
+        cdef uint64_t start_ns = profiler.start_c()
         self._execute_command(command)
+        if start_ns:
+            profiler.stop_c("engine", "ExecEngine", "_execute_command", start_ns)
 
     cpdef void process(self, OrderEvent event):
         """
@@ -889,7 +900,15 @@ cdef class ExecutionEngine(Component):
         """
         Condition.not_none(event, "event")
 
+        cdef HotPathProfiler profiler = self._get_profiler()
+        if profiler is None:
+            self._handle_event(event)
+            return
+
+        cdef uint64_t start_ns = profiler.start_c()
         self._handle_event(event)
+        if start_ns:
+            profiler.stop_c("engine", "ExecEngine", "_handle_event", start_ns)
 
     cpdef void flush_db(self):
         """
@@ -1117,6 +1136,10 @@ cdef class ExecutionEngine(Component):
 
     cpdef void _handle_submit_order(self, ExecutionClient client, SubmitOrder command):
         cdef Order order = command.order
+        cdef LatencyTracer tracer = self._get_tracer()
+        if tracer is not None:
+            tracer.stamp_order(order.client_order_id, TraceStage.EXEC_ENGINE)
+
         if not self._cache.order_exists(order.client_order_id):
             # Cache order
             self._cache.add_order(order, command.position_id, command.client_id)
@@ -1144,6 +1167,9 @@ cdef class ExecutionEngine(Component):
         if self.manage_own_order_books and should_handle_own_book_order(order):
             self._add_own_book_order(order)
 
+        if tracer is not None:
+            tracer.stamp_order(order.client_order_id, TraceStage.EXEC_CLIENT)
+
         # Send to execution client
         client.submit_order(command)
 
@@ -53,11 +53,35 @@ class LiveDataEngineConfig(DataEngineConfig, frozen=True):
     graceful_shutdown_on_exception : bool, default False
         If the system should perform a graceful shutdown when an unexpected exception
         occurs during message queue processing (does not include user actor/strategy exceptions).
+    use_ring_buffer_queues : bool, default False
+        If the engines internal queues should be bounded ring buffers, which signal the
+        event loop once per batch of messages (rather than once per message), and are
+        drained up to `queue_batch_size` messages per wakeup.
+    queue_batch_size : PositiveInt, default 1_000
+        The maximum number of messages drained per wakeup (ring buffer queues only).
+    queue_latency_histograms : bool, default False
+        If the enqueue to dequeue latency histograms should be recorded for each
+        internal queue (ring buffer queues only).
+    conflation_policies : dict[str, str], optional
+        The conflation policies for market data when the data queue is under backpressure,
+        keyed by data type name. Use 'latest' to keep only the newest pending data per
+        instrument (supported for `QuoteTick`, `MarkPriceUpdate`, `IndexPriceUpdate`,
+        `FundingRateUpdate` and `OrderBookDepth10`), or 'merge' to merge pending
+        `OrderBookDeltas` per instrument into a single batch. Trades, bars and all other
+        data are never conflated. If ``None`` then no data is conflated.
+    conflation_threshold : PositiveFloat, default 0.8
+        The fraction of `qsize` at which the data queue is considered under backpressure,
+        and conflation begins (must be in range (0, 1]).
 
     """
 
     qsize: PositiveInt = 100_000
     graceful_shutdown_on_exception: bool = False
+    use_ring_buffer_queues: bool = False
+    queue_batch_size: PositiveInt = 1_000
+    queue_latency_histograms: bool = False
+    conflation_policies: dict[str, str] | None = None
+    conflation_threshold: PositiveFloat = 0.8
 
 
 class LiveRiskEngineConfig(RiskEngineConfig, frozen=True):
@@ -71,11 +95,23 @@ class LiveRiskEngineConfig(RiskEngineConfig, frozen=True):
     graceful_shutdown_on_exception : bool, default False
         If the system should perform a graceful shutdown when an unexpected exception
         occurs during message queue processing (does not include user actor/strategy exceptions).
+    use_ring_buffer_queues : bool, default False
+        If the engines internal queues should be bounded ring buffers, which signal the
+        event loop once per batch of messages (rather than once per message), and are
+        drained up to `queue_batch_size` messages per wakeup.
+    queue_batch_size : PositiveInt, default 1_000
+        The maximum number of messages drained per wakeup (ring buffer queues only).
+    queue_latency_histograms : bool, default False
+        If the enqueue to dequeue latency histograms should be recorded for each
+        internal queue (ring buffer queues only).
 
     """
 
     qsize: PositiveInt = 100_000
     graceful_shutdown_on_exception: bool = False
+    use_ring_buffer_queues: bool = False
+    queue_batch_size: PositiveInt = 1_000
+    queue_latency_histograms: bool = False
 
 
 class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
@@ -171,6 +207,15 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
     graceful_shutdown_on_exception : bool, default False
         If the system should perform a graceful shutdown when an unexpected exception
         occurs during message queue processing (does not include user actor/strategy exceptions).
+    use_ring_buffer_queues : bool, default False
+        If the engines internal queues should be bounded ring buffers, which signal the
+        event loop once per batch of messages (rather than once per message), and are
+        drained up to `queue_batch_size` messages per wakeup.
+    queue_batch_size : PositiveInt, default 1_000
+        The maximum number of messages drained per wakeup (ring buffer queues only).
+    queue_latency_histograms : bool, default False
+        If the enqueue to dequeue latency histograms should be recorded for each
+        internal queue (ring buffer queues only).
 
     """
 
@@ -199,6 +244,9 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
     reconciliation_startup_delay_secs: PositiveFloat = 10.0
     qsize: PositiveInt = 100_000
     graceful_shutdown_on_exception: bool = False
+    use_ring_buffer_queues: bool = False
+    queue_batch_size: PositiveInt = 1_000
+    queue_latency_histograms: bool = False
 
 
 class RoutingConfig(NautilusConfig, frozen=True):
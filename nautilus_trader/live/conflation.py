@@ -0,0 +1,249 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from collections import Counter
+from typing import Final
+
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.data import Data
+from nautilus_trader.model.data import FundingRateUpdate
+from nautilus_trader.model.data import IndexPriceUpdate
+from nautilus_trader.model.data import MarkPriceUpdate
+from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.data import OrderBookDepth10
+from nautilus_trader.model.data import QuoteTick
+
+
+CONFLATION_LATEST: Final[str] = "latest"
+CONFLATION_MERGE: Final[str] = "merge"
+
+# Data types which are snapshots of state, so only the newest per instrument matters
+_LATEST_TYPES: Final[dict[str, type]] = {
+    QuoteTick.__name__: QuoteTick,
+    MarkPriceUpdate.__name__: MarkPriceUpdate,
+    IndexPriceUpdate.__name__: IndexPriceUpdate,
+    FundingRateUpdate.__name__: FundingRateUpdate,
+    OrderBookDepth10.__name__: OrderBookDepth10,
+}
+
+# Data types which are incremental, so pending updates are merged rather than dropped
+_MERGE_TYPES: Final[dict[str, type]] = {
+    OrderBookDeltas.__name__: OrderBookDeltas,
+}
+
+
+class ConflationSlot:
+    """
+    Represents a queue position holding the pending conflated data for a key.
+
+    Parameters
+    ----------
+    key : tuple[type, object]
+        The conflation key (data type and instrument ID).
+    data : Data
+        The initial pending data.
+
+    """
+
+    __slots__ = ("data", "key", "merged")
+
+    def __init__(self, key: tuple[type, object], data: Data) -> None:
+        self.key = key
+        self.data = data
+        self.merged: list[OrderBookDelta] | None = None
+
+
+class DataConflator:
+    """
+    Provides per data type conflation of market data for a live engine queue under
+    backpressure.
+
+    Once the queue size reaches the threshold, data of a conflated type is no longer
+    queued individually. The first message for each (data type, instrument ID) key
+    takes a single queue position (a `ConflationSlot`), and subsequent messages for
+    the same key update the slot in place until it is consumed (even if the queue
+    size has since dropped below the threshold, so data is never delivered out of order):
+
+    - 'latest': the pending data is replaced with the newest data.
+    - 'merge': the pending `OrderBookDeltas` are merged with the new deltas into a
+      single batch, so no book updates are lost.
+
+    This bounds the queue growth during bursts to the number of keys, and the consumer
+    always sees the newest state. Data types without a policy (such as trades, bars,
+    and all order events) are never conflated.
+
+    Parameters
+    ----------
+    policies : dict[str, str]
+        The conflation policies keyed by data type name.
+    maxsize : int
+        The maximum size of the queue being conflated.
+    threshold : float
+        The fraction of `maxsize` at which conflation begins.
+
+    Raises
+    ------
+    ValueError
+        If a policy is not 'latest' or 'merge', or is not supported for the data type.
+    ValueError
+        If `threshold` is not in range (0, 1].
+
+    """
+
+    def __init__(
+        self,
+        policies: dict[str, str],
+        maxsize: int,
+        threshold: float,
+    ) -> None:
+        PyCondition.positive_int(maxsize, "maxsize")
+        PyCondition.in_range(threshold, 0.0, 1.0, "threshold")
+        PyCondition.positive(threshold, "threshold")
+
+        self._policies: dict[type, str] = {}
+        for type_name, policy in policies.items():
+            if policy == CONFLATION_LATEST and type_name in _LATEST_TYPES:
+                self._policies[_LATEST_TYPES[type_name]] = policy
+            elif policy == CONFLATION_MERGE and type_name in _MERGE_TYPES:
+                self._policies[_MERGE_TYPES[type_name]] = policy
+            else:
+                raise ValueError(
+                    f"Invalid conflation policy '{policy}' for data type '{type_name}', "
+                    f"supported 'latest' for {sorted(_LATEST_TYPES)}, "
+                    f"and 'merge' for {sorted(_MERGE_TYPES)}",
+                )
+
+        self._threshold_size = max(1, int(maxsize * threshold))
+        self._pending: dict[tuple[type, object], ConflationSlot] = {}
+        self._counts: Counter[str] = Counter()
+
+    @property
+    def threshold_size(self) -> int:
+        """
+        Return the queue size at which conflation begins.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._threshold_size
+
+    def pending_count(self) -> int:
+        """
+        Return the number of keys with pending conflated data.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._pending)
+
+    def counts(self) -> dict[str, int]:
+        """
+        Return the number of messages conflated (replaced or merged), keyed by data type
+        name.
+
+        Returns
+        -------
+        dict[str, int]
+
+        """
+        return dict(self._counts)
+
+    def is_conflated(self, data: Data) -> bool:
+        """
+        Return whether the given data type has a conflation policy.
+
+        Parameters
+        ----------
+        data : Data
+            The data to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        return type(data) in self._policies
+
+    def conflate(self, data: Data, qsize: int) -> Data | ConflationSlot | None:
+        """
+        Conflate the given data if the queue is under backpressure.
+
+        Parameters
+        ----------
+        data : Data
+            The data to conflate.
+        qsize : int
+            The current queue size.
+
+        Returns
+        -------
+        Data or ConflationSlot or ``None``
+            The item to enqueue, or ``None`` if the data was conflated into a pending slot.
+
+        """
+        data_type = type(data)
+        policy = self._policies.get(data_type)
+        if policy is None:
+            return data
+
+        key = (data_type, data.instrument_id)
+
+        # A pending slot absorbs all data for its key regardless of the queue size,
+        # otherwise data queued behind the slot would be delivered out of order
+        slot = self._pending.get(key)
+        if slot is None:
+            if qsize < self._threshold_size:
+                return data
+
+            slot = ConflationSlot(key, data)
+            self._pending[key] = slot
+            return slot
+
+        if policy == CONFLATION_MERGE:
+            # Accumulate the deltas and only build the merged batch once when taken
+            if slot.merged is None:
+                slot.merged = slot.data.deltas
+            slot.merged.extend(data.deltas)
+
+        slot.data = data
+        self._counts[data_type.__name__] += 1
+
+        return None
+
+    def take(self, slot: ConflationSlot) -> Data:
+        """
+        Take the pending data from the given slot when it is consumed from the queue.
+
+        Parameters
+        ----------
+        slot : ConflationSlot
+            The slot to take from.
+
+        Returns
+        -------
+        Data
+
+        """
+        self._pending.pop(slot.key, None)
+
+        if slot.merged is not None:
+            return OrderBookDeltas(instrument_id=slot.data.instrument_id, deltas=slot.merged)
+
+        return slot.data
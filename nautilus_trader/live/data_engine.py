@@ -15,7 +15,6 @@
 
 import asyncio
 import os
-from asyncio import Queue
 from typing import Final
 
 from nautilus_trader.cache.cache import Cache
@@ -29,7 +28,12 @@ from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.data.messages import DataCommand
 from nautilus_trader.data.messages import DataResponse
 from nautilus_trader.data.messages import RequestData
+from nautilus_trader.live.conflation import ConflationSlot
+from nautilus_trader.live.conflation import DataConflator
+from nautilus_trader.live.enqueue import RingBufferQueue
 from nautilus_trader.live.enqueue import ThrottledEnqueuer
+from nautilus_trader.live.enqueue import create_queue
+from nautilus_trader.live.enqueue import get_batch
 
 
 class LiveDataEngine(DataEngine):
@@ -77,10 +81,10 @@ class LiveDataEngine(DataEngine):
         )
 
         self._loop: asyncio.AbstractEventLoop = loop
-        self._cmd_queue: asyncio.Queue = Queue(maxsize=config.qsize)
-        self._req_queue: asyncio.Queue = Queue(maxsize=config.qsize)
-        self._res_queue: asyncio.Queue = Queue(maxsize=config.qsize)
-        self._data_queue: asyncio.Queue = Queue(maxsize=config.qsize)
+        self._cmd_queue: asyncio.Queue | RingBufferQueue = create_queue(config, loop)
+        self._req_queue: asyncio.Queue | RingBufferQueue = create_queue(config, loop)
+        self._res_queue: asyncio.Queue | RingBufferQueue = create_queue(config, loop)
+        self._data_queue: asyncio.Queue | RingBufferQueue = create_queue(config, loop)
 
         self._cmd_enqueuer: ThrottledEnqueuer[DataCommand] = ThrottledEnqueuer(
             qname="cmd_queue",
@@ -111,6 +115,14 @@ class LiveDataEngine(DataEngine):
             logger=self._log,
         )
 
+        self._conflator: DataConflator | None = None
+        if config.conflation_policies:
+            self._conflator = DataConflator(
+                policies=config.conflation_policies,
+                maxsize=config.qsize,
+                threshold=config.conflation_threshold,
+            )
+
         # Async tasks
         self._cmd_queue_task: asyncio.Task | None = None
         self._req_queue_task: asyncio.Task | None = None
@@ -242,6 +254,74 @@ class LiveDataEngine(DataEngine):
         """
         return self._data_queue.qsize()
 
+    def queue_high_water_marks(self) -> dict[str, int]:
+        """
+        Return the high-water marks for the internal queues, keyed by queue name.
+
+        Only available for ring buffer queues (see `use_ring_buffer_queues`),
+        otherwise an empty dict is returned.
+
+        Returns
+        -------
+        dict[str, int]
+
+        """
+        return {
+            enqueuer.qname: enqueuer.high_water_mark
+            for enqueuer in (
+                self._cmd_enqueuer,
+                self._req_enqueuer,
+                self._res_enqueuer,
+                self._data_enqueuer,
+            )
+            if enqueuer.high_water_mark is not None
+        }
+
+    def queue_latency_histograms(self) -> dict[str, dict[int, int]]:
+        """
+        Return the enqueue to dequeue latency histograms for the internal queues, keyed
+        by queue name.
+
+        Each histogram maps the bucket upper bound (nanoseconds) to the message count.
+        Only available for ring buffer queues with `queue_latency_histograms` enabled,
+        otherwise an empty dict is returned.
+
+        Returns
+        -------
+        dict[str, dict[int, int]]
+
+        """
+        histograms: dict[str, dict[int, int]] = {}
+        for enqueuer in (
+            self._cmd_enqueuer,
+            self._req_enqueuer,
+            self._res_enqueuer,
+            self._data_enqueuer,
+        ):
+            histogram = enqueuer.latency_histogram()
+            if histogram:
+                histograms[enqueuer.qname] = histogram
+
+        return histograms
+
+    def conflation_counts(self) -> dict[str, int]:
+        """
+        Return the number of data messages conflated under backpressure, keyed by data
+        type name.
+
+        A message is counted when it replaces or is merged into pending data for the same
+        instrument (see `conflation_policies`).
+
+        Returns
+        -------
+        dict[str, int]
+
+        """
+        if self._conflator is None:
+            return {}
+
+        return self._conflator.counts()
+
     def kill(self) -> None:
         """
         Kill the engine by abruptly canceling the queue tasks and calling stop.
@@ -329,6 +409,9 @@ class LiveDataEngine(DataEngine):
         and schedules an asynchronous `put()` operation. This ensures all messages are
         eventually enqueued and processed without blocking the caller when the queue is full.
 
+        If `conflation_policies` are configured, then once the queue reaches the conflation
+        threshold, data of a conflated type is conflated per instrument rather than queued.
+
         Parameters
         ----------
         data : Data
@@ -340,6 +423,12 @@ class LiveDataEngine(DataEngine):
         loop is running on. Calling it from a different thread may lead to unexpected behavior.
 
         """
+        if self._conflator is not None:
+            item = self._conflator.conflate(data, self._data_queue.qsize())
+            if item is not None:
+                self._data_enqueuer.enqueue(item)
+            return
+
         self._data_enqueuer.enqueue(data)
 
     # -- INTERNAL -------------------------------------------------------------------------------------
@@ -403,19 +492,32 @@ class LiveDataEngine(DataEngine):
         self._log.debug(
             f"DataCommand message queue processing starting (qsize={self.cmd_qsize()})",
         )
+        profiler = self._msgbus.profiler
         try:
             while True:
                 try:
-                    command: DataCommand | None = await self._cmd_queue.get()
-                    if command is self._sentinel:
-                        break
-
-                    self._execute_command(command)
+                    batch: list[DataCommand | None] = await get_batch(self._cmd_queue)
                 except asyncio.CancelledError:
                     self._log.warning("DataCommand message queue canceled")
                     break
-                except Exception as e:
-                    self._handle_queue_exception(e, "DataCommand")
+
+                for command in batch:
+                    if command is self._sentinel:
+                        return
+
+                    try:
+                        if profiler is None:
+                            self._execute_command(command)
+                        else:
+                            profiler.call(
+                                "engine",
+                                "DataEngine",
+                                "_execute_command",
+                                self._execute_command,
+                                command,
+                            )
+                    except Exception as e:
+                        self._handle_queue_exception(e, "DataCommand")
         finally:
             stopped_msg = "DataCommand message queue stopped"
 
@@ -428,19 +530,32 @@ class LiveDataEngine(DataEngine):
         self._log.debug(
             f"RequestData message queue processing starting (qsize={self.req_qsize()})",
         )
+        profiler = self._msgbus.profiler
         try:
             while True:
                 try:
-                    request: RequestData | None = await self._req_queue.get()
-                    if request is self._sentinel:
-                        break
-
-                    self._handle_request(request)
+                    batch: list[RequestData | None] = await get_batch(self._req_queue)
                 except asyncio.CancelledError:
                     self._log.warning("RequestData message queue canceled")
                     break
-                except Exception as e:
-                    self._handle_queue_exception(e, "RequestData")
+
+                for request in batch:
+                    if request is self._sentinel:
+                        return
+
+                    try:
+                        if profiler is None:
+                            self._handle_request(request)
+                        else:
+                            profiler.call(
+                                "engine",
+                                "DataEngine",
+                                "_handle_request",
+                                self._handle_request,
+                                request,
+                            )
+                    except Exception as e:
+                        self._handle_queue_exception(e, "RequestData")
         finally:
             stopped_msg = "RequestData message queue stopped"
 
@@ -453,19 +568,32 @@ class LiveDataEngine(DataEngine):
         self._log.debug(
             f"DataResponse message queue processing starting (qsize={self.res_qsize()})",
         )
+        profiler = self._msgbus.profiler
         try:
             while True:
                 try:
-                    response: DataResponse | None = await self._res_queue.get()
-                    if response is self._sentinel:
-                        break
-
-                    self._handle_response(response)
+                    batch: list[DataResponse | None] = await get_batch(self._res_queue)
                 except asyncio.CancelledError:
                     self._log.warning("DataResponse message queue canceled")
                     break
-                except Exception as e:
-                    self._handle_queue_exception(e, "DataResponse")
+
+                for response in batch:
+                    if response is self._sentinel:
+                        return
+
+                    try:
+                        if profiler is None:
+                            self._handle_response(response)
+                        else:
+                            profiler.call(
+                                "engine",
+                                "DataEngine",
+                                "_handle_response",
+                                self._handle_response,
+                                response,
+                            )
+                    except Exception as e:
+                        self._handle_queue_exception(e, "DataResponse")
         finally:
             stopped_msg = "DataResponse message queue stopped"
 
@@ -476,19 +604,35 @@ class LiveDataEngine(DataEngine):
 
     async def _run_data_queue(self) -> None:
         self._log.debug(f"Data queue processing starting (qsize={self.data_qsize()})")
+        profiler = self._msgbus.profiler
         try:
             while True:
                 try:
-                    data: Data | None = await self._data_queue.get()
-                    if data is self._sentinel:
-                        break
-
-                    self._handle_data(data)
+                    batch: list[Data | None] = await get_batch(self._data_queue)
                 except asyncio.CancelledError:
                     self._log.warning("Data message queue canceled")
                     break
-                except Exception as e:
-                    self._handle_queue_exception(e, "Data")
+
+                for data in batch:
+                    if data is self._sentinel:
+                        return
+
+                    try:
+                        if type(data) is ConflationSlot:
+                            data = self._conflator.take(data)
+
+                        if profiler is None:
+                            self._handle_data(data)
+                        else:
+                            profiler.call(
+                                "engine",
+                                "DataEngine",
+                                "_handle_data",
+                                self._handle_data,
+                                data,
+                            )
+                    except Exception as e:
+                        self._handle_queue_exception(e, "Data")
         finally:
             stopped_msg = "Data message queue stopped"
 
@@ -14,11 +14,381 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any
 from weakref import WeakSet
 
 from nautilus_trader.common.component import Clock
 from nautilus_trader.common.component import Logger
+from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.nautilus_pyo3 import NANOSECONDS_IN_SECOND
+from nautilus_trader.live.config import LiveDataEngineConfig
+from nautilus_trader.live.config import LiveExecEngineConfig
+from nautilus_trader.live.config import LiveRiskEngineConfig
+
+
+# Latency histogram buckets are powers of two nanoseconds, from <= 1.024us to > 1.074s
+_LATENCY_MIN_EXP = 10
+_LATENCY_BUCKETS = 21
+
+
+class RingBufferQueue[T]:
+    """
+    Provides a bounded ring buffer queue for high throughput ingest onto the event loop.
+
+    Producers append to the buffer without a lock (appends and pops on the inner deque
+    are atomic), and the loop is only signalled when the consumer is waiting and has not
+    already been signalled, so a burst of messages costs a single wakeup rather than
+    one self-pipe write and loop callback per message. The consumer drains up to
+    `batch_size` messages per wakeup with `get_batch`.
+
+    The queue tracks a high-water mark, and optionally a histogram of the latency from
+    enqueue to dequeue for each message.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of messages in the buffer.
+    loop : asyncio.AbstractEventLoop
+        The event loop the consumer runs on.
+    batch_size : int, default 1_000
+        The maximum number of messages to drain per `get_batch`.
+    latency_histogram : bool, default False
+        If the enqueue to dequeue latency of each message should be recorded.
+
+    Raises
+    ------
+    ValueError
+        If `maxsize` is not positive.
+    ValueError
+        If `batch_size` is not positive.
+
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        loop: asyncio.AbstractEventLoop,
+        batch_size: int = 1_000,
+        latency_histogram: bool = False,
+    ) -> None:
+        PyCondition.positive_int(maxsize, "maxsize")
+        PyCondition.positive_int(batch_size, "batch_size")
+
+        self._maxsize = maxsize
+        self._loop = loop
+        self._batch_size = batch_size
+        self._record_latency = latency_histogram
+        self._buffer: deque[Any] = deque()
+        self._waiter: asyncio.Future | None = None
+        self._signalled: bool = False
+        self._putters: deque[asyncio.Future] = deque()
+        self._loop_thread_id: int | None = None
+        self._high_water_mark: int = 0
+        self._latency_counts: list[int] = [0] * _LATENCY_BUCKETS
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Return the maximum number of messages in the buffer.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._maxsize
+
+    @property
+    def batch_size(self) -> int:
+        """
+        Return the maximum number of messages drained per batch.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._batch_size
+
+    @property
+    def high_water_mark(self) -> int:
+        """
+        Return the maximum number of messages which have been buffered.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._high_water_mark
+
+    def qsize(self) -> int:
+        """
+        Return the number of messages in the buffer.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._buffer)
+
+    def empty(self) -> bool:
+        """
+        Return whether the buffer is empty.
+
+        Returns
+        -------
+        bool
+
+        """
+        return not self._buffer
+
+    def full(self) -> bool:
+        """
+        Return whether the buffer is at capacity.
+
+        Returns
+        -------
+        bool
+
+        """
+        return len(self._buffer) >= self._maxsize
+
+    def latency_histogram(self) -> dict[int, int]:
+        """
+        Return the histogram of enqueue to dequeue latencies.
+
+        The keys are the upper bounds of each bucket in nanoseconds (powers of two),
+        and the last bucket also counts all greater latencies. Empty if latency
+        recording is not enabled.
+
+        Returns
+        -------
+        dict[int, int]
+
+        """
+        if not self._record_latency:
+            return {}
+
+        return {1 << (_LATENCY_MIN_EXP + i): count for i, count in enumerate(self._latency_counts)}
+
+    def reset_metrics(self) -> None:
+        """
+        Reset the high-water mark and latency histogram.
+        """
+        self._high_water_mark = len(self._buffer)
+        self._latency_counts = [0] * _LATENCY_BUCKETS
+
+    def put_nowait(self, msg: T) -> None:
+        """
+        Put the message onto the buffer without blocking.
+
+        This method is safe to call from any thread.
+
+        Parameters
+        ----------
+        msg : T
+            The message to put.
+
+        Raises
+        ------
+        asyncio.QueueFull
+            If the buffer is at capacity.
+
+        """
+        size = len(self._buffer)
+        if size >= self._maxsize:
+            raise asyncio.QueueFull
+
+        if self._record_latency:
+            self._buffer.append((time.monotonic_ns(), msg))
+        else:
+            self._buffer.append(msg)
+
+        if size >= self._high_water_mark:
+            self._high_water_mark = size + 1
+
+        # Signal at most once per consumer wait, the appended message must be
+        # visible before the waiter check (see `get_batch`)
+        if self._waiter is not None and not self._signalled:
+            self._signalled = True
+            if threading.get_ident() == self._loop_thread_id:
+                self._loop.call_soon(self._wakeup)
+            else:
+                self._loop.call_soon_threadsafe(self._wakeup)
+
+    async def put(self, msg: T) -> None:
+        """
+        Put the message onto the buffer, waiting for capacity if full.
+
+        Parameters
+        ----------
+        msg : T
+            The message to put.
+
+        """
+        while self.full():
+            putter = self._loop.create_future()
+            self._putters.append(putter)
+            await putter
+
+        self.put_nowait(msg)
+
+    def get_nowait(self) -> T:
+        """
+        Return the next message from the buffer without blocking.
+
+        Returns
+        -------
+        T
+
+        Raises
+        ------
+        asyncio.QueueEmpty
+            If the buffer is empty.
+
+        """
+        try:
+            item = self._buffer.popleft()
+        except IndexError:
+            raise asyncio.QueueEmpty from None
+
+        self._wakeup_putters()
+
+        return self._unwrap(item)
+
+    async def get(self) -> T:
+        """
+        Return the next message from the buffer, waiting if empty.
+
+        Returns
+        -------
+        T
+
+        """
+        await self._wait_not_empty()
+        return self.get_nowait()
+
+    async def get_batch(self) -> list[T]:
+        """
+        Return up to `batch_size` messages from the buffer, waiting if empty.
+
+        A ``None`` sentinel message ends the batch (it is the last message returned).
+
+        Returns
+        -------
+        list[T]
+
+        """
+        await self._wait_not_empty()
+
+        buffer = self._buffer
+        batch: list[T] = []
+        for _ in range(min(len(buffer), self._batch_size)):
+            msg = self._unwrap(buffer.popleft())
+            batch.append(msg)
+            if msg is None:
+                break  # Sentinel
+
+        self._wakeup_putters()
+
+        return batch
+
+    async def _wait_not_empty(self) -> None:
+        self._loop_thread_id = threading.get_ident()
+
+        while not self._buffer:
+            self._signalled = False
+            self._waiter = self._loop.create_future()
+
+            # Check again after publishing the waiter, a producer may have appended
+            # before it could see the waiter
+            if not self._buffer:
+                try:
+                    await self._waiter
+                finally:
+                    self._waiter = None
+            else:
+                self._waiter = None
+
+    def _wakeup(self) -> None:
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _wakeup_putters(self) -> None:
+        putters = self._putters
+        while putters and len(self._buffer) < self._maxsize:
+            putter = putters.popleft()
+            if not putter.done():
+                putter.set_result(None)
+
+    def _unwrap(self, item: Any) -> T:
+        if not self._record_latency:
+            return item
+
+        ts_enqueued, msg = item
+        latency_ns = time.monotonic_ns() - ts_enqueued
+        index = max(0, (latency_ns - 1).bit_length() - _LATENCY_MIN_EXP)
+        self._latency_counts[min(index, _LATENCY_BUCKETS - 1)] += 1
+
+        return msg
+
+
+def create_queue(
+    config: LiveDataEngineConfig | LiveExecEngineConfig | LiveRiskEngineConfig,
+    loop: asyncio.AbstractEventLoop,
+) -> asyncio.Queue | RingBufferQueue:
+    """
+    Create an internal message queue for a live engine from the given config.
+
+    Parameters
+    ----------
+    config : LiveDataEngineConfig or LiveExecEngineConfig or LiveRiskEngineConfig
+        The engine configuration.
+    loop : asyncio.AbstractEventLoop
+        The event loop the consumer runs on.
+
+    Returns
+    -------
+    asyncio.Queue or RingBufferQueue
+
+    """
+    if config.use_ring_buffer_queues:
+        return RingBufferQueue(
+            maxsize=config.qsize,
+            loop=loop,
+            batch_size=config.queue_batch_size,
+            latency_histogram=config.queue_latency_histograms,
+        )
+
+    return asyncio.Queue(maxsize=config.qsize)
+
+
+async def get_batch[T](queue: asyncio.Queue | RingBufferQueue) -> list[T]:
+    """
+    Return the next batch of messages from the given queue, waiting if empty.
+
+    For an `asyncio.Queue` the batch is a single message.
+
+    Parameters
+    ----------
+    queue : asyncio.Queue or RingBufferQueue
+        The queue to get from.
+
+    Returns
+    -------
+    list[T]
+
+    """
+    if isinstance(queue, RingBufferQueue):
+        return await queue.get_batch()
+
+    return [await queue.get()]
 
 
 class ThrottledEnqueuer[T]:
@@ -29,8 +399,8 @@ class ThrottledEnqueuer[T]:
     ----------
     qname : str
         The name of the inner queue  (e.g., "data_queue").
-    queue : asyncio.Queue
-        The inner asyncio queue to manage.
+    queue : asyncio.Queue or RingBufferQueue
+        The inner queue to manage.
     loop : asyncio.AbstractEventLoop
         The event loop used for scheduling queue operations.
     clock : Clock
@@ -43,13 +413,14 @@ class ThrottledEnqueuer[T]:
     def __init__(
         self,
         qname: str,
-        queue: asyncio.Queue,
+        queue: asyncio.Queue | RingBufferQueue,
         loop: asyncio.AbstractEventLoop,
         clock: Clock,
         logger: Logger,
     ) -> None:
         self._qname = qname
         self._queue = queue
+        self._is_ring_buffer = isinstance(queue, RingBufferQueue)
         self._loop = loop
         self._clock = clock
         self._log = logger
@@ -92,6 +463,36 @@ class ThrottledEnqueuer[T]:
         """
         return self._queue.maxsize
 
+    @property
+    def high_water_mark(self) -> int | None:
+        """
+        Return the inner queue high-water mark (ring buffer queues only).
+
+        Returns
+        -------
+        int or ``None``
+
+        """
+        if not self._is_ring_buffer:
+            return None
+
+        return self._queue.high_water_mark
+
+    def latency_histogram(self) -> dict[int, int] | None:
+        """
+        Return the inner queue enqueue to dequeue latency histogram (ring buffer queues
+        only).
+
+        Returns
+        -------
+        dict[int, int] or ``None``
+
+        """
+        if not self._is_ring_buffer:
+            return None
+
+        return self._queue.latency_histogram()
+
     def enqueue(self, msg: T) -> None:
         """
         Enqueue a message and logs a throttled warning if the queue is at capacity.
@@ -109,8 +510,16 @@ class ThrottledEnqueuer[T]:
         assert msg is not None, "message was `None` when a value was expected"
 
         if self._queue.qsize() < self._queue.maxsize:
-            self._loop.call_soon_threadsafe(self._enqueue_nowait_safely, self._queue, msg)
-            return
+            if self._is_ring_buffer:
+                # Thread-safe, and only signals the loop once per consumer wakeup
+                try:
+                    self._queue.put_nowait(msg)
+                    return
+                except asyncio.QueueFull:
+                    pass  # Lost a race with other producers, fall through to async put
+            else:
+                self._loop.call_soon_threadsafe(self._enqueue_nowait_safely, self._queue, msg)
+                return
 
         task = self._loop.create_task(self._queue.put(msg))
         task.add_done_callback(self._handle_task_exception)
@@ -145,7 +554,7 @@ class ThrottledEnqueuer[T]:
         if exc is not None:
             self._log.error(f"Error putting message on {self._qname}: {exc!r}")
 
-    def _enqueue_nowait_safely(self, queue: asyncio.Queue, msg: T) -> None:
+    def _enqueue_nowait_safely(self, queue: asyncio.Queue | RingBufferQueue, msg: T) -> None:
         # Attempt put_nowait(msg) and if the queue is full,
         # schedule an async put() as a fallback.
         try:
@@ -16,7 +16,6 @@
 import asyncio
 import math
 import os
-from asyncio import Queue
 from collections import Counter
 from collections.abc import Iterable
 from decimal import Decimal
@@ -53,7 +52,10 @@ from nautilus_trader.execution.reports import ExecutionReport
 from nautilus_trader.execution.reports import FillReport
 from nautilus_trader.execution.reports import OrderStatusReport
 from nautilus_trader.execution.reports import PositionStatusReport
+from nautilus_trader.live.enqueue import RingBufferQueue
 from nautilus_trader.live.enqueue import ThrottledEnqueuer
+from nautilus_trader.live.enqueue import create_queue
+from nautilus_trader.live.enqueue import get_batch
 from nautilus_trader.live.reconciliation import adjust_fills_for_partial_window
 from nautilus_trader.live.reconciliation import calculate_reconciliation_price
 from nautilus_trader.live.reconciliation import create_inferred_order_filled_event
@@ -65,6 +67,7 @@ from nautilus_trader.live.reconciliation import create_order_rejected_event
 from nautilus_trader.live.reconciliation import create_order_triggered_event
 from nautilus_trader.live.reconciliation import create_order_updated_event
 from nautilus_trader.live.reconciliation import get_existing_fill_for_trade_id
+from nautilus_trader.live.reconciliation import has_trimmed_events
 from nautilus_trader.live.reconciliation import is_within_single_unit_tolerance
 from nautilus_trader.model.book import py_should_handle_own_book_order
 from nautilus_trader.model.enums import OrderSide
@@ -144,8 +147,8 @@ class LiveExecutionEngine(ExecutionEngine):
         )
 
         self._loop: asyncio.AbstractEventLoop = loop
-        self._cmd_queue: asyncio.Queue = Queue(maxsize=config.qsize)
-        self._evt_queue: asyncio.Queue = Queue(maxsize=config.qsize)
+        self._cmd_queue: asyncio.Queue | RingBufferQueue = create_queue(config, loop)
+        self._evt_queue: asyncio.Queue | RingBufferQueue = create_queue(config, loop)
 
         # Reconciliation
         self._recon_check_retries: Counter[ClientOrderId] = Counter()
@@ -366,6 +369,46 @@ class LiveExecutionEngine(ExecutionEngine):
         """
         return self._evt_queue.qsize()
 
+    def queue_high_water_marks(self) -> dict[str, int]:
+        """
+        Return the high-water marks for the internal queues, keyed by queue name.
+
+        Only available for ring buffer queues (see `use_ring_buffer_queues`),
+        otherwise an empty dict is returned.
+
+        Returns
+        -------
+        dict[str, int]
+
+        """
+        return {
+            enqueuer.qname: enqueuer.high_water_mark
+            for enqueuer in (self._cmd_enqueuer, self._evt_enqueuer)
+            if enqueuer.high_water_mark is not None
+        }
+
+    def queue_latency_histograms(self) -> dict[str, dict[int, int]]:
+        """
+        Return the enqueue to dequeue latency histograms for the internal queues, keyed
+        by queue name.
+
+        Each histogram maps the bucket upper bound (nanoseconds) to the message count.
+        Only available for ring buffer queues with `queue_latency_histograms` enabled,
+        otherwise an empty dict is returned.
+
+        Returns
+        -------
+        dict[str, dict[int, int]]
+
+        """
+        histograms: dict[str, dict[int, int]] = {}
+        for enqueuer in (self._cmd_enqueuer, self._evt_enqueuer):
+            histogram = enqueuer.latency_histogram()
+            if histogram:
+                histograms[enqueuer.qname] = histogram
+
+        return histograms
+
     def _on_start(self) -> None:
         if not self._loop.is_running():
             self._log.warning("Started when loop is not running")
@@ -487,19 +530,32 @@ class LiveExecutionEngine(ExecutionEngine):
         self._log.debug(
             f"Command message queue processing starting (qsize={self.cmd_qsize()})",
         )
+        profiler = self._msgbus.profiler
         try:
             while True:
                 try:
-                    command: Command | None = await self._cmd_queue.get()
-                    if command is self._sentinel:
-                        break
-
-                    self._execute_command(command)
+                    batch: list[Command | None] = await get_batch(self._cmd_queue)
                 except asyncio.CancelledError:
                     self._log.warning("Canceled task 'run_cmd_queue'")
                     break
-                except Exception as e:
-                    self._handle_queue_exception(e, "command")
+
+                for command in batch:
+                    if command is self._sentinel:
+                        return
+
+                    try:
+                        if profiler is None:
+                            self._execute_command(command)
+                        else:
+                            profiler.call(
+                                "engine",
+                                "ExecEngine",
+                                "_execute_command",
+                                self._execute_command,
+                                command,
+                            )
+                    except Exception as e:
+                        self._handle_queue_exception(e, "command")
         finally:
             stopped_msg = "Command message queue stopped"
 
@@ -512,19 +568,32 @@ class LiveExecutionEngine(ExecutionEngine):
         self._log.debug(
             f"Event message queue processing starting (qsize={self.evt_qsize()})",
         )
+        profiler = self._msgbus.profiler
         try:
             while True:
                 try:
-                    event: OrderEvent | None = await self._evt_queue.get()
-                    if event is self._sentinel:
-                        break
-
-                    self._handle_event_with_tracking(event)
+                    batch: list[OrderEvent | None] = await get_batch(self._evt_queue)
                 except asyncio.CancelledError:
                     self._log.warning("Canceled task 'run_evt_queue'")
                     break
-                except Exception as e:
-                    self._handle_queue_exception(e, "event")
+
+                for event in batch:
+                    if event is self._sentinel:
+                        return
+
+                    try:
+                        if profiler is None:
+                            self._handle_event_with_tracking(event)
+                        else:
+                            profiler.call(
+                                "engine",
+                                "ExecEngine",
+                                "_handle_event_with_tracking",
+                                self._handle_event_with_tracking,
+                                event,
+                            )
+                    except Exception as e:
+                        self._handle_queue_exception(e, "event")
         finally:
             stopped_msg = "Event message queue stopped"
 
@@ -1217,23 +1286,31 @@ class LiveExecutionEngine(ExecutionEngine):
             fills = cast("list[FillReport]", fills_or_exception)
             venue_fills.extend(fills)
 
-        cached_fill_trade_ids: set[TradeId] = set()
-
-        for order in self._cache.orders(instrument_id=instrument_id):
-            for event in order.events:
-                if isinstance(event, OrderFilled):
-                    cached_fill_trade_ids.add(event.trade_id)
+        orders = self._cache.orders(instrument_id=instrument_id)
 
         # Find missing fills (not in cache and not in recent fills cache)
         missing_fills = [
             fill
             for fill in venue_fills
-            if fill.trade_id not in cached_fill_trade_ids
-            and fill.trade_id not in self._recent_fills_cache
+            if fill.trade_id not in self._recent_fills_cache
+            and not self._is_fill_cached(fill, orders)
         ]
 
         return missing_fills, had_fill_query_errors
 
+    def _is_fill_cached(self, fill: FillReport, orders: list[Order]) -> bool:
+        # Trade IDs are checked with `has_trade_id` rather than the order events, which
+        # omit fills trimmed by a bounded event history. The fill's own order is checked
+        # first, falling back to every order for the instrument.
+        client_order_id = fill.client_order_id or self._cache.client_order_id(
+            fill.venue_order_id,
+        )
+        order = self._cache.order(client_order_id) if client_order_id is not None else None
+        if order is not None and order.has_trade_id(fill.trade_id):
+            return True
+
+        return any(o.has_trade_id(fill.trade_id) for o in orders)
+
     async def _reconcile_missing_fills(
         self,
         missing_fills: list[FillReport],
@@ -1337,6 +1414,9 @@ class LiveExecutionEngine(ExecutionEngine):
 
     def _validate_open_orders_consistency(self) -> None:
         for order in self._cache.orders_open():
+            if has_trimmed_events(order):
+                continue  # Fills trimmed from the event history can't be summed
+
             computed_filled = sum(e.last_qty for e in order.events if isinstance(e, OrderFilled))
             if computed_filled != order.filled_qty:
                 self._log.error(
@@ -3346,12 +3426,12 @@ class LiveExecutionEngine(ExecutionEngine):
                 f"fill.last_qty={report.last_qty}, will result in filled_qty={potential_filled_qty}",
             )
 
-        # Verify total fills consistency BEFORE applying
+        # Verify total fills consistency BEFORE applying (unless fills were trimmed)
         current_total = sum(
             event.last_qty for event in order.events if isinstance(event, OrderFilled)
         )
 
-        if current_total != order.filled_qty:
+        if current_total != order.filled_qty and not has_trimmed_events(order):
             self._log.error(
                 f"INCONSISTENCY DETECTED before applying fill: "
                 f"sum(fills)={current_total} != order.filled_qty={order.filled_qty} "
@@ -3361,7 +3441,7 @@ class LiveExecutionEngine(ExecutionEngine):
         # Final check: ensure trade_id doesn't already exist before generating fill
         # This prevents KeyError from being raised in _apply_event_to_order
         existing_fill = get_existing_fill_for_trade_id(order, report.trade_id)
-        if report.trade_id in order.trade_ids or existing_fill is not None:
+        if order.has_trade_id(report.trade_id) or existing_fill is not None:
             self._log.debug(
                 f"Fill with trade_id {report.trade_id} already exists for order {order.client_order_id}, skipping duplicate",
             )
@@ -3415,10 +3495,11 @@ class LiveExecutionEngine(ExecutionEngine):
                 )
                 return True  # Skip this fill, it's already covered by inferred fill
 
-        # Check for duplicate fill by trade_id - check both trade_ids collection and events
-        # This handles cases where order is loaded from cache and trade_ids might not be fully populated
+        # Check for duplicate fill by trade_id - check both the order trade IDs and events
+        # This handles cases where order is loaded from cache and trade_ids might not be fully populated,
+        # while `has_trade_id` also covers fills trimmed from a bounded event history
         existing_fill = get_existing_fill_for_trade_id(order, report.trade_id)
-        if report.trade_id in order.trade_ids or existing_fill is not None:
+        if order.has_trade_id(report.trade_id) or existing_fill is not None:
             # Fill already applied; check if data is consistent.
             # An existing fill may be sourced from the cache on start,
             # or may exist in-memory when a reconciliation is triggered.
@@ -3476,7 +3557,7 @@ class LiveExecutionEngine(ExecutionEngine):
                     f"differences: {', '.join(differences)}; retaining cached data for consistency",
                 )
 
-            # If trade_id is in order.trade_ids or we found an existing fill, skip this fill
+            # If the order has the trade_id or we found an existing fill, skip this fill
             # This prevents duplicate fills from being applied
             return True  # Fill already applied, continue with existing data
 
@@ -89,6 +89,9 @@ def get_existing_fill_for_trade_id(
     """
     Find an existing fill event for a trade ID in the order's event history.
 
+    Fills trimmed from a bounded event history are not found, use `Order.has_trade_id`
+    to check whether the order has been filled with a trade ID.
+
     Parameters
     ----------
     order : Order
@@ -101,6 +104,9 @@ def get_existing_fill_for_trade_id(
     OrderFilled or ``None``
 
     """
+    if not order.has_trade_id(trade_id):
+        return None  # Avoid scanning the events
+
     for event in order.events:
         if isinstance(event, OrderFilled) and event.trade_id == trade_id:
             return event
@@ -108,6 +114,26 @@ def get_existing_fill_for_trade_id(
     return None
 
 
+def has_trimmed_events(order: Order) -> bool:
+    """
+    Return whether events were trimmed from the order's bounded event history.
+
+    When this is the case the fills in the order's events no longer add up to the
+    order's filled quantity.
+
+    Parameters
+    ----------
+    order : Order
+        The order to check.
+
+    Returns
+    -------
+    bool
+
+    """
+    return order.event_count > len(order.events)
+
+
 def create_order_rejected_event(
     order: Order,
     ts_now: int,
@@ -15,7 +15,6 @@
 
 import asyncio
 import os
-from asyncio import Queue
 from typing import Final
 
 from nautilus_trader.cache.base import CacheFacade
@@ -26,7 +25,10 @@ from nautilus_trader.config import LiveRiskEngineConfig
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.message import Command
 from nautilus_trader.core.message import Event
+from nautilus_trader.live.enqueue import RingBufferQueue
 from nautilus_trader.live.enqueue import ThrottledEnqueuer
+from nautilus_trader.live.enqueue import create_queue
+from nautilus_trader.live.enqueue import get_batch
 from nautilus_trader.portfolio.base import PortfolioFacade
 from nautilus_trader.risk.engine import RiskEngine
 
@@ -80,8 +82,8 @@ class LiveRiskEngine(RiskEngine):
         )
 
         self._loop: asyncio.AbstractEventLoop = loop
-        self._cmd_queue: asyncio.Queue = Queue(maxsize=config.qsize)
-        self._evt_queue: asyncio.Queue = Queue(maxsize=config.qsize)
+        self._cmd_queue: asyncio.Queue | RingBufferQueue = create_queue(config, loop)
+        self._evt_queue: asyncio.Queue | RingBufferQueue = create_queue(config, loop)
 
         self._cmd_enqueuer: ThrottledEnqueuer[Command] = ThrottledEnqueuer(
             qname="cmd_queue",
@@ -152,6 +154,46 @@ class LiveRiskEngine(RiskEngine):
         """
         return self._evt_queue.qsize()
 
+    def queue_high_water_marks(self) -> dict[str, int]:
+        """
+        Return the high-water marks for the internal queues, keyed by queue name.
+
+        Only available for ring buffer queues (see `use_ring_buffer_queues`),
+        otherwise an empty dict is returned.
+
+        Returns
+        -------
+        dict[str, int]
+
+        """
+        return {
+            enqueuer.qname: enqueuer.high_water_mark
+            for enqueuer in (self._cmd_enqueuer, self._evt_enqueuer)
+            if enqueuer.high_water_mark is not None
+        }
+
+    def queue_latency_histograms(self) -> dict[str, dict[int, int]]:
+        """
+        Return the enqueue to dequeue latency histograms for the internal queues, keyed
+        by queue name.
+
+        Each histogram maps the bucket upper bound (nanoseconds) to the message count.
+        Only available for ring buffer queues with `queue_latency_histograms` enabled,
+        otherwise an empty dict is returned.
+
+        Returns
+        -------
+        dict[str, dict[int, int]]
+
+        """
+        histograms: dict[str, dict[int, int]] = {}
+        for enqueuer in (self._cmd_enqueuer, self._evt_enqueuer):
+            histogram = enqueuer.latency_histogram()
+            if histogram:
+                histograms[enqueuer.qname] = histogram
+
+        return histograms
+
     # -- COMMANDS -------------------------------------------------------------------------------------
 
     def kill(self) -> None:
@@ -255,19 +297,32 @@ class LiveRiskEngine(RiskEngine):
         self._log.debug(
             f"Command message queue processing (qsize={self.cmd_qsize()})",
         )
+        profiler = self._msgbus.profiler
         try:
             while True:
                 try:
-                    command: Command | None = await self._cmd_queue.get()
-                    if command is self._sentinel:
-                        break
-
-                    self._execute_command(command)
+                    batch: list[Command | None] = await get_batch(self._cmd_queue)
                 except asyncio.CancelledError:
                     self._log.warning("Canceled task 'run_cmd_queue'")
                     break
-                except Exception as e:
-                    self._handle_queue_exception(e, "command")
+
+                for command in batch:
+                    if command is self._sentinel:
+                        return
+
+                    try:
+                        if profiler is None:
+                            self._execute_command(command)
+                        else:
+                            profiler.call(
+                                "engine",
+                                "RiskEngine",
+                                "_execute_command",
+                                self._execute_command,
+                                command,
+                            )
+                    except Exception as e:
+                        self._handle_queue_exception(e, "command")
         finally:
             stopped_msg = "Command message queue stopped"
 
@@ -280,19 +335,32 @@ class LiveRiskEngine(RiskEngine):
         self._log.debug(
             f"Event message queue processing starting (qsize={self.evt_qsize()})",
         )
+        profiler = self._msgbus.profiler
         try:
             while True:
                 try:
-                    event: Event | None = await self._evt_queue.get()
-                    if event is self._sentinel:
-                        break
-
-                    self._handle_event(event)
+                    batch: list[Event | None] = await get_batch(self._evt_queue)
                 except asyncio.CancelledError:
                     self._log.warning("Canceled task 'run_evt_queue'")
                     break
-                except Exception as e:
-                    self._handle_queue_exception(e, "event")
+
+                for event in batch:
+                    if event is self._sentinel:
+                        return
+
+                    try:
+                        if profiler is None:
+                            self._handle_event(event)
+                        else:
+                            profiler.call(
+                                "engine",
+                                "RiskEngine",
+                                "_handle_event",
+                                self._handle_event,
+                                event,
+                            )
+                    except Exception as e:
+                        self._handle_queue_exception(e, "event")
         finally:
             stopped_msg = "Event message queue stopped"
 
@@ -15,6 +15,8 @@
 
 import pickle
 import warnings
+from decimal import ROUND_HALF_EVEN
+from decimal import Decimal
 
 import numpy as np
 import pandas as pd
@@ -27,6 +29,7 @@ from cpython.mem cimport PyMem_Malloc
 from cpython.pycapsule cimport PyCapsule_Destructor
 from cpython.pycapsule cimport PyCapsule_GetPointer
 from cpython.pycapsule cimport PyCapsule_New
+from libc.math cimport isnan
 from libc.stdint cimport uint8_t
 from libc.stdint cimport uint32_t
 from libc.stdint cimport uint64_t
@@ -36,8 +39,17 @@ from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.rust.core cimport CVec
 from nautilus_trader.core.rust.core cimport millis_to_nanos
+from nautilus_trader.core.rust.core cimport precision_from_cstr
 from nautilus_trader.core.rust.core cimport secs_to_nanos
 from nautilus_trader.core.rust.model cimport DEPTH10_LEN
+from nautilus_trader.core.rust.model cimport FIXED_PRECISION
+from nautilus_trader.core.rust.model cimport PRICE_MAX
+from nautilus_trader.core.rust.model cimport PRICE_MIN
+from nautilus_trader.core.rust.model cimport PRICE_RAW_MAX
+from nautilus_trader.core.rust.model cimport PRICE_RAW_MIN
+from nautilus_trader.core.rust.model cimport QUANTITY_MAX
+from nautilus_trader.core.rust.model cimport QUANTITY_MIN
+from nautilus_trader.core.rust.model cimport QUANTITY_RAW_MAX
 from nautilus_trader.core.rust.model cimport AggregationSource
 from nautilus_trader.core.rust.model cimport AggressorSide
 from nautilus_trader.core.rust.model cimport Bar_t
@@ -126,7 +138,9 @@ from nautilus_trader.core.rust.model cimport orderbook_depth10_eq
 from nautilus_trader.core.rust.model cimport orderbook_depth10_hash
 from nautilus_trader.core.rust.model cimport orderbook_depth10_new
 from nautilus_trader.core.rust.model cimport price_from_raw
+from nautilus_trader.core.rust.model cimport price_new as price_from_f64
 from nautilus_trader.core.rust.model cimport quantity_from_raw
+from nautilus_trader.core.rust.model cimport quantity_new as quantity_from_f64
 from nautilus_trader.core.rust.model cimport quote_tick_eq
 from nautilus_trader.core.rust.model cimport quote_tick_hash
 from nautilus_trader.core.rust.model cimport quote_tick_new
@@ -290,6 +304,79 @@ cdef inline IndexPriceUpdate index_price_from_mem_c(IndexPriceUpdate_t mem):
     return update
 
 
+cdef inline void check_precision_c(int precision, str param):
+    if precision < 0:
+        raise ValueError(f"`{param}` must be given for float or raw integer values")
+    if precision > FIXED_PRECISION:
+        raise ValueError(
+            f"invalid `{param}` greater than max {FIXED_PRECISION}, was {precision}",
+        )
+
+
+cdef inline object raw_from_str_c(str value, int *precision, str name):
+    # Parses a decimal string exactly into a fixed point raw value (as `Price.from_str`
+    # does), inferring the precision from the string if not given
+    value = value.replace("_", "")
+    if precision[0] < 0:
+        precision[0] = precision_from_cstr(pystr_to_cstr(value))
+    check_precision_c(precision[0], f"{name}_precision")
+
+    try:
+        scaled = Decimal(value).scaleb(precision[0]).to_integral_value(rounding=ROUND_HALF_EVEN)
+        return int(scaled) * 10 ** (FIXED_PRECISION - precision[0])
+    except (ArithmeticError, ValueError, OverflowError):
+        raise ValueError(f"invalid {name} value, was {value}")
+
+
+cdef inline double value_to_double_c(object value):
+    if isinstance(value, (float, np.floating)):
+        return value
+    else:
+        raise TypeError(
+            f"invalid value type, expected `str`, `float` or raw `int`, was {type(value).__name__}",
+        )
+
+
+cdef inline Price_t price_from_object_c(object value, int precision):
+    if isinstance(value, (int, np.integer)):
+        check_precision_c(precision, "price_precision")
+        # SAFETY: Panics if raw values are not correctly aligned for their precision
+        return price_from_raw(value, precision)
+
+    if isinstance(value, str):
+        raw = raw_from_str_c(value, &precision, "price")
+        if raw < PRICE_RAW_MIN or raw > PRICE_RAW_MAX:
+            raise ValueError(f"invalid price value, was {value}")
+        return price_from_raw(raw, precision)
+
+    cdef double float_value = value_to_double_c(value)
+    check_precision_c(precision, "price_precision")
+    if isnan(float_value) or float_value > PRICE_MAX or float_value < PRICE_MIN:
+        raise ValueError(f"invalid price value, was {value}")
+
+    return price_from_f64(float_value, precision)
+
+
+cdef inline Quantity_t quantity_from_object_c(object value, int precision):
+    if isinstance(value, (int, np.integer)):
+        check_precision_c(precision, "size_precision")
+        # SAFETY: Panics if raw values are not correctly aligned for their precision
+        return quantity_from_raw(value, precision)
+
+    if isinstance(value, str):
+        raw = raw_from_str_c(value, &precision, "size")
+        if raw < 0 or raw > QUANTITY_RAW_MAX:
+            raise ValueError(f"invalid size value, was {value}")
+        return quantity_from_raw(raw, precision)
+
+    cdef double float_value = value_to_double_c(value)
+    check_precision_c(precision, "size_precision")
+    if isnan(float_value) or float_value > QUANTITY_MAX or float_value < QUANTITY_MIN:
+        raise ValueError(f"invalid size value, was {value}")
+
+    return quantity_from_f64(float_value, precision)
+
+
 # SAFETY: Do NOT deallocate the capsule here
 cpdef list capsule_to_list(capsule):
     cdef CVec* data = <CVec*>PyCapsule_GetPointer(capsule, DATA_FFI_CVEC_CAPSULE_NAME)
@@ -3397,6 +3484,149 @@ cdef class OrderBookDeltas(Data):
 
         return deltas
 
+    @staticmethod
+    def from_arrays(
+        InstrumentId instrument_id not None,
+        prices not None,
+        sizes not None,
+        sides not None,
+        uint64_t sequence,
+        uint64_t ts_event,
+        uint64_t ts_init,
+        BookAction action = BookAction.UPDATE,
+        uint8_t flags = 0,
+        bint snapshot = False,
+        int price_precision = -1,
+        int size_precision = -1,
+    ) -> OrderBookDeltas:
+        """
+        Return order book deltas built from the given parallel arrays of level prices,
+        sizes and sides, in a single native call.
+
+        No intermediate `Price`, `Quantity`, `BookOrder` or `OrderBookDelta` objects are
+        created, which makes this the preferred way to parse venue book messages with many
+        levels.
+
+        Prices and sizes may be given as strings (parsed exactly as `Price.from_str` does,
+        and the precision is inferred per value if not given), floats, or raw fixed-point
+        integers (the precision must be given).
+        Levels with a positive size apply `action`, and levels with a zero size are
+        deleted. The last delta is flagged with `F_LAST`.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the book.
+        prices : Sequence[str | float | int]
+            The level prices.
+        sizes : Sequence[str | float | int]
+            The level sizes.
+        sides : Sequence[OrderSide]
+            The level sides.
+        sequence : uint64_t
+            The unique sequence number for the update.
+            If no sequence number provided in the source data then use a value of zero.
+        ts_event : uint64_t
+            UNIX timestamp (nanoseconds) when the data event occurred.
+        ts_init : uint64_t
+            UNIX timestamp (nanoseconds) when the data object was initialized.
+        action : BookAction {``ADD``, ``UPDATE``}, default ``UPDATE``
+            The order book delta action for levels with a positive size.
+        flags : uint8_t, default 0
+            The record flags bit field for every delta.
+        snapshot : bool, default False
+            If a `CLEAR` delta should be prepended, so that the deltas replace the book.
+        price_precision : int, default -1
+            The price precision (required for float and raw prices, -1 to infer from strings).
+        size_precision : int, default -1
+            The size precision (required for float and raw sizes, -1 to infer from strings).
+
+        Returns
+        -------
+        OrderBookDeltas
+
+        Raises
+        ------
+        ValueError
+            If the lengths of `prices`, `sizes` and `sides` are not equal.
+        ValueError
+            If `prices` is empty and `snapshot` is False.
+        ValueError
+            If a price or size is invalid, or the precision is not given when required.
+        TypeError
+            If a price or size is not a string, float or integer.
+
+        """
+        cdef uint64_t count = len(prices)
+        Condition.equal(count, len(sizes), "len(prices)", "len(sizes)")
+        Condition.equal(count, len(sides), "len(prices)", "len(sides)")
+        if not snapshot:
+            Condition.positive_int(count, "len(prices)")
+
+        cdef uint64_t offset = 1 if snapshot else 0
+        cdef uint64_t len_ = count + offset
+
+        # Create a C OrderBookDeltas_t buffer
+        cdef OrderBookDelta_t *data = <OrderBookDelta_t *>PyMem_Malloc(len_ * sizeof(OrderBookDelta_t))
+        if not data:
+            raise MemoryError()
+
+        cdef CVec *cvec = NULL
+        cdef uint64_t i
+        cdef Price_t price
+        cdef Quantity_t size
+        cdef OrderBookDeltas deltas
+        try:
+            if snapshot:
+                data[0] = orderbook_delta_new(
+                    instrument_id._mem,
+                    BookAction.CLEAR,
+                    book_order_new(
+                        OrderSide.NO_ORDER_SIDE,
+                        price_new(0, 0),
+                        quantity_new(0, 0),
+                        0,
+                    ),
+                    flags | RecordFlag.F_LAST if count == 0 else flags,
+                    sequence,
+                    ts_event,
+                    ts_init,
+                )
+
+            for i in range(count):
+                price = price_from_object_c(prices[i], price_precision)
+                size = quantity_from_object_c(sizes[i], size_precision)
+                data[offset + i] = orderbook_delta_new(
+                    instrument_id._mem,
+                    action if size.raw > 0 else BookAction.DELETE,
+                    book_order_new(<OrderSide>sides[i], price, size, 0),
+                    flags | RecordFlag.F_LAST if i == count - 1 else flags,
+                    sequence,
+                    ts_event,
+                    ts_init,
+                )
+
+            # Create CVec
+            cvec = <CVec *>PyMem_Malloc(1 * sizeof(CVec))
+            if not cvec:
+                raise MemoryError()
+
+            cvec.ptr = data
+            cvec.len = len_
+            cvec.cap = len_
+
+            # Transfer data to Rust
+            deltas = OrderBookDeltas.__new__(OrderBookDeltas)
+            deltas._mem = orderbook_deltas_new(
+                instrument_id._mem,
+                cvec,
+            )
+        finally:
+            PyMem_Free(data) # De-allocate buffer
+            PyMem_Free(cvec) # De-allocate cvec
+
+        return deltas
+
     cpdef to_capsule(self):
         cdef OrderBookDeltas_API *data = <OrderBookDeltas_API *>PyMem_Malloc(sizeof(OrderBookDeltas_API))
         data[0] = self._mem
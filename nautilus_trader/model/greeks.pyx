@@ -16,6 +16,8 @@
 from libc.math cimport exp
 from libc.stdint cimport uint64_t
 
+import numpy as np
+
 from nautilus_trader.core.nautilus_pyo3 import black_scholes_greeks
 from nautilus_trader.core.nautilus_pyo3 import imply_vol_and_greeks
 from nautilus_trader.core.nautilus_pyo3 import refine_vol_and_greeks
@@ -24,10 +26,14 @@ from nautilus_trader.model.enums import InstrumentClass
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.model.greeks_data import GreeksData
 from nautilus_trader.model.greeks_data import PortfolioGreeks
+from nautilus_trader.model.greeks_vectorized import black_scholes_greeks_vectorized
+from nautilus_trader.model.greeks_vectorized import imply_vol_and_greeks_vectorized
+from nautilus_trader.model.greeks_vectorized import modify_greeks_vectorized
 
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Logger
+from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport unix_nanos_to_dt
 from nautilus_trader.core.rust.model cimport OptionKind
 from nautilus_trader.core.rust.model cimport PositionSide
@@ -40,6 +46,13 @@ from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.position cimport Position
 
 
+cdef object _weights_array(object weights, list underlying_instrument_ids):
+    if weights is None:
+        return None
+
+    return np.array([weights.get(instrument_id, 1.0) for instrument_id in underlying_instrument_ids])
+
+
 cdef class GreeksCalculator:
     """
     Class used to calculate instrument and portfolio greeks (sensitivities of price moves with respect to market data moves).
@@ -80,6 +93,7 @@ cdef class GreeksCalculator:
         self._clock = clock
         self._log = Logger(type(self).__name__)
         self._cached_futures_spreads = {}
+        self._batch_greeks_cache = {}
 
     def instrument_greeks(
         self,
@@ -191,6 +205,171 @@ cdef class GreeksCalculator:
 
         return greeks_data
 
+    def instrument_greeks_batch(
+        self,
+        list instrument_ids not None,
+        flat_interest_rate: float = 0.0425,
+        flat_dividend_yield: float | None = None,
+        spot_shock: float = 0.,
+        vol_shock: float = 0.,
+        time_to_expiry_shock: float = 0.,
+        use_cached_greeks: bool = False,
+        update_vol: bool = False,
+        cache_greeks: bool = False,
+        ts_event: int = 0,
+        percent_greeks: bool = False,
+        index_instrument_id: InstrumentId | None = None,
+        beta_weights: dict[InstrumentId, float] | None = None,
+        vega_time_weight_base: int | None = None,
+        vol_index_instrument_id: InstrumentId | None = None,
+        vol_beta_weights: dict[InstrumentId, float] | None = None,
+        price_bucket_size: float = 0.,
+    ) -> dict[InstrumentId, GreeksData]:
+        """
+        Calculate option or underlying greeks for a batch of instruments and a quantity of 1.
+
+        This is the batch equivalent of `instrument_greeks` for whole option chains or position sets.
+        Market data, yield curves and expiries are gathered once per instrument, then the implied
+        volatilities and greeks of all options are solved in a single vectorized pass.
+
+        Solved option greeks are kept per instrument and reused by later calls with the same
+        timestamp, option price, underlying price bucket, interest rate, cost of carry and
+        `update_vol` (greeks from the cache with `use_cached_greeks` are never solved).
+
+        Parameters
+        ----------
+        instrument_ids : list[InstrumentId]
+            The IDs of the instruments to calculate greeks for.
+        flat_interest_rate : float, default 0.0425
+            The interest rate to use for calculations when no curve is available.
+        flat_dividend_yield : float, optional
+            The dividend yield to use for calculations when no dividend curve is available.
+        spot_shock : float, default 0.0
+            Shock to apply to spot price.
+        vol_shock : float, default 0.0
+            Shock to apply to implied volatility.
+        time_to_expiry_shock : float, default 0.0
+            Shock in years to apply to time to expiry.
+        use_cached_greeks : bool, default False
+            Whether to use cached greeks values if available.
+        update_vol : bool, default False
+            Whether to start the implied volatility search from the previously calculated volatility.
+        cache_greeks : bool, default False
+            Whether to cache the calculated greeks.
+        ts_event : int, default 0
+            Timestamp of the event triggering the calculation, by default 0.
+        percent_greeks : bool, optional
+            Whether to compute greeks as percentage of the underlying price, by default False.
+        index_instrument_id : InstrumentId, optional
+            The reference instrument id beta is computed with respect to.
+        beta_weights : dict[InstrumentId, float], optional
+            Dictionary of beta weights used to compute portfolio delta and gamma.
+        vega_time_weight_base : int, optional
+            Base value in days for time-weighting vega. When provided, vega is multiplied by sqrt(vega_time_weight_base / expiry_in_days).
+        vol_index_instrument_id : InstrumentId, optional
+            The reference volatility instrument id vega beta is computed with respect to, for example VIX.
+        vol_beta_weights : dict[InstrumentId, float], optional
+            Dictionary of volatility beta weights used to compute portfolio vega.
+        price_bucket_size : float, default 0.0
+            The underlying price bucket size within which previously solved option greeks are reused
+            for the same timestamp. If zero then the underlying price must match exactly.
+
+        Returns
+        -------
+        dict[InstrumentId, GreeksData]
+            The calculated greeks data keyed by instrument ID, in the order given.
+            Instruments whose greeks could not be calculated are omitted.
+
+        Raises
+        ------
+        ValueError
+            If `price_bucket_size` is negative.
+
+        """
+        Condition.not_negative(price_bucket_size, "price_bucket_size")
+
+        cdef uint64_t utc_now_ns = ts_event if ts_event else self._clock.timestamp_ns()
+        cdef object index_price = None
+        cdef object vol_index_price = None
+        cdef dict results = {}
+        cdef list option_instruments = []
+        cdef list option_underlying_ids = []
+        cdef list base_greeks = []
+        cdef list base_underlying_ids = []
+        cdef object instrument
+        cdef object greeks_data
+        cdef InstrumentId underlying_instrument_id
+
+        if index_instrument_id is not None:
+            index_price = self._get_price(index_instrument_id)
+            if index_price is not None:
+                index_price = float(index_price)
+
+        if vol_index_instrument_id is not None:
+            vol_index_price = self._get_price(vol_index_instrument_id)
+            if vol_index_price is not None:
+                vol_index_price = float(vol_index_price)
+
+        for instrument_id in instrument_ids:
+            instrument = self._cache.instrument(instrument_id)
+            if instrument is None:
+                self._log.error(f"Cannot calculate greeks: instrument {instrument_id!r} not found")
+                continue
+
+            if instrument.instrument_class is not InstrumentClass.OPTION:
+                greeks_data = self._calculate_non_option_greeks(
+                    instrument, instrument_id, spot_shock, ts_event, None, percent_greeks,
+                    index_instrument_id, beta_weights
+                )
+                if greeks_data is not None:
+                    results[instrument_id] = greeks_data
+                continue
+
+            # Consistent with instrument_greeks, options require the vol index price when one is given
+            if vol_index_instrument_id is not None and vol_index_price is None:
+                continue
+
+            underlying_instrument_id = InstrumentId.from_str(f"{instrument.underlying}.{instrument_id.venue}")
+
+            if use_cached_greeks:
+                greeks_data = self._cache.greeks(instrument_id)
+                if greeks_data is not None:
+                    base_greeks.append(greeks_data)
+                    base_underlying_ids.append(underlying_instrument_id)
+                    continue
+
+            option_instruments.append(instrument)
+            option_underlying_ids.append(underlying_instrument_id)
+
+        if option_instruments:
+            for greeks_data, underlying_instrument_id in zip(
+                self._calculate_option_greeks_batch(
+                    option_instruments, option_underlying_ids, flat_interest_rate, flat_dividend_yield,
+                    update_vol, cache_greeks, utc_now_ns, percent_greeks, index_price, beta_weights,
+                    vega_time_weight_base, vol_index_price, vol_beta_weights, price_bucket_size,
+                ),
+                option_underlying_ids,
+            ):
+                if greeks_data is not None:
+                    base_greeks.append(greeks_data)
+                    base_underlying_ids.append(underlying_instrument_id)
+
+        if base_greeks and (spot_shock != 0. or vol_shock != 0. or time_to_expiry_shock != 0.):
+            base_greeks = self._apply_option_greeks_shocks_batch(
+                base_greeks, base_underlying_ids, spot_shock, vol_shock, time_to_expiry_shock,
+                percent_greeks, index_price, beta_weights, vega_time_weight_base, vol_index_price,
+                vol_beta_weights,
+            )
+
+        for greeks_data in base_greeks:
+            results[greeks_data.instrument_id] = greeks_data
+
+        return {
+            instrument_id: results[instrument_id]
+            for instrument_id in instrument_ids
+            if instrument_id in results
+        }
+
     cdef object _calculate_non_option_greeks(
         self,
         object instrument,
@@ -369,6 +548,245 @@ cdef class GreeksCalculator:
             greeks_data.cost_of_carry, shocked_vol, 0., greeks.price, delta, gamma, vega, greeks.theta, greeks.itm_prob
         )
 
+    cdef list _calculate_option_greeks_batch(
+        self,
+        list instruments,
+        list underlying_instrument_ids,
+        double flat_interest_rate,
+        object flat_dividend_yield,
+        bint update_vol,
+        bint cache_greeks,
+        uint64_t utc_now_ns,
+        bint percent_greeks,
+        object index_price,
+        object beta_weights,
+        object vega_time_weight_base,
+        object vol_index_price,
+        object vol_beta_weights,
+        double price_bucket_size,
+    ):
+        # Returns a list aligned with instruments, containing None where greeks are unavailable.
+        # Solved rows hold the inputs followed by the unmodified greeks:
+        # (underlying_price, interest_rate, cost_of_carry, is_call, strike, expiry_in_years,
+        #  expiry_int, expiry_in_days, multiplier, vol, price, delta, gamma, vega, theta, itm_prob)
+        cdef Py_ssize_t count = len(instruments)
+        cdef list results = [None] * count
+        cdef list rows = [None] * count
+        cdef list keys = [None] * count
+        cdef list pending = []
+        cdef list inputs = []
+        cdef list option_prices = []
+        cdef list initial_vols = []
+        cdef dict underlying_prices = {}
+        cdef dict expiries = {}
+        cdef dict yield_curves = {}
+        cdef dict interest_rates = {}
+        cdef dict dividend_curves = {}
+        cdef object utc_now = unix_nanos_to_dt(utc_now_ns)
+        cdef object instrument
+        cdef object key
+        cdef object memo
+        cdef object expiry
+        cdef object expiry_utc
+        cdef object rate_key
+        cdef object yield_curve
+        cdef object dividend_curve
+        cdef object cached_greeks
+        cdef object greeks
+        cdef InstrumentId instrument_id
+        cdef InstrumentId underlying_instrument_id
+        cdef Price option_price_obj
+        cdef Price underlying_price_obj
+        cdef double underlying_price
+        cdef double option_price
+        cdef double interest_rate
+        cdef double cost_of_carry
+        cdef double expiry_in_years
+        cdef int expiry_in_days
+        cdef str currency
+        cdef Py_ssize_t i
+
+        for i in range(count):
+            instrument = instruments[i]
+            instrument_id = instrument.id
+            underlying_instrument_id = underlying_instrument_ids[i]
+
+            option_price_obj = self._get_price(instrument_id)
+            if option_price_obj is None:
+                continue
+
+            if underlying_instrument_id in underlying_prices:
+                underlying_price_obj = underlying_prices[underlying_instrument_id]
+            else:
+                underlying_price_obj = self._get_underlying_price(underlying_instrument_id)
+                underlying_prices[underlying_instrument_id] = underlying_price_obj
+
+            if underlying_price_obj is None:
+                continue
+
+            option_price = float(option_price_obj)
+            underlying_price = float(underlying_price_obj)
+
+            expiry = expiries.get(instrument.expiration_ns)
+            if expiry is None:
+                expiry_utc = instrument.expiration_utc
+                expiry = (int(expiry_utc.strftime("%Y%m%d")), max((expiry_utc - utc_now).days, 1))
+                expiries[instrument.expiration_ns] = expiry
+
+            expiry_in_days = expiry[1]
+            expiry_in_years = expiry_in_days / 365.25
+
+            currency = instrument.quote_currency.code
+            rate_key = (currency, expiry_in_days)
+            if rate_key not in interest_rates:
+                if currency not in yield_curves:
+                    yield_curves[currency] = self._cache.yield_curve(currency)
+
+                yield_curve = yield_curves[currency]
+                interest_rates[rate_key] = yield_curve(expiry_in_years) if yield_curve is not None else flat_interest_rate
+
+            interest_rate = interest_rates[rate_key]
+
+            if underlying_instrument_id not in dividend_curves:
+                dividend_curves[underlying_instrument_id] = self._cache.yield_curve(str(underlying_instrument_id))
+
+            dividend_curve = dividend_curves[underlying_instrument_id]
+            cost_of_carry = 0.
+            if dividend_curve is not None:
+                cost_of_carry = interest_rate - dividend_curve(expiry_in_years)
+            elif flat_dividend_yield is not None:
+                cost_of_carry = interest_rate - flat_dividend_yield
+
+            # Reuse greeks solved for the same timestamp, option price and underlying price bucket,
+            # with the same pricing inputs (the rate and carry cover the curves and flat inputs)
+            key = (
+                utc_now_ns,
+                round(underlying_price / price_bucket_size) if price_bucket_size > 0. else underlying_price,
+                option_price,
+                interest_rate,
+                cost_of_carry,
+                update_vol,
+            )
+            memo = self._batch_greeks_cache.get(instrument_id)
+            if memo is not None and memo[0] == key:
+                rows[i] = memo[1]
+                continue
+
+            keys[i] = key
+
+            cached_greeks = self._cache.greeks(instrument_id) if update_vol else None
+
+            pending.append(i)
+            option_prices.append(option_price)
+            initial_vols.append(cached_greeks.vol if cached_greeks is not None else 0.)
+            inputs.append((
+                underlying_price, interest_rate, cost_of_carry, instrument.option_kind is OptionKind.CALL,
+                float(instrument.strike_price), expiry_in_years, expiry[0], expiry_in_days,
+                float(instrument.multiplier),
+            ))
+
+        cdef list columns
+        if pending:
+            columns = list(zip(*inputs))
+            greeks = imply_vol_and_greeks_vectorized(
+                np.array(columns[0]), np.array(columns[1]), np.array(columns[2]), np.array(columns[3]),
+                np.array(columns[4]), np.array(columns[5]), np.array(option_prices),
+                np.array(initial_vols) if update_vol else None,
+            )
+            for i, row, solved in zip(pending, inputs, zip(
+                greeks.vol.tolist(), greeks.price.tolist(), greeks.delta.tolist(), greeks.gamma.tolist(),
+                greeks.vega.tolist(), greeks.theta.tolist(), greeks.itm_prob.tolist(),
+            )):
+                rows[i] = row + solved
+                self._batch_greeks_cache[instruments[i].id] = (keys[i], rows[i])
+
+        cdef list indices = [i for i in range(count) if rows[i] is not None]
+        if not indices:
+            return results
+
+        cdef list solved_rows = [rows[i] for i in indices]
+        cdef list solved_underlying_ids = [underlying_instrument_ids[i] for i in indices]
+        columns = list(zip(*solved_rows))
+
+        cdef object underlying_prices_array = np.array(columns[0])
+        cdef object vols = np.array(columns[9])
+        delta, gamma, vega = modify_greeks_vectorized(
+            np.array(columns[11]), np.array(columns[12]), underlying_prices_array, underlying_prices_array,
+            percent_greeks, index_price, _weights_array(beta_weights, solved_underlying_ids),
+            np.array(columns[13]), vols, np.array(columns[7]), vega_time_weight_base, vols,
+            vol_index_price, _weights_array(vol_beta_weights, solved_underlying_ids),
+        )
+
+        cdef object greeks_data
+        for i, row, row_delta, row_gamma, row_vega in zip(
+            indices, solved_rows, delta.tolist(), gamma.tolist(), vega.tolist(),
+        ):
+            greeks_data = GreeksData(
+                utc_now_ns, utc_now_ns, instruments[i].id, row[3], row[4], row[6], row[7], row[5],
+                row[8], 1.0, row[0], row[1], row[2], row[9], 0., row[10], row_delta, row_gamma,
+                row_vega, row[14], row[15]
+            )
+            if cache_greeks:
+                self._cache.add_greeks(greeks_data)
+
+            results[i] = greeks_data
+
+        return results
+
+    cdef list _apply_option_greeks_shocks_batch(
+        self,
+        list greeks_data,
+        list underlying_instrument_ids,
+        double spot_shock,
+        double vol_shock,
+        double time_to_expiry_shock,
+        bint percent_greeks,
+        object index_price,
+        object beta_weights,
+        object vega_time_weight_base,
+        object vol_index_price,
+        object vol_beta_weights,
+    ):
+        cdef object underlying_price = np.array([data.underlying_price for data in greeks_data])
+        cdef object vol = np.array([data.vol for data in greeks_data])
+        cdef object shocked_underlying_price = underlying_price + spot_shock
+        cdef object shocked_vol = vol + vol_shock
+        cdef object shocked_time_to_expiry = (
+            np.array([data.expiry_in_years for data in greeks_data]) - time_to_expiry_shock
+        )
+        cdef object greeks = black_scholes_greeks_vectorized(
+            shocked_underlying_price,
+            np.array([data.interest_rate for data in greeks_data]),
+            np.array([data.cost_of_carry for data in greeks_data]),
+            shocked_vol,
+            np.array([data.is_call for data in greeks_data]),
+            np.array([data.strike for data in greeks_data]),
+            shocked_time_to_expiry,
+        )
+        cdef object shocked_expiry_in_days = (shocked_time_to_expiry * 365.25).astype(np.int64)
+
+        delta, gamma, vega = modify_greeks_vectorized(
+            greeks.delta, greeks.gamma, shocked_underlying_price, underlying_price, percent_greeks,
+            index_price, _weights_array(beta_weights, underlying_instrument_ids), greeks.vega,
+            shocked_vol, shocked_expiry_in_days, vega_time_weight_base, vol, vol_index_price,
+            _weights_array(vol_beta_weights, underlying_instrument_ids),
+        )
+
+        cdef list shocked_greeks = []
+        for data, values in zip(greeks_data, zip(
+            shocked_underlying_price.tolist(), shocked_vol.tolist(), shocked_time_to_expiry.tolist(),
+            shocked_expiry_in_days.tolist(), greeks.price.tolist(), delta.tolist(), gamma.tolist(),
+            vega.tolist(), greeks.theta.tolist(), greeks.itm_prob.tolist(),
+        )):
+            shocked_greeks.append(GreeksData(
+                data.ts_event, data.ts_event, data.instrument_id, data.is_call, data.strike,
+                data.expiry, values[3], values[2], data.multiplier, data.quantity, values[0],
+                data.interest_rate, data.cost_of_carry, values[1], 0., values[4], values[5],
+                values[6], values[7], values[8], values[9]
+            ))
+
+        return shocked_greeks
+
     cdef Price _get_underlying_price(self, InstrumentId underlying_instrument_id):
         cdef Price price = self._get_price(underlying_instrument_id)
         if price is not None:
@@ -595,6 +1013,8 @@ cdef class GreeksCalculator:
         vega_time_weight_base: int | None = None,
         vol_index_instrument_id: InstrumentId | None = None,
         vol_beta_weights: dict[InstrumentId, float] | None = None,
+        vectorized: bool = False,
+        price_bucket_size: float = 0.0,
     ) -> PortfolioGreeks | None:
         """
         Calculate the portfolio Greeks for a given set of positions.
@@ -657,6 +1077,12 @@ cdef class GreeksCalculator:
             The reference volatility instrument id vega beta is computed with respect to, for example VIX.
         vol_beta_weights : dict[InstrumentId, float], optional
             Dictionary of volatility beta weights used to compute portfolio vega.
+        vectorized : bool, default False
+            Whether to calculate the greeks of all option positions in a single vectorized pass
+            using `instrument_greeks_batch`.
+        price_bucket_size : float, default 0.0
+            The underlying price bucket size within which previously solved option greeks are reused
+            when `vectorized` is True.
 
         Returns
         -------
@@ -674,11 +1100,15 @@ cdef class GreeksCalculator:
         cdef uint64_t ts_event = self._clock.timestamp_ns()
         cdef object portfolio_greeks = PortfolioGreeks(ts_event, ts_event)
         cdef list open_positions = self._cache.positions_open(venue, instrument_id, strategy_id, side)
+        cdef list positions = []
         cdef InstrumentId position_instrument_id
         cdef bint skip_position
         cdef double quantity
+        cdef object instrument
         cdef object instrument_greeks
         cdef object position_greeks
+        cdef dict batch_greeks = {}
+        cdef dict batch_instrument_ids = {}
 
         for position in open_positions:
             position_instrument_id = position.instrument_id
@@ -694,13 +1124,37 @@ cdef class GreeksCalculator:
                 if skip_position:
                     continue
 
-            quantity = position.signed_qty
-            instrument_greeks = self.instrument_greeks(
-                position_instrument_id, flat_interest_rate, flat_dividend_yield, spot_shock, vol_shock,
-                time_to_expiry_shock, use_cached_greeks, update_vol, cache_greeks, ts_event, position,
-                percent_greeks, index_instrument_id, beta_weights, vega_time_weight_base,
-                vol_index_instrument_id, vol_beta_weights,
+            positions.append(position)
+
+            if vectorized and position_instrument_id not in batch_instrument_ids:
+                instrument = self._cache.instrument(position_instrument_id)
+                if instrument is not None and instrument.instrument_class is InstrumentClass.OPTION:
+                    batch_instrument_ids[position_instrument_id] = None
+
+        if batch_instrument_ids:
+            batch_greeks = self.instrument_greeks_batch(
+                list(batch_instrument_ids), flat_interest_rate, flat_dividend_yield, spot_shock, vol_shock,
+                time_to_expiry_shock, use_cached_greeks, update_vol, cache_greeks, ts_event, percent_greeks,
+                index_instrument_id, beta_weights, vega_time_weight_base, vol_index_instrument_id,
+                vol_beta_weights, price_bucket_size,
             )
+
+        for position in positions:
+            position_instrument_id = position.instrument_id
+            quantity = position.signed_qty
+
+            if position_instrument_id in batch_instrument_ids:
+                instrument_greeks = batch_greeks.get(position_instrument_id)
+                if instrument_greeks is not None:
+                    instrument_greeks.pnl = instrument_greeks.price - position.avg_px_open
+            else:
+                instrument_greeks = self.instrument_greeks(
+                    position_instrument_id, flat_interest_rate, flat_dividend_yield, spot_shock, vol_shock,
+                    time_to_expiry_shock, use_cached_greeks, update_vol, cache_greeks, ts_event, position,
+                    percent_greeks, index_instrument_id, beta_weights, vega_time_weight_base,
+                    vol_index_instrument_id, vol_beta_weights,
+                )
+
             if instrument_greeks is None:
                 self._log.warning(f"No greeks available for underlying {position_instrument_id}")
                 continue
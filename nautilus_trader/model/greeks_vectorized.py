@@ -0,0 +1,416 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+"""
+Vectorized generalized Black-Scholes greeks and implied volatility over option chains.
+
+The functions in this module mirror `black_scholes_greeks`, `imply_vol_and_greeks` and
+`refine_vol_and_greeks` from `nautilus_pyo3`, but operate on numpy arrays so that a
+whole option chain or position set is solved in a single pass.
+
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+# Scale for vega to express as absolute percent change
+VEGA_PERCENT_FACTOR = 0.01
+
+# Used to convert theta to per-calendar-day change
+THETA_DAILY_FACTOR = 1.0 / 365.25
+
+# Floor applied to failed implied volatilities so greeks remain finite
+MIN_VOL = 1e-8
+
+_FRAC_1_SQRT_2PI = 0.3989422804014327
+_FRAC_1_SQRT_2 = 0.7071067811865476
+_MAX_VOL = 10.0
+
+
+class BlackScholesGreeksArrays(NamedTuple):
+    """
+    Represents the vectorized result of a Black-Scholes greeks calculation (per unit).
+    """
+
+    price: np.ndarray
+    vol: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    vega: np.ndarray
+    theta: np.ndarray
+    itm_prob: np.ndarray
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return _FRAC_1_SQRT_2PI * np.exp(-0.5 * x * x)
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    # Chebyshev approximation of erfc with fractional error below 1.2e-7 everywhere,
+    # which keeps deep out-of-the-money prices accurate (Numerical Recipes, section 6.2)
+    z = np.abs(x) * _FRAC_1_SQRT_2
+    t = 1.0 / (1.0 + 0.5 * z)
+    poly = -0.82215223 + t * 0.17087277
+    poly = 1.48851587 + t * poly
+    poly = -1.13520398 + t * poly
+    poly = 0.27886807 + t * poly
+    poly = -0.18628806 + t * poly
+    poly = 0.09678418 + t * poly
+    poly = 0.37409196 + t * poly
+    poly = 1.00002368 + t * poly
+    poly = -1.26551223 + t * poly
+    half_erfc = 0.5 * t * np.exp(-z * z + poly)
+    return np.where(x >= 0.0, 1.0 - half_erfc, half_erfc)
+
+
+def _as_arrays(*values) -> list[np.ndarray]:
+    return np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in values))
+
+
+def _price_and_vega(
+    s: np.ndarray,
+    r: np.ndarray,
+    b: np.ndarray,
+    vol: np.ndarray,
+    phi: np.ndarray,
+    k: np.ndarray,
+    t: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    # Lightweight kernel for the implied volatility search (vega is dPrice / dVol)
+    sqrt_t = np.sqrt(t)
+    scaled_vol = vol * sqrt_t
+    d1 = (np.log(s / k) + (b + 0.5 * vol * vol) * t) / scaled_vol
+    d2 = d1 - scaled_vol
+    s_forward = s * np.exp((b - r) * t)
+    price = phi * (s_forward * _norm_cdf(phi * d1) - k * np.exp(-r * t) * _norm_cdf(phi * d2))
+    return price, s_forward * sqrt_t * _norm_pdf(d1)
+
+
+def black_scholes_greeks_vectorized(
+    s,
+    r,
+    b,
+    vol,
+    is_call,
+    k,
+    t,
+) -> BlackScholesGreeksArrays:
+    """
+    Calculate the Black-Scholes greeks for arrays of option contracts (per unit).
+
+    All inputs are broadcast against each other, so scalars may be mixed with arrays.
+
+    Parameters
+    ----------
+    s : array_like
+        The current prices of the underlying assets.
+    r : array_like
+        The risk-free interest rates.
+    b : array_like
+        The costs of carry of the underlying assets.
+    vol : array_like
+        The volatilities of the underlying assets.
+    is_call : array_like
+        Whether each option is a call (True) or a put (False).
+    k : array_like
+        The strike prices of the options.
+    t : array_like
+        The times to expiration of the options in years.
+
+    Returns
+    -------
+    BlackScholesGreeksArrays
+
+    """
+    s, r, b, vol, k, t = _as_arrays(s, r, b, vol, k, t)
+    phi = np.where(np.broadcast_to(np.asarray(is_call, dtype=bool), s.shape), 1.0, -1.0)
+
+    sqrt_t = np.sqrt(t)
+    scaled_vol = vol * sqrt_t
+    d1 = (np.log(s / k) + (b + 0.5 * vol * vol) * t) / scaled_vol
+    d2 = d1 - scaled_vol
+
+    cdf_phi_d1 = _norm_cdf(phi * d1)
+    cdf_phi_d2 = _norm_cdf(phi * d2)
+    pdf_d1 = _norm_pdf(d1)
+
+    df_b = np.exp((b - r) * t)
+    df_r = np.exp(-r * t)
+
+    price = phi * (s * df_b * cdf_phi_d1 - k * df_r * cdf_phi_d2)
+    delta = phi * df_b * cdf_phi_d1
+    gamma = (df_b * pdf_d1) / (s * scaled_vol)
+    vega = s * df_b * sqrt_t * pdf_d1 * VEGA_PERCENT_FACTOR
+
+    # Decay due to volatility, cost of carry and interest rate on the strike
+    theta_v = -(s * df_b * pdf_d1 * vol) / (2.0 * sqrt_t)
+    theta_b = -phi * (b - r) * s * df_b * cdf_phi_d1
+    theta_r = -phi * r * k * df_r * cdf_phi_d2
+    theta = (theta_v + theta_b + theta_r) * THETA_DAILY_FACTOR
+
+    return BlackScholesGreeksArrays(price, vol, delta, gamma, vega, theta, cdf_phi_d2)
+
+
+def imply_vol_vectorized(
+    s,
+    r,
+    b,
+    is_call,
+    k,
+    t,
+    price,
+    initial_vol=None,
+    max_iterations: int = 100,
+    tolerance: float = 1e-12,
+) -> np.ndarray:
+    """
+    Calculate the implied volatilities for arrays of option contracts.
+
+    Every contract is solved simultaneously with a bracketed Newton-Raphson iteration
+    which falls back to bisection whenever a Newton step leaves the bracket.
+
+    Parameters
+    ----------
+    s : array_like
+        The current prices of the underlying assets.
+    r : array_like
+        The risk-free interest rates.
+    b : array_like
+        The costs of carry of the underlying assets.
+    is_call : array_like
+        Whether each option is a call (True) or a put (False).
+    k : array_like
+        The strike prices of the options.
+    t : array_like
+        The times to expiration of the options in years.
+    price : array_like
+        The current market prices of the options.
+    initial_vol : array_like, optional
+        The initial volatility guesses, for example from previously calculated greeks.
+        Non-positive guesses are replaced with a Brenner-Subrahmanyam approximation.
+    max_iterations : int, default 100
+        The maximum number of iterations.
+    tolerance : float, default 1e-12
+        The convergence tolerance on the volatility step.
+
+    Returns
+    -------
+    np.ndarray
+        The implied volatilities, zero where the price is outside the no-arbitrage bounds.
+
+    """
+    s, r, b, k, t, price = _as_arrays(s, r, b, k, t, price)
+    phi = np.where(np.broadcast_to(np.asarray(is_call, dtype=bool), s.shape), 1.0, -1.0)
+
+    s_forward = s * np.exp((b - r) * t)
+    k_discounted = k * np.exp(-r * t)
+    lower_bound = np.maximum(phi * (s_forward - k_discounted), 0.0)
+    upper_bound = np.where(phi > 0.0, s_forward, k_discounted)
+    active = (price > lower_bound) & (price < upper_bound) & (t > 0.0)
+
+    vol = np.sqrt(2.0 * np.pi / np.where(t > 0.0, t, 1.0)) * price / s_forward
+    if initial_vol is not None:
+        initial_vol = np.broadcast_to(np.asarray(initial_vol, dtype=np.float64), s.shape)
+        vol = np.where(initial_vol > 0.0, initial_vol, vol)
+
+    vol = np.clip(vol, 1e-4, _MAX_VOL / 2.0)
+    lower = np.zeros_like(vol)
+    upper = np.full_like(vol, _MAX_VOL)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(max_iterations):
+            if not active.any():
+                break
+
+            model_price, vega = _price_and_vega(s, r, b, vol, phi, k, t)
+            diff = model_price - price
+            upper = np.where(active & (diff > 0.0), vol, upper)
+            lower = np.where(active & (diff < 0.0), vol, lower)
+
+            step = diff / vega
+            newton_vol = vol - step
+            bisect = ~np.isfinite(newton_vol) | (newton_vol <= lower) | (newton_vol >= upper)
+            next_vol = np.where(bisect, 0.5 * (lower + upper), newton_vol)
+
+            converged = (diff == 0.0) | (np.abs(next_vol - vol) <= tolerance * np.maximum(vol, 1.0))
+            vol = np.where(active, next_vol, vol)
+            active &= ~converged
+
+    return np.where((price > lower_bound) & (price < upper_bound) & (t > 0.0), vol, 0.0)
+
+
+def imply_vol_and_greeks_vectorized(
+    s,
+    r,
+    b,
+    is_call,
+    k,
+    t,
+    price,
+    initial_vol=None,
+) -> BlackScholesGreeksArrays:
+    """
+    Calculate the implied volatilities and greeks for arrays of option contracts (per unit).
+
+    Parameters
+    ----------
+    s : array_like
+        The current prices of the underlying assets.
+    r : array_like
+        The risk-free interest rates.
+    b : array_like
+        The costs of carry of the underlying assets.
+    is_call : array_like
+        Whether each option is a call (True) or a put (False).
+    k : array_like
+        The strike prices of the options.
+    t : array_like
+        The times to expiration of the options in years.
+    price : array_like
+        The current market prices of the options.
+    initial_vol : array_like, optional
+        The initial volatility guesses, for example from previously calculated greeks.
+
+    Returns
+    -------
+    BlackScholesGreeksArrays
+
+    """
+    vol = imply_vol_vectorized(s, r, b, is_call, k, t, price, initial_vol)
+
+    # A failed implied volatility is floored so greeks remain finite
+    return black_scholes_greeks_vectorized(s, r, b, np.maximum(vol, MIN_VOL), is_call, k, t)
+
+
+def modify_greeks_vectorized(
+    delta_input: np.ndarray,
+    gamma_input: np.ndarray,
+    underlying_price: np.ndarray,
+    unshocked_underlying_price: np.ndarray,
+    percent_greeks: bool,
+    index_price: float | None = None,
+    beta: np.ndarray | None = None,
+    vega_input: np.ndarray | None = None,
+    vol: np.ndarray | None = None,
+    expiry_in_days: np.ndarray | None = None,
+    vega_time_weight_base: int | None = None,
+    unshocked_vol: np.ndarray | None = None,
+    vol_index_price: float | None = None,
+    vega_beta: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Modify arrays of delta, gamma and vega based on beta weighting and percentage calculations.
+
+    This is the vectorized equivalent of `GreeksCalculator.modify_greeks`, with the index
+    prices already resolved.
+
+    Parameters
+    ----------
+    delta_input : np.ndarray
+        The input delta values.
+    gamma_input : np.ndarray
+        The input gamma values.
+    underlying_price : np.ndarray
+        The current prices of the underlying assets.
+    unshocked_underlying_price : np.ndarray
+        The base (non-shocked) prices of the underlying assets.
+    percent_greeks : bool
+        Whether to compute greeks as percentage of the underlying price.
+    index_price : float, optional
+        The beta index price, no beta weighting is applied if None.
+    beta : np.ndarray, optional
+        The beta of each underlying with respect to the index (default 1.0).
+    vega_input : np.ndarray, optional
+        The input vega values (default 0.0).
+    vol : np.ndarray, optional
+        The implied volatilities (default 0.0).
+    expiry_in_days : np.ndarray, optional
+        The days to expiry (default 0).
+    vega_time_weight_base : int, optional
+        Base value in days for time-weighting vega.
+    unshocked_vol : np.ndarray, optional
+        The base implied volatilities before shocks (default 0.0).
+    vol_index_price : float, optional
+        The volatility index price, no vega beta weighting is applied if None.
+    vega_beta : np.ndarray, optional
+        The volatility beta of each underlying with respect to the volatility index (default 1.0).
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        Modified delta, gamma, and vega values.
+
+    """
+    delta = np.array(delta_input, dtype=np.float64)
+    gamma = np.array(gamma_input, dtype=np.float64)
+    shape = delta.shape
+    underlying_price = np.broadcast_to(np.asarray(underlying_price, dtype=np.float64), shape)
+    unshocked_underlying_price = np.broadcast_to(
+        np.asarray(unshocked_underlying_price, dtype=np.float64),
+        shape,
+    )
+    vega = np.zeros(shape) if vega_input is None else np.array(vega_input, dtype=np.float64)
+    vol = np.zeros(shape) if vol is None else np.broadcast_to(np.asarray(vol, np.float64), shape)
+    used_vol = vol
+    if unshocked_vol is not None:
+        unshocked_vol = np.broadcast_to(np.asarray(unshocked_vol, dtype=np.float64), shape)
+        used_vol = np.where(unshocked_vol != 0.0, unshocked_vol, vol)
+
+    used_index_price = None
+    used_index_vol = None
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if index_price is not None:
+            beta = np.ones(shape) if beta is None else np.asarray(beta, dtype=np.float64)
+            used_index_price = np.full(shape, float(index_price))
+            used_index_price = np.where(
+                underlying_price != unshocked_underlying_price,
+                used_index_price
+                + 1.0
+                / beta
+                * (used_index_price / unshocked_underlying_price)
+                * (underlying_price - unshocked_underlying_price),
+                used_index_price,
+            )
+            delta_multiplier = beta * underlying_price / used_index_price
+            delta *= delta_multiplier
+            gamma *= delta_multiplier**2
+
+        if vol_index_price is not None:
+            vega_beta = np.ones(shape) if vega_beta is None else np.asarray(vega_beta, np.float64)
+            used_index_vol = np.full(shape, float(vol_index_price) * 0.01)
+            used_index_vol = np.where(
+                (vol != used_vol) & (used_vol != 0.0),
+                used_index_vol + 1.0 / vega_beta * (used_index_vol / used_vol) * (vol - used_vol),
+                used_index_vol,
+            )
+            vega = np.where(used_index_vol != 0.0, vega * vega_beta * vol / used_index_vol, vega)
+
+    if percent_greeks:
+        reference_price = underlying_price if used_index_price is None else used_index_price
+        delta *= reference_price * 0.01
+        gamma *= (reference_price * 0.01) ** 2
+        vega *= (vol if used_index_vol is None else used_index_vol) * 0.01
+
+    if vega_time_weight_base is not None and expiry_in_days is not None:
+        expiry_in_days = np.broadcast_to(np.asarray(expiry_in_days), shape)
+        vega = np.where(
+            expiry_in_days > 0,
+            vega * np.sqrt(vega_time_weight_base / np.maximum(expiry_in_days, 1)),
+            vega,
+        )
+
+    return delta, gamma, vega
@@ -61,7 +61,10 @@ cdef class Order:
     cdef list _events
     cdef list _venue_order_ids
     cdef list _trade_ids
+    cdef set _trade_ids_set
     cdef dict _commissions
+    cdef int _event_history_limit
+    cdef int _events_trimmed
     cdef FiniteStateMachine _fsm
     cdef OrderStatus _previous_status
     cdef Price _triggered_price
@@ -149,6 +152,7 @@ cdef class Order:
     cpdef dict to_dict(self)
 
     cpdef void set_quote_quantity(self, bint value)
+    cpdef void set_event_history_limit(self, int limit)
     cdef void set_activated_c(self, Price activation_price)
     cdef void set_triggered_price_c(self, Price triggered_price)
     cdef Price get_triggered_price_c(self)
@@ -158,6 +162,7 @@ cdef class Order:
     cdef list events_c(self)
     cdef list venue_order_ids_c(self)
     cdef list trade_ids_c(self)
+    cdef bint has_trade_id_c(self, TradeId trade_id)
     cdef int event_count_c(self)
     cdef str status_string_c(self)
     cdef str type_string_c(self)
@@ -210,6 +215,7 @@ cdef class Order:
     cdef void _update_quantity(self, Quantity quantity)
     cdef double _calculate_avg_px(self, double last_qty, double last_px)
     cdef void _set_slippage(self)
+    cdef void _trim_events(self)
 
     @staticmethod
     cdef void _hydrate_initial_events(Order original, Order transformed)
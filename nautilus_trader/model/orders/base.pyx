@@ -184,7 +184,10 @@ cdef class Order:
         self._events: list[OrderEvent] = [init]
         self._venue_order_ids: list[VenueOrderId] = []
         self._trade_ids: list[TradeId] = []
+        self._trade_ids_set: set[TradeId] = set()
         self._commissions: dict[Currency, Money] = {}
+        self._event_history_limit = 0  # Unbounded
+        self._events_trimmed = 0
         self._fsm = FiniteStateMachine(
             state_transition_table=_ORDER_STATE_TABLE,
             initial_state=OrderStatus.INITIALIZED,
@@ -340,6 +343,33 @@ cdef class Order:
     cpdef void set_quote_quantity(self, bint value):
         self.is_quote_quantity = value
 
+    cpdef void set_event_history_limit(self, int limit):
+        """
+        Set the maximum number of recent events held in memory for the order.
+
+        The initialized event is always retained in addition to the most recent
+        `limit` events. Running aggregates (filled quantity, average price,
+        commissions), `has_trade_id` and duplicate fill detection cover the full
+        history, while `events` and `trade_ids` only return the retained events, so
+        reports built from the events (such as the fills report) omit trimmed fills.
+        The full event history is still persisted to the cache database (if configured).
+
+        Parameters
+        ----------
+        limit : int
+            The event history limit (zero for unbounded).
+
+        Raises
+        ------
+        ValueError
+            If `limit` is negative.
+
+        """
+        Condition.not_negative(limit, "limit")
+
+        self._event_history_limit = limit
+        self._trim_events()
+
     cdef void set_activated_c(self, Price activation_price):
         raise NotImplementedError("method `set_activated` must be implemented in the subclass")  # pragma: no cover
 
@@ -368,8 +398,12 @@ cdef class Order:
     cdef list trade_ids_c(self):
         return self._trade_ids.copy()
 
+    cdef bint has_trade_id_c(self, TradeId trade_id):
+        Condition.not_none(trade_id, "trade_id")
+        return trade_id in self._trade_ids_set
+
     cdef int event_count_c(self):
-        return len(self._events)
+        return len(self._events) + self._events_trimmed
 
     cdef str status_string_c(self):
         return self._fsm.state_string_c()
@@ -586,6 +620,25 @@ cdef class Order:
         """
         return self.trade_ids_c()
 
+    def has_trade_id(self, TradeId trade_id) -> bool:
+        """
+        Return whether the order has been filled with the given trade ID.
+
+        Unlike `trade_ids`, this covers the full history when the event history is
+        bounded with `set_event_history_limit`.
+
+        Parameters
+        ----------
+        trade_id : TradeId
+            The trade ID to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.has_trade_id_c(trade_id)
+
     @property
     def event_count(self):
         """
@@ -1088,7 +1141,7 @@ cdef class Order:
             if self.venue_order_id is None:
                 self.venue_order_id = event.venue_order_id
             else:
-                Condition.not_in(event.trade_id, self._trade_ids, "event.trade_id", "_trade_ids")
+                Condition.not_in(event.trade_id, self._trade_ids_set, "event.trade_id", "_trade_ids")
             # Fill order
             self._filled(event)
         else:
@@ -1103,6 +1156,9 @@ cdef class Order:
         self._events.append(event)
         self.ts_last = event.ts_event
 
+        if self._event_history_limit > 0:
+            self._trim_events()
+
     cdef Quantity calculate_overfill_c(self, Quantity fill_qty):
         cdef QuantityRaw potential_filled_raw = self.filled_qty._mem.raw + fill_qty._mem.raw
 
@@ -1114,25 +1170,32 @@ cdef class Order:
         return Quantity.zero_c(fill_qty._mem.precision)
 
     cdef bint is_duplicate_fill_c(self, OrderFilled fill):
+        # Fast path: trade_id not seen before, no need to scan events
+        if fill.trade_id not in self._trade_ids_set:
+            return False
+
         cdef OrderEvent event
         for event in self._events:
             if not isinstance(event, OrderFilled):
                 continue
 
-            if (
-                event.trade_id == fill.trade_id
-                and event.order_side == fill.order_side
-                and event.last_px == fill.last_px
-                and event.last_qty == fill.last_qty
-            ):
-                return True
+            if event.trade_id == fill.trade_id:
+                return (
+                    event.order_side == fill.order_side
+                    and event.last_px == fill.last_px
+                    and event.last_qty == fill.last_qty
+                )
 
-        return False
+        # The fill event was trimmed from a bounded event history, only its trade ID is kept
+        return self._events_trimmed > 0
 
     def is_duplicate_fill(self, OrderFilled fill) -> bool:
         """
         Return whether a fill with matching trade_id, side, qty, and price already exists.
 
+        With a bounded event history only the trade IDs of trimmed fills are kept, so a
+        fill with the trade ID of a trimmed fill is always considered a duplicate.
+
         Parameters
         ----------
         fill : OrderFilled
@@ -1184,6 +1247,7 @@ cdef class Order:
         self.position_id = fill.position_id
         self.strategy_id = fill.strategy_id
         self._trade_ids.append(fill.trade_id)
+        self._trade_ids_set.add(fill.trade_id)
         self.last_trade_id = fill.trade_id
         if self.ts_accepted == 0:
             # Set ts_accepted to time of first fill if not previously set
@@ -1236,6 +1300,22 @@ cdef class Order:
     cdef void _set_slippage(self):
         pass  # Optionally implement
 
+    cdef void _trim_events(self):
+        if self._event_history_limit == 0:
+            return
+
+        # Always retain the initialized event at index 0
+        # Trade IDs of trimmed fills are kept in `_trade_ids_set`, so redelivered fills are
+        # still detected once their events are gone
+        cdef int excess = len(self._events) - 1 - self._event_history_limit
+        if excess > 0:
+            del self._events[1:1 + excess]
+            self._events_trimmed += excess
+
+        excess = len(self._trade_ids) - self._event_history_limit
+        if excess > 0:
+            del self._trade_ids[:excess]
+
     @staticmethod
     cdef void _hydrate_initial_events(Order original, Order transformed):
         cdef list original_events = original.events_c()
@@ -1245,3 +1325,5 @@ cdef class Order:
             # Insert each event to the beginning of the events list in reverse
             # to preserve correct order of events.
             transformed._events.insert(0, event)
+
+        transformed._events_trimmed += original._events_trimmed
@@ -38,6 +38,10 @@ cdef class Position:
     cdef list _events
     cdef list _adjustments
     cdef set _trade_ids
+    cdef set _client_order_ids
+    cdef set _venue_order_ids
+    cdef int _event_history_limit
+    cdef int _events_trimmed
     cdef Quantity _buy_qty
     cdef Quantity _sell_qty
     cdef dict _commissions
@@ -105,6 +109,7 @@ cdef class Position:
 
     cpdef str info(self)
     cpdef dict to_dict(self)
+    cpdef void set_event_history_limit(self, int limit)
 
     cdef list client_order_ids_c(self)
     cdef list venue_order_ids_c(self)
@@ -139,6 +144,7 @@ cdef class Position:
     cdef void _check_duplicate_trade_id(self, OrderFilled fill)
     cdef void _handle_buy_order_fill(self, OrderFilled fill)
     cdef void _handle_sell_order_fill(self, OrderFilled fill)
+    cdef void _trim_events(self)
     cdef double _calculate_avg_px(self, double avg_px, double qty, double last_px, double last_qty)
     cdef double _calculate_avg_px_open_px(self, double last_px, double last_qty)
     cdef double _calculate_avg_px_close_px(self, double last_px, double last_qty)
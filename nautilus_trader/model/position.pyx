@@ -29,6 +29,7 @@ from nautilus_trader.model.events.position cimport PositionAdjustmentType
 from nautilus_trader.model.functions cimport order_side_to_str
 from nautilus_trader.model.functions cimport position_side_to_str
 from nautilus_trader.model.identifiers cimport TradeId
+from nautilus_trader.model.identifiers cimport VenueOrderId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.instruments.currency_pair cimport CurrencyPair
 from nautilus_trader.model.objects cimport Price
@@ -68,6 +69,10 @@ cdef class Position:
         self._events: list[OrderFilled] = []
         self._adjustments: list = []
         self._trade_ids: set[TradeId] = set()
+        self._client_order_ids: set[ClientOrderId] = set()
+        self._venue_order_ids: set[VenueOrderId] = set()
+        self._event_history_limit = 0  # Unbounded
+        self._events_trimmed = 0
         self._buy_qty = Quantity.zero_c(precision=instrument.size_precision)
         self._sell_qty = Quantity.zero_c(precision=instrument.size_precision)
         self._commissions = {}
@@ -128,6 +133,10 @@ cdef class Position:
         remain, the position is reset to an empty shell with all history cleared
         (including timestamps), making it eligible for immediate cache cleanup.
 
+        If events have been trimmed by the event history limit then the position
+        cannot be rebuilt, so only the retained events for the order are dropped
+        and the running aggregates are left unchanged.
+
         Parameters
         ----------
         client_order_id : ClientOrderId
@@ -141,6 +150,11 @@ cdef class Position:
             if event.client_order_id != client_order_id
         ]
 
+        if self._events_trimmed > 0:
+            self._events = remaining_events
+            self._client_order_ids.discard(client_order_id)
+            return
+
         # Preserve non-commission adjustments (funding, manual adjustments, etc.)
         # Commission adjustments will be automatically re-created when fills are replayed
         cdef list preserved_adjustments = [
@@ -150,6 +164,8 @@ cdef class Position:
 
         self._events.clear()
         self._trade_ids.clear()
+        self._client_order_ids.clear()
+        self._venue_order_ids.clear()
         self._adjustments.clear()
 
         # If no fills remain, reset to flat state clearing all history
@@ -194,6 +210,31 @@ cdef class Position:
         cdef str quantity = " " if self.quantity._mem.raw == 0 else f" {self.quantity.to_formatted_str()} "
         return f"{position_side_to_str(self.side)}{quantity}{self.instrument_id}"
 
+    cpdef void set_event_history_limit(self, int limit):
+        """
+        Set the maximum number of recent fill events held in memory for the position.
+
+        Running aggregates (quantities, average prices, commissions, realized PnL),
+        the order IDs and `has_trade_id` cover the full history, while `events`,
+        `trade_ids` and the duplicate fill check only consider the retained fills.
+        The full event history is still persisted to the cache database (if configured).
+
+        Parameters
+        ----------
+        limit : int
+            The event history limit (zero for unbounded).
+
+        Raises
+        ------
+        ValueError
+            If `limit` is negative.
+
+        """
+        Condition.not_negative(limit, "limit")
+
+        self._event_history_limit = limit
+        self._trim_events()
+
     cpdef dict to_dict(self):
         """
         Return a dictionary representation of this object.
@@ -232,12 +273,10 @@ cdef class Position:
         }
 
     cdef list client_order_ids_c(self):
-        # Note the inner set {}
-        return sorted(list({fill.client_order_id for fill in self._events}))
+        return sorted(self._client_order_ids)
 
     cdef list venue_order_ids_c(self):
-        # Note the inner set {}
-        return sorted(list({fill.venue_order_id for fill in self._events}))
+        return sorted(self._venue_order_ids)
 
     cdef list trade_ids_c(self):
         # Checked for duplicate before appending to events
@@ -260,7 +299,7 @@ cdef class Position:
         return trade_id in self._trade_ids
 
     cdef int event_count_c(self):
-        return len(self._events)
+        return len(self._events) + self._events_trimmed
 
     cdef bint is_open_c(self):
         return self.side != PositionSide.FLAT
@@ -390,6 +429,25 @@ cdef class Position:
         """
         return self.last_trade_id_c()
 
+    def has_trade_id(self, TradeId trade_id) -> bool:
+        """
+        Return whether the position has been filled with the given trade ID.
+
+        Unlike `trade_ids`, this covers the full history when the event history is
+        bounded with `set_event_history_limit`.
+
+        Parameters
+        ----------
+        trade_id : TradeId
+            The trade ID to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.has_trade_id_c(trade_id)
+
     @property
     def event_count(self):
         """
@@ -554,6 +612,9 @@ cdef class Position:
         if self.side == PositionSide.FLAT:
             self._events.clear()
             self._trade_ids.clear()
+            self._client_order_ids.clear()
+            self._venue_order_ids.clear()
+            self._events_trimmed = 0
             self._adjustments.clear()
             self._buy_qty = Quantity.zero_c(precision=self.size_precision)
             self._sell_qty = Quantity.zero_c(precision=self.size_precision)
@@ -572,6 +633,11 @@ cdef class Position:
 
         self._events.append(fill)
         self._trade_ids.add(fill.trade_id)
+        self._client_order_ids.add(fill.client_order_id)
+        self._venue_order_ids.add(fill.venue_order_id)
+
+        if self._event_history_limit > 0:
+            self._trim_events()
 
         # Accumulate commission in its currency
         cdef Currency currency = fill.commission.currency
@@ -890,6 +956,15 @@ cdef class Position:
             ):
                 raise KeyError(f"Duplicate {fill.trade_id!r} in events {fill} {p_fill}")
 
+    cdef void _trim_events(self):
+        if self._event_history_limit == 0:
+            return
+
+        cdef int excess = len(self._events) - self._event_history_limit
+        if excess > 0:
+            del self._events[:excess]
+            self._events_trimmed += excess
+
     cdef void _handle_buy_order_fill(self, OrderFilled fill):
         cdef:
             double realized_pnl
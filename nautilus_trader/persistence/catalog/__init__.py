@@ -13,8 +13,22 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from typing import TYPE_CHECKING
+
+from nautilus_trader.core.lazy import lazy_getattr
 from nautilus_trader.persistence.catalog.base import BaseDataCatalog
-from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+
+
+if TYPE_CHECKING:
+    from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+
+
+# The Parquet catalog imports `pyarrow.dataset` and `fsspec`, which are slow to load
+# and only needed once a catalog is used
+__getattr__ = lazy_getattr(
+    __name__,
+    {"ParquetDataCatalog": "nautilus_trader.persistence.catalog.parquet"},
+)
 
 
 __all__ = (
@@ -15,12 +15,19 @@
 
 from __future__ import annotations
 
+import heapq
 import itertools
 import os
 import platform
 import re
+import time
 from collections import defaultdict
+from collections.abc import Callable
 from collections.abc import Generator
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from functools import partial
 from itertools import groupby
 from os import PathLike
 from pathlib import Path
@@ -29,6 +36,7 @@ from typing import NamedTuple
 from typing import Union
 
 import fsspec
+import msgspec
 import pandas as pd
 import portion as P
 import pyarrow as pa
@@ -96,8 +104,44 @@ class FeatherFile(NamedTuple):
     class_name: str
 
 
+class ConsolidationStats(NamedTuple):
+    """
+    Represents the outcome of consolidating a single catalog leaf directory.
+    """
+
+    directory: str
+    file_count: int
+    row_count: int
+    elapsed_secs: float
+
+    @property
+    def rows_per_sec(self) -> float:
+        """
+        Return the consolidation throughput in rows per second.
+
+        Returns
+        -------
+        float
+
+        """
+        return self.row_count / self.elapsed_secs if self.elapsed_secs > 0 else 0.0
+
+
+class RowGroupStats(NamedTuple):
+    """
+    Represents the `ts_init` range, row count and byte range of a parquet row group.
+    """
+
+    ts_min: int
+    ts_max: int
+    num_rows: int
+    offset: int
+    byte_size: int
+
+
 _NAUTILUS_PATH = "NAUTILUS_PATH"
 _DEFAULT_FS_PROTOCOL = "file"
+_ROW_GROUP_INDEX_FILENAME = "_row_groups.json"  # Not matched by `*.parquet` globs
 
 
 class ParquetDataCatalog(BaseDataCatalog):
@@ -136,6 +180,10 @@ class ParquetDataCatalog(BaseDataCatalog):
     For further details about `fsspec` and its filesystem protocols, see
     https://filesystem-spec.readthedocs.io/en/latest/.
 
+    Each leaf data directory keeps a `_row_groups.json` sidecar index of the `ts_init` range,
+    row count and byte range of every row group, which time range queries use to prune below
+    file granularity (see `index_catalog`).
+
     """
 
     def __init__(
@@ -386,12 +434,15 @@ class ParquetDataCatalog(BaseDataCatalog):
                     f"non-disjoint intervals. Existing intervals: {current_intervals}",
                 )
 
+        metadata_collector: list[pq.FileMetaData] = []
         pq.write_table(
             table,
             where=parquet_file,
             filesystem=self.fs,
             row_group_size=self.max_rows_per_group,
+            metadata_collector=metadata_collector,
         )
+        self._update_row_group_index(directory, {parquet_file: metadata_collector[0]})
 
     def _objects_to_table(self, data: list[Data], data_cls: type) -> pa.Table:
         PyCondition.not_empty(data, "data")
@@ -464,6 +515,7 @@ class ParquetDataCatalog(BaseDataCatalog):
                 )
                 new_path = os.path.join(directory, _timestamps_to_filename(start, interval[1]))
                 self.fs.rename(old_path, new_path)
+                self._update_row_group_index(directory, renamed={old_path: new_path})
                 break
             elif interval[1] == start - 1:
                 old_path = os.path.join(
@@ -472,6 +524,7 @@ class ParquetDataCatalog(BaseDataCatalog):
                 )
                 new_path = os.path.join(directory, _timestamps_to_filename(interval[0], end))
                 self.fs.rename(old_path, new_path)
+                self._update_row_group_index(directory, renamed={old_path: new_path})
                 break
 
         intervals = self._get_directory_intervals(directory)
@@ -549,6 +602,7 @@ class ParquetDataCatalog(BaseDataCatalog):
             return
 
         parquet_files = self.fs.glob(os.path.join(directory, "*.parquet"))
+        renamed: dict[str, str] = {}
 
         for file in parquet_files:
             first_ts, last_ts = self._min_max_from_parquet_metadata(file, "ts_init")
@@ -559,6 +613,9 @@ class ParquetDataCatalog(BaseDataCatalog):
             new_filename = _timestamps_to_filename(first_ts, last_ts)
             new_path = os.path.join(os.path.dirname(file), new_filename)
             self.fs.rename(file, new_path)
+            renamed[file] = new_path
+
+        self._update_row_group_index(directory, renamed=renamed)
 
         intervals = self._get_directory_intervals(directory)
         assert _are_intervals_disjoint(
@@ -602,7 +659,9 @@ class ParquetDataCatalog(BaseDataCatalog):
         end: TimestampLike | None = None,
         ensure_contiguous_files: bool = True,
         deduplicate: bool = False,
-    ) -> None:
+        max_workers: int = 1,
+        show_progress: bool = False,
+    ) -> list[ConsolidationStats]:
         """
         Consolidate all parquet files across the entire catalog within the specified
         time range.
@@ -626,6 +685,21 @@ class ParquetDataCatalog(BaseDataCatalog):
             If True, ensures that files have contiguous timestamps before consolidation.
         deduplicate : bool, default False
             If True, removes duplicate rows from the consolidated file.
+        max_workers : int, default 1
+            The maximum number of leaf directories to consolidate concurrently.
+        show_progress : bool, default False
+            If the file count, row count and throughput should be printed to stdout as
+            each leaf directory completes.
+
+        Returns
+        -------
+        list[ConsolidationStats]
+            The consolidation stats for each leaf directory, in directory order.
+
+        Raises
+        ------
+        ValueError
+            If `max_workers` is not positive.
 
         Notes
         -----
@@ -636,20 +710,68 @@ class ParquetDataCatalog(BaseDataCatalog):
           that directory will be aborted for safety.
         - After consolidation, the original files are removed and replaced with a single file
           in each leaf directory.
+        - Each worker owns a whole leaf directory, so no two workers ever touch the same files.
+          Parquet decoding, encoding and compression release the GIL, so worker threads
+          overlap both I/O and CPU bound work.
         - This method is useful for periodic maintenance of the catalog to improve query
           performance and reduce storage overhead.
 
         """
-        leaf_directories = self._find_leaf_data_directories()
-
-        for directory in leaf_directories:
-            self._consolidate_directory(
-                directory,
-                start,
-                end,
-                ensure_contiguous_files,
+        return self._consolidate_directories(
+            self._find_leaf_data_directories(),
+            partial(
+                self._consolidate_directory,
+                start=start,
+                end=end,
+                ensure_contiguous_files=ensure_contiguous_files,
                 deduplicate=deduplicate,
-            )
+            ),
+            max_workers=max_workers,
+            show_progress=show_progress,
+        )
+
+    def _consolidate_directories(
+        self,
+        directories: list[str],
+        consolidate: Callable[[str], ConsolidationStats | None],
+        max_workers: int,
+        show_progress: bool,
+    ) -> list[ConsolidationStats]:
+        PyCondition.positive_int(max_workers, "max_workers")
+
+        results: dict[str, ConsolidationStats] = {}
+
+        def on_complete(stats: ConsolidationStats | None) -> None:
+            if stats is None:
+                return
+
+            results[stats.directory] = stats
+
+            if show_progress:
+                print(
+                    f"Consolidated {stats.directory} ({len(results)}/{len(directories)}): "
+                    f"{stats.file_count} files, {stats.row_count:,} rows in "
+                    f"{stats.elapsed_secs:.3f}s ({stats.rows_per_sec:,.0f} rows/s)",
+                )
+
+        if max_workers == 1 or len(directories) <= 1:
+            for directory in directories:
+                on_complete(consolidate(directory))
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(directories))) as executor:
+                futures = [executor.submit(consolidate, directory) for directory in directories]
+
+                try:
+                    for future in as_completed(futures):
+                        on_complete(future.result())
+                except BaseException:
+                    # Fail fast: directories not yet started are left untouched
+                    for future in futures:
+                        future.cancel()
+
+                    raise
+
+        return [results[directory] for directory in directories if directory in results]
 
     def consolidate_data(
         self,
@@ -713,7 +835,8 @@ class ParquetDataCatalog(BaseDataCatalog):
         end: TimestampLike | None = None,
         ensure_contiguous_files: bool = True,
         deduplicate: bool = False,
-    ) -> None:
+    ) -> ConsolidationStats:
+        start_time = time.perf_counter()
         parquet_files = self.fs.glob(os.path.join(directory, "*.parquet"))
         files_to_consolidate = []
         used_start: pd.Timestamp | None = time_object_to_dt(start)
@@ -721,7 +844,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         intervals = []
 
         if len(parquet_files) <= 1:
-            return
+            return ConsolidationStats(directory, 0, 0, time.perf_counter() - start_time)
 
         for file in parquet_files:
             interval = _parse_filename_timestamps(file)
@@ -735,7 +858,7 @@ class ParquetDataCatalog(BaseDataCatalog):
                 intervals.append(interval)
 
         if len(intervals) <= 1:
-            return
+            return ConsolidationStats(directory, 0, 0, time.perf_counter() - start_time)
 
         intervals.sort(key=lambda x: x[0])
 
@@ -747,47 +870,168 @@ class ParquetDataCatalog(BaseDataCatalog):
             _timestamps_to_filename(intervals[0][0], intervals[-1][1]),
         )
         files_to_consolidate.sort()
-        self._combine_parquet_files(files_to_consolidate, new_file_name, deduplicate=deduplicate)
+        row_count = self._combine_parquet_files(
+            files_to_consolidate,
+            new_file_name,
+            deduplicate=deduplicate,
+        )
+
+        return ConsolidationStats(
+            directory,
+            len(files_to_consolidate),
+            row_count,
+            time.perf_counter() - start_time,
+        )
 
     def _combine_parquet_files(
         self,
         file_list: list[str],
         new_file: str,
         deduplicate: bool = False,
-    ) -> None:
+    ) -> int:
         if len(file_list) <= 1:
-            return
+            return 0
 
-        tables = [
-            pq.read_table(file, memory_map=True, pre_buffer=False, filesystem=self.fs)
-            for file in file_list
+        parquet_files = [
+            pq.ParquetFile(file, pre_buffer=False, filesystem=self.fs) for file in file_list
         ]
-        self._validate_table_metadata(tables, file_list)
-
-        combined_table = pa.concat_tables(tables)
+        tmp_file = f"{new_file}.tmp"
 
-        if deduplicate:
-            combined_table = self._deduplicate_table(combined_table)
+        try:
+            self._validate_schema_metadata([pf.schema_arrow for pf in parquet_files], file_list)
+            row_count, metadata = self._write_tables_to_temp_file(
+                _merge_parquet_files(
+                    parquet_files,
+                    batch_size=self.max_rows_per_group,
+                    deduplicate=deduplicate,
+                ),
+                parquet_files[0].schema_arrow,
+                tmp_file,
+            )
+        finally:
+            for pf in parquet_files:
+                pf.close()
 
-        pq.write_table(combined_table, where=new_file, filesystem=self.fs)
+        self.fs.mv(tmp_file, new_file)
 
         for file in file_list:
             if file != new_file:
                 self.fs.rm(file)
 
+        self._update_row_group_index(os.path.dirname(new_file), {new_file: metadata})
+
+        return row_count
+
+    def _write_tables_to_temp_file(
+        self,
+        tables: Iterable[pa.Table],
+        schema: pa.Schema,
+        tmp_file: str,
+    ) -> tuple[int, pq.FileMetaData]:
+        # Writes to a sibling temporary file (not matched by `*.parquet` globs) which the
+        # caller renames into place once complete, so readers never observe a partial file
+        metadata_collector: list[pq.FileMetaData] = []
+        row_count = 0
+
+        try:
+            with pq.ParquetWriter(
+                tmp_file,
+                schema,
+                filesystem=self.fs,
+                metadata_collector=metadata_collector,
+            ) as writer:
+                # Coalesce chunks so row groups stay close to `max_rows_per_group`
+                pending: list[pa.Table] = []
+                pending_rows = 0
+
+                for table in tables:
+                    pending.append(table)
+                    pending_rows += table.num_rows
+
+                    if pending_rows >= self.max_rows_per_group:
+                        writer.write_table(
+                            pa.concat_tables(pending),
+                            row_group_size=self.max_rows_per_group,
+                        )
+                        row_count += pending_rows
+                        pending = []
+                        pending_rows = 0
+
+                if pending:
+                    writer.write_table(
+                        pa.concat_tables(pending),
+                        row_group_size=self.max_rows_per_group,
+                    )
+                    row_count += pending_rows
+        except BaseException:
+            if self.fs.exists(tmp_file):
+                self.fs.rm(tmp_file)
+
+            raise
+
+        return row_count, metadata_collector[0]
+
+    def _write_period_to_temp_file(
+        self,
+        file_list: list[str],
+        tmp_file: str,
+        start_ns: int,
+        end_ns: int,
+    ) -> tuple[int, int, pq.FileMetaData] | None:
+        # Streams the rows of `file_list` with a `ts_init` within [start_ns, end_ns] into
+        # `tmp_file`, returning the first and last `ts_init` written along with the file
+        # metadata, or None (leaving no file behind) if no rows fall within the period
+        period_files = []
+
+        for file in file_list:
+            interval = _parse_filename_timestamps(file)
+
+            if interval is None or (interval[0] <= end_ns and start_ns <= interval[1]):
+                period_files.append(file)
+
+        if not period_files:
+            return None
+
+        parquet_files = [
+            pq.ParquetFile(file, pre_buffer=False, filesystem=self.fs) for file in period_files
+        ]
+        ts_bounds: list[int] = []
+
+        try:
+            self._validate_schema_metadata([pf.schema_arrow for pf in parquet_files], period_files)
+            row_count, metadata = self._write_tables_to_temp_file(
+                _filter_ts_init(
+                    _merge_parquet_files(parquet_files, batch_size=self.max_rows_per_group),
+                    start_ns,
+                    end_ns,
+                    ts_bounds,
+                ),
+                parquet_files[0].schema_arrow,
+                tmp_file,
+            )
+        finally:
+            for pf in parquet_files:
+                pf.close()
+
+        if row_count == 0:
+            self.fs.rm(tmp_file)
+            return None
+
+        return ts_bounds[0], ts_bounds[-1], metadata
+
     @staticmethod
-    def _validate_table_metadata(
-        tables: list[pa.Table],
+    def _validate_schema_metadata(
+        schemas: list[pa.Schema],
         file_list: list[str],
     ) -> None:
-        if len(tables) <= 1:
+        if len(schemas) <= 1:
             return
 
-        reference_metadata = tables[0].schema.metadata or {}
+        reference_metadata = schemas[0].metadata or {}
         reference_keys = set(reference_metadata.keys())
 
-        for i, table in enumerate(tables[1:], start=1):
-            metadata = table.schema.metadata or {}
+        for i, schema in enumerate(schemas[1:], start=1):
+            metadata = schema.metadata or {}
             metadata_keys = set(metadata.keys())
 
             missing = reference_keys - metadata_keys
@@ -828,7 +1072,9 @@ class ParquetDataCatalog(BaseDataCatalog):
         start: TimestampLike | None = None,
         end: TimestampLike | None = None,
         ensure_contiguous_files: bool = True,
-    ) -> None:
+        max_workers: int = 1,
+        show_progress: bool = False,
+    ) -> list[ConsolidationStats]:
         """
         Consolidate all parquet files across the entire catalog by splitting them into
         fixed time periods.
@@ -854,6 +1100,21 @@ class ParquetDataCatalog(BaseDataCatalog):
         ensure_contiguous_files : bool, default True
             If True, uses period boundaries for file naming.
             If False, uses actual data timestamps for file naming.
+        max_workers : int, default 1
+            The maximum number of leaf directories to consolidate concurrently.
+        show_progress : bool, default False
+            If the file count, row count and throughput should be printed to stdout as
+            each leaf directory completes.
+
+        Returns
+        -------
+        list[ConsolidationStats]
+            The consolidation stats for each known leaf directory, in directory order.
+
+        Raises
+        ------
+        ValueError
+            If `max_workers` is not positive.
 
         Notes
         -----
@@ -863,28 +1124,62 @@ class ParquetDataCatalog(BaseDataCatalog):
           all files into a single file per directory.
         - Uses the same period-based consolidation logic as `consolidate_data_by_period`.
         - Original files are removed and replaced with period-based consolidated files.
+        - Periods within a directory are consolidated in order, while leaf directories are
+          distributed over `max_workers` threads.
         - This method is useful for periodic maintenance of the catalog to standardize
           file organization by time periods.
 
         """
-        leaf_directories = self._find_leaf_data_directories()
-
-        for directory in leaf_directories:
-            data_cls, identifier = self._extract_data_cls_and_identifier_from_path(directory)
-
-            if data_cls is None:
-                # Skip directories that don't correspond to known data classes
-                continue
-
-            # Call the existing consolidate_data_by_period method
-            self.consolidate_data_by_period(
-                data_cls=data_cls,
-                identifier=identifier,
+        return self._consolidate_directories(
+            self._find_leaf_data_directories(),
+            partial(
+                self._consolidate_directory_by_period,
                 period=period,
                 start=start,
                 end=end,
                 ensure_contiguous_files=ensure_contiguous_files,
-            )
+            ),
+            max_workers=max_workers,
+            show_progress=show_progress,
+        )
+
+    def _consolidate_directory_by_period(
+        self,
+        directory: str,
+        period: pd.Timedelta,
+        start: TimestampLike | None,
+        end: TimestampLike | None,
+        ensure_contiguous_files: bool,
+    ) -> ConsolidationStats | None:
+        data_cls, identifier = self._extract_data_cls_and_identifier_from_path(directory)
+
+        if data_cls is None:
+            # Skip directories that don't correspond to known data classes
+            return None
+
+        start_time = time.perf_counter()
+
+        # Row counts come from the parquet footers, so no data pages are read here
+        parquet_files = self.fs.glob(os.path.join(directory, "*.parquet"))
+        row_count = sum(
+            pq.read_metadata(file, filesystem=self.fs).num_rows for file in parquet_files
+        )
+
+        self.consolidate_data_by_period(
+            data_cls=data_cls,
+            identifier=identifier,
+            period=period,
+            start=start,
+            end=end,
+            ensure_contiguous_files=ensure_contiguous_files,
+        )
+
+        return ConsolidationStats(
+            directory,
+            len(parquet_files),
+            row_count,
+            time.perf_counter() - start_time,
+        )
 
     def consolidate_data_by_period(  # noqa: C901
         self,
@@ -898,10 +1193,10 @@ class ParquetDataCatalog(BaseDataCatalog):
         """
         Consolidate data files by splitting them into fixed time periods.
 
-        This method queries data by period and writes consolidated files immediately,
-        using the skip_disjoint_check parameter to avoid interval conflicts during
-        the consolidation process. When start/end boundaries intersect existing files,
-        the function automatically splits those files to preserve all data.
+        Each period is streamed from the existing files into a temporary file which is
+        renamed into place once complete, so neither a whole period nor a partially
+        written file is ever held or observed. When start/end boundaries intersect existing
+        files, the function automatically splits those files to preserve all data.
 
         Parameters
         ----------
@@ -930,8 +1225,8 @@ class ParquetDataCatalog(BaseDataCatalog):
         - Groups intervals into contiguous groups to preserve holes between groups
         - Allows consolidation across multiple files within each contiguous group
         - Skips queries if target files already exist for efficiency
-        - Original files are removed immediately after querying each period
-        - Uses skip_disjoint_check to avoid interval conflicts during consolidation
+        - Original files are only removed once the period covering them has been written
+        - Periods are read in row batches of `max_rows_per_group`, keeping the original schema
         - When ensure_contiguous_files=False, file timestamps match actual data range
         - When ensure_contiguous_files=True, file timestamps use period boundaries
         - Uses modulo arithmetic for efficient period boundary calculation
@@ -971,17 +1266,20 @@ class ParquetDataCatalog(BaseDataCatalog):
         file_start_ns = None  # Track contiguity across periods
 
         for query_info in queries_to_execute:
-            # Query data for this period using existing files
-            period_data = self.query(
-                data_cls=data_cls,
-                identifiers=[identifier] if identifier is not None else None,
-                start=query_info["query_start"],
-                end=query_info["query_end"],
-                files=existing_files,
-                optimize_file_loading=False,
+            # Stream the data for this period from the existing files into a temporary file
+            tmp_file = os.path.join(
+                directory,
+                _timestamps_to_filename(query_info["query_start"], query_info["query_end"])
+                + ".tmp",
+            )
+            written = self._write_period_to_temp_file(
+                existing_files,
+                tmp_file,
+                query_info["query_start"],
+                query_info["query_end"],
             )
 
-            if not period_data:
+            if written is None:
                 # Skip if no data found, but maintain contiguity by using query start
                 if file_start_ns is None:
                     file_start_ns = query_info["query_start"]
@@ -999,8 +1297,7 @@ class ParquetDataCatalog(BaseDataCatalog):
                 file_end_ns = query_info["query_end"]
             else:
                 # Use actual data timestamps for file naming
-                file_start_ns = period_data[0].ts_init
-                file_end_ns = period_data[-1].ts_init
+                file_start_ns, file_end_ns, _ = written
 
             # Check again if target file exists (in case it was created during this process)
             target_filename = os.path.join(
@@ -1010,19 +1307,13 @@ class ParquetDataCatalog(BaseDataCatalog):
 
             if self.fs.exists(target_filename):
                 # Skip if target file already exists
+                self.fs.rm(tmp_file)
                 continue
 
-            # Write consolidated data for this period
-            # Use skip_disjoint_check since we're managing file removal carefully
-            self.write_data(
-                data=period_data,
-                start=file_start_ns,
-                end=file_end_ns,
-                skip_disjoint_check=True,
-            )
-
-            # Clear the data from memory immediately
-            del period_data
+            # Only once the period is complete is it moved into place (and are the files it
+            # covers removed), so a failure never loses data
+            self.fs.mv(tmp_file, target_filename)
+            self._update_row_group_index(directory, {target_filename: written[2]})
 
             # Identify files that are completely covered by this period
             for file in existing_files[:]:  # Use slice copy to avoid modification during iteration
@@ -1583,6 +1874,8 @@ class ParquetDataCatalog(BaseDataCatalog):
         end: TimestampLike | None = None,
         where: str | None = None,
         files: list[str] | None = None,
+        max_workers: int = 1,
+        batch_size: int | None = None,
         **kwargs: Any,
     ) -> list[Data | CustomData]:
         """
@@ -1607,6 +1900,14 @@ class ParquetDataCatalog(BaseDataCatalog):
         files : list[str], optional
             A specific list of files to query from. If provided, these files are used
             instead of discovering files through the normal process.
+        max_workers : int, default 1
+            The maximum number of identifiers (instruments or bar types) to load concurrently.
+            If greater than 1, each identifier's files are read and decoded to objects on a
+            worker thread, and the per-identifier results are k-way merged by `ts_init`.
+        batch_size : int, optional
+            The maximum number of rows each worker decodes at once, which caps the Arrow data
+            held per worker when `max_workers` is greater than 1. If None, then
+            `max_rows_per_group` is used.
         **kwargs : Any
             Additional keyword arguments passed to the underlying query implementation.
 
@@ -1615,17 +1916,35 @@ class ParquetDataCatalog(BaseDataCatalog):
         list[Data | CustomData]
             A list of data objects matching the query criteria.
 
+        Raises
+        ------
+        ValueError
+            If `max_workers` is not positive, or `batch_size` is not positive when fanning out.
+
         Notes
         -----
         - For Nautilus built-in data types (OrderBookDelta, QuoteTick, etc.) with the 'file'
           protocol, the Rust implementation is used for better performance.
         - For other data types or protocols, the PyArrow implementation is used.
         - When files parameter is provided, PyArrow backend is used regardless of data type.
+        - When `max_workers` is greater than 1 (and neither `files` nor `where` is provided),
+          the fan-out mode is used regardless of data type. This suits loading many
+          identifiers from object stores, where per-file latency dominates.
         - Non-Nautilus data classes are wrapped in CustomData objects with the appropriate
           DataType.
 
         """
-        if (
+        if max_workers != 1 and files is None and where is None:
+            data = self._query_fan_out(
+                data_cls=data_cls,
+                identifiers=identifiers,
+                start=start,
+                end=end,
+                filter_expr=kwargs.get("filter_expr"),
+                max_workers=max_workers,
+                batch_size=batch_size,
+            )
+        elif (
             data_cls
             in (
                 OrderBookDelta,
@@ -2061,22 +2380,15 @@ class ParquetDataCatalog(BaseDataCatalog):
         if not file_list:
             return []
 
-        dataset = pds.dataset(file_list, filesystem=self.fs)
-
         # Filter dataset
         used_start: pd.Timestamp | None = time_object_to_dt(start)
         used_end: pd.Timestamp | None = time_object_to_dt(end)
-        filters: list[pds.Expression] = [filter_expr] if filter_expr is not None else []
-
-        if used_start is not None:
-            filters.append(pds.field("ts_init") >= used_start.value)
+        dataset = self._make_dataset(file_list, used_start, used_end)
 
-        if used_end is not None:
-            filters.append(pds.field("ts_init") <= used_end.value)
-
-        combined_filters = combine_filters(*filters) if filters else None
+        if dataset is None:
+            return []
 
-        table = dataset.to_table(filter=combined_filters)
+        table = dataset.to_table(filter=_make_ts_filter(filter_expr, used_start, used_end))
 
         # Convert dataset to nautilus objects
         if table is None or table.num_rows == 0:
@@ -2084,6 +2396,129 @@ class ParquetDataCatalog(BaseDataCatalog):
 
         return self._handle_table_nautilus(table, data_cls=data_cls)
 
+    def _query_fan_out(
+        self,
+        data_cls: type,
+        identifiers: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+        filter_expr: pds.Expression | None = None,
+        max_workers: int = 1,
+        batch_size: int | None = None,
+    ) -> list[Data]:
+        PyCondition.positive_int(max_workers, "max_workers")
+
+        if batch_size is None:
+            batch_size = self.max_rows_per_group
+
+        PyCondition.positive_int(batch_size, "batch_size")
+
+        query_data_cls = OrderBookDelta if data_cls == OrderBookDeltas else data_cls
+
+        # One task per identifier directory, whose files sort by their start timestamp
+        directories: dict[str, list[str]] = defaultdict(list)
+
+        for file in sorted(self._query_files(query_data_cls, identifiers, start, end)):
+            directories[os.path.dirname(file)].append(file)
+
+        if not directories:
+            return []
+
+        query_directory = partial(
+            self._query_directory,
+            data_cls=query_data_cls,
+            start=time_object_to_dt(start),
+            end=time_object_to_dt(end),
+            filter_expr=filter_expr,
+            batch_size=batch_size,
+        )
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(directories))) as executor:
+            results = list(executor.map(query_directory, directories.values()))
+
+        # Each result is already sorted, so merge rather than re-sort (ties keep directory order)
+        data: list[Data] = list(heapq.merge(*results, key=lambda x: x.ts_init))
+
+        if data_cls == OrderBookDeltas:
+            data = OrderBookDeltas.batch(data)
+
+        return data
+
+    def _query_directory(
+        self,
+        files: list[str],
+        data_cls: type,
+        start: pd.Timestamp | None,
+        end: pd.Timestamp | None,
+        filter_expr: pds.Expression | None,
+        batch_size: int,
+    ) -> list[Data]:
+        dataset = self._make_dataset(files, start, end)
+
+        if dataset is None:
+            return []
+
+        data: list[Data] = []
+        batches: list[pa.RecordBatch] = []
+        batch_rows = 0
+
+        # Decode in slices of about `batch_size` rows, so a worker never holds more Arrow data
+        # than that (plus one scanned batch) alongside the objects decoded so far
+        for batch in dataset.to_batches(
+            filter=_make_ts_filter(filter_expr, start, end),
+            batch_size=batch_size,
+            use_threads=False,  # Keep batches in file order, workers already run in parallel
+        ):
+            batches.append(batch)
+            batch_rows += batch.num_rows
+
+            if batch_rows >= batch_size:
+                data.extend(self._handle_table_nautilus(pa.Table.from_batches(batches), data_cls))
+                batches = []
+                batch_rows = 0
+
+        if batch_rows:
+            data.extend(self._handle_table_nautilus(pa.Table.from_batches(batches), data_cls))
+
+        # Files written with `skip_disjoint_check` may overlap
+        if any(prev.ts_init > curr.ts_init for prev, curr in itertools.pairwise(data)):
+            data.sort(key=lambda x: x.ts_init)
+
+        return data
+
+    def _make_dataset(
+        self,
+        file_list: list[str],
+        start: pd.Timestamp | None,
+        end: pd.Timestamp | None,
+    ) -> pds.Dataset | None:
+        dataset = pds.dataset(file_list, filesystem=self.fs)
+
+        if start is None and end is None:
+            return dataset
+
+        # Only scan the row groups which the index shows overlapping the range
+        selected = self._select_indexed_row_groups(file_list, start, end)
+        fragments = []
+
+        for fragment in dataset.get_fragments():
+            row_group_ids = selected.get(fragment.path)
+
+            if row_group_ids is None:
+                fragments.append(fragment)
+            elif row_group_ids:
+                fragments.append(fragment.subset(row_group_ids=row_group_ids))
+
+        if not fragments:
+            return None
+
+        return pds.FileSystemDataset(
+            fragments,
+            dataset.schema,
+            dataset.format,
+            dataset.filesystem,
+        )
+
     def _query_files(
         self,
         data_cls: type,
@@ -2160,6 +2595,9 @@ class ParquetDataCatalog(BaseDataCatalog):
         partial matching by checking if the file's identifier starts with the provided identifier
         followed by a dash (to match bar type patterns).
 
+        When a time range is given, files covered by the row group index are also dropped when
+        none of their row groups overlap the range.
+
         """
         if identifiers:
             if not isinstance(identifiers, list):
@@ -2196,6 +2634,18 @@ class ParquetDataCatalog(BaseDataCatalog):
             if _query_intersects_filename(file_path, used_start, used_end)
         ]
 
+        if used_start is not None or used_end is not None:
+            # Drop files whose name intersects the range but none of whose row groups do
+            file_paths = [
+                file_path
+                for file_path, row_group_ids in self._select_indexed_row_groups(
+                    file_paths,
+                    used_start,
+                    used_end,
+                ).items()
+                if row_group_ids is None or row_group_ids
+            ]
+
         if self.show_query_paths:
             for file_path in file_paths:
                 print(file_path)
@@ -2381,6 +2831,169 @@ class ParquetDataCatalog(BaseDataCatalog):
 
         return intervals
 
+    def get_row_count(
+        self,
+        data_cls: type,
+        identifier: str | None = None,
+    ) -> int:
+        """
+        Return the number of rows stored for a specific data class and instrument ID.
+
+        Parameters
+        ----------
+        data_cls : type
+            The data class type to count rows for.
+        identifier : str, optional
+            The instrument ID to count rows for. If None, counts rows across all instruments
+            for the specified data class.
+
+        Returns
+        -------
+        int
+
+        Notes
+        -----
+        Files covered by the row group index are counted without opening them, only the
+        footers of unindexed files are read.
+
+        """
+        directory = self._make_path(data_cls, identifier)
+        directories = [directory]
+
+        if identifier is None:
+            directories.extend(
+                sub_dir
+                for sub_dir in self.fs.glob(os.path.join(directory, "*"))
+                if self.fs.isdir(sub_dir)
+            )
+
+        row_count = 0
+
+        for directory in directories:
+            for file, row_groups in self._get_row_group_index(directory).items():
+                if row_groups is None:
+                    row_count += pq.read_metadata(file, filesystem=self.fs).num_rows
+                else:
+                    row_count += sum(row_group.num_rows for row_group in row_groups)
+
+        return row_count
+
+    def index_catalog(self) -> None:
+        """
+        Build the row group index of every leaf directory in the catalog.
+
+        Each leaf directory keeps a small sidecar index holding the `ts_init` range, row count
+        and byte range of every row group in its parquet files. Time range queries use it to
+        skip files and row groups which do not overlap the range, and `get_row_count` answers
+        from it without opening the files.
+
+        Notes
+        -----
+        - The index is maintained automatically when the catalog writes, consolidates or
+          renames files, so this is only needed for files written by other means (such as
+          the Rust catalog or an earlier version).
+        - Files missing from the index, or whose size no longer matches it, are never pruned
+          below file granularity, so a stale index cannot drop data from query results.
+
+        """
+        for directory in self._find_leaf_data_directories():
+            parquet_files = self.fs.glob(os.path.join(directory, "*.parquet"))
+            self._update_row_group_index(directory, dict.fromkeys(parquet_files))
+
+    def _select_indexed_row_groups(
+        self,
+        file_paths: list[str],
+        start: pd.Timestamp | None,
+        end: pd.Timestamp | None,
+    ) -> dict[str, list[int] | None]:
+        # Maps each file to the ids of its row groups overlapping the range, or None when
+        # the file is not covered by the index
+        start_ns = start.value if start is not None else None
+        end_ns = end.value if end is not None else None
+        indexes: dict[str, dict[str, list[RowGroupStats] | None]] = {}
+        selected: dict[str, list[int] | None] = {}
+
+        for file_path in file_paths:
+            directory = os.path.dirname(file_path)
+
+            if directory not in indexes:
+                indexes[directory] = self._get_row_group_index(directory)
+
+            row_groups = indexes[directory].get(file_path)
+            selected[file_path] = (
+                None if row_groups is None else _select_row_groups(row_groups, start_ns, end_ns)
+            )
+
+        return selected
+
+    def _get_row_group_index(self, directory: str) -> dict[str, list[RowGroupStats] | None]:
+        # Maps every parquet file in the directory to its indexed row groups, or None when
+        # the file is not indexed or its size has changed since it was indexed
+        index = self._read_row_group_index(directory)
+        listing = self.fs.glob(os.path.join(directory, "*.parquet"), detail=True)
+        result: dict[str, list[RowGroupStats] | None] = {}
+
+        for file, info in listing.items():
+            entry = index.get(os.path.basename(file))
+            result[file] = entry[1] if entry is not None and entry[0] == info["size"] else None
+
+        return result
+
+    def _read_row_group_index(self, directory: str) -> dict[str, tuple[int, list[RowGroupStats]]]:
+        index_path = os.path.join(directory, _ROW_GROUP_INDEX_FILENAME)
+
+        try:
+            with self.fs.open(index_path, "rb") as f:
+                return msgspec.json.decode(
+                    f.read(),
+                    type=dict[str, tuple[int, list[RowGroupStats]]],
+                )
+        except (FileNotFoundError, msgspec.DecodeError):
+            # A missing or unreadable index only disables pruning until it is rebuilt
+            return {}
+
+    def _update_row_group_index(
+        self,
+        directory: str,
+        added: dict[str, pq.FileMetaData | None] | None = None,
+        renamed: dict[str, str] | None = None,
+    ) -> None:
+        index = self._read_row_group_index(directory)
+
+        for old_path, new_path in (renamed or {}).items():
+            entry = index.pop(os.path.basename(old_path), None)
+
+            if entry is not None:
+                index[os.path.basename(new_path)] = entry
+
+        listing = self.fs.glob(os.path.join(directory, "*.parquet"), detail=True)
+        sizes = {os.path.basename(file): info["size"] for file, info in listing.items()}
+
+        for file, metadata in (added or {}).items():
+            name = os.path.basename(file)
+
+            if name not in sizes:
+                continue
+
+            if metadata is None:
+                metadata = pq.read_metadata(file, filesystem=self.fs)
+
+            index[name] = (
+                sizes[name],
+                _row_group_stats(metadata, _parse_filename_timestamps(file)),
+            )
+
+        # Drop entries for files since removed, or rewritten outside the catalog
+        index = {name: entry for name, entry in index.items() if sizes.get(name) == entry[0]}
+
+        index_path = os.path.join(directory, _ROW_GROUP_INDEX_FILENAME)
+        tmp_path = f"{index_path}.tmp"
+
+        with self.fs.open(tmp_path, "wb") as f:
+            f.write(msgspec.json.encode(index))
+
+        self.fs.mv(tmp_path, index_path)
+
     def _make_path(
         self,
         data_cls: type[Data],
@@ -2913,6 +3526,175 @@ def _file_timestamp_to_iso_timestamp(file_timestamp: str) -> str:
     return f"{date_part}T{final_time_part}Z"
 
 
+def _merge_parquet_files(  # noqa: C901
+    parquet_files: list[pq.ParquetFile],
+    batch_size: int,
+    deduplicate: bool = False,
+) -> Generator[pa.Table, None, None]:
+    # Streams a k-way merge of parquet files which are each sorted by `ts_init`, holding at
+    # most a buffered and a look-ahead batch per file. Every buffered row strictly below the
+    # watermark (the lowest last `ts_init` of any file with unread batches) is emitted at
+    # once, so all rows sharing a `ts_init` land in the same chunk and can be deduplicated
+    # there without a whole-table read.
+    if "ts_init" not in parquet_files[0].schema_arrow.names:
+        # No ordering key, so fall back to concatenating the files in order
+        batches = itertools.chain.from_iterable(
+            pf.iter_batches(batch_size=batch_size) for pf in parquet_files
+        )
+
+        if deduplicate:
+            table = pa.Table.from_batches(batches, schema=parquet_files[0].schema_arrow)
+            yield ParquetDataCatalog._deduplicate_table(table)
+        else:
+            for batch in batches:
+                yield pa.Table.from_batches([batch])
+
+        return
+
+    sources = [pf.iter_batches(batch_size=batch_size) for pf in parquet_files]
+    lookahead = [next(source, None) for source in sources]
+    buffers: list[pa.Table | None] = [None] * len(sources)
+
+    def pull(i: int) -> None:
+        batch = lookahead[i]
+        lookahead[i] = next(sources[i], None)
+        table = pa.Table.from_batches([batch])
+        buffers[i] = table if buffers[i] is None else pa.concat_tables([buffers[i], table])
+
+    def last_ts(i: int) -> int:
+        return buffers[i]["ts_init"][-1].as_py()
+
+    while True:
+        for i in range(len(sources)):
+            while (buffers[i] is None or buffers[i].num_rows == 0) and lookahead[i] is not None:
+                pull(i)
+
+        live = [i for i in range(len(sources)) if buffers[i] is not None and buffers[i].num_rows]
+        if not live:
+            return
+
+        unread = [i for i in live if lookahead[i] is not None]
+        watermark = min(last_ts(i) for i in unread) if unread else None
+
+        chunks = []
+        for i in live:
+            if watermark is None:
+                split = buffers[i].num_rows
+            else:
+                split = pc.sum(pc.less(buffers[i]["ts_init"], watermark)).as_py() or 0
+
+            if split:
+                chunks.append(buffers[i].slice(0, split))
+                buffers[i] = buffers[i].slice(split)
+
+        if not chunks:
+            # Every buffered row of the lowest file(s) sits at the watermark, so read further
+            for i in unread:
+                if last_ts(i) == watermark:
+                    pull(i)
+
+            continue
+
+        table = pa.concat_tables(chunks)
+
+        if deduplicate:
+            table = ParquetDataCatalog._deduplicate_table(table)
+
+        if len(chunks) > 1 or deduplicate:
+            table = table.sort_by("ts_init")  # Stable, so file order is kept within a `ts_init`
+
+        yield table
+
+
+def _filter_ts_init(
+    tables: Iterable[pa.Table],
+    start_ns: int,
+    end_ns: int,
+    ts_bounds: list[int],
+) -> Generator[pa.Table, None, None]:
+    # Yields the rows of `tables` (in `ts_init` order) with a `ts_init` within
+    # [start_ns, end_ns], recording the first and last `ts_init` yielded in `ts_bounds`
+    for table in tables:
+        ts_init = table["ts_init"]
+
+        if ts_init[0].as_py() > end_ns:
+            return  # Every remaining row is after the range
+
+        table = table.filter(
+            pc.and_(pc.greater_equal(ts_init, start_ns), pc.less_equal(ts_init, end_ns)),
+        )
+
+        if table.num_rows:
+            if not ts_bounds:
+                ts_bounds.append(table["ts_init"][0].as_py())
+
+            ts_bounds[1:] = [table["ts_init"][-1].as_py()]
+            yield table
+
+
+def _make_ts_filter(
+    filter_expr: pds.Expression | None,
+    start: pd.Timestamp | None,
+    end: pd.Timestamp | None,
+) -> pds.Expression | None:
+    filters: list[pds.Expression] = [filter_expr] if filter_expr is not None else []
+
+    if start is not None:
+        filters.append(pds.field("ts_init") >= start.value)
+
+    if end is not None:
+        filters.append(pds.field("ts_init") <= end.value)
+
+    return combine_filters(*filters) if filters else None
+
+
+def _row_group_stats(
+    metadata: pq.FileMetaData,
+    interval: tuple[int, int] | None,
+) -> list[RowGroupStats]:
+    column_paths = [metadata.schema.column(i).path for i in range(metadata.num_columns)]
+    ts_index = column_paths.index("ts_init") if "ts_init" in column_paths else None
+
+    # Row groups without `ts_init` statistics fall back to the whole file interval
+    default_min, default_max = interval or (0, 2**64 - 1)
+    row_groups = []
+
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        ts_min, ts_max = default_min, default_max
+
+        if ts_index is not None:
+            statistics = row_group.column(ts_index).statistics
+
+            if statistics is not None and statistics.has_min_max:
+                ts_min, ts_max = statistics.min, statistics.max
+
+        first_column = row_group.column(0)
+        offset = (
+            first_column.dictionary_page_offset
+            if first_column.has_dictionary_page
+            else first_column.data_page_offset
+        )
+        byte_size = sum(
+            row_group.column(j).total_compressed_size for j in range(row_group.num_columns)
+        )
+        row_groups.append(RowGroupStats(ts_min, ts_max, row_group.num_rows, offset, byte_size))
+
+    return row_groups
+
+
+def _select_row_groups(
+    row_groups: list[RowGroupStats],
+    start: int | None,
+    end: int | None,
+) -> list[int]:
+    return [
+        i
+        for i, row_group in enumerate(row_groups)
+        if (start is None or start <= row_group.ts_max) and (end is None or row_group.ts_min <= end)
+    ]
+
+
 def _are_intervals_disjoint(intervals: list[tuple[int, int]]) -> bool:
     n = len(intervals)
 
@@ -16,13 +16,19 @@
 from __future__ import annotations
 
 from datetime import time
+from enum import Enum
 
-import fsspec
 import pandas as pd
 
 from nautilus_trader.common.config import NautilusConfig
 from nautilus_trader.persistence.catalog.base import BaseDataCatalog
-from nautilus_trader.persistence.writer import RotationMode
+
+
+class RotationMode(Enum):
+    SIZE = 0
+    INTERVAL = 1
+    SCHEDULED_DATES = 2
+    NO_ROTATION = 3
 
 
 class StreamingConfig(NautilusConfig, frozen=True):
@@ -74,6 +80,8 @@ class StreamingConfig(NautilusConfig, frozen=True):
 
     @property
     def fs(self):
+        import fsspec
+
         return fsspec.filesystem(protocol=self.fs_protocol, **(self.fs_storage_options or {}))
 
     def as_catalog(self) -> BaseDataCatalog:
@@ -13,10 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import re
+from __future__ import annotations
 
-from pyarrow.dataset import Expression
-from pyarrow.dataset import field
+import re
+from typing import TYPE_CHECKING
 
 from nautilus_trader.core.inspect import is_nautilus_class
 from nautilus_trader.core.nautilus_pyo3 import convert_to_snake_case
@@ -33,6 +33,10 @@ from nautilus_trader.serialization.arrow.serializer import _ARROW_ENCODERS
 from nautilus_trader.serialization.arrow.serializer import _RUST_CUSTOM_TYPE_REGISTRY
 
 
+if TYPE_CHECKING:
+    from pyarrow.dataset import Expression
+
+
 CUSTOM_DATA_PREFIX = "custom_"
 
 
@@ -158,6 +162,9 @@ def parse_filters_expr(s: str | None) -> Expression | None:
             "Only field() comparisons with strings or numbers are permitted.",
         )
 
+    # Imported here as `pyarrow.dataset` is slow to load and only needed for catalog queries
+    from pyarrow.dataset import field
+
     try:
         # For now, rely on the regex validation above to guarantee safety and
         # evaluate the expression in a minimal global namespace that only exposes
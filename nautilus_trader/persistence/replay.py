@@ -0,0 +1,439 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import itertools
+import os
+from collections.abc import Generator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.data import Data
+from nautilus_trader.core.datetime import time_object_to_dt
+from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.enums import RecordFlag
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.catalog.parquet import TimestampLike
+from nautilus_trader.persistence.catalog.parquet import _parse_filename_timestamps
+
+
+REPLAY_SIDECAR_SUFFIX = ".arrow"
+
+# Schema metadata key for the fingerprint of the Parquet file a sidecar was written from
+_SOURCE_METADATA_KEY = b"nautilus_replay_source"
+
+
+def replay_sidecar_path(path: str) -> str:
+    """
+    Return the replay sidecar path for the given catalog Parquet file path.
+
+    Parameters
+    ----------
+    path : str
+        The Parquet file path.
+
+    Returns
+    -------
+    str
+
+    """
+    return str(Path(path).with_suffix(REPLAY_SIDECAR_SUFFIX))
+
+
+def write_replay_sidecar(path: str, overwrite: bool = False) -> str:
+    """
+    Write an uncompressed Arrow IPC (file format) sidecar alongside the given Parquet
+    file.
+
+    The sidecar holds the same columns and schema metadata as the Parquet file, but in
+    a fixed-width layout which can be memory-mapped and read without decoding or
+    copying. The sidecar is first written to a temporary file and then atomically
+    renamed into place.
+
+    An existing sidecar is only reused if it was written from the current Parquet file,
+    identified by its size, modification time and a hash of its footer (which holds the
+    row group offsets and statistics), so rewritten files are re-converted.
+
+    Parameters
+    ----------
+    path : str
+        The local Parquet file path.
+    overwrite : bool, default False
+        If an existing sidecar should be rewritten even if current.
+
+    Returns
+    -------
+    str
+        The sidecar file path.
+
+    """
+    sidecar_path = replay_sidecar_path(path)
+    fingerprint = _local_source_fingerprint(path)
+
+    if not overwrite and _read_source_fingerprint(sidecar_path) == fingerprint:
+        return sidecar_path
+
+    tmp_path = f"{sidecar_path}.tmp"
+    _write_sidecar(pq.ParquetFile(path, memory_map=True), tmp_path, fingerprint)
+    os.replace(tmp_path, sidecar_path)
+
+    return sidecar_path
+
+
+def _write_sidecar(parquet_file: pq.ParquetFile, path: str, fingerprint: str) -> None:
+    schema = parquet_file.schema_arrow
+    metadata = {**(schema.metadata or {}), _SOURCE_METADATA_KEY: fingerprint.encode()}
+
+    with (
+        pa.OSFile(path, "wb") as sink,
+        pa.ipc.new_file(sink, schema.with_metadata(metadata)) as writer,
+    ):
+        for batch in parquet_file.iter_batches():
+            writer.write_batch(batch)
+
+
+def _source_fingerprint(f: BinaryIO, size: int, mtime: object) -> str:
+    # The Parquet footer is the last 8 bytes: a 4 byte footer length and the magic bytes
+    f.seek(-8, os.SEEK_END)
+    footer_size = int.from_bytes(f.read(4), "little")
+    f.seek(-(footer_size + 8), os.SEEK_END)
+    digest = hashlib.sha256(f.read(footer_size)).hexdigest()
+
+    return f"{size}:{mtime}:{digest}"
+
+
+def _local_source_fingerprint(path: str) -> str:
+    stat = os.stat(path)
+    with open(path, "rb") as f:
+        return _source_fingerprint(f, stat.st_size, stat.st_mtime_ns)
+
+
+def _read_source_fingerprint(sidecar_path: str) -> str | None:
+    try:
+        with pa.memory_map(sidecar_path, "r") as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+    except (FileNotFoundError, pa.ArrowInvalid):
+        return None  # No sidecar, or not an IPC file
+
+    fingerprint = metadata.get(_SOURCE_METADATA_KEY)
+    return fingerprint.decode() if fingerprint is not None else None
+
+
+class MemoryMappedReplaySource:
+    """
+    Provides a replay source which streams catalog data files into a backtest from
+    memory-mapped Arrow buffers.
+
+    Files are memory-mapped rather than read into memory, and Nautilus data objects are
+    only created for one chunk of rows at a time as the backtest consumes them, so the
+    resident memory is bounded by the OS page cache rather than the dataset size. When
+    Arrow IPC sidecars are available (see `write_replay_sidecar`), the column buffers are
+    used directly without any decoding, and the pages are shared between all processes
+    replaying the same files.
+
+    For `OrderBookDeltas`, the deltas are batched by their `F_LAST` flag as for catalog
+    queries, with a batch which spans a chunk boundary yielded in the later chunk.
+
+    Parameters
+    ----------
+    data_cls : type
+        The data class for the files.
+    paths : list[str]
+        The local file paths to replay. Paths may be Arrow IPC (file or stream format) or
+        Parquet files, each sorted by `ts_init`. Files within the same directory (the
+        catalog identifier partition) must have non-overlapping time ranges, and the
+        streams for different directories are merged by `ts_init`.
+    chunk_size : int, default 10_000
+        The maximum number of rows to convert to data objects per yielded chunk.
+    start : TimestampLike, optional
+        The start (inclusive) `ts_init` for the replay.
+    end : TimestampLike, optional
+        The end (inclusive) `ts_init` for the replay.
+
+    Raises
+    ------
+    ValueError
+        If `paths` is empty.
+    ValueError
+        If `chunk_size` is not positive.
+
+    """
+
+    def __init__(
+        self,
+        data_cls: type,
+        paths: list[str],
+        chunk_size: int = 10_000,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+    ) -> None:
+        PyCondition.not_empty(paths, "paths")
+        PyCondition.positive_int(chunk_size, "chunk_size")
+
+        used_start = time_object_to_dt(start)
+        used_end = time_object_to_dt(end)
+
+        self.data_cls = data_cls
+        self.paths = sorted(paths, key=_file_sort_key)
+        self.chunk_size = chunk_size
+        self.start_ns: int = used_start.value if used_start is not None else 0
+        self.end_ns: int = used_end.value if used_end is not None else np.iinfo(np.uint64).max
+
+    @classmethod
+    def from_catalog(
+        cls,
+        catalog: ParquetDataCatalog,
+        data_cls: type,
+        identifiers: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+        chunk_size: int = 10_000,
+        write_sidecars: bool = False,
+    ) -> MemoryMappedReplaySource:
+        """
+        Create a replay source for the catalog files matching the given query.
+
+        Parameters
+        ----------
+        catalog : ParquetDataCatalog
+            The catalog to replay from (must use the local 'file' protocol).
+        data_cls : type
+            The data class to replay.
+        identifiers : list[str], optional
+            The instrument IDs or bar types to filter by.
+        start : TimestampLike, optional
+            The start (inclusive) `ts_init` for the replay.
+        end : TimestampLike, optional
+            The end (inclusive) `ts_init` for the replay.
+        chunk_size : int, default 10_000
+            The maximum number of rows to convert to data objects per yielded chunk.
+        write_sidecars : bool, default False
+            If missing Arrow IPC sidecars should be written for the matched files.
+            Existing sidecars are preferred over the Parquet files while current (see
+        `write_replay_sidecar`).
+
+        Returns
+        -------
+        MemoryMappedReplaySource
+
+        Raises
+        ------
+        ValueError
+            If the catalog does not use the local 'file' protocol.
+        ValueError
+            If no files match the query.
+
+        """
+        PyCondition.equal(catalog.fs_protocol, "file", "catalog.fs_protocol", "'file'")
+
+        query_data_cls = OrderBookDelta if data_cls is OrderBookDeltas else data_cls
+        file_paths = catalog._query_files(query_data_cls, identifiers, start, end)
+
+        paths: list[str] = []
+        for path in file_paths:
+            if write_sidecars:
+                paths.append(write_replay_sidecar(path))
+                continue
+
+            sidecar_path = replay_sidecar_path(path)
+            is_current = _read_source_fingerprint(sidecar_path) == _local_source_fingerprint(path)
+            paths.append(sidecar_path if is_current else path)
+
+        return cls(
+            data_cls=data_cls,
+            paths=paths,
+            chunk_size=chunk_size,
+            start=start,
+            end=end,
+        )
+
+    @property
+    def row_count(self) -> int:
+        """
+        Return the total row count across all files (before time filtering).
+
+        Returns
+        -------
+        int
+
+        """
+        total = 0
+        for path in self.paths:
+            if path.endswith(".parquet"):
+                total += pq.ParquetFile(path, memory_map=True).metadata.num_rows
+            else:
+                total += sum(batch.num_rows for batch in _iter_ipc_batches(path))
+
+        return total
+
+    def iter_chunks(self) -> Generator[list[Data], None, None]:
+        """
+        Return a generator of data chunks sorted by `ts_init`.
+
+        The generator is suitable for `BacktestEngine.add_data_iterator`.
+
+        Returns
+        -------
+        Generator[list[Data], None, None]
+
+        """
+        groups: dict[str, list[str]] = {}
+        for path in self.paths:
+            groups.setdefault(str(Path(path).parent), []).append(path)
+
+        if len(groups) == 1:
+            yield from self._iter_group_chunks(self.paths)
+            return
+
+        # Files for different identifiers overlap in time, so k-way merge the
+        # already sorted per-identifier streams and re-chunk the output
+        streams = [
+            itertools.chain.from_iterable(self._iter_group_chunks(paths))
+            for paths in groups.values()
+        ]
+        chunk: list[Data] = []
+        for data in heapq.merge(*streams, key=_ts_init):
+            chunk.append(data)
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+    def _iter_group_chunks(self, paths: list[str]) -> Generator[list[Data], None, None]:
+        if self.data_cls is OrderBookDeltas:
+            yield from _batch_deltas(self._iter_decoded_chunks(paths))
+        else:
+            yield from self._iter_decoded_chunks(paths)
+
+    def _iter_decoded_chunks(self, paths: list[str]) -> Generator[list[Data], None, None]:
+        for path in paths:
+            bounds = _file_bounds(path)
+            if bounds is not None and (bounds[1] < self.start_ns or bounds[0] > self.end_ns):
+                continue  # File entirely outside of the replay range
+
+            for batch in self._iter_file_batches(path):
+                batch = self._slice_to_range(batch)
+                if batch is None:
+                    continue
+
+                for offset in range(0, batch.num_rows, self.chunk_size):
+                    chunk = batch.slice(offset, self.chunk_size)
+                    data = self._decode(chunk)
+                    if data:
+                        yield data
+
+    def __iter__(self) -> Iterator[list[Data]]:
+        return self.iter_chunks()
+
+    def _iter_file_batches(self, path: str) -> Generator[pa.RecordBatch, None, None]:
+        if path.endswith(".parquet"):
+            parquet_file = pq.ParquetFile(path, memory_map=True)
+            schema = parquet_file.schema_arrow
+            for batch in parquet_file.iter_batches(batch_size=self.chunk_size):
+                # Reattach schema metadata which carries the decoding parameters
+                yield batch.replace_schema_metadata(schema.metadata)
+        else:
+            yield from _iter_ipc_batches(path)
+
+    def _slice_to_range(self, batch: pa.RecordBatch) -> pa.RecordBatch | None:
+        if batch.num_rows == 0:
+            return None
+
+        # Zero-copy view over the mapped `ts_init` buffer (sorted within each file)
+        ts_init = batch.column("ts_init").to_numpy()
+        lo = int(np.searchsorted(ts_init, self.start_ns, side="left"))
+        hi = int(np.searchsorted(ts_init, self.end_ns, side="right"))
+        if lo >= hi:
+            return None
+
+        if lo == 0 and hi == batch.num_rows:
+            return batch
+
+        return batch.slice(lo, hi - lo)
+
+    def _decode(self, batch: pa.RecordBatch) -> list[Data]:
+        table = pa.Table.from_batches([batch])
+
+        if self.data_cls is OrderBookDeltas:
+            # Decoded as individual deltas, which are batched by `_batch_deltas`
+            return ParquetDataCatalog._handle_table_nautilus(table, data_cls=OrderBookDelta)
+
+        return ParquetDataCatalog._handle_table_nautilus(table, data_cls=self.data_cls)
+
+
+def _batch_deltas(
+    chunks: Iterable[list[OrderBookDelta]],
+) -> Generator[list[OrderBookDeltas], None, None]:
+    # Batches are delimited by `F_LAST`, which may fall in a later chunk (or file), so
+    # the deltas after the last `F_LAST` in a chunk are carried over into the next
+    pending: list[OrderBookDelta] = []
+    for deltas in chunks:
+        start = len(pending)
+        pending.extend(deltas)
+
+        end = len(pending)
+        while end > start and not pending[end - 1].flags & RecordFlag.F_LAST:
+            end -= 1
+
+        if end == start:
+            continue  # No batch completed within the chunk
+
+        yield OrderBookDeltas.batch(pending[:end])
+        pending = pending[end:]
+
+    if pending:
+        # A trailing incomplete batch is emitted with the remaining deltas (the same as catalog queries)
+        yield OrderBookDeltas.batch(pending)
+
+
+def _iter_ipc_batches(path: str) -> Generator[pa.RecordBatch, None, None]:
+    source = pa.memory_map(path, "r")
+    try:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            yield reader.get_batch(i)
+    except pa.ArrowInvalid:
+        # Not the IPC file format, fall back to the streaming format (e.g. feather streams)
+        source.seek(0)
+        yield from pa.ipc.open_stream(source)
+
+
+def _ts_init(data: Data) -> int:
+    return data.ts_init
+
+
+def _file_bounds(path: str) -> tuple[int, int] | None:
+    try:
+        return _parse_filename_timestamps(path)
+    except ValueError:
+        return None  # Not a catalog timestamped file name
+
+
+def _file_sort_key(path: str) -> tuple[int, str]:
+    bounds = _file_bounds(path)
+    return (bounds[0] if bounds is not None else 0, path)
@@ -0,0 +1,462 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import contextlib
+import glob
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import BinaryIO
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.data import Data
+from nautilus_trader.core.datetime import time_object_to_dt
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.catalog.parquet import TimestampLike
+from nautilus_trader.persistence.catalog.parquet import _query_intersects_filename
+from nautilus_trader.persistence.funcs import class_to_filename
+from nautilus_trader.persistence.funcs import urisafe_identifier
+from nautilus_trader.persistence.replay import REPLAY_SIDECAR_SUFFIX
+from nautilus_trader.persistence.replay import MemoryMappedReplaySource
+from nautilus_trader.persistence.replay import _file_bounds
+from nautilus_trader.persistence.replay import _read_source_fingerprint
+from nautilus_trader.persistence.replay import _source_fingerprint
+from nautilus_trader.persistence.replay import _write_sidecar
+
+
+_SHARED_MEMORY_ROOT = "/dev/shm"  # noqa: S108 (tmpfs shared memory)
+_STORE_DIRECTORY = "nautilus_shared_stores"
+
+
+def default_shared_store_root() -> str:
+    """
+    Return the default root directory for shared data stores.
+
+    This is the tmpfs shared memory mount where available (Linux), otherwise the
+    platform temporary directory.
+
+    Returns
+    -------
+    str
+
+    """
+    if os.path.isdir(_SHARED_MEMORY_ROOT):
+        return os.path.join(_SHARED_MEMORY_ROOT, _STORE_DIRECTORY)
+
+    return os.path.join(tempfile.gettempdir(), _STORE_DIRECTORY)
+
+
+class SharedDataStore:
+    """
+    Provides a host-wide, read-only store of immutable Arrow buffers for instruments
+    and data, shared between backtest processes.
+
+    Data is published once from a `ParquetDataCatalog` into uncompressed Arrow IPC files
+    under a named directory in shared memory (tmpfs). Any process on the host can then
+    attach to the store by name and memory-map the same pages, so running many backtest
+    engines concurrently does not multiply the resident memory of the source data.
+
+    The store mirrors the catalog directory layout, and publishing is idempotent and
+    safe from concurrent processes (files are written to a temporary path and then
+    atomically renamed).
+
+    Parameters
+    ----------
+    name : str
+        The unique name of the store on the host.
+    root : str, optional
+        The root directory for stores. If ``None`` then uses `default_shared_store_root()`.
+
+    Raises
+    ------
+    ValueError
+        If `name` is not a valid string.
+
+    """
+
+    def __init__(self, name: str, root: str | None = None) -> None:
+        PyCondition.valid_string(name, "name")
+
+        self.name = name
+        self.path = os.path.join(root or default_shared_store_root(), name)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name}, path={self.path})"
+
+    @classmethod
+    def create(cls, name: str, root: str | None = None) -> SharedDataStore:
+        """
+        Create (or open if already existing) the named shared data store.
+
+        Parameters
+        ----------
+        name : str
+            The unique name of the store on the host.
+        root : str, optional
+            The root directory for stores.
+
+        Returns
+        -------
+        SharedDataStore
+
+        """
+        store = cls(name=name, root=root)
+        os.makedirs(store.path, exist_ok=True)
+
+        return store
+
+    @classmethod
+    def attach(cls, name: str, root: str | None = None) -> SharedDataStore:
+        """
+        Attach to an existing named shared data store.
+
+        Parameters
+        ----------
+        name : str
+            The unique name of the store on the host.
+        root : str, optional
+            The root directory for stores.
+
+        Returns
+        -------
+        SharedDataStore
+
+        Raises
+        ------
+        FileNotFoundError
+            If the store has not been created.
+
+        """
+        store = cls(name=name, root=root)
+
+        if not os.path.isdir(store.path):
+            raise FileNotFoundError(f"Shared data store '{name}' not found at {store.path}")
+
+        return store
+
+    @property
+    def exists(self) -> bool:
+        """
+        Return whether the store exists on the host.
+
+        Returns
+        -------
+        bool
+
+        """
+        return os.path.isdir(self.path)
+
+    def unlink(self) -> None:
+        """
+        Remove the store and all of its files from the host.
+
+        Processes which are still attached keep their existing memory mappings
+        valid until they are closed.
+
+        """
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    # -- PUBLISHING -------------------------------------------------------------------------------
+
+    def publish(
+        self,
+        catalog: ParquetDataCatalog,
+        data_cls: type,
+        identifiers: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+    ) -> list[str]:
+        """
+        Publish the catalog files for the given query into the store.
+
+        Whole catalog files are published (time filtering is applied when reading),
+        and files already present in the store are only rewritten if the catalog file
+        has changed (by size, modification time and a hash of its footer). Store files
+        overlapping a published file which no longer match a catalog file (e.g. after
+        consolidation) are removed.
+
+        Parameters
+        ----------
+        catalog : ParquetDataCatalog
+            The catalog to publish from.
+        data_cls : type
+            The data class to publish.
+        identifiers : list[str], optional
+            The instrument IDs or bar types to filter by.
+        start : TimestampLike, optional
+            The start time for the files to publish.
+        end : TimestampLike, optional
+            The end time for the files to publish.
+
+        Returns
+        -------
+        list[str]
+            The store file paths for the query.
+
+        """
+        query_data_cls = OrderBookDelta if data_cls is OrderBookDeltas else data_cls
+        file_paths = catalog._query_files(query_data_cls, identifiers, start, end)
+
+        return [self._publish_file(catalog, query_data_cls, path) for path in file_paths]
+
+    def publish_instruments(
+        self,
+        catalog: ParquetDataCatalog,
+        instrument_ids: list[str] | None = None,
+    ) -> list[str]:
+        """
+        Publish the catalog instrument definitions into the store.
+
+        Parameters
+        ----------
+        catalog : ParquetDataCatalog
+            The catalog to publish from.
+        instrument_ids : list[str], optional
+            The instrument IDs to publish. If ``None`` then publishes all instruments.
+
+        Returns
+        -------
+        list[str]
+            The published store file paths.
+
+        """
+        published: list[str] = []
+
+        for instrument_cls in Instrument.__subclasses__():
+            file_paths = catalog._query_files(instrument_cls, instrument_ids)
+            for path in file_paths:
+                published.append(self._publish_file(catalog, instrument_cls, path))
+
+        return published
+
+    def _publish_file(self, catalog: ParquetDataCatalog, data_cls: type, path: str) -> str:
+        identifier_dir = Path(path).parent.name
+        target_dir = os.path.join(self.path, "data", class_to_filename(data_cls), identifier_dir)
+        target_path = os.path.join(target_dir, Path(path).stem + REPLAY_SIDECAR_SUFFIX)
+
+        info = catalog.fs.info(path)
+        mtime = info.get("mtime", info.get("LastModified"))
+
+        with catalog.fs.open(path, "rb") as f:
+            fingerprint = _source_fingerprint(f, info["size"], mtime)
+            if _read_source_fingerprint(target_path) != fingerprint:
+                os.makedirs(target_dir, exist_ok=True)
+                _write_segment(f, target_path, fingerprint)
+
+        _remove_overlapping_segments(target_path)
+
+        return target_path
+
+    # -- QUERIES ----------------------------------------------------------------------------------
+
+    def files(
+        self,
+        data_cls: type,
+        identifiers: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+    ) -> list[str]:
+        """
+        Return the store file paths matching the given query.
+
+        Parameters
+        ----------
+        data_cls : type
+            The data class to match.
+        identifiers : list[str], optional
+            The instrument IDs or bar types to filter by.
+        start : TimestampLike, optional
+            The start time to filter by.
+        end : TimestampLike, optional
+            The end time to filter by.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        query_data_cls = OrderBookDelta if data_cls is OrderBookDeltas else data_cls
+        pattern = os.path.join(
+            self.path,
+            "data",
+            class_to_filename(query_data_cls),
+            "**",
+            f"*{REPLAY_SIDECAR_SUFFIX}",
+        )
+        file_paths = sorted(glob.glob(pattern, recursive=True))
+
+        if identifiers:
+            safe_identifiers = [urisafe_identifier(str(i)) for i in identifiers]
+            matched = [p for p in file_paths if Path(p).parent.name in safe_identifiers]
+
+            if not matched and issubclass(query_data_cls, Bar):
+                # Partial match of instrument IDs in bar types (same as the catalog)
+                matched = [
+                    p
+                    for p in file_paths
+                    if any(Path(p).parent.name.startswith(f"{i}-") for i in safe_identifiers)
+                ]
+
+            file_paths = matched
+
+        used_start: pd.Timestamp | None = time_object_to_dt(start)
+        used_end: pd.Timestamp | None = time_object_to_dt(end)
+
+        return [p for p in file_paths if _query_intersects_filename(p, used_start, used_end)]
+
+    def replay_source(
+        self,
+        data_cls: type,
+        identifiers: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+        chunk_size: int = 10_000,
+    ) -> MemoryMappedReplaySource:
+        """
+        Return a memory-mapped replay source over the store files for the given query.
+
+        Parameters
+        ----------
+        data_cls : type
+            The data class to replay.
+        identifiers : list[str], optional
+            The instrument IDs or bar types to filter by.
+        start : TimestampLike, optional
+            The start (inclusive) `ts_init` for the replay.
+        end : TimestampLike, optional
+            The end (inclusive) `ts_init` for the replay.
+        chunk_size : int, default 10_000
+            The maximum number of rows to convert to data objects per yielded chunk.
+
+        Returns
+        -------
+        MemoryMappedReplaySource
+
+        Raises
+        ------
+        ValueError
+            If no store files match the query.
+
+        """
+        return MemoryMappedReplaySource(
+            data_cls=data_cls,
+            paths=self.files(data_cls, identifiers, start, end),
+            chunk_size=chunk_size,
+            start=start,
+            end=end,
+        )
+
+    def query(
+        self,
+        data_cls: type,
+        identifiers: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+    ) -> list[Data]:
+        """
+        Return all data in the store matching the given query, sorted by `ts_init`.
+
+        Parameters
+        ----------
+        data_cls : type
+            The data class to query.
+        identifiers : list[str], optional
+            The instrument IDs or bar types to filter by.
+        start : TimestampLike, optional
+            The start (inclusive) `ts_init` for the query.
+        end : TimestampLike, optional
+            The end (inclusive) `ts_init` for the query.
+
+        Returns
+        -------
+        list[Data]
+
+        """
+        if not self.files(data_cls, identifiers, start, end):
+            return []
+
+        source = self.replay_source(data_cls, identifiers, start, end)
+
+        return [d for chunk in source.iter_chunks() for d in chunk]
+
+    def instruments(self, instrument_ids: list[str] | None = None) -> list[Instrument]:
+        """
+        Return the instruments published to the store.
+
+        Parameters
+        ----------
+        instrument_ids : list[str], optional
+            The instrument IDs to filter by. If ``None`` then returns all instruments.
+
+        Returns
+        -------
+        list[Instrument]
+
+        """
+        instruments: list[Instrument] = []
+
+        for instrument_cls in Instrument.__subclasses__():
+            for path in self.files(instrument_cls, instrument_ids):
+                with pa.memory_map(path, "r") as source:
+                    table = pa.ipc.open_file(source).read_all()
+                    instruments.extend(
+                        ParquetDataCatalog._handle_table_nautilus(table, data_cls=instrument_cls),
+                    )
+
+        return instruments
+
+
+def _write_segment(f: BinaryIO, target_path: str, fingerprint: str) -> None:
+    # Unique temporary path so concurrent publishers never interleave writes, readers
+    # with a previous segment mapped keep reading it until they close it
+    tmp_fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target_path), suffix=".tmp")
+    os.close(tmp_fd)
+
+    try:
+        f.seek(0)
+        _write_sidecar(pq.ParquetFile(f), tmp_path, fingerprint)
+        os.replace(tmp_path, target_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _remove_overlapping_segments(segment_path: str) -> None:
+    # Catalog files for an identifier never overlap in time, so any other segment which
+    # overlaps was published from a catalog file since rewritten (e.g. by consolidation)
+    bounds = _file_bounds(segment_path)
+    if bounds is None:
+        return
+
+    pattern = os.path.join(os.path.dirname(segment_path), f"*{REPLAY_SIDECAR_SUFFIX}")
+    for path in glob.glob(pattern):
+        other = _file_bounds(path)
+        if path == segment_path or other is None:
+            continue
+
+        if other[0] <= bounds[1] and bounds[0] <= other[1]:
+            with contextlib.suppress(FileNotFoundError):  # Removed by a concurrent publisher
+                os.remove(path)
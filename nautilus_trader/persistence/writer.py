@@ -15,7 +15,6 @@
 
 import datetime as dt
 from collections import OrderedDict
-from enum import Enum
 from io import TextIOWrapper
 from typing import Any
 from typing import BinaryIO
@@ -43,19 +42,13 @@ from nautilus_trader.model.data import OrderBookDepth10
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.persistence.config import RotationMode
 from nautilus_trader.persistence.funcs import class_to_filename
 from nautilus_trader.persistence.funcs import urisafe_identifier
 from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
 from nautilus_trader.serialization.arrow.serializer import list_schemas
 
 
-class RotationMode(Enum):
-    SIZE = 0
-    INTERVAL = 1
-    SCHEDULED_DATES = 2
-    NO_ROTATION = 3
-
-
 class StreamingFeatherWriter:
     """
     Provides a stream writer of Nautilus objects into feather files with rotation
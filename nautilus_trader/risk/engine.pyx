@@ -33,6 +33,9 @@ from nautilus_trader.common.component cimport LogColor
 from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.common.component cimport Throttler
 from nautilus_trader.common.messages cimport TradingStateChanged
+from nautilus_trader.common.profiling cimport HotPathProfiler
+from nautilus_trader.common.profiling cimport LatencyTracer
+from nautilus_trader.common.profiling cimport TraceStage
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport unix_nanos_to_dt
 from nautilus_trader.core.message cimport Command
@@ -209,7 +212,15 @@ cdef class RiskEngine(Component):
         """
         Condition.not_none(command, "command")
 
+        cdef HotPathProfiler profiler = self._get_profiler()
+        if profiler is None:
+            self._execute_command(command)
+            return
+
+        cdef uint64_t start_ns = profiler.start_c()
         self._execute_command(command)
+        if start_ns:
+            profiler.stop_c("engine", "RiskEngine", "_execute_command", start_ns)
 
     cpdef void process(self, Event event):
         """
@@ -223,7 +234,15 @@ cdef class RiskEngine(Component):
         """
         Condition.not_none(event, "event")
 
+        cdef HotPathProfiler profiler = self._get_profiler()
+        if profiler is None:
+            self._handle_event(event)
+            return
+
+        cdef uint64_t start_ns = profiler.start_c()
         self._handle_event(event)
+        if start_ns:
+            profiler.stop_c("engine", "RiskEngine", "_handle_event", start_ns)
 
     cpdef void set_trading_state(self, TradingState state):
         """
@@ -412,6 +431,10 @@ cdef class RiskEngine(Component):
             self._log.error(f"Cannot handle command: {command}")
 
     cpdef void _handle_submit_order(self, SubmitOrder command):
+        cdef LatencyTracer tracer = self._get_tracer()
+        if tracer is not None:
+            tracer.stamp_order(command.order.client_order_id, TraceStage.RISK_ENGINE)
+
         if self.is_bypassed:
             # Perform no further risk checks or throttling
             self._send_to_execution(command)
@@ -18,11 +18,13 @@ from __future__ import annotations
 from nautilus_trader.cache.config import CacheConfig
 from nautilus_trader.common import Environment
 from nautilus_trader.common.config import ImportableActorConfig
+from nautilus_trader.common.config import LatencyTracingConfig
 from nautilus_trader.common.config import LoggingConfig
 from nautilus_trader.common.config import MessageBusConfig
 from nautilus_trader.common.config import NautilusConfig
 from nautilus_trader.common.config import OrderEmulatorConfig
 from nautilus_trader.common.config import PositiveFloat
+from nautilus_trader.common.config import ProfilingConfig
 from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.data.config import DataEngineConfig
 from nautilus_trader.execution.config import ExecEngineConfig
@@ -82,6 +84,12 @@ class NautilusKernelConfig(NautilusConfig, frozen=True):
         If the asyncio event loop should be in debug mode.
     logging : LoggingConfig, optional
         The logging configuration for the kernel.
+    profiling : ProfilingConfig, optional
+        The hot-path profiling configuration for the kernel.
+        If ``None`` then no profiling will occur.
+    latency_tracing : LatencyTracingConfig, optional
+        The tick-to-trade latency tracing configuration for the kernel.
+        If ``None`` then no tracing will occur.
     timeout_connection : PositiveFloat, default 60
         The timeout (seconds) for all clients to connect and initialize.
     timeout_reconciliation : PositiveFloat, default 30
@@ -123,6 +131,8 @@ class NautilusKernelConfig(NautilusConfig, frozen=True):
     save_state: bool = False
     loop_debug: bool = False
     logging: LoggingConfig | None = None
+    profiling: ProfilingConfig | None = None
+    latency_tracing: LatencyTracingConfig | None = None
 
     timeout_connection: PositiveFloat = 60.0
     timeout_reconciliation: PositiveFloat = 30.0
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from __future__ import annotations
+
 import asyncio
 import concurrent.futures
 import platform
@@ -24,6 +26,7 @@ from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import msgspec
 
@@ -51,6 +54,8 @@ from nautilus_trader.common.enums import LogColor
 from nautilus_trader.common.enums import LogLevel
 from nautilus_trader.common.enums import log_level_from_str
 from nautilus_trader.common.messages import ShutdownSystem
+from nautilus_trader.common.profiling import HotPathProfiler
+from nautilus_trader.common.profiling import LatencyTracer
 from nautilus_trader.config import ActorFactory
 from nautilus_trader.config import ControllerFactory
 from nautilus_trader.config import DataEngineConfig
@@ -77,7 +82,6 @@ from nautilus_trader.live.execution_engine import LiveExecutionEngine
 from nautilus_trader.live.risk_engine import LiveRiskEngine
 from nautilus_trader.model.identifiers import TraderId
 from nautilus_trader.persistence.catalog import BaseDataCatalog
-from nautilus_trader.persistence.writer import StreamingFeatherWriter
 from nautilus_trader.portfolio.base import PortfolioFacade
 from nautilus_trader.portfolio.portfolio import Portfolio
 from nautilus_trader.risk.engine import RiskEngine
@@ -87,6 +91,10 @@ from nautilus_trader.trading.strategy import Strategy
 from nautilus_trader.trading.trader import Trader
 
 
+if TYPE_CHECKING:
+    from nautilus_trader.persistence.writer import StreamingFeatherWriter
+
+
 try:
     import uvloop
 except ImportError:  # pragma: no cover
@@ -353,6 +361,22 @@ class NautilusKernel:
             config=config.message_bus,
         )
 
+        self._profiler: HotPathProfiler | None = None
+
+        if config.profiling:
+            self._profiler = HotPathProfiler(sample_rate=config.profiling.sample_rate)
+            self._msgbus.set_profiler(self._profiler)
+
+        self._tracer: LatencyTracer | None = None
+
+        if config.latency_tracing:
+            self._tracer = LatencyTracer(
+                clock=self._clock,
+                sample_rate=config.latency_tracing.sample_rate,
+                max_pending=config.latency_tracing.max_pending,
+            )
+            self._msgbus.set_tracer(self._tracer)
+
         self._setup_shutdown_handling()
 
         self._cache = Cache(
@@ -462,6 +486,14 @@ class NautilusKernel:
                 config=config.exec_engine,
             )
 
+        if self._profiler is not None:
+            for engine in (self._data_engine, self._risk_engine, self._exec_engine):
+                if isinstance(engine, LiveDataEngine | LiveRiskEngine | LiveExecutionEngine):
+                    self._profiler.add_queue_source(
+                        engine.id.value,
+                        engine.queue_latency_histograms,
+                    )
+
         flush_on_start = config.cache is not None and config.cache.flush_on_start
         if config.exec_engine and config.exec_engine.load_cache and not flush_on_start:
             self.exec_engine.load_cache()
@@ -585,6 +617,9 @@ class NautilusKernel:
         self._msgbus.subscribe("commands.system.shutdown", self._on_shutdown_system)
 
     def _setup_streaming(self, config: StreamingConfig) -> None:
+        # Imported here as the writer loads `fsspec` and Arrow IPC, only needed when streaming
+        from nautilus_trader.persistence.writer import StreamingFeatherWriter
+
         # Set up persistence
         path = f"{config.catalog_path}/{self._environment.value}/{self.instance_id}"
         self._writer = StreamingFeatherWriter(
@@ -830,6 +865,30 @@ class NautilusKernel:
         """
         return self._msgbus
 
+    @property
+    def profiler(self) -> HotPathProfiler | None:
+        """
+        Return the kernel's hot-path profiler (if profiling is configured).
+
+        Returns
+        -------
+        HotPathProfiler or ``None``
+
+        """
+        return self._profiler
+
+    @property
+    def tracer(self) -> LatencyTracer | None:
+        """
+        Return the kernel's tick-to-trade latency tracer (if tracing is configured).
+
+        Returns
+        -------
+        LatencyTracer or ``None``
+
+        """
+        return self._tracer
+
     @property
     def msgbus_serializer(self) -> MessageBus:
         """
@@ -1140,6 +1199,14 @@ class NautilusKernel:
         if self._writer:
             self._writer.close()
 
+        if self._profiler is not None and self._msgbus.profiler is not None:
+            self._report_profiling()
+            self._msgbus.set_profiler(None)  # Stop profiling (histograms remain available)
+
+        if self._tracer is not None and self._msgbus.tracer is not None:
+            self._report_tracing()
+            self._msgbus.set_tracer(None)  # Stop tracing (histograms remain available)
+
         self._cache.dispose()
         self._msgbus.dispose()
 
@@ -1454,3 +1521,36 @@ class NautilusKernel:
     def _close_writer(self) -> None:
         if self._writer is not None:
             self._writer.close()
+
+    def _report_profiling(self) -> None:
+        config = self._config.profiling
+
+        if config.log_report:
+            report = self._profiler.report(limit=config.report_limit)
+            self._log.info(f"Hot-path profile:\n{report}")
+
+        if config.output_path:
+            self._profiler.dump(config.output_path)
+            self._log.info(f"Wrote hot-path profile to {config.output_path}")
+
+    def _report_tracing(self) -> None:
+        config = self._config.latency_tracing
+
+        if config.log_report:
+            self._log.info(f"Tick-to-trade latencies:\n{self._tracer.report()}")
+
+        if config.output_path:
+            self._tracer.dump(config.output_path)
+            self._log.info(f"Wrote tick-to-trade latencies to {config.output_path}")
+
+        if config.catalog_name:
+            catalog = self._catalogs.get(config.catalog_name)
+            if catalog is None:
+                self._log.error(
+                    f"Cannot write tick-to-trade latencies: "
+                    f"no catalog named {config.catalog_name!r}",
+                )
+                return
+
+            self._tracer.write_catalog(catalog, f"{self.trader_id}_{self.instance_id}")
+            self._log.info(f"Wrote tick-to-trade latencies to catalog {config.catalog_name!r}")
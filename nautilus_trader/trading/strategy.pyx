@@ -43,6 +43,9 @@ from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.common.component cimport TimeEvent
 from nautilus_trader.common.factories cimport OrderFactory
+from nautilus_trader.common.profiling cimport HotPathProfiler
+from nautilus_trader.common.profiling cimport LatencyTracer
+from nautilus_trader.common.profiling cimport TraceStage
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.fsm cimport InvalidStateTrigger
 from nautilus_trader.core.message cimport Event
@@ -106,6 +109,19 @@ from nautilus_trader.model.position cimport Position
 from nautilus_trader.portfolio.base cimport PortfolioFacade
 
 
+# Profiled callback names by event type (e.g. `OrderFilled` -> "on_order_filled")
+cdef dict _EVENT_CALLBACK_NAMES = {}
+
+
+cdef str _event_callback_name(type event_type):
+    cdef str name = _EVENT_CALLBACK_NAMES.get(event_type)
+    if name is None:
+        name = "on" + "".join([f"_{c.lower()}" if c.isupper() else c for c in event_type.__name__])
+        _EVENT_CALLBACK_NAMES[event_type] = name
+
+    return name
+
+
 cdef class Strategy(Actor):
     """
     The base class for all trading strategies.
@@ -888,12 +904,18 @@ cdef class Strategy(Actor):
         if self.manage_gtd_expiry and order.time_in_force == TimeInForce.GTD:
             self._set_gtd_expiry(order)
 
+        cdef LatencyTracer tracer
+
         # Route order
         if order.emulation_trigger != TriggerType.NO_TRIGGER:
             self._manager.send_emulator_command(command)
         elif order.exec_algorithm_id is not None:
             self._manager.send_algo_command(command, order.exec_algorithm_id)
         else:
+            tracer = self._get_tracer()
+            if tracer is not None:
+                # Carry any active tick trace through the risk and execution engines
+                tracer.attach(order.client_order_id)
             self._manager.send_risk_command(command)
 
     cpdef void submit_order_list(
@@ -1920,6 +1942,9 @@ cdef class Strategy(Actor):
         if self.manage_contingent_orders and self._manager is not None:
             self._manager.handle_event(event)
 
+        cdef HotPathProfiler profiler = self._get_profiler()
+        cdef uint64_t start_ns = profiler.start_c() if profiler is not None else 0
+
         try:
             # Send to specific event handler
             if isinstance(event, OrderInitialized):
@@ -1986,6 +2011,10 @@ cdef class Strategy(Actor):
             self.log.exception(f"Error on handling {repr(event)}", e)
             raise
 
+        if start_ns:
+            # Includes the general `on_order_event`, `on_position_event` and `on_event` callbacks
+            profiler.stop_c("callback", self.id.to_str(), _event_callback_name(type(event)), start_ns)
+
 # -- EVENTS ---------------------------------------------------------------------------------------
 
     cdef OrderDenied _generate_order_denied(self, Order order, str reason):
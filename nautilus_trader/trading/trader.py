@@ -26,6 +26,7 @@ from collections.abc import Callable
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
 
 from nautilus_trader.analysis.reporter import ReportProvider
 from nautilus_trader.cache.cache import Cache
@@ -851,6 +852,17 @@ class Trader(Component):
         """
         return ReportProvider.generate_orders_report(self._cache.orders())
 
+    def generate_orders_table(self) -> pa.Table:
+        """
+        Generate an orders report as an Arrow table.
+
+        Returns
+        -------
+        pa.Table
+
+        """
+        return ReportProvider.generate_orders_table(self._cache.orders())
+
     def generate_order_fills_report(self) -> pd.DataFrame:
         """
         Generate an order fills report.
@@ -873,6 +885,17 @@ class Trader(Component):
         """
         return ReportProvider.generate_fills_report(self._cache.orders())
 
+    def generate_fills_table(self) -> pa.Table:
+        """
+        Generate a fills report as an Arrow table.
+
+        Returns
+        -------
+        pa.Table
+
+        """
+        return ReportProvider.generate_fills_table(self._cache.orders())
+
     def generate_positions_report(self) -> pd.DataFrame:
         """
         Generate a positions report.
@@ -888,6 +911,20 @@ class Trader(Component):
         # Generate report with positions and snapshots
         return ReportProvider.generate_positions_report(positions, snapshots)
 
+    def generate_positions_table(self) -> pa.Table:
+        """
+        Generate a positions report as an Arrow table.
+
+        Returns
+        -------
+        pa.Table
+
+        """
+        return ReportProvider.generate_positions_table(
+            self._cache.positions(),
+            self._cache.position_snapshots(),
+        )
+
     def generate_account_report(
         self,
         venue: Venue = None,
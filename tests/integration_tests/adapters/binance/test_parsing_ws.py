@@ -17,6 +17,7 @@ import pkgutil
 from decimal import Decimal
 
 import msgspec
+import pytest
 
 from nautilus_trader.adapters.binance.common.enums import BinanceExecutionType
 from nautilus_trader.adapters.binance.common.enums import BinanceOrderStatus
@@ -24,6 +25,8 @@ from nautilus_trader.adapters.binance.common.schemas.market import BinanceAggreg
 from nautilus_trader.adapters.binance.common.schemas.market import BinanceOrderBookData
 from nautilus_trader.adapters.binance.common.schemas.market import BinanceQuoteData
 from nautilus_trader.adapters.binance.common.schemas.market import BinanceTickerData
+from nautilus_trader.adapters.binance.data import extract_stream_name
+from nautilus_trader.adapters.binance.data import parse_stream_type
 from nautilus_trader.adapters.binance.futures.enums import BinanceFuturesEnumParser
 from nautilus_trader.adapters.binance.futures.schemas.user import BinanceFuturesAlgoUpdateWrapper
 from nautilus_trader.adapters.binance.futures.schemas.user import BinanceFuturesTradeLiteMsg
@@ -461,3 +464,55 @@ class TestBinanceWebSocketMarketDataForwardCompat:
         # Assert: core fields parse correctly
         assert data.s == "BTCUSDT"
         assert data.c == "0.0025"
+
+
+class TestBinanceStreamRouting:
+    @pytest.mark.parametrize(
+        ("stream", "expected"),
+        [
+            ("btcusdt@bookTicker", "bookTicker"),
+            ("btcusdt@ticker", "ticker"),
+            ("ethusdt@kline_1m", "kline"),
+            ("btcusdt@trade", "trade"),
+            ("btcusdt@aggTrade", "aggTrade"),
+            ("btcusdt@depth", "depth"),
+            ("btcusdt@depth@100ms", "depth"),
+            ("btcusdt@depth5", "depth5"),
+            ("btcusdt@depth20@100ms", "depth20"),
+            ("btcusdt@markPrice@1s", "markPrice"),
+            ("!markPrice@arr", "!markPrice@arr"),
+            ("!markPrice@arr@1s", "!markPrice@arr"),
+            ("!bookTicker", "!bookTicker"),
+        ],
+    )
+    def test_parse_stream_type(self, stream: str, expected: str):
+        # Arrange, Act
+        result = parse_stream_type(stream)
+
+        # Assert
+        assert result == expected
+
+    def test_extract_stream_name_from_combined_stream_message(self):
+        # Arrange
+        raw = b'{"stream":"btcusdt@depth@100ms","data":{"e":"depthUpdate"}}'
+
+        # Act
+        result = extract_stream_name(raw)
+
+        # Assert
+        assert result == "btcusdt@depth@100ms"
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            b'{"result":null,"id":1}',
+            b'{"stream":"btcusdt@depth',
+            b'{ "stream": "btcusdt@depth@100ms", "data": {} }',
+        ],
+    )
+    def test_extract_stream_name_when_not_prefixed_returns_none(self, raw: bytes):
+        # Arrange, Act
+        result = extract_stream_name(raw)
+
+        # Assert
+        assert result is None
@@ -0,0 +1,128 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+
+import pytest
+
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.core.datetime import secs_to_nanos
+from nautilus_trader.data.aggregation import TimeBarAggregator
+from nautilus_trader.data.aggregation import TimeBarScheduler
+from nautilus_trader.data.aggregation import VolumeBarAggregator
+from nautilus_trader.data.vectorized import aggregate_bars
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.persistence.wranglers import TradeTickDataWrangler
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+from nautilus_trader.test_kit.providers import TestDataProvider
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+
+ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
+
+
+@pytest.fixture(name="trades", scope="module")
+def fixture_trades() -> list[TradeTick]:
+    wrangler = TradeTickDataWrangler(instrument=ETHUSDT_BINANCE)
+    return wrangler.process(TestDataProvider().read_csv_ticks("binance/ethusdt-trades.csv"))
+
+
+@pytest.mark.parametrize("count", [100, 1_000])
+@pytest.mark.parametrize("shared", [False, True])
+def test_time_bar_aggregators_close_on_minute_boundary(benchmark, count: int, shared: bool) -> None:
+    clock = TestClock()
+    clock.set_time(1)  # Start mid-interval
+    scheduler = TimeBarScheduler(clock) if shared else None
+    for i in range(count):
+        # One 1-minute bar type per instrument, so every aggregator closes on each boundary
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD", Venue(f"SIM{i}"))
+        aggregator = TimeBarAggregator(
+            instrument,
+            BarType.from_str(f"{instrument.id}-1-MINUTE-MID-INTERNAL"),
+            lambda bar: None,
+            clock,
+            scheduler=scheduler,
+        )
+        aggregator.start_timer()
+
+    boundary = [0]
+
+    def _close_next_boundary():
+        boundary[0] += 1
+        for event in clock.advance_time(secs_to_nanos(boundary[0] * 60)):
+            event.handle()
+
+    benchmark(_close_next_boundary)
+
+
+@pytest.mark.parametrize("bar_type", ["1-MINUTE-LAST", "1000-VOLUME-LAST"])
+def test_streaming_bar_aggregation_from_trades(benchmark, trades, bar_type: str) -> None:
+    bar_type = BarType.from_str(f"{ETHUSDT_BINANCE.id}-{bar_type}-INTERNAL")
+
+    def _aggregate():
+        if bar_type.spec.is_time_aggregated():
+            aggregator = TimeBarAggregator(ETHUSDT_BINANCE, bar_type, lambda bar: None, TestClock())
+            aggregator.set_historical_mode(True, lambda bar: None)
+        else:
+            aggregator = VolumeBarAggregator(ETHUSDT_BINANCE, bar_type, lambda bar: None)
+
+        for trade in trades:
+            aggregator.handle_trade_tick(trade)
+
+    benchmark(_aggregate)
+
+
+@pytest.mark.parametrize("bar_type", ["1-MINUTE-LAST", "1000-VOLUME-LAST"])
+def test_vectorized_bar_aggregation_from_trades(benchmark, trades, bar_type: str) -> None:
+    bar_type = BarType.from_str(f"{ETHUSDT_BINANCE.id}-{bar_type}-INTERNAL")
+    table = ArrowSerializer.serialize_batch(trades, TradeTick)
+
+    benchmark(aggregate_bars, table, ETHUSDT_BINANCE, bar_type)
+
+
+@pytest.mark.parametrize("cascade", [False, True])
+def test_time_bar_aggregation_for_multiple_timeframes_from_trades(
+    benchmark,
+    trades,
+    cascade: bool,
+) -> None:
+    def _aggregate():
+        clock = TestClock()
+        clock.set_time(trades[0].ts_init)
+        aggregators = []
+        for step in (1, 5, 15, 60):
+            aggregator = TimeBarAggregator(
+                ETHUSDT_BINANCE,
+                BarType.from_str(f"{ETHUSDT_BINANCE.id}-{step}-MINUTE-LAST-INTERNAL"),
+                lambda bar: None,
+                clock,
+            )
+            aggregator.start_timer()
+            if cascade and aggregators:
+                aggregators[-1].add_cascade(aggregator)
+
+            aggregators.append(aggregator)
+
+        # Only the finest aggregator receives the trades when cascaded
+        roots = aggregators[:1] if cascade else aggregators
+        for trade in trades:
+            for event in clock.advance_time(trade.ts_init):
+                event.handle()
+
+            for aggregator in roots:
+                aggregator.handle_trade_tick(trade)
+
+    benchmark(_aggregate)
@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import itertools
+import time
+import tracemalloc
 from datetime import datetime
 from decimal import Decimal
 
@@ -23,25 +26,38 @@ import pytz
 from nautilus_trader import TEST_DATA_DIR
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.backtest.engine import OrderMatchingEngine
 from nautilus_trader.backtest.models import FillModel
+from nautilus_trader.backtest.models import MakerTakerFeeModel
 from nautilus_trader.backtest.modules import FXRolloverInterestConfig
 from nautilus_trader.backtest.modules import FXRolloverInterestModule
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
 from nautilus_trader.config import LoggingConfig
 from nautilus_trader.examples.strategies.ema_cross import EMACross
 from nautilus_trader.examples.strategies.ema_cross import EMACrossConfig
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import BookType
+from nautilus_trader.model.enums import LiquiditySide
 from nautilus_trader.model.enums import OmsType
+from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Money
 from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from nautilus_trader.test_kit.providers import TestDataProvider
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
+from nautilus_trader.test_kit.stubs.execution import TestExecStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 from nautilus_trader.trading.strategy import Strategy
 
 
 USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+ETHUSDT_PERP_BINANCE = TestInstrumentProvider.ethusdt_perp_binance()
+
+FILL_COUNT = 10_000
 
 
 @pytest.mark.skip
@@ -164,3 +180,145 @@ def test_run_with_ema_cross_strategy(benchmark):
     end = datetime(2013, 3, 1, 0, 0, 0, 0, tzinfo=pytz.utc)
 
     benchmark(engine.run, start, end)
+
+
+@pytest.mark.skip
+@pytest.mark.parametrize("batch_data_dispatch", [False, True])
+def test_run_dense_ticks_events_per_second(batch_data_dispatch):
+    # Multiple instruments sharing the same bar-derived timestamps, so every
+    # `ts_init` carries a group of quotes across instruments
+    config = BacktestEngineConfig(
+        logging=LoggingConfig(bypass_logging=True),
+        batch_data_dispatch=batch_data_dispatch,
+    )
+    engine = BacktestEngine(config=config)
+
+    engine.add_venue(
+        venue=Venue("SIM"),
+        oms_type=OmsType.HEDGING,
+        account_type=AccountType.MARGIN,
+        base_currency=USD,
+        starting_balances=[Money(1_000_000, USD)],
+    )
+
+    provider = TestDataProvider()
+    bid_data = provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")
+    ask_data = provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv")
+
+    for symbol in ("USD/JPY", "AUD/JPY", "EUR/JPY", "GBP/JPY"):
+        instrument = TestInstrumentProvider.default_fx_ccy(symbol)
+        engine.add_instrument(instrument)
+        wrangler = QuoteTickDataWrangler(instrument)
+        ticks = wrangler.process_bar_data(bid_data=bid_data, ask_data=ask_data)
+        engine.add_data(ticks, sort=False)
+
+    engine.sort_data()
+    engine.add_strategy(Strategy())
+
+    start = datetime(2013, 2, 1, 0, 0, 0, 0, tzinfo=pytz.utc)
+    end = datetime(2013, 3, 1, 0, 0, 0, 0, tzinfo=pytz.utc)
+
+    start_ns = time.perf_counter_ns()
+    engine.run(start, end)
+    elapsed_ns = time.perf_counter_ns() - start_ns
+
+    events = engine.iteration
+    print(
+        f"scenario=dense_ticks batch_data_dispatch={batch_data_dispatch} "
+        f"events={events} elapsed_ms={elapsed_ns / 1_000_000:.0f} "
+        f"events_per_sec={events * 1_000_000_000 / elapsed_ns:.0f}",
+    )
+
+    engine.dispose()
+
+
+def _fill_heavy_matching_engine() -> tuple[OrderMatchingEngine, list[int]]:
+    clock = TestClock()
+    msgbus = MessageBus(trader_id=TestIdStubs.trader_id(), clock=clock)
+    cache = TestComponentStubs.cache()
+    cache.add_instrument(ETHUSDT_PERP_BINANCE)
+
+    matching_engine = OrderMatchingEngine(
+        instrument=ETHUSDT_PERP_BINANCE,
+        raw_id=0,
+        fill_model=FillModel(),
+        fee_model=MakerTakerFeeModel(),
+        book_type=BookType.L1_MBP,
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.MARGIN,
+        msgbus=msgbus,
+        cache=cache,
+        clock=clock,
+    )
+
+    # Count the generated events without retaining them, so traced memory
+    # reflects the matching engine fill path only
+    event_count = [0]
+
+    def _handle_event(event) -> None:
+        event_count[0] += 1
+
+    msgbus.register("ExecEngine.process", _handle_event)
+
+    return matching_engine, event_count
+
+
+def _fill_many(matching_engine: OrderMatchingEngine, order_ids: itertools.count) -> None:
+    order = TestExecStubs.market_order(
+        instrument=ETHUSDT_PERP_BINANCE,
+        order_side=OrderSide.BUY,
+        quantity=ETHUSDT_PERP_BINANCE.make_qty(FILL_COUNT),
+        client_order_id=TestIdStubs.client_order_id(next(order_ids)),
+    )
+    last_px = ETHUSDT_PERP_BINANCE.make_price(1000.0)
+    last_qty = ETHUSDT_PERP_BINANCE.make_qty(1.0)
+
+    for _ in range(FILL_COUNT):
+        matching_engine.fill_order(
+            order=order,
+            last_px=last_px,
+            last_qty=last_qty,
+            liquidity_side=LiquiditySide.TAKER,
+        )
+
+
+def test_matching_engine_fill_order(benchmark):
+    matching_engine, event_count = _fill_heavy_matching_engine()
+
+    benchmark(_fill_many, matching_engine, itertools.count(1))
+
+    assert event_count[0] >= FILL_COUNT
+
+
+def test_matching_engine_fill_order_allocations():
+    matching_engine, event_count = _fill_heavy_matching_engine()
+    order_ids = itertools.count(1)
+    _fill_many(matching_engine, order_ids)  # Warm up caches and interned objects
+
+    tracemalloc.start()
+    try:
+        baseline_bytes, _ = tracemalloc.get_traced_memory()
+        blocks_before = sum(
+            stat.count for stat in tracemalloc.take_snapshot().statistics("filename")
+        )
+        tracemalloc.reset_peak()
+
+        _fill_many(matching_engine, order_ids)
+
+        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        blocks_after = sum(
+            stat.count for stat in tracemalloc.take_snapshot().statistics("filename")
+        )
+    finally:
+        tracemalloc.stop()
+
+    print(
+        f"scenario=fill_order fills={FILL_COUNT} events={event_count[0]} "
+        f"peak_bytes_per_fill={(peak_bytes - baseline_bytes) / FILL_COUNT:.1f} "
+        f"retained_bytes_per_fill={(current_bytes - baseline_bytes) / FILL_COUNT:.1f} "
+        f"retained_blocks_per_fill={(blocks_after - blocks_before) / FILL_COUNT:.2f}",
+    )
+
+    # Fill generation should not retain allocations per fill (events are not kept)
+    assert event_count[0] >= 2 * FILL_COUNT
+    assert blocks_after - blocks_before < FILL_COUNT
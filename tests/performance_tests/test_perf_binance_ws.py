@@ -0,0 +1,110 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pkgutil
+
+import msgspec
+import pytest
+
+from nautilus_trader.adapters.binance.config import BinanceDataClientConfig
+from nautilus_trader.adapters.binance.futures.data import BinanceFuturesDataClient
+from nautilus_trader.adapters.binance.futures.providers import BinanceFuturesInstrumentProvider
+from nautilus_trader.adapters.binance.http.client import BinanceHttpClient
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.config import InstrumentProviderConfig
+from nautilus_trader.data.engine import DataEngine
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+_SYMBOL_COUNT = 300
+
+# Recorded payloads with the stream type suffix they are published on
+_PAYLOADS = [
+    ("ws_futures_depth_diff_update.json", "depth@100ms"),
+    ("ws_futures_book_ticker.json", "bookTicker"),
+    ("ws_spot_agg_trade.json", "aggTrade"),
+]
+
+
+def _load_frames() -> list[bytes]:
+    # Wraps each recorded payload as a combined stream message per symbol
+    frames: list[bytes] = []
+    for resource, stream_type in _PAYLOADS:
+        raw = pkgutil.get_data(
+            package="tests.integration_tests.adapters.binance.resources.ws_messages",
+            resource=resource,
+        )
+        assert raw
+        payload = msgspec.json.decode(raw)
+        payload = payload.get("data", payload)
+
+        for i in range(_SYMBOL_COUNT):
+            symbol = f"SYM{i}USDT"
+            data = {**payload, "s": symbol}
+            frames.append(
+                msgspec.json.encode({"stream": f"{symbol.lower()}@{stream_type}", "data": data}),
+            )
+
+    return frames
+
+
+@pytest.fixture(name="data_client")
+def fixture_data_client(request, clock):
+    loop = request.getfixturevalue("event_loop")
+    msgbus = MessageBus(
+        trader_id=TestIdStubs.trader_id(),
+        clock=clock,
+    )
+    cache = TestComponentStubs.cache()
+
+    DataEngine(
+        msgbus=msgbus,
+        cache=cache,
+        clock=clock,
+    )
+
+    http_client = BinanceHttpClient(
+        clock=clock,
+        api_key="SOME_BINANCE_API_KEY",
+        api_secret="SOME_BINANCE_API_SECRET",
+        base_url="https://fapi.binance.com/",
+    )
+
+    return BinanceFuturesDataClient(
+        loop=loop,
+        client=http_client,
+        msgbus=msgbus,
+        cache=cache,
+        clock=clock,
+        instrument_provider=BinanceFuturesInstrumentProvider(
+            client=http_client,
+            clock=clock,
+            config=InstrumentProviderConfig(),
+        ),
+        base_url_ws="wss://fstream.binance.com",
+        config=BinanceDataClientConfig(),
+    )
+
+
+def test_handle_ws_message_replay(benchmark, data_client):
+    frames = _load_frames()
+    handle_ws_message = data_client._handle_ws_message
+
+    def replay() -> None:
+        for raw in frames:
+            handle_ws_message(raw)
+
+    benchmark(replay)
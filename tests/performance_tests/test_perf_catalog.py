@@ -14,16 +14,23 @@
 # -------------------------------------------------------------------------------------------------
 
 import os
+import shutil
 
+import pandas as pd
 import pytest
 
 from nautilus_trader import PACKAGE_ROOT
 from nautilus_trader.core.nautilus_pyo3 import DataBackendSession
 from nautilus_trader.core.nautilus_pyo3 import NautilusDataType
+from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import capsule_to_list
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
 from nautilus_trader.test_kit.mocks.data import load_catalog_with_stub_quote_ticks_audusd
 from nautilus_trader.test_kit.mocks.data import load_catalog_with_stub_trade_ticks_ethusdt
 from nautilus_trader.test_kit.mocks.data import setup_catalog
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
 
 
 @pytest.mark.skip
@@ -78,6 +85,72 @@ def test_load_trade_ticks(benchmark, tmp_path) -> None:
     benchmark(run)
 
 
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_consolidate_catalog(benchmark, tmp_path, max_workers: int) -> None:
+    # 8 instruments, each fragmented into 50 files of 1,000 quotes
+    minute = pd.Timedelta(minutes=1).value
+    quotes = {}
+    for i in range(8):
+        instrument_id = TestInstrumentProvider.default_fx_ccy("AUD/USD", Venue(f"SIM{i}")).id
+        quotes[instrument_id] = [
+            QuoteTick(
+                instrument_id=instrument_id,
+                bid_price=Price.from_str("1.00000"),
+                ask_price=Price.from_str("1.00001"),
+                bid_size=Quantity.from_int(1_000_000),
+                ask_size=Quantity.from_int(1_000_000),
+                ts_event=j * minute,
+                ts_init=j * minute,
+            )
+            for j in range(50_000)
+        ]
+
+    def setup():
+        shutil.rmtree(tmp_path / "catalog", ignore_errors=True)
+        catalog = setup_catalog("file", path=tmp_path / "catalog")
+        for instrument_quotes in quotes.values():
+            for k in range(0, len(instrument_quotes), 1_000):
+                catalog.write_data(instrument_quotes[k : k + 1_000], skip_disjoint_check=True)
+
+        return (catalog,), {}
+
+    def run(catalog):
+        stats = catalog.consolidate_catalog(ensure_contiguous_files=False, max_workers=max_workers)
+        assert sum(s.row_count for s in stats) == 400_000
+
+    benchmark.pedantic(run, setup=setup, rounds=5)
+
+
+@pytest.mark.parametrize("max_workers", [1, 8])
+def test_query_many_instruments(benchmark, tmp_path, max_workers: int) -> None:
+    # 200 instruments, each with 10 files of 500 quotes
+    catalog = setup_catalog("file", path=tmp_path / "catalog")
+    second = pd.Timedelta(seconds=1).value
+    for i in range(200):
+        instrument_id = TestInstrumentProvider.default_fx_ccy("AUD/USD", Venue(f"SIM{i}")).id
+        for j in range(10):
+            catalog.write_data(
+                [
+                    QuoteTick(
+                        instrument_id=instrument_id,
+                        bid_price=Price.from_str("1.00000"),
+                        ask_price=Price.from_str("1.00001"),
+                        bid_size=Quantity.from_int(1_000_000),
+                        ask_size=Quantity.from_int(1_000_000),
+                        ts_event=k * second,
+                        ts_init=k * second,
+                    )
+                    for k in range(j * 500, (j + 1) * 500)
+                ],
+            )
+
+    def run():
+        quotes = catalog.quote_ticks(max_workers=max_workers)
+        assert len(quotes) == 1_000_000
+
+    benchmark.pedantic(run, rounds=3)
+
+
 @pytest.mark.skip(reason="development_only")
 def test_load_single_stream(benchmark) -> None:
     file_path = PACKAGE_ROOT / "bench_data" / "quotes_0005.parquet"
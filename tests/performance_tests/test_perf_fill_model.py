@@ -13,7 +13,17 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pytest
+
+from nautilus_trader.backtest.models import CompetitionAwareFillModel
 from nautilus_trader.backtest.models import FillModel
+from nautilus_trader.backtest.models import SizeAwareFillModel
+from nautilus_trader.backtest.models import ThreeTierFillModel
+from nautilus_trader.core.rust.model import OrderSide
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.execution import TestExecStubs
 
 
 _FILL_MODEL = FillModel(
@@ -24,3 +34,57 @@ _FILL_MODEL = FillModel(
 
 def test_is_limit_filled(benchmark):
     benchmark(_FILL_MODEL.is_limit_filled)
+
+
+_INSTRUMENT = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+_BEST_BID = Price.from_str("1.00000")
+_BEST_ASK = Price.from_str("1.00010")
+_ORDERS = [
+    TestExecStubs.market_order(
+        instrument=_INSTRUMENT,
+        order_side=OrderSide.BUY if i % 2 == 0 else OrderSide.SELL,
+        quantity=Quantity.from_int(50),
+    )
+    for i in range(100)
+]
+
+
+def _simulate_fills(fill_model: FillModel, books: dict | None) -> None:
+    # Evaluates many orders against the same book state (a fill heavy strategy),
+    # reusing simulated books by key when a cache is given (as the matching engine does)
+    for order in _ORDERS:
+        if books is None:
+            book = fill_model.get_orderbook_for_fill_simulation(
+                _INSTRUMENT,
+                order,
+                _BEST_BID,
+                _BEST_ASK,
+            )
+        else:
+            key = fill_model.fill_simulation_key(order)
+            book = books.get(key)
+            if book is None:
+                book = fill_model.get_orderbook_for_fill_simulation(
+                    _INSTRUMENT,
+                    order,
+                    _BEST_BID,
+                    _BEST_ASK,
+                )
+                books[key] = book
+
+        book.simulate_fills(
+            order,
+            price_prec=_INSTRUMENT.price_precision,
+            size_prec=_INSTRUMENT.size_precision,
+            is_aggressive=True,
+        )
+
+
+@pytest.mark.parametrize("cached", [False, True])
+@pytest.mark.parametrize(
+    "fill_model",
+    [ThreeTierFillModel(), SizeAwareFillModel(), CompetitionAwareFillModel()],
+    ids=lambda model: type(model).__name__,
+)
+def test_simulate_fills_same_book_state(benchmark, fill_model: FillModel, cached: bool):
+    benchmark(lambda: _simulate_fills(fill_model, {} if cached else None))
@@ -0,0 +1,66 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from nautilus_trader.core.nautilus_pyo3 import imply_vol_and_greeks
+from nautilus_trader.model.greeks_vectorized import black_scholes_greeks_vectorized
+from nautilus_trader.model.greeks_vectorized import imply_vol_and_greeks_vectorized
+
+
+@pytest.fixture(name="option_chain", scope="module")
+def fixture_option_chain() -> dict[str, np.ndarray]:
+    # An options book of 3,000 contracts on a single underlying
+    rng = np.random.default_rng(42)
+    count = 3_000
+    chain = {
+        "s": np.full(count, 100.0),
+        "r": np.full(count, 0.0425),
+        "b": np.full(count, 0.0425),
+        "is_call": rng.random(count) < 0.5,
+        "k": rng.uniform(70.0, 130.0, count).round(),
+        "t": rng.integers(7, 365, count) / 365.25,
+    }
+    chain["price"] = black_scholes_greeks_vectorized(
+        vol=rng.uniform(0.15, 0.6, count),
+        **{key: chain[key] for key in ("s", "r", "b", "is_call", "k", "t")},
+    ).price
+    return chain
+
+
+def test_imply_vol_and_greeks_option_chain(benchmark, option_chain) -> None:
+    contracts = list(
+        zip(
+            option_chain["s"].tolist(),
+            option_chain["r"].tolist(),
+            option_chain["b"].tolist(),
+            option_chain["is_call"].tolist(),
+            option_chain["k"].tolist(),
+            option_chain["t"].tolist(),
+            option_chain["price"].tolist(),
+            strict=True,
+        ),
+    )
+
+    def _solve_chain():
+        for contract in contracts:
+            imply_vol_and_greeks(*contract)
+
+    benchmark(_solve_chain)
+
+
+def test_imply_vol_and_greeks_vectorized_option_chain(benchmark, option_chain) -> None:
+    benchmark(imply_vol_and_greeks_vectorized, **option_chain)
@@ -0,0 +1,79 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import subprocess
+import sys
+
+import pytest
+
+
+# Heavy optional subsystems which must not be loaded by importing a core entry point
+LAZY_MODULES = [
+    "plotly",
+    "fsspec",
+    "pyarrow.dataset",
+    "nautilus_trader.analysis.tearsheet",
+    "nautilus_trader.persistence.catalog.parquet",
+    "nautilus_trader.persistence.writer",
+]
+
+
+def _import_times(module: str) -> dict[str, int]:
+    # Each import runs in a fresh interpreter, so nothing is cached in `sys.modules`
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Lines are formatted as 'import time: self [us] | cumulative | imported package'
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "nautilus_trader.system.kernel",
+        "nautilus_trader.live.node",
+        "nautilus_trader.backtest.engine",
+        "nautilus_trader.backtest.node",
+    ],
+)
+def test_import_entry_point(benchmark, module: str) -> None:
+    times = benchmark.pedantic(_import_times, args=(module,), rounds=3, iterations=1)
+
+    assert module in times
+    for lazy_module in LAZY_MODULES:
+        assert lazy_module not in times, f"{lazy_module} imported eagerly by {module}"
+
+
+def test_import_adapter_package(benchmark) -> None:
+    times = benchmark.pedantic(
+        _import_times,
+        args=("nautilus_trader.adapters.binance",),
+        rounds=3,
+        iterations=1,
+    )
+
+    assert "nautilus_trader.adapters.binance" in times
+    assert "nautilus_trader.adapters.binance.factories" not in times
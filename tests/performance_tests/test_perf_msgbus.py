@@ -15,7 +15,13 @@
 
 import random
 
+import pytest
+
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.component import is_matching_py
+from nautilus_trader.common.profiling import HotPathProfiler
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 
 
 def generate_topics(n: int, seed: int) -> list[str]:
@@ -47,3 +53,22 @@ def test_topic_pattern_matching(benchmark) -> None:
             is_matching_py(pattern, topic)
 
     benchmark(match_topics)
+
+
+@pytest.mark.parametrize("sample_rate", [None, 1, 100])
+def test_publish_with_profiler(benchmark, sample_rate) -> None:
+    msgbus = MessageBus(trader_id=TestIdStubs.trader_id(), clock=TestClock())
+    if sample_rate is not None:
+        msgbus.set_profiler(HotPathProfiler(sample_rate=sample_rate))
+
+    received: list[list[str]] = [[] for _ in range(10)]
+    for handler_received in received:
+        msgbus.subscribe(topic="data.quotes.*", handler=handler_received.append)
+
+    def publish():
+        for _ in range(1_000):
+            msgbus.publish("data.quotes.BINANCE.BTCUSDT", "msg")
+        for handler_received in received:
+            handler_received.clear()
+
+    benchmark(publish)
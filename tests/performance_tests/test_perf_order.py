@@ -13,18 +13,26 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pytest
+
 from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.factories import OrderFactory
 from nautilus_trader.common.generators import ClientOrderIdGenerator
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.identifiers import TradeId
 from nautilus_trader.model.identifiers import TraderId
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
 from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 
 
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
 class TestOrderPerformance:
     def setup(self):
         self.generator = ClientOrderIdGenerator(
@@ -67,3 +75,37 @@ class TestOrderPerformance:
             Price.from_str("0.80010"),
         )
         benchmark(order.to_own_book_order)
+
+
+@pytest.mark.parametrize("event_history_limit", [0, 100])
+def test_apply_many_fills_to_parent_order(benchmark, event_history_limit: int) -> None:
+    order_factory = OrderFactory(
+        trader_id=TestIdStubs.trader_id(),
+        strategy_id=TestIdStubs.strategy_id(),
+        clock=TestClock(),
+    )
+    order = order_factory.market(AUDUSD_SIM.id, OrderSide.BUY, Quantity.from_int(10_000_000))
+    fills = [
+        TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            trade_id=TradeId(str(i)),
+            last_qty=Quantity.from_int(1_000),
+        )
+        for i in range(10_000)
+    ]
+
+    def _apply_fills():
+        parent = order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(10_000_000),
+            client_order_id=order.client_order_id,
+        )
+        parent.set_event_history_limit(event_history_limit)
+        parent.apply(TestEventStubs.order_submitted(parent))
+        parent.apply(TestEventStubs.order_accepted(parent))
+        for fill in fills:
+            parent.apply(fill)
+
+    benchmark(_apply_fills)
@@ -16,12 +16,17 @@
 import pytest
 
 from nautilus_trader import TEST_DATA_DIR
+from nautilus_trader.adapters.binance.common.schemas.market import BinanceDepth
 from nautilus_trader.adapters.databento.loaders import DatabentoDataLoader
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.model.data import BookOrder
 from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.enums import BookAction
 from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import RecordFlag
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
@@ -86,3 +91,67 @@ def test_own_book_audit(benchmark) -> None:
         cache.update_order(order)
 
     benchmark(cache.audit_own_order_books)
+
+
+_BOOK_LEVELS = 500
+_DEPTH_PRICES = [f"{100 - i * 0.01:.2f}" for i in range(_BOOK_LEVELS)] + [
+    f"{100.01 + i * 0.01:.2f}" for i in range(_BOOK_LEVELS)
+]
+_DEPTH_SIZES = [f"{1 + i * 0.001:.3f}" for i in range(_BOOK_LEVELS * 2)]
+_DEPTH_SIDES = [OrderSide.BUY] * _BOOK_LEVELS + [OrderSide.SELL] * _BOOK_LEVELS
+
+
+def test_deltas_per_level_1000_levels(benchmark) -> None:
+    instrument_id = TestIdStubs.audusd_id()
+
+    def _build_deltas():
+        deltas = []
+        for i in range(len(_DEPTH_PRICES)):
+            order = BookOrder(
+                side=_DEPTH_SIDES[i],
+                price=Price.from_str(_DEPTH_PRICES[i]),
+                size=Quantity.from_str(_DEPTH_SIZES[i]),
+                order_id=0,
+            )
+            deltas.append(
+                OrderBookDelta(
+                    instrument_id=instrument_id,
+                    action=BookAction.UPDATE,
+                    order=order,
+                    flags=RecordFlag.F_LAST if i == len(_DEPTH_PRICES) - 1 else 0,
+                    sequence=1,
+                    ts_event=0,
+                    ts_init=0,
+                ),
+            )
+        return OrderBookDeltas(instrument_id=instrument_id, deltas=deltas)
+
+    benchmark(_build_deltas)
+
+
+def test_deltas_from_arrays_1000_levels(benchmark) -> None:
+    instrument_id = TestIdStubs.audusd_id()
+
+    def _build_deltas():
+        return OrderBookDeltas.from_arrays(
+            instrument_id=instrument_id,
+            prices=_DEPTH_PRICES,
+            sizes=_DEPTH_SIZES,
+            sides=_DEPTH_SIDES,
+            sequence=1,
+            ts_event=0,
+            ts_init=0,
+        )
+
+    benchmark(_build_deltas)
+
+
+def test_binance_depth_snapshot_parse_1000_levels(benchmark) -> None:
+    instrument_id = TestIdStubs.audusd_id()
+    depth = BinanceDepth(
+        lastUpdateId=1,
+        bids=list(zip(_DEPTH_PRICES[:_BOOK_LEVELS], _DEPTH_SIZES[:_BOOK_LEVELS], strict=True)),
+        asks=list(zip(_DEPTH_PRICES[_BOOK_LEVELS:], _DEPTH_SIZES[_BOOK_LEVELS:], strict=True)),
+    )
+
+    benchmark(depth.parse_to_order_book_snapshot, instrument_id, 0)
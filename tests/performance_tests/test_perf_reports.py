@@ -0,0 +1,79 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.analysis.reporter import ReportProvider
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.orders import Order
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+@pytest.fixture(name="filled_orders", scope="module")
+def fixture_filled_orders() -> list[Order]:
+    order_factory = OrderFactory(
+        trader_id=TestIdStubs.trader_id(),
+        strategy_id=TestIdStubs.strategy_id(),
+        clock=TestClock(),
+    )
+    orders = []
+    for i in range(10_000):
+        order = order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY if i % 2 == 0 else OrderSide.SELL,
+            Quantity.from_int(100_000),
+            Price.from_str("0.80010"),
+        )
+        order.apply(TestEventStubs.order_submitted(order))
+        order.apply(TestEventStubs.order_accepted(order))
+        for j in range(2):
+            order.apply(
+                TestEventStubs.order_filled(
+                    order,
+                    instrument=AUDUSD_SIM,
+                    trade_id=TradeId(f"{i}-{j}"),
+                    last_qty=Quantity.from_int(50_000),
+                ),
+            )
+
+        orders.append(order)
+
+    return orders
+
+
+def test_generate_fills_report(benchmark, filled_orders) -> None:
+    benchmark(ReportProvider.generate_fills_report, filled_orders)
+
+
+def test_generate_fills_table(benchmark, filled_orders) -> None:
+    benchmark(ReportProvider.generate_fills_table, filled_orders)
+
+
+def test_generate_orders_report(benchmark, filled_orders) -> None:
+    benchmark(ReportProvider.generate_orders_report, filled_orders)
+
+
+def test_generate_orders_table(benchmark, filled_orders) -> None:
+    benchmark(ReportProvider.generate_orders_table, filled_orders)
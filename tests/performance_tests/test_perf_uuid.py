@@ -15,7 +15,13 @@
 
 import uuid
 
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.generators import ClientOrderIdGenerator
 from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.core.uuid import clear_uuid4_seed
+from nautilus_trader.core.uuid import set_uuid4_seed
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.identifiers import TraderId
 
 
 def test_make_builtin_uuid(benchmark):
@@ -26,6 +32,24 @@ def test_make_nautilus_uuid(benchmark):
     benchmark(UUID4)
 
 
+def test_make_nautilus_uuid_seeded(benchmark):
+    set_uuid4_seed(42)
+    try:
+        benchmark(UUID4)
+    finally:
+        clear_uuid4_seed()
+
+
+def test_generate_client_order_id(benchmark):
+    generator = ClientOrderIdGenerator(
+        trader_id=TraderId("TRADER-001"),
+        strategy_id=StrategyId("S-001"),
+        clock=TestClock(),
+    )
+
+    benchmark(generator.generate)
+
+
 def test_nautilus_uuid_value(benchmark):
     uuid = UUID4()
 
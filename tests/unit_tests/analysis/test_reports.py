@@ -15,6 +15,7 @@
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from nautilus_trader.accounting.accounts.margin import MarginAccount
 from nautilus_trader.analysis.reporter import ReportProvider
@@ -184,6 +185,57 @@ class TestReportProvider:
         assert report.iloc[0]["slippage"] == 9.99999999995449e-06
         assert np.isnan(report.iloc[1]["avg_px"])
 
+    def test_generate_orders_table_with_no_orders_returns_empty_table(self):
+        # Arrange, Act
+        table = ReportProvider.generate_orders_table([])
+
+        # Assert
+        assert table.num_rows == 0
+
+    def test_generate_orders_table(self):
+        # Arrange
+        order1 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(1_500_000),
+            Price.from_str("0.80010"),
+        )
+        order2 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(1_000_000),
+        )
+
+        for order in (order1, order2):
+            order.apply(TestEventStubs.order_submitted(order))
+            order.apply(TestEventStubs.order_accepted(order))
+
+        order1.apply(
+            TestEventStubs.order_filled(
+                order1,
+                instrument=AUDUSD_SIM,
+                position_id=PositionId("P-1"),
+                last_px=Price.from_str("0.80011"),
+            ),
+        )
+
+        # Act
+        table = ReportProvider.generate_orders_table([order2, order1])
+
+        # Assert
+        report = ReportProvider.generate_orders_report([order2, order1])
+        assert table.num_rows == 2
+        assert table.column("client_order_id").to_pylist() == list(report.index)
+        assert table.column("type").to_pylist() == ["LIMIT", "MARKET"]
+        assert table.column("side").to_pylist() == ["BUY", "SELL"]
+        assert table.column("status").to_pylist() == ["FILLED", "ACCEPTED"]
+        assert table.column("quantity").to_pylist() == [1_500_000.0, 1_000_000.0]
+        assert table.column("price").to_pylist() == [0.8001, None]
+        assert table.column("trigger_price").to_pylist() == [None, None]
+        assert table.column("avg_px").to_pylist() == [0.80011, None]
+        assert pa.types.is_dictionary(table.schema.field("status").type)
+        assert table.schema.field("ts_last").type == pa.timestamp("ns", tz="UTC")
+
     def test_generate_order_fills_report(self):
         # Arrange
         order1 = self.order_factory.limit(
@@ -316,6 +368,79 @@ class TestReportProvider:
         assert report.iloc[1]["last_qty"] == "500000"
         assert report.iloc[1]["last_px"] == "0.80011"
 
+    def test_generate_fills_table_with_no_fills_returns_empty_table(self):
+        # Arrange
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(1_500_000),
+        )
+
+        # Act
+        table = ReportProvider.generate_fills_table([order])
+
+        # Assert
+        assert table.num_rows == 0
+
+    def test_generate_fills_table(self):
+        # Arrange
+        order1 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(1_500_000),
+            Price.from_str("0.80010"),
+        )
+        order2 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(1_000_000),
+            Price.from_str("0.80020"),
+        )
+
+        for order in (order1, order2):
+            order.apply(TestEventStubs.order_submitted(order))
+            order.apply(TestEventStubs.order_accepted(order))
+
+        for order, last_qty, last_px, commission in (
+            (order2, 1_000_000, "0.80021", Money(0.5, BTC)),
+            (order1, 1_000_000, "0.80011", None),
+            (order1, 500_000, "0.80012", None),
+        ):
+            order.apply(
+                TestEventStubs.order_filled(
+                    order,
+                    trade_id=TradeId(f"E-{order.filled_qty}-{last_px}"),
+                    instrument=AUDUSD_SIM,
+                    position_id=PositionId("P-1"),
+                    strategy_id=StrategyId("S-1"),
+                    last_qty=Quantity.from_int(last_qty),
+                    last_px=Price.from_str(last_px),
+                    commission=commission,
+                    ts_event=1_000_000_001,
+                ),
+            )
+
+        # Act
+        table = ReportProvider.generate_fills_table([order2, order1])
+
+        # Assert
+        report = ReportProvider.generate_fills_report([order2, order1])
+        assert table.num_rows == 3
+        assert set(table.column_names) == {
+            "client_order_id",
+            "commission_currency",
+            *report.columns,
+        } - {"info"}
+        assert table.column("client_order_id").to_pylist() == list(report.index)
+        assert table.column("last_qty").to_pylist() == [1_000_000.0, 500_000.0, 1_000_000.0]
+        assert table.column("last_px").to_pylist() == [0.80011, 0.80012, 0.80021]
+        assert table.column("commission").to_pylist()[2] == 0.5
+        assert table.column("commission_currency").to_pylist() == ["USD", "USD", "BTC"]
+        assert table.column("order_side").to_pylist() == ["BUY", "BUY", "SELL"]
+        assert pa.types.is_dictionary(table.schema.field("instrument_id").type)
+        assert table.schema.field("ts_event").type == pa.timestamp("ns", tz="UTC")
+        assert table.column("ts_event").to_pandas().tolist() == list(report["ts_event"])
+
     def test_generate_positions_report(self):
         # Arrange
         order1 = self.order_factory.market(
@@ -375,6 +500,63 @@ class TestReportProvider:
         assert not report.iloc[0]["is_snapshot"]
         assert not report.iloc[1]["is_snapshot"]
 
+    def test_generate_positions_table(self):
+        # Arrange
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order2 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+
+        fill1 = TestEventStubs.order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            strategy_id=StrategyId("S-001"),
+            last_px=Price.from_str("1.00010"),
+        )
+        fill2 = TestEventStubs.order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            strategy_id=StrategyId("S-001"),
+            last_px=Price.from_str("1.00020"),
+            ts_event=1_000,
+        )
+
+        closed = Position(instrument=AUDUSD_SIM, fill=fill1)
+        closed.apply(fill2)
+        snapshot = Position(
+            instrument=AUDUSD_SIM,
+            fill=TestEventStubs.order_filled(
+                order1,
+                instrument=AUDUSD_SIM,
+                position_id=PositionId("P-0"),
+                strategy_id=StrategyId("S-001"),
+            ),
+        )
+
+        # Act
+        table = ReportProvider.generate_positions_table([closed], [snapshot])
+
+        # Assert
+        report = ReportProvider.generate_positions_report([closed], [snapshot])
+        assert table.num_rows == 2
+        assert table.column("position_id").to_pylist() == list(report.index)
+        assert table.column("is_snapshot").to_pylist() == list(report["is_snapshot"])
+        assert table.column("side").to_pylist() == ["FLAT", "LONG"]
+        assert table.column("peak_qty").to_pylist() == [100_000.0, 100_000.0]
+        assert table.column("avg_px_close").to_pylist() == [1.0002, None]
+        assert table.column("realized_pnl").to_pylist()[0] == closed.realized_pnl.as_double()
+        assert table.column("settlement_currency").to_pylist() == ["USD", "USD"]
+        assert table.column("ts_closed").to_pandas().tolist()[0] == report["ts_closed"].iloc[0]
+        assert table.schema.field("duration_ns").type == pa.duration("ns")
+
     def test_generate_positions_report_with_snapshots(self):
         # Arrange
         # This test demonstrates the manual snapshot functionality for reporting purposes.
@@ -0,0 +1,333 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nautilus_trader.analysis.config import StreamingStatisticsConfig
+from nautilus_trader.analysis.streaming import StreamingStatistics
+from nautilus_trader.analysis.streaming import StreamingStatisticsActor
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.common.messages import ShutdownSystem
+from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.events import AccountState
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.identifiers import VenueOrderId
+from nautilus_trader.model.objects import AccountBalance
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.position import Position
+from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+NANOS_PER_DAY = 86_400_000_000_000
+
+
+def _expected_daily_returns(ts_events: list[int], balances: list[float]) -> pd.Series:
+    # Mirrors the daily binning used by `PortfolioAnalyzer`
+    series = pd.Series(balances, index=pd.to_datetime(ts_events, unit="ns", utc=True))
+    return series.resample("D").last().ffill().pct_change().dropna()
+
+
+def test_streaming_statistics_initial_state():
+    # Arrange, Act
+    stats = StreamingStatistics()
+
+    # Assert
+    assert stats.balance is None
+    assert stats.returns_count == 0
+    assert stats.trade_count == 0
+    assert stats.total_return == 0.0
+    assert stats.max_drawdown == 0.0
+    assert stats.current_drawdown == 0.0
+    assert math.isnan(stats.sharpe_ratio)
+    assert math.isnan(stats.sortino_ratio)
+    assert math.isnan(stats.win_rate)
+    assert math.isnan(stats.profit_factor)
+
+
+def test_streaming_statistics_with_invalid_period_raises():
+    # Arrange, Act, Assert
+    with pytest.raises(ValueError):
+        StreamingStatistics(period=0)
+
+
+def test_streaming_statistics_matches_batch_daily_returns():
+    # Arrange
+    rng = np.random.default_rng(42)
+    stats = StreamingStatistics()
+
+    ts_events: list[int] = []
+    balances: list[float] = []
+    balance = 1_000_000.0
+    ts = 0
+    for _ in range(2_000):
+        ts += int(rng.integers(1, 12)) * 3_600_000_000_000  # Leaves some days without updates
+        balance *= 1.0 + rng.normal(0.0, 0.002)
+        ts_events.append(ts)
+        balances.append(balance)
+
+    # Act
+    for ts_event, value in zip(ts_events, balances, strict=True):
+        stats.update_balance(ts_event, value)
+
+    # Assert (the final day is still open so is excluded from the batch returns)
+    returns = _expected_daily_returns(ts_events, balances).iloc[:-1]
+    downside = returns[returns < 0.0]
+    expected_sharpe = returns.mean() / returns.std() * np.sqrt(252)
+    expected_sortino = returns.mean() / np.sqrt((downside**2).sum() / len(returns)) * np.sqrt(252)
+
+    assert stats.returns_count == len(returns)
+    assert stats.sharpe_ratio == pytest.approx(expected_sharpe, rel=1e-9)
+    assert stats.sortino_ratio == pytest.approx(expected_sortino, rel=1e-9)
+    assert stats.total_return == pytest.approx(balances[-1] / balances[0] - 1.0)
+
+
+def test_streaming_statistics_drawdown():
+    # Arrange
+    stats = StreamingStatistics()
+    balances = [100.0, 120.0, 90.0, 110.0, 130.0, 117.0]
+
+    # Act
+    for i, balance in enumerate(balances):
+        stats.update_balance(i * NANOS_PER_DAY, balance)
+
+    # Assert
+    assert stats.balance == 117.0
+    assert stats.max_drawdown == pytest.approx(-0.25)
+    assert stats.current_drawdown == pytest.approx(-0.1)
+
+
+def test_streaming_statistics_trade_statistics():
+    # Arrange
+    stats = StreamingStatistics()
+
+    # Act
+    for pnl in [100.0, -50.0, 25.0, 0.0, -25.0]:
+        stats.update_realized_pnl(pnl)
+
+    # Assert
+    assert stats.trade_count == 5
+    assert stats.win_rate == pytest.approx(0.4)
+    assert stats.profit_factor == pytest.approx(125.0 / 75.0)
+
+
+def test_streaming_statistics_reset():
+    # Arrange
+    stats = StreamingStatistics()
+    stats.update_balance(0, 100.0)
+    stats.update_balance(NANOS_PER_DAY, 90.0)
+    stats.update_balance(2 * NANOS_PER_DAY, 95.0)
+    stats.update_realized_pnl(10.0)
+
+    # Act
+    stats.reset()
+
+    # Assert
+    assert stats.to_dict()["balance"] is None
+    assert stats.returns_count == 0
+    assert stats.trade_count == 0
+    assert stats.max_drawdown == 0.0
+
+
+class TestStreamingStatisticsActor:
+    def setup_method(self) -> None:
+        # Fixture Setup
+        self.clock = TestClock()
+        self.trader_id = TestIdStubs.trader_id()
+        self.account_id = TestIdStubs.account_id()
+
+        self.msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+        )
+        self.cache = TestComponentStubs.cache()
+        self.portfolio = Portfolio(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        self.shutdowns: list[ShutdownSystem] = []
+        self.msgbus.subscribe("commands.system.shutdown", self.shutdowns.append)
+
+    def _create_actor(self, **kwargs) -> StreamingStatisticsActor:
+        actor = StreamingStatisticsActor(StreamingStatisticsConfig(**kwargs))
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        actor.start()
+        return actor
+
+    def _publish_balance(self, ts_event: int, total: float) -> None:
+        event = AccountState(
+            account_id=self.account_id,
+            account_type=AccountType.CASH,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(Money(total, USD), Money(0, USD), Money(total, USD)),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=ts_event,
+            ts_init=ts_event,
+        )
+        self.msgbus.publish(topic=f"events.account.{self.account_id}", msg=event)
+
+    def _publish_closed_position(self, exit_px: str) -> None:
+        order_factory = OrderFactory(
+            trader_id=self.trader_id,
+            strategy_id=TestIdStubs.strategy_id(),
+            clock=self.clock,
+        )
+        order = order_factory.market(AUDUSD_SIM.id, OrderSide.BUY, Quantity.from_int(100_000))
+        position_id = PositionId(f"P-{order.client_order_id}")
+        fill1 = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            position_id=position_id,
+            last_px=Price.from_str("1.00000"),
+            commission=Money(0, USD),
+        )
+        position = Position(instrument=AUDUSD_SIM, fill=fill1)
+        fill2 = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            venue_order_id=VenueOrderId("2"),
+            trade_id=TradeId("E2"),
+            position_id=position_id,
+            side=OrderSide.SELL,
+            last_px=Price.from_str(exit_px),
+            commission=Money(0, USD),
+        )
+        position.apply(fill2)
+        event = TestEventStubs.position_closed(position)
+        self.msgbus.publish(topic=f"events.position.{event.strategy_id}", msg=event)
+
+    def test_actor_tracks_statistics_from_events(self) -> None:
+        # Arrange
+        actor = self._create_actor()
+
+        # Act
+        self._publish_balance(0, 1_000.0)
+        self._publish_balance(NANOS_PER_DAY, 1_100.0)
+        self._publish_balance(2 * NANOS_PER_DAY, 990.0)
+        self._publish_closed_position("1.00010")
+        self._publish_closed_position("0.99990")
+
+        # Assert
+        assert actor.statistics.balance == 990.0
+        assert actor.statistics.returns_count == 1
+        assert actor.statistics.max_drawdown == pytest.approx(-0.1)
+        assert actor.statistics.trade_count == 2
+        assert actor.statistics.win_rate == pytest.approx(0.5)
+        assert actor.stop_reason is None
+        assert self.shutdowns == []
+
+    def test_actor_ignores_other_currencies(self) -> None:
+        # Arrange
+        actor = self._create_actor(currency="EUR")
+
+        # Act
+        self._publish_balance(0, 1_000.0)
+        self._publish_closed_position("1.00010")
+
+        # Assert
+        assert actor.statistics.balance is None
+        assert actor.statistics.trade_count == 0
+
+    def test_actor_max_drawdown_rule_requests_shutdown(self) -> None:
+        # Arrange
+        actor = self._create_actor(max_drawdown=0.2)
+
+        # Act
+        self._publish_balance(0, 1_000.0)
+        self._publish_balance(1, 850.0)
+        self._publish_balance(2, 750.0)
+        self._publish_balance(3, 700.0)
+
+        # Assert
+        assert actor.stop_reason is not None
+        assert actor.stop_reason.startswith("max drawdown 25.00%")
+        assert len(self.shutdowns) == 1  # Only requested once
+        assert self.shutdowns[0].reason == actor.stop_reason
+
+    def test_actor_min_sharpe_ratio_rule_waits_for_min_returns(self) -> None:
+        # Arrange
+        actor = self._create_actor(min_sharpe_ratio=0.0, min_returns=4)
+        balances = [1_000.0, 990.0, 985.0, 970.0, 975.0, 960.0]
+
+        # Act
+        for i, balance in enumerate(balances):
+            self._publish_balance(i * NANOS_PER_DAY, balance)
+            if i == 4:
+                stop_reason_before_min_returns = actor.stop_reason  # 3 completed returns
+
+        # Assert
+        assert stop_reason_before_min_returns is None
+        assert actor.stop_reason is not None
+        assert actor.stop_reason.startswith("Sharpe ratio")
+        assert len(self.shutdowns) == 1
+
+    def test_actor_min_win_rate_rule_waits_for_min_trades(self) -> None:
+        # Arrange
+        actor = self._create_actor(min_win_rate=0.5, min_trades=3)
+
+        # Act
+        self._publish_closed_position("0.99990")
+        self._publish_closed_position("0.99990")
+        stop_reason_before_min_trades = actor.stop_reason
+        self._publish_closed_position("1.00010")
+
+        # Assert
+        assert stop_reason_before_min_trades is None
+        assert actor.stop_reason is not None
+        assert actor.stop_reason.startswith("win rate 33.33%")
+        assert len(self.shutdowns) == 1
+
+    def test_actor_reset_clears_statistics(self) -> None:
+        # Arrange
+        actor = self._create_actor(max_drawdown=0.1)
+        self._publish_balance(0, 1_000.0)
+        self._publish_balance(1, 800.0)
+        actor.stop()
+
+        # Act
+        actor.reset()
+
+        # Assert
+        assert actor.statistics.balance is None
+        assert actor.stop_reason is None
@@ -34,6 +34,8 @@ from nautilus_trader.analysis.tearsheet import _aggregate_period_returns
 from nautilus_trader.analysis.tearsheet import _calculate_account_returns
 from nautilus_trader.analysis.tearsheet import _create_stats_table
 from nautilus_trader.analysis.tearsheet import _create_tearsheet_figure
+from nautilus_trader.analysis.tearsheet import _downsample_ohlc
+from nautilus_trader.analysis.tearsheet import _downsample_series
 from nautilus_trader.analysis.tearsheet import _normalize_theme_config
 from nautilus_trader.analysis.tearsheet import _resolve_tearsheet_returns
 from nautilus_trader.analysis.tearsheet import create_drawdown_chart
@@ -276,6 +278,113 @@ def test_create_equity_curve_with_empty_returns():
     assert fig is not None
 
 
+@pytest.fixture
+def long_returns():
+    dates = pd.date_range("2024-01-01", periods=50_000, freq="min")
+    rng = np.random.default_rng(42)
+    return pd.Series(rng.normal(0.0, 0.0001, len(dates)), index=dates)
+
+
+def test_downsample_series_when_within_budget_returns_series_unchanged(sample_returns):
+    # Arrange, Act
+    result = _downsample_series(sample_returns, max_points=1_000)
+
+    # Assert
+    assert result is sample_returns
+
+
+def test_downsample_series_keeps_budget_and_endpoints(long_returns):
+    # Arrange
+    equity = (1 + long_returns).cumprod()
+
+    # Act
+    result = _downsample_series(equity, max_points=500)
+
+    # Assert
+    assert len(result) == 500
+    assert result.index[0] == equity.index[0]
+    assert result.index[-1] == equity.index[-1]
+    assert result.index.is_monotonic_increasing
+    assert result.equals(equity.loc[result.index])
+
+
+def test_downsample_series_drops_nan_values(long_returns):
+    # Arrange
+    rolling = long_returns.rolling(window=100).mean()
+
+    # Act
+    result = _downsample_series(rolling, max_points=500)
+
+    # Assert
+    assert len(result) == 500
+    assert not result.isna().any()
+
+
+def test_downsample_ohlc_rebuckets_bars():
+    # Arrange
+    bars_df = pd.DataFrame(
+        {
+            "ts_init": pd.date_range("2024-01-01", periods=5, freq="min"),
+            "open": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "high": [1.5, 4.5, 3.5, 4.5, 5.5],
+            "low": [0.5, 1.5, 0.25, 3.5, 4.5],
+            "close": [1.2, 2.2, 3.2, 4.2, 5.2],
+        },
+    )
+
+    # Act
+    result = _downsample_ohlc(bars_df, max_points=2)
+
+    # Assert
+    assert result["ts_init"].tolist() == [bars_df["ts_init"][0], bars_df["ts_init"][3]]
+    assert result["open"].tolist() == [1.0, 4.0]
+    assert result["high"].tolist() == [4.5, 5.5]
+    assert result["low"].tolist() == [0.25, 3.5]
+    assert result["close"].tolist() == [3.2, 5.2]
+
+
+def test_create_equity_curve_downsamples_to_max_points(long_returns):
+    # Arrange, Act
+    fig = create_equity_curve(returns=long_returns, max_points=1_000)
+
+    # Assert
+    assert len(fig.data[0].x) == 1_000
+
+
+def test_create_equity_curve_with_no_max_points_renders_every_point(long_returns):
+    # Arrange, Act
+    fig = create_equity_curve(returns=long_returns, max_points=None)
+
+    # Assert
+    assert len(fig.data[0].x) == len(long_returns)
+
+
+def test_tearsheet_chart_max_points_overrides_config(long_returns):
+    # Arrange
+    config = TearsheetConfig(
+        charts=[
+            TearsheetEquityChart(),
+            TearsheetDrawdownChart(max_points=200),
+        ],
+        max_points=1_000,
+    )
+
+    # Act
+    fig = _create_tearsheet_figure(
+        stats_returns={},
+        stats_general={},
+        stats_pnls={},
+        returns=long_returns,
+        title="Downsampled",
+        config=config,
+    )
+
+    # Assert
+    equity_trace, drawdown_trace = fig.data
+    assert len(equity_trace.x) == 1_000
+    assert len(drawdown_trace.x) == 200
+
+
 def test_create_drawdown_chart_with_valid_data(sample_returns, tmp_path):
     # Arrange
     output_path = tmp_path / "drawdown.html"
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import json
 import pickle
 import sys
 from decimal import Decimal
@@ -28,9 +29,14 @@ from nautilus_trader.backtest.models import FillModel
 from nautilus_trader.common.actor import Actor
 from nautilus_trader.config import ImportableControllerConfig
 from nautilus_trader.config import InvalidConfiguration
+from nautilus_trader.config import LatencyTracingConfig
 from nautilus_trader.config import LoggingConfig
+from nautilus_trader.config import ProfilingConfig
 from nautilus_trader.config import StreamingConfig
 from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.core.uuid import clear_uuid4_seed
+from nautilus_trader.core.uuid import is_uuid4_seeded
+from nautilus_trader.core.uuid import set_uuid4_seed
 from nautilus_trader.examples.strategies.ema_cross import EMACross
 from nautilus_trader.examples.strategies.ema_cross import EMACrossConfig
 from nautilus_trader.examples.strategies.signal_strategy import SignalStrategy
@@ -343,6 +349,111 @@ class TestBacktestEngine:
         assert msg.ts_init == expected_ts
         assert msg.ts_event == expected_ts
 
+    def test_run_with_batch_data_dispatch(self):
+        # Arrange
+        engine = self.create_engine(
+            config=BacktestEngineConfig(
+                logging=LoggingConfig(bypass_logging=True),
+                batch_data_dispatch=True,
+            ),
+        )
+        strategy = SignalStrategy(SignalStrategyConfig(instrument_id=USDJPY_SIM.id))
+        engine.add_strategy(strategy)
+
+        # Act
+        engine.run()
+
+        # Assert
+        assert engine.iteration == 8000
+        assert strategy.counter == 8000
+        assert engine.cache.quote_tick(USDJPY_SIM.id) is not None
+        engine.dispose()
+
+    @pytest.mark.parametrize(
+        ("batch_data_dispatch", "expected_events"),
+        [
+            [
+                False,
+                [
+                    ("quote", "USD/JPY", 1_000_000_000, "100.010"),
+                    ("quote", "AUD/USD", 1_000_000_000, "0.70010"),
+                    ("quote", "USD/JPY", 2_000_000_000, "101.010"),
+                    ("fill", "USD/JPY", 2_000_000_000, "101.010"),
+                    ("quote", "USD/JPY", 2_000_000_000, "102.010"),
+                    ("quote", "AUD/USD", 2_000_000_000, "0.71010"),
+                ],
+            ],
+            [
+                True,
+                [
+                    ("quote", "USD/JPY", 1_000_000_000, "100.010"),
+                    ("quote", "AUD/USD", 1_000_000_000, "0.70010"),
+                    ("quote", "USD/JPY", 2_000_000_000, "101.010"),
+                    ("quote", "USD/JPY", 2_000_000_000, "102.010"),
+                    ("quote", "AUD/USD", 2_000_000_000, "0.71010"),
+                    ("fill", "USD/JPY", 2_000_000_000, "102.010"),  # Settled at end of group
+                ],
+            ],
+        ],
+    )
+    def test_run_with_batch_data_dispatch_settles_same_timestamp_group(
+        self,
+        batch_data_dispatch: bool,
+        expected_events: list[tuple],
+    ):
+        # Arrange
+        engine = BacktestEngine(
+            BacktestEngineConfig(
+                logging=LoggingConfig(bypass_logging=True),
+                batch_data_dispatch=batch_data_dispatch,
+            ),
+        )
+        engine.add_venue(
+            venue=Venue("SIM"),
+            oms_type=OmsType.HEDGING,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            starting_balances=[Money(1_000_000, USD)],
+            fill_model=FillModel(),
+        )
+        engine.add_instrument(USDJPY_SIM)
+        engine.add_instrument(AUDUSD_SIM)
+
+        # Both instruments share timestamps, with two USD/JPY quotes at the second
+        quotes = [
+            (USDJPY_SIM, 100.000, 100.010, 1_000_000_000),
+            (AUDUSD_SIM, 0.70000, 0.70010, 1_000_000_000),
+            (USDJPY_SIM, 101.000, 101.010, 2_000_000_000),
+            (USDJPY_SIM, 102.000, 102.010, 2_000_000_000),
+            (AUDUSD_SIM, 0.71000, 0.71010, 2_000_000_000),
+        ]
+        engine.add_data(
+            [
+                TestDataStubs.quote_tick(
+                    instrument=instrument,
+                    bid_price=bid_price,
+                    ask_price=ask_price,
+                    ts_event=ts,
+                    ts_init=ts,
+                )
+                for instrument, bid_price, ask_price, ts in quotes
+            ],
+        )
+        strategy = SameTimestampOrderStrategy(
+            instrument_ids=[USDJPY_SIM.id, AUDUSD_SIM.id],
+            order_instrument_id=USDJPY_SIM.id,
+            order_ts=2_000_000_000,
+        )
+        engine.add_strategy(strategy)
+
+        # Act
+        engine.run()
+
+        # Assert
+        assert strategy.events == expected_events
+        assert engine.iteration == 5
+        engine.dispose()
+
     def test_set_instance_id(self):
         # Arrange
         instance_id = UUID4()
@@ -364,6 +475,155 @@ class TestBacktestEngine:
         assert engine1.kernel.instance_id == instance_id
         assert engine2.kernel.instance_id != instance_id
 
+    def test_uuid_seed_makes_ids_reproducible(self):
+        # Arrange
+        config = BacktestEngineConfig(
+            logging=LoggingConfig(bypass_logging=True),
+            uuid_seed=42,
+        )
+
+        # Act
+        engine1 = self.create_engine(config=config)
+        engine1.run()
+        instance_id1 = engine1.kernel.instance_id
+        event_ids1 = [event.id for event in engine1.cache.accounts()[0].events]
+        engine1.dispose()
+        seeded_after_dispose = is_uuid4_seeded()
+
+        engine2 = self.create_engine(config=config)
+        engine2.run()
+        event_ids2 = [event.id for event in engine2.cache.accounts()[0].events]
+
+        # Assert
+        assert not seeded_after_dispose
+        assert engine2.kernel.instance_id == instance_id1
+        assert event_ids2 == event_ids1
+        engine2.dispose()
+
+    def test_uuid_seed_run_after_reset_reproduces_ids(self):
+        # Arrange
+        config = BacktestEngineConfig(
+            logging=LoggingConfig(bypass_logging=True),
+            uuid_seed=42,
+        )
+        engine = self.create_engine(config=config)
+
+        # Act
+        engine.run()
+        run_id1 = engine.run_id
+        event_ids1 = [event.id for event in engine.cache.accounts()[0].events]
+        engine.reset()
+        engine.run()
+        run_id2 = engine.run_id
+        event_ids2 = [event.id for event in engine.cache.accounts()[0].events]
+
+        # Assert
+        assert run_id2 == run_id1
+        assert event_ids2 == event_ids1
+        engine.dispose()
+
+    @pytest.mark.parametrize("uuid_seed", [None, 42])
+    def test_uuid_seed_leaves_process_wide_generation_unchanged(self, uuid_seed):
+        # Arrange
+        set_uuid4_seed(7)
+        expected = [UUID4() for _ in range(3)]
+        set_uuid4_seed(7)
+        config = BacktestEngineConfig(
+            logging=LoggingConfig(bypass_logging=True),
+            uuid_seed=uuid_seed,
+        )
+
+        # Act
+        first = UUID4()
+        engine = self.create_engine(config=config)
+        engine.run()
+        engine.dispose()
+        rest = [UUID4(), UUID4()]
+        seeded = is_uuid4_seeded()
+        clear_uuid4_seed()
+
+        # Assert
+        assert seeded
+        if uuid_seed is not None:  # An unseeded engine draws from the process-wide generator
+            assert [first, *rest] == expected
+
+    def test_profiling_records_hot_path_histograms(self, tmp_path):
+        # Arrange
+        output_path = tmp_path / "profile.json"
+        config = BacktestEngineConfig(
+            logging=LoggingConfig(bypass_logging=True),
+            profiling=ProfilingConfig(output_path=str(output_path)),
+        )
+        engine = self.create_engine(config=config)
+        strategy = EMACross(
+            config=EMACrossConfig(
+                instrument_id=USDJPY_SIM.id,
+                bar_type=BarType.from_str("USD/JPY.SIM-1-MINUTE-BID-INTERNAL"),
+                trade_size=Decimal(100_000),
+                fast_ema_period=10,
+                slow_ema_period=20,
+            ),
+        )
+        engine.add_strategy(strategy)
+
+        # Act
+        engine.run()
+        profiler = engine.kernel.profiler
+        engine.dispose()
+
+        # Assert
+        source = str(strategy.id)
+        snapshot = json.loads(output_path.read_bytes())
+        assert engine.kernel.msgbus.profiler is None  # Profiling stopped on dispose
+        assert profiler.histogram("engine", "DataEngine", "_handle_data").count > 0
+        assert profiler.histogram("callback", source, "on_bar").count > 0
+        assert profiler.histogram("callback", source, "on_order_filled").count > 0
+        assert {row["kind"] for row in snapshot} >= {"handler", "callback", "indicator", "engine"}
+        assert any(
+            row["kind"] == "indicator" and row["name"].startswith("ExponentialMovingAverage")
+            for row in snapshot
+        )
+
+    def test_latency_tracing_records_tick_to_trade_stages(self, tmp_path):
+        # Arrange
+        output_path = tmp_path / "latency.json"
+        config = BacktestEngineConfig(
+            logging=LoggingConfig(bypass_logging=True),
+            latency_tracing=LatencyTracingConfig(output_path=str(output_path)),
+        )
+        engine = self.create_engine(config=config)
+        strategy = EMACross(
+            config=EMACrossConfig(
+                instrument_id=USDJPY_SIM.id,
+                bar_type=BarType.from_str("USD/JPY.SIM-10-TICK-BID-INTERNAL"),
+                trade_size=Decimal(100_000),
+                fast_ema_period=10,
+                slow_ema_period=20,
+            ),
+        )
+        engine.add_strategy(strategy)
+
+        # Act
+        engine.run()
+        tracer = engine.kernel.tracer
+        engine.dispose()
+
+        # Assert
+        snapshot = json.loads(output_path.read_bytes())
+        assert engine.kernel.msgbus.tracer is None  # Tracing stopped on dispose
+        assert tracer.histogram("data_engine").count == 8000  # Every quote tick
+        assert tracer.histogram("tick_to_trade").count > 0
+        assert [row["stage"] for row in snapshot] == [
+            "data_engine",
+            "msgbus",
+            "strategy",
+            "submit_order",
+            "risk_engine",
+            "exec_engine",
+            "exec_client",
+            "tick_to_trade",
+        ]
+
     def test_controller(self):
         # Arrange - Controller class
         config = BacktestEngineConfig(
@@ -1796,6 +2056,43 @@ class BarResubscriberStrategy(Strategy):
             self.resubscribe_count += 1
 
 
+class SameTimestampOrderStrategy(Strategy):
+    """
+    Strategy that records quote and fill callbacks, buying on the first quote at a
+    timestamp.
+    """
+
+    def __init__(self, instrument_ids, order_instrument_id, order_ts):
+        super().__init__()
+        self._instrument_ids = instrument_ids
+        self._order_instrument_id = order_instrument_id
+        self._order_ts = order_ts
+        self.events = []
+
+    def on_start(self):
+        for instrument_id in self._instrument_ids:
+            self.subscribe_quote_ticks(instrument_id)
+
+    def on_quote_tick(self, tick):
+        self.events.append(
+            ("quote", tick.instrument_id.symbol.value, tick.ts_init, str(tick.ask_price)),
+        )
+
+        if tick.instrument_id == self._order_instrument_id and tick.ts_init == self._order_ts:
+            self._order_ts = None  # Only buy once
+            order = self.order_factory.market(
+                instrument_id=tick.instrument_id,
+                order_side=OrderSide.BUY,
+                quantity=Quantity.from_int(100_000),
+            )
+            self.submit_order(order)
+
+    def on_order_filled(self, event):
+        self.events.append(
+            ("fill", event.instrument_id.symbol.value, event.ts_event, str(event.last_px)),
+        )
+
+
 class TestBacktestEngineStreamingBars:
     def setup_method(self):
         self.instrument = TestInstrumentProvider.default_fx_ccy("USD/JPY")
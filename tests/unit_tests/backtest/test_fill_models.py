@@ -73,6 +73,90 @@ class TestFillLimitInsideSpread:
         assert CompetitionAwareFillModel().fill_limit_inside_spread() is False
 
 
+class TestFillSimulationPurity:
+    def setup_method(self):
+        self.instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+    def test_base_fill_model_is_not_pure(self):
+        assert FillModel().is_pure() is False
+
+    def test_probabilistic_fill_model_is_not_pure(self):
+        assert ProbabilisticFillModel().is_pure() is False
+
+    def test_deterministic_fill_models_are_pure(self):
+        # Arrange
+        models = [
+            BestPriceFillModel(),
+            OneTickSlippageFillModel(),
+            TwoTierFillModel(),
+            SizeAwareFillModel(),
+            LimitOrderPartialFillModel(),
+            ThreeTierFillModel(),
+            MarketHoursFillModel(),
+            VolumeSensitiveFillModel(),
+            CompetitionAwareFillModel(),
+        ]
+
+        # Act, Assert
+        assert all(model.is_pure() for model in models)
+
+    def test_base_fill_simulation_key_includes_order_inputs(self):
+        # Arrange
+        fill_model = FillModel()
+        order1 = TestExecStubs.market_order(
+            instrument=self.instrument,
+            quantity=Quantity.from_int(5),
+        )
+        order2 = TestExecStubs.market_order(
+            instrument=self.instrument,
+            quantity=Quantity.from_int(50),
+        )
+
+        # Act, Assert
+        assert fill_model.fill_simulation_key(order1) != fill_model.fill_simulation_key(order2)
+
+    def test_size_aware_fill_simulation_key_depends_on_quantity(self):
+        # Arrange
+        fill_model = SizeAwareFillModel()
+        buy = TestExecStubs.market_order(
+            instrument=self.instrument,
+            order_side=OrderSide.BUY,
+            quantity=Quantity.from_int(5),
+        )
+        sell = TestExecStubs.market_order(
+            instrument=self.instrument,
+            order_side=OrderSide.SELL,
+            quantity=Quantity.from_int(5),
+        )
+
+        # Act, Assert
+        assert fill_model.fill_simulation_key(buy) == fill_model.fill_simulation_key(sell)
+
+    def test_volume_sensitive_fill_simulation_key_includes_model_state(self):
+        # Arrange
+        fill_model = VolumeSensitiveFillModel()
+        order = TestExecStubs.market_order(instrument=self.instrument)
+        key1 = fill_model.fill_simulation_key(order)
+
+        # Act
+        fill_model.set_recent_volume(100.0)
+
+        # Assert
+        assert fill_model.fill_simulation_key(order) != key1
+
+    def test_market_hours_fill_simulation_key_includes_model_state(self):
+        # Arrange
+        fill_model = MarketHoursFillModel()
+        order = TestExecStubs.market_order(instrument=self.instrument)
+        key1 = fill_model.fill_simulation_key(order)
+
+        # Act
+        fill_model.set_low_liquidity_period(True)
+
+        # Assert
+        assert fill_model.fill_simulation_key(order) != key1
+
+
 class TestEnhancedFillModels:
     def setup_method(self):
         # Common test setup
@@ -13,8 +13,26 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from typing import Any
+
 import pytest
 
+from nautilus_trader.backtest.engine import OrderMatchingEngine
+from nautilus_trader.backtest.models import FillModel
+from nautilus_trader.backtest.models import MakerTakerFeeModel
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import BookType
+from nautilus_trader.model.enums import LiquiditySide
+from nautilus_trader.model.enums import OmsType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.events import OrderFilled
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.execution import TestExecStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
 
 FNV_OFFSET_BASIS = 0xCBF29CE484222325
 FNV_PRIME = 0x100000001B3
@@ -108,3 +126,50 @@ def test_fnv1a_is_bounded_to_u64() -> None:
     h = _fnv1a_trade_id_hash("X" * 50, 2**32 - 1, 2**64 - 1)
     assert 0 <= h <= U64_MASK
     assert len(f"{h:016x}") == 16
+
+
+def test_matching_engine_trade_ids_match_rust_parity_fixture() -> None:
+    # The matching engine caches the `(venue, raw_id)` hash prefix and only folds in
+    # `ts_init` per fill, so pin its output to the same fixture as the reference hash
+    clock = TestClock()
+    clock.set_time(1_700_000_000_000_000_000)
+    msgbus = MessageBus(trader_id=TestIdStubs.trader_id(), clock=clock)
+    instrument = TestInstrumentProvider.ethusdt_perp_binance()
+    cache = TestComponentStubs.cache()
+    cache.add_instrument(instrument)
+
+    matching_engine = OrderMatchingEngine(
+        instrument=instrument,
+        raw_id=1,
+        fill_model=FillModel(),
+        fee_model=MakerTakerFeeModel(),
+        book_type=BookType.L1_MBP,
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.MARGIN,
+        msgbus=msgbus,
+        cache=cache,
+        clock=clock,
+    )
+
+    messages: list[Any] = []
+    msgbus.register("ExecEngine.process", messages.append)
+
+    order = TestExecStubs.market_order(
+        instrument=instrument,
+        order_side=OrderSide.BUY,
+        quantity=instrument.make_qty(10.0),
+    )
+
+    for _ in range(2):
+        matching_engine.fill_order(
+            order=order,
+            last_px=instrument.make_price(1000.0),
+            last_qty=instrument.make_qty(1.0),
+            liquidity_side=LiquiditySide.TAKER,
+        )
+
+    fills = [m for m in messages if isinstance(m, OrderFilled)]
+    assert [fill.trade_id.value for fill in fills] == [
+        "T-5c080ffb681dc0d4-001",
+        "T-5c080ffb681dc0d4-002",
+    ]
@@ -21,6 +21,7 @@ import pytest
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.cache.cache import Cache
+from nautilus_trader.cache.config import CacheConfig
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.config import LoggingConfig
@@ -550,6 +551,35 @@ class TestCache:
         assert self.cache.position_for_order(order.client_order_id) == position
         assert self.cache.orders_for_position(position.id) == [order]
 
+    def test_add_order_and_position_with_event_history_limit(self):
+        # Arrange
+        cache = Cache(config=CacheConfig(event_history_limit=1))
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        cache.add_order(order)
+
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.00000"),
+        )
+        position = Position(instrument=AUDUSD_SIM, fill=fill)
+        cache.add_position(position, OmsType.HEDGING)
+
+        # Act
+        order.apply(TestEventStubs.order_submitted(order))
+        order.apply(TestEventStubs.order_accepted(order))
+        order.apply(fill)
+
+        # Assert
+        assert order.events == [order.init_event, fill]
+        assert order.event_count == 4
+        assert position.events == [fill]
+
     def test_snapshot_position(self):
         # Arrange
         order = self.strategy.order_factory.market(
@@ -57,6 +57,46 @@ class TestOrderIdGenerator:
         # Assert
         assert result1 == ClientOrderId("O-19700101-000000-001-001-1")
 
+    def test_generate_order_id_when_clock_advances_updates_datetime_tag(self):
+        # Arrange
+        clock = TestClock()
+        generator = ClientOrderIdGenerator(
+            trader_id=TraderId("TRADER-001"),
+            strategy_id=StrategyId("SCALPER-001"),
+            clock=clock,
+        )
+        result1 = generator.generate()
+
+        # Act
+        clock.set_time(999_999_999)  # Same second
+        result2 = generator.generate()
+        clock.set_time(61_000_000_000)
+        result3 = generator.generate()
+
+        # Assert
+        assert result1 == ClientOrderId("O-19700101-000000-001-001-1")
+        assert result2 == ClientOrderId("O-19700101-000000-001-001-2")
+        assert result3 == ClientOrderId("O-19700101-000101-001-001-3")
+
+    def test_generate_order_id_without_hyphens_when_clock_advances(self):
+        # Arrange
+        clock = TestClock()
+        generator = ClientOrderIdGenerator(
+            trader_id=TraderId("TRADER-001"),
+            strategy_id=StrategyId("SCALPER-001"),
+            clock=clock,
+            use_hyphens=False,
+        )
+        result1 = generator.generate()
+
+        # Act
+        clock.set_time(61_000_000_000)
+        result2 = generator.generate()
+
+        # Assert
+        assert result1 == ClientOrderId("O197001010000000010011")
+        assert result2 == ClientOrderId("O197001010001010010012")
+
 
 class TestOrderListIdGenerator:
     def setup(self):
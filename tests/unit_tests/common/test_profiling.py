@@ -0,0 +1,536 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import json
+import threading
+
+import pyarrow.parquet as pq
+import pytest
+
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.profiling import HotPathProfiler
+from nautilus_trader.common.profiling import LatencyHistogram
+from nautilus_trader.common.profiling import LatencyTracer
+from nautilus_trader.common.profiling import TraceStage
+from nautilus_trader.indicators import ExponentialMovingAverage
+from nautilus_trader.model.identifiers import ClientOrderId
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+class TestLatencyHistogram:
+    def test_initial_state(self):
+        # Arrange, Act
+        histogram = LatencyHistogram()
+
+        # Assert
+        assert histogram.count == 0
+        assert histogram.total_ns == 0
+        assert histogram.mean_ns == 0.0
+        assert histogram.max_ns == 0
+        assert histogram.percentile(0.5) == 0
+        assert histogram.buckets() == {}
+
+    def test_record_updates_statistics_and_buckets(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        for duration_ns in [100, 200, 300, 5_000]:
+            histogram.record(duration_ns)
+
+        # Assert
+        assert histogram.count == 4
+        assert histogram.total_ns == 5_600
+        assert histogram.mean_ns == 1_400.0
+        assert histogram.min_ns == 100
+        assert histogram.max_ns == 5_000
+        assert histogram.buckets() == {128: 1, 256: 1, 512: 1, 8192: 1}
+
+    def test_percentile_resolves_to_bucket_upper_bound_capped_at_max(self):
+        # Arrange
+        histogram = LatencyHistogram()
+        for duration_ns in [100, 200, 300, 5_000]:
+            histogram.record(duration_ns)
+
+        # Act, Assert
+        assert histogram.percentile(0.0) == 100
+        assert histogram.percentile(0.5) == 256
+        assert histogram.percentile(0.75) == 512
+        assert histogram.percentile(1.0) == 5_000
+
+    def test_percentile_with_invalid_quantile_raises(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            histogram.percentile(1.5)
+
+    def test_merge_combines_statistics_and_buckets(self):
+        # Arrange
+        histogram = LatencyHistogram()
+        histogram.record(100)
+        other = LatencyHistogram()
+        other.record(50)
+        other.record(5_000)
+
+        # Act
+        histogram.merge(other)
+
+        # Assert
+        assert histogram.count == 3
+        assert histogram.total_ns == 5_150
+        assert histogram.min_ns == 50
+        assert histogram.max_ns == 5_000
+        assert histogram.buckets() == {64: 1, 128: 1, 8192: 1}
+
+    def test_reset(self):
+        # Arrange
+        histogram = LatencyHistogram()
+        histogram.record(1_000)
+
+        # Act
+        histogram.reset()
+
+        # Assert
+        assert histogram.count == 0
+        assert histogram.buckets() == {}
+        assert histogram.to_dict()["min_ns"] == 0
+
+
+class TestHotPathProfiler:
+    def test_instantiate_with_invalid_sample_rate_raises(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            HotPathProfiler(sample_rate=0)
+
+    def test_call_invokes_handler_and_records_duration(self):
+        # Arrange
+        profiler = HotPathProfiler()
+        received = []
+
+        # Act
+        profiler.call("engine", "DataEngine", "_handle_data", received.append, "msg")
+
+        # Assert
+        histogram = profiler.histogram("engine", "DataEngine", "_handle_data")
+        assert received == ["msg"]
+        assert histogram.count == 1
+        assert profiler.histogram("engine", "DataEngine", "_handle_request") is None
+
+    def test_sample_rate_times_one_in_every_n_calls_on_average(self):
+        # Arrange
+        profiler = HotPathProfiler(sample_rate=4)
+        received = []
+
+        # Act
+        for i in range(4_000):
+            profiler.call("engine", "DataEngine", "_handle_data", received.append, i)
+
+        # Assert
+        assert len(received) == 4_000
+        assert profiler.sample_rate == 4
+        assert 900 <= profiler.histogram("engine", "DataEngine", "_handle_data").count <= 1_100
+
+    def test_sample_rate_does_not_alias_with_periodic_call_sites(self):
+        # Arrange: two call sites always called in turn, which every second call
+        # sampling would split into one always and one never sampled
+        profiler = HotPathProfiler(sample_rate=2)
+        received = []
+
+        # Act
+        for i in range(1_000):
+            profiler.call("engine", "DataEngine", "_handle_data", received.append, i)
+            profiler.call("engine", "RiskEngine", "_execute_command", received.append, i)
+
+        # Assert
+        data = profiler.histogram("engine", "DataEngine", "_handle_data")
+        risk = profiler.histogram("engine", "RiskEngine", "_execute_command")
+        assert 400 <= data.count <= 600
+        assert 400 <= risk.count <= 600
+
+    def test_snapshot_orders_by_total_time_with_queues_last(self):
+        # Arrange
+        profiler = HotPathProfiler()
+        profiler.record("callback", "MyStrategy-001", "on_bar", 1_000)
+        profiler.record("callback", "MyStrategy-001", "on_quote_tick", 5_000)
+        profiler.add_queue_source(
+            "DataEngine",
+            lambda: {"data_queue": {1024: 3, 2048: 1}},
+        )
+
+        # Act
+        snapshot = profiler.snapshot()
+
+        # Assert
+        assert [row["name"] for row in snapshot] == ["on_quote_tick", "on_bar", "data_queue"]
+        assert snapshot[2] == {
+            "kind": "queue",
+            "source": "DataEngine",
+            "name": "data_queue",
+            "count": 4,
+            "total_ns": None,
+            "mean_ns": None,
+            "min_ns": None,
+            "p50_ns": 1024,
+            "p90_ns": 2048,
+            "p99_ns": 2048,
+            "max_ns": 2048,
+        }
+
+    def test_report_limits_rows(self):
+        # Arrange
+        profiler = HotPathProfiler()
+        profiler.record("callback", "MyStrategy-001", "on_bar", 1_000)
+        profiler.record("callback", "MyStrategy-001", "on_quote_tick", 5_000)
+
+        # Act
+        report = profiler.report(limit=1)
+
+        # Assert
+        lines = report.splitlines()
+        assert len(lines) == 2  # Header and one row
+        assert "on_quote_tick" in lines[1]
+
+    def test_dump_writes_json_snapshot(self, tmp_path):
+        # Arrange
+        profiler = HotPathProfiler()
+        profiler.record("callback", "MyStrategy-001", "on_bar", 1_000)
+        path = tmp_path / "profiling" / "profile.json"
+
+        # Act
+        profiler.dump(str(path))
+
+        # Assert
+        assert json.loads(path.read_bytes()) == profiler.snapshot()
+
+    def test_reset_clears_histograms(self):
+        # Arrange
+        profiler = HotPathProfiler()
+        profiler.record("callback", "MyStrategy-001", "on_bar", 1_000)
+
+        # Act
+        profiler.reset()
+
+        # Assert
+        assert profiler.snapshot() == []
+
+
+class TestLatencyTracer:
+    def setup_method(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.tracer = LatencyTracer(clock=self.clock)
+        self.client_order_id = ClientOrderId("O-123456")
+
+    def trace_order(self, tracer: LatencyTracer, client_order_id: ClientOrderId) -> None:
+        self.clock.set_time(1_000)
+        tracer.begin(100)
+        self.clock.set_time(1_500)
+        tracer.stamp(TraceStage.MSGBUS)
+        self.clock.set_time(2_500)
+        tracer.stamp(TraceStage.STRATEGY)
+        self.clock.set_time(4_500)
+        tracer.attach(client_order_id)
+        tracer.end()
+        self.clock.set_time(9_000)
+        tracer.stamp_order(client_order_id, TraceStage.RISK_ENGINE)
+        tracer.stamp_order(client_order_id, TraceStage.EXEC_ENGINE)
+        self.clock.set_time(10_000)
+        tracer.stamp_order(client_order_id, TraceStage.EXEC_CLIENT)
+
+    def test_instantiate_with_invalid_sample_rate_raises(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            LatencyTracer(clock=self.clock, sample_rate=0)
+
+    def test_trace_records_latency_per_stage(self):
+        # Arrange, Act
+        self.trace_order(self.tracer, self.client_order_id)
+
+        # Assert
+        assert [(row["stage"], row["count"], row["max_ns"]) for row in self.tracer.snapshot()] == [
+            ("data_engine", 1, 900),
+            ("msgbus", 1, 500),
+            ("strategy", 1, 1_000),
+            ("submit_order", 1, 2_000),
+            ("risk_engine", 1, 4_500),
+            ("exec_engine", 1, 0),
+            ("exec_client", 1, 1_000),
+            ("tick_to_trade", 1, 9_900),
+        ]
+
+    def test_begin_when_trace_active_does_not_start_nested_trace(self):
+        # Arrange
+        self.tracer.begin(0)
+
+        # Act
+        result = self.tracer.begin(0)
+
+        # Assert
+        assert not result
+        assert self.tracer.histogram("data_engine").count == 1
+
+    def test_sample_rate_traces_one_in_every_n_ticks(self):
+        # Arrange
+        tracer = LatencyTracer(clock=self.clock, sample_rate=2)
+
+        # Act
+        results = []
+        for _ in range(4):
+            results.append(tracer.begin(0))
+            tracer.end()
+
+        # Assert
+        assert results == [False, True, False, True]
+        assert tracer.sample_rate == 2
+        assert tracer.histogram("data_engine").count == 2
+
+    def test_stamp_without_active_trace_does_nothing(self):
+        # Arrange, Act
+        self.tracer.stamp(TraceStage.STRATEGY)
+        self.tracer.attach(self.client_order_id)
+        self.tracer.stamp_order(self.client_order_id, TraceStage.EXEC_CLIENT)
+
+        # Assert
+        assert self.tracer.snapshot() == []
+
+    def test_attach_beyond_max_pending_discards_oldest(self):
+        # Arrange
+        tracer = LatencyTracer(clock=self.clock, max_pending=1)
+        first = ClientOrderId("O-1")
+        second = ClientOrderId("O-2")
+        tracer.begin(0)
+        tracer.attach(first)
+        tracer.attach(second)
+        tracer.end()
+
+        # Act
+        tracer.stamp_order(first, TraceStage.EXEC_CLIENT)
+        tracer.stamp_order(second, TraceStage.EXEC_CLIENT)
+
+        # Assert
+        assert tracer.histogram("tick_to_trade").count == 1
+
+    def test_histogram_with_invalid_stage_raises(self):
+        # Arrange, Act, Assert
+        with pytest.raises(KeyError):
+            self.tracer.histogram("ts_init")
+
+    def test_histogram_merges_threads(self):
+        # Arrange
+        thread = threading.Thread(target=self.trace_order, args=(self.tracer, ClientOrderId("O-1")))
+        thread.start()
+        thread.join()
+
+        # Act
+        self.trace_order(self.tracer, self.client_order_id)
+
+        # Assert
+        assert self.tracer.histogram("tick_to_trade").count == 2
+
+    def test_stamp_order_on_another_thread_completes_trace(self):
+        # Arrange
+        self.clock.set_time(1_000)
+        self.tracer.begin(100)
+        self.tracer.attach(self.client_order_id)
+        self.tracer.end()
+        self.clock.set_time(10_000)
+
+        # Act
+        thread = threading.Thread(
+            target=self.tracer.stamp_order,
+            args=(self.client_order_id, TraceStage.EXEC_CLIENT),
+        )
+        thread.start()
+        thread.join()
+
+        # Assert
+        histogram = self.tracer.histogram("tick_to_trade")
+        assert histogram.count == 1
+        assert histogram.max_ns == 9_900
+
+    def test_sample_rate_counts_ticks_per_thread(self):
+        # Arrange
+        tracer = LatencyTracer(clock=self.clock, sample_rate=2)
+        tracer.begin(0)  # Not sampled
+
+        def begin_on_thread():
+            tracer.begin(0)  # Not sampled, the count is per thread
+            tracer.end()
+
+        thread = threading.Thread(target=begin_on_thread)
+        thread.start()
+        thread.join()
+
+        # Act
+        result = tracer.begin(0)
+
+        # Assert
+        assert result
+        assert tracer.histogram("data_engine").count == 1
+
+    def test_report_includes_recorded_stages(self):
+        # Arrange
+        self.trace_order(self.tracer, self.client_order_id)
+
+        # Act
+        report = self.tracer.report()
+
+        # Assert
+        lines = report.splitlines()
+        assert len(lines) == 9  # Header and eight stages
+        assert lines[-1].startswith("tick_to_trade")
+
+    def test_dump_writes_json_snapshot(self, tmp_path):
+        # Arrange
+        self.trace_order(self.tracer, self.client_order_id)
+        path = tmp_path / "tracing" / "latency.json"
+
+        # Act
+        self.tracer.dump(str(path))
+
+        # Assert
+        assert json.loads(path.read_bytes()) == self.tracer.snapshot()
+
+    def test_write_catalog_writes_parquet(self, tmp_path):
+        # Arrange
+        self.trace_order(self.tracer, self.client_order_id)
+        catalog = ParquetDataCatalog(str(tmp_path))
+
+        # Act
+        self.tracer.write_catalog(catalog, "TESTER-000")
+
+        # Assert
+        table = pq.read_table(str(tmp_path / "latency" / "TESTER-000.parquet"))
+        assert table.column("stage").to_pylist()[-1] == "tick_to_trade"
+        assert table.num_rows == 8
+
+    def test_reset_clears_histograms_and_pending(self):
+        # Arrange
+        self.tracer.begin(0)
+        self.tracer.attach(self.client_order_id)
+        self.tracer.end()
+
+        # Act
+        self.tracer.reset()
+        self.tracer.stamp_order(self.client_order_id, TraceStage.EXEC_CLIENT)
+
+        # Assert
+        assert self.tracer.snapshot() == []
+
+
+class TestHotPathProfilerIntegration:
+    def setup_method(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.msgbus = MessageBus(
+            trader_id=TestIdStubs.trader_id(),
+            clock=self.clock,
+        )
+        self.cache = TestComponentStubs.cache()
+        self.portfolio = Portfolio(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        self.profiler = HotPathProfiler()
+        self.msgbus.set_profiler(self.profiler)
+
+    def test_msgbus_without_profiler(self):
+        # Arrange
+        msgbus = MessageBus(
+            trader_id=TestIdStubs.trader_id(),
+            clock=self.clock,
+        )
+
+        # Act, Assert
+        assert msgbus.profiler is None
+
+    def test_publish_records_handler_by_topic(self):
+        # Arrange
+        received = []
+        self.msgbus.subscribe(topic="data.*", handler=received.append)
+
+        # Act
+        self.msgbus.publish("data.quotes.SIM.AUD/USD", "msg")
+        self.msgbus.publish("data.quotes.SIM.AUD/USD", "msg")
+
+        # Assert
+        histogram = self.profiler.histogram("handler", "data.quotes.SIM.AUD/USD", "list.append")
+        assert received == ["msg", "msg"]
+        assert histogram.count == 2
+
+    def test_send_records_endpoint_handler(self):
+        # Arrange
+        actor = Actor()
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        self.msgbus.register(endpoint="MyEndpoint", handler=actor.handle_data)
+
+        # Act
+        self.msgbus.send(endpoint="MyEndpoint", msg=TestDataStubs.quote_tick())
+
+        # Assert
+        histogram = self.profiler.histogram("endpoint", "MyEndpoint", f"{actor.id}.handle_data")
+        assert histogram.count == 1
+
+    def test_actor_records_callback_and_indicator_durations(self):
+        # Arrange
+        actor = Actor()
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        tick = TestDataStubs.quote_tick()
+        ema = ExponentialMovingAverage(10)
+        actor.register_indicator_for_quote_ticks(tick.instrument_id, ema)
+        actor.start()
+
+        # Act
+        actor.handle_quote_tick(tick)
+
+        # Assert
+        source = str(actor.id)
+        assert self.profiler.histogram("callback", source, "on_quote_tick").count == 1
+        assert self.profiler.histogram("indicator", source, repr(ema)).count == 1
+
+    def test_actor_not_running_does_not_record_callback(self):
+        # Arrange
+        actor = Actor()
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        # Act
+        actor.handle_quote_tick(TestDataStubs.quote_tick())
+
+        # Assert
+        assert self.profiler.histogram("callback", str(actor.id), "on_quote_tick") is None
@@ -18,6 +18,11 @@ import pickle
 import pytest
 
 from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.core.uuid import clear_uuid4_seed
+from nautilus_trader.core.uuid import is_uuid4_seeded
+from nautilus_trader.core.uuid import restore_uuid4_seed_state
+from nautilus_trader.core.uuid import set_uuid4_seed
+from nautilus_trader.core.uuid import uuid4_seed_state
 
 
 class TestUUID:
@@ -84,3 +89,76 @@ class TestUUID:
         assert isinstance(result, UUID4)
         assert len(str(result)) == 36
         assert len(str(result).replace("-", "")) == 32
+
+
+class TestSeededUUID:
+    def teardown_method(self):
+        clear_uuid4_seed()
+
+    def test_seeded_uuid4_sequence_is_reproducible(self):
+        # Arrange
+        set_uuid4_seed(42)
+        first = [UUID4() for _ in range(100)]
+
+        # Act
+        set_uuid4_seed(42)
+        second = [UUID4() for _ in range(100)]
+
+        # Assert
+        assert is_uuid4_seeded()
+        assert first == second
+        assert len(set(first)) == 100
+
+    def test_seeded_uuid4_sequence_differs_by_seed(self):
+        # Arrange
+        set_uuid4_seed(1)
+        first = UUID4()
+
+        # Act
+        set_uuid4_seed(2)
+        second = UUID4()
+
+        # Assert
+        assert first != second
+
+    def test_seeded_uuid4_values_are_valid_version_4(self):
+        # Arrange
+        set_uuid4_seed(0)
+
+        # Act
+        values = [UUID4() for _ in range(1_000)]
+
+        # Assert
+        for value in values:
+            assert UUID4.from_str(value.value) == value  # Validates version and variant
+
+    def test_clear_uuid4_seed_restores_random_generation(self):
+        # Arrange
+        set_uuid4_seed(42)
+        seeded = UUID4()
+
+        # Act
+        clear_uuid4_seed()
+        set_uuid4_seed(42)
+        clear_uuid4_seed()
+        result = UUID4()
+
+        # Assert
+        assert not is_uuid4_seeded()
+        assert result != seeded
+
+    def test_restore_uuid4_seed_state_resumes_sequence(self):
+        # Arrange
+        set_uuid4_seed(42)
+        UUID4()
+        state = uuid4_seed_state()
+        expected = [UUID4() for _ in range(3)]
+
+        # Act
+        clear_uuid4_seed()
+        restore_uuid4_seed_state(state)
+        result = [UUID4() for _ in range(3)]
+
+        # Assert
+        assert is_uuid4_seeded()
+        assert result == expected
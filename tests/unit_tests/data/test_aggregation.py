@@ -32,6 +32,7 @@ from nautilus_trader.data.aggregation import TickBarAggregator
 from nautilus_trader.data.aggregation import TickImbalanceBarAggregator
 from nautilus_trader.data.aggregation import TickRunsBarAggregator
 from nautilus_trader.data.aggregation import TimeBarAggregator
+from nautilus_trader.data.aggregation import TimeBarScheduler
 from nautilus_trader.data.aggregation import ValueBarAggregator
 from nautilus_trader.data.aggregation import ValueImbalanceBarAggregator
 from nautilus_trader.data.aggregation import ValueRunsBarAggregator
@@ -467,6 +468,62 @@ class TestBarBuilder:
         assert bar2.close == Price.from_str("1.00002")
         assert bar2.volume == Quantity.from_str("3.0")
 
+    def test_merge_is_equivalent_to_applying_all_updates(self):
+        # Arrange
+        bar_type = TestDataStubs.bartype_btcusdt_binance_100tick_last()
+        builder = BarBuilder(BTCUSDT_BINANCE, bar_type)
+        finer = BarBuilder(BTCUSDT_BINANCE, bar_type)
+        expected = BarBuilder(BTCUSDT_BINANCE, bar_type)
+        updates = [
+            (Price.from_str("1.00001"), Quantity.from_str("1.000001"), 1),
+            (Price.from_str("1.00003"), Quantity.from_str("1.500000"), 2),
+            (Price.from_str("0.99999"), Quantity.from_str("0.500001"), 3),
+            (Price.from_str("1.00002"), Quantity.from_str("2.000000"), 4),
+        ]
+        for price, size, ts_init in updates[:2]:
+            builder.update(price, size, ts_init)
+
+        for price, size, ts_init in updates[2:]:
+            finer.update(price, size, ts_init)
+
+        for price, size, ts_init in updates:
+            expected.update(price, size, ts_init)
+
+        # Act
+        builder.merge(finer)
+
+        # Assert
+        assert builder.count == expected.count == 4
+        assert builder.ts_last == expected.ts_last == 4
+        assert builder.build_now() == expected.build_now()
+
+    def test_merge_into_empty_builder_initializes(self):
+        # Arrange
+        bar_type = TestDataStubs.bartype_btcusdt_binance_100tick_last()
+        builder = BarBuilder(BTCUSDT_BINANCE, bar_type)
+        finer = BarBuilder(BTCUSDT_BINANCE, bar_type)
+        finer.update(Price.from_str("1.00001"), Quantity.from_str("1.0"), 1)
+
+        # Act
+        builder.merge(finer)
+        bar = builder.build_now()
+
+        # Assert
+        assert bar == finer.build_now()
+
+    def test_merge_with_no_updates_does_nothing(self):
+        # Arrange
+        bar_type = TestDataStubs.bartype_btcusdt_binance_100tick_last()
+        builder = BarBuilder(BTCUSDT_BINANCE, bar_type)
+        builder.update(Price.from_str("1.00001"), Quantity.from_str("1.0"), 1)
+
+        # Act
+        builder.merge(BarBuilder(BTCUSDT_BINANCE, bar_type))
+
+        # Assert
+        assert builder.count == 1
+        assert builder.ts_last == 1
+
 
 class TestTickBarAggregator:
     def test_handle_quote_tick_when_count_below_threshold_updates(self):
@@ -6726,6 +6783,385 @@ class TestSpreadQuoteAggregatorHistoricalMode:
         assert futures_spread_quote.ask_price.as_double() == 10.25
 
 
+class TestTimeBarScheduler:
+    def _aggregators(self, clock: TestClock, handler: list, scheduler: TimeBarScheduler | None):
+        clock.set_time(1)  # Start mid-interval (a start on a bar boundary fires immediately)
+        aggregators = []
+        for bar_type in (
+            BarType.from_str("AUD/USD.SIM-1-MINUTE-MID-INTERNAL"),
+            BarType.from_str("AUD/USD.SIM-1-MINUTE-BID-INTERNAL"),
+            BarType.from_str("AUD/USD.SIM-2-MINUTE-ASK-INTERNAL"),
+        ):
+            aggregator = TimeBarAggregator(
+                AUDUSD_SIM,
+                bar_type,
+                handler.append,
+                clock,
+                scheduler=scheduler,
+            )
+            aggregator.start_timer()
+            aggregators.append(aggregator)
+        return aggregators
+
+    def _run(self, clock: TestClock, aggregators: list[TimeBarAggregator], minutes: int) -> None:
+        for minute in range(minutes):
+            ts = minute * 60 * NANOSECONDS_IN_SECOND + 1
+            tick = TestDataStubs.quote_tick(
+                instrument=AUDUSD_SIM,
+                bid_price=1.00001 + minute * 0.00001,
+                ask_price=1.00003 + minute * 0.00001,
+                ts_event=ts,
+                ts_init=ts,
+            )
+            for aggregator in aggregators:
+                aggregator.handle_quote_tick(tick)
+
+            for event in clock.advance_time((minute + 1) * 60 * NANOSECONDS_IN_SECOND):
+                event.handle()
+
+    def test_start_timer_registers_single_shared_alert(self):
+        # Arrange
+        clock = TestClock()
+        scheduler = TimeBarScheduler(clock)
+
+        # Act
+        self._aggregators(clock, [], scheduler)
+
+        # Assert
+        assert clock.timer_names == ["TIME_BAR_"]
+        assert clock.next_time_ns("TIME_BAR_") == 60 * NANOSECONDS_IN_SECOND
+        assert scheduler.aggregator_count() == 3
+        assert scheduler.pending_close_count() == 2
+
+    def test_close_due_builds_all_due_bars_in_one_batch(self):
+        # Arrange
+        clock = TestClock()
+        scheduler = TimeBarScheduler(clock)
+        handler: list[Bar] = []
+        aggregators = self._aggregators(clock, handler, scheduler)
+
+        # Act
+        self._run(clock, aggregators, minutes=2)
+
+        # Assert
+        assert [str(bar.bar_type) for bar in handler] == [
+            "AUD/USD.SIM-1-MINUTE-BID-INTERNAL",
+            "AUD/USD.SIM-1-MINUTE-MID-INTERNAL",
+            "AUD/USD.SIM-1-MINUTE-BID-INTERNAL",
+            "AUD/USD.SIM-1-MINUTE-MID-INTERNAL",
+            "AUD/USD.SIM-2-MINUTE-ASK-INTERNAL",
+        ]
+        assert scheduler.batch_count == 2
+        assert [a.next_close_ns for a in aggregators] == [
+            3 * 60 * NANOSECONDS_IN_SECOND,
+            3 * 60 * NANOSECONDS_IN_SECOND,
+            4 * 60 * NANOSECONDS_IN_SECOND,
+        ]
+
+    def test_bars_match_independent_timers(self):
+        # Arrange
+        clock1 = TestClock()
+        clock2 = TestClock()
+        independent: list[Bar] = []
+        shared: list[Bar] = []
+        aggregators1 = self._aggregators(clock1, independent, None)
+        aggregators2 = self._aggregators(clock2, shared, TimeBarScheduler(clock2))
+
+        # Act
+        self._run(clock1, aggregators1, minutes=5)
+        self._run(clock2, aggregators2, minutes=5)
+
+        # Assert
+        assert len(clock1.timer_names) == 3
+        assert len(shared) == 12
+        assert shared == independent
+
+    @pytest.mark.parametrize("shared", [False, True])
+    def test_bar_closes_fire_in_timer_name_order_with_other_timers(self, shared: bool):
+        # Arrange
+        clock = TestClock()
+        events: list = []
+        scheduler = TimeBarScheduler(clock) if shared else None
+        aggregators = self._aggregators(clock, events, scheduler)
+        for name in ("ALERT", "ZZZ_ALERT"):
+            clock.set_time_alert_ns(
+                name=name,
+                alert_time_ns=60 * NANOSECONDS_IN_SECOND,
+                callback=lambda event: events.append(event.name),
+            )
+
+        # Act
+        self._run(clock, aggregators, minutes=1)
+
+        # Assert
+        assert [str(e.bar_type) if isinstance(e, Bar) else e for e in events] == [
+            "ALERT",
+            "AUD/USD.SIM-1-MINUTE-BID-INTERNAL",
+            "AUD/USD.SIM-1-MINUTE-MID-INTERNAL",
+            "ZZZ_ALERT",
+        ]
+
+    def test_stop_timer_removes_aggregator_and_cancels_alert_when_empty(self):
+        # Arrange
+        clock = TestClock()
+        scheduler = TimeBarScheduler(clock)
+        aggregators = self._aggregators(clock, [], scheduler)
+
+        # Act
+        aggregators[0].stop_timer()
+        count_after_first = scheduler.aggregator_count()
+        for aggregator in aggregators[1:]:
+            aggregator.stop_timer()
+
+        # Assert
+        assert count_after_first == 2
+        assert scheduler.aggregator_count() == 0
+        assert clock.timer_names == []
+
+
+class TestTimeBarAggregatorCascade:
+    SPECS = ("5-SECOND", "15-SECOND", "1-MINUTE", "5-MINUTE")
+
+    def _aggregators(
+        self,
+        clock: TestClock,
+        handler: list,
+        specs: tuple[str, ...] = SPECS,
+        price_type: str = "MID",
+    ) -> list[TimeBarAggregator]:
+        aggregators = []
+        for spec in specs:
+            aggregator = TimeBarAggregator(
+                AUDUSD_SIM,
+                BarType.from_str(f"AUD/USD.SIM-{spec}-{price_type}-INTERNAL"),
+                handler.append,
+                clock,
+            )
+            aggregator.start_timer()
+            aggregators.append(aggregator)
+        return aggregators
+
+    def _run(self, clock: TestClock, aggregators: list[TimeBarAggregator], start: int, stop: int):
+        for i in range(start, stop):
+            ts = NANOSECONDS_IN_SECOND + i * 1_700_000_000 + 300_000_000
+            for event in clock.advance_time(ts):
+                event.handle()
+
+            tick = TestDataStubs.quote_tick(
+                instrument=AUDUSD_SIM,
+                bid_price=1.00000 + ((i * 37) % 23) * 0.00001,
+                ask_price=1.00002 + ((i * 37) % 23) * 0.00001 + ((i * 11) % 5) * 0.00001,
+                bid_size=((i * 13) % 7 + 1) * 100_000,
+                ask_size=((i * 17) % 5 + 1) * 100_000,
+                ts_event=ts,
+                ts_init=ts,
+            )
+            # Only aggregators which are not cascaded receive the market data
+            for aggregator in aggregators:
+                if aggregator.cascade_parent is None:
+                    aggregator.handle_quote_tick(tick)
+
+    def _cascade(self, aggregators: list[TimeBarAggregator]) -> None:
+        # Each aggregator is rolled up from the previous (finer) aggregator
+        for i in range(1, len(aggregators)):
+            aggregators[i - 1].add_cascade(aggregators[i])
+
+    def _by_bar_type(self, bars: list[Bar]) -> dict[BarType, list[Bar]]:
+        result: dict[BarType, list[Bar]] = {}
+        for bar in bars:
+            result.setdefault(bar.bar_type, []).append(bar)
+        return result
+
+    @pytest.mark.parametrize(
+        ("fine", "coarse", "expected"),
+        [
+            ["AUD/USD.SIM-5-SECOND-MID-INTERNAL", "AUD/USD.SIM-15-SECOND-MID-INTERNAL", True],
+            ["AUD/USD.SIM-1-MINUTE-MID-INTERNAL", "AUD/USD.SIM-1-HOUR-MID-INTERNAL", True],
+            ["AUD/USD.SIM-1-HOUR-MID-INTERNAL", "AUD/USD.SIM-1-DAY-MID-INTERNAL", True],
+            ["AUD/USD.SIM-15-SECOND-MID-INTERNAL", "AUD/USD.SIM-5-SECOND-MID-INTERNAL", False],
+            ["AUD/USD.SIM-1-MINUTE-MID-INTERNAL", "AUD/USD.SIM-1-MINUTE-MID-INTERNAL", False],
+            ["AUD/USD.SIM-2-MINUTE-MID-INTERNAL", "AUD/USD.SIM-3-MINUTE-MID-INTERNAL", False],
+            ["AUD/USD.SIM-1-MINUTE-BID-INTERNAL", "AUD/USD.SIM-5-MINUTE-ASK-INTERNAL", False],
+            ["AUD/USD.SIM-1-DAY-MID-INTERNAL", "AUD/USD.SIM-1-MONTH-MID-INTERNAL", False],
+        ],
+    )
+    def test_is_cascadable(self, fine: str, coarse: str, expected: bool):
+        # Arrange
+        clock = TestClock()
+        clock.set_time(1)
+        fine_aggregator = TimeBarAggregator(AUDUSD_SIM, BarType.from_str(fine), [].append, clock)
+        coarse_aggregator = TimeBarAggregator(
+            AUDUSD_SIM, BarType.from_str(coarse), [].append, clock
+        )
+        fine_aggregator.start_timer()
+        coarse_aggregator.start_timer()
+
+        # Act, Assert
+        assert fine_aggregator.is_cascadable(coarse_aggregator) == expected
+
+    def test_is_cascadable_when_closes_not_aligned_returns_false(self):
+        # Arrange
+        clock = TestClock()
+        clock.set_time(1)
+        fine = TimeBarAggregator(
+            AUDUSD_SIM,
+            BarType.from_str("AUD/USD.SIM-1-MINUTE-MID-INTERNAL"),
+            [].append,
+            clock,
+        )
+        coarse = TimeBarAggregator(
+            AUDUSD_SIM,
+            BarType.from_str("AUD/USD.SIM-5-MINUTE-MID-INTERNAL"),
+            [].append,
+            clock,
+            time_bars_origin_offset=pd.Timedelta(seconds=30),
+        )
+        fine.start_timer()
+        coarse.start_timer()
+
+        # Act, Assert
+        assert not fine.is_cascadable(coarse)
+
+    def test_add_cascade_when_not_cascadable_raises(self):
+        # Arrange
+        clock = TestClock()
+        clock.set_time(1)
+        fine, coarse = self._aggregators(clock, [], specs=("5-SECOND", "15-SECOND"))
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            coarse.add_cascade(fine)
+
+    def test_add_cascade_keeps_timer_of_cascaded_aggregator(self):
+        # Arrange
+        clock = TestClock()
+        clock.set_time(1)
+        fine, coarse = self._aggregators(clock, [], specs=("5-SECOND", "15-SECOND"))
+
+        # Act
+        fine.add_cascade(coarse)
+
+        # Assert
+        assert coarse.cascade_parent is fine
+        assert fine.cascade() == [coarse]
+        assert sorted(clock.timer_names) == [
+            "TIME_BAR_AUD/USD.SIM-15-SECOND-MID-INTERNAL",
+            "TIME_BAR_AUD/USD.SIM-5-SECOND-MID-INTERNAL",
+        ]
+
+    def test_cascade_bars_match_independent_aggregation(self):
+        # Arrange
+        clock1 = TestClock()
+        clock2 = TestClock()
+        clock1.set_time(NANOSECONDS_IN_SECOND)
+        clock2.set_time(NANOSECONDS_IN_SECOND)
+        independent: list[Bar] = []
+        cascaded: list[Bar] = []
+        aggregators1 = self._aggregators(clock1, independent)
+        aggregators2 = self._aggregators(clock2, cascaded)
+
+        # Act
+        self._cascade(aggregators2)
+
+        self._run(clock1, aggregators1, 0, 400)
+        self._run(clock2, aggregators2, 0, 400)
+
+        # Assert
+        assert len(self._by_bar_type(independent)) == 4
+        assert self._by_bar_type(cascaded) == self._by_bar_type(independent)
+
+    def test_cascade_emits_bars_in_same_order_as_independent_aggregation(self):
+        # Arrange
+        clock1 = TestClock()
+        clock2 = TestClock()
+        clock1.set_time(NANOSECONDS_IN_SECOND)
+        clock2.set_time(NANOSECONDS_IN_SECOND)
+        independent: list[Bar] = []
+        cascaded: list[Bar] = []
+        aggregators1: list[TimeBarAggregator] = []
+        aggregators2: list[TimeBarAggregator] = []
+
+        # Timer names sort coarser bars (e.g. 15-SECOND) before finer bars (e.g. 5-SECOND),
+        # and interleave the bars of separate cascades for other price types
+        for price_type in ("MID", "BID"):
+            aggregators1 += self._aggregators(clock1, independent, price_type=price_type)
+            cascade = self._aggregators(clock2, cascaded, price_type=price_type)
+            self._cascade(cascade)
+            aggregators2 += cascade
+
+        # Act
+        self._run(clock1, aggregators1, 0, 400)
+        self._run(clock2, aggregators2, 0, 400)
+
+        # Assert
+        last_minute = [bar for bar in cascaded if bar.ts_event == 60 * NANOSECONDS_IN_SECOND]
+        assert [str(bar.bar_type.spec) for bar in last_minute] == [
+            "1-MINUTE-BID",
+            "1-MINUTE-MID",
+            "15-SECOND-BID",
+            "15-SECOND-MID",
+            "5-SECOND-BID",
+            "5-SECOND-MID",
+        ]
+        assert len(self._by_bar_type(independent)) == 8
+        assert cascaded == independent
+
+    @pytest.mark.parametrize("start", [33, 40])
+    def test_cascade_added_mid_interval_matches_independent_aggregation(self, start: int):
+        # Arrange
+        clock1 = TestClock()
+        clock2 = TestClock()
+        clock1.set_time(NANOSECONDS_IN_SECOND)
+        clock2.set_time(NANOSECONDS_IN_SECOND)
+        independent: list[Bar] = []
+        cascaded: list[Bar] = []
+        aggregators1 = self._aggregators(clock1, independent, specs=("5-SECOND", "5-MINUTE"))
+        aggregators2 = self._aggregators(clock2, cascaded, specs=("5-SECOND", "5-MINUTE"))
+        self._run(clock1, aggregators1, 0, start)
+        self._run(clock2, aggregators2, 0, start)
+
+        # Act
+        aggregators1 += self._aggregators(clock1, independent, specs=("15-SECOND", "1-MINUTE"))
+        aggregators2 += self._aggregators(clock2, cascaded, specs=("15-SECOND", "1-MINUTE"))
+        aggregators2[0].add_cascade(aggregators2[2])  # 5-SECOND -> 15-SECOND (pending)
+        aggregators2[2].add_cascade(aggregators2[3])  # 15-SECOND -> 1-MINUTE (pending)
+        aggregators2[3].add_cascade(aggregators2[1])  # 1-MINUTE -> 5-MINUTE (pending)
+
+        self._run(clock1, aggregators1, start, 400)
+        self._run(clock2, aggregators2, start, 400)
+
+        # Assert
+        assert len(self._by_bar_type(independent)) == 4
+        assert self._by_bar_type(cascaded) == self._by_bar_type(independent)
+
+    @pytest.mark.parametrize("index", [0, 1, 2])
+    def test_remove_cascade_mid_interval_matches_independent_aggregation(self, index: int):
+        # Arrange
+        clock1 = TestClock()
+        clock2 = TestClock()
+        clock1.set_time(NANOSECONDS_IN_SECOND)
+        clock2.set_time(NANOSECONDS_IN_SECOND)
+        independent: list[Bar] = []
+        cascaded: list[Bar] = []
+        aggregators1 = self._aggregators(clock1, independent)
+        aggregators2 = self._aggregators(clock2, cascaded)
+        self._cascade(aggregators2)
+
+        self._run(clock1, aggregators1, 0, 100)
+        self._run(clock2, aggregators2, 0, 100)
+
+        # Act
+        aggregators2[index].remove_cascade(aggregators2[index + 1])
+
+        self._run(clock1, aggregators1, 100, 400)
+        self._run(clock2, aggregators2, 100, 400)
+
+        # Assert
+        assert aggregators2[index + 1].cascade_parent is None
+        assert len(clock2.timer_names) == 4
+        assert self._by_bar_type(cascaded) == self._by_bar_type(independent)
+
+
 class TestTimeBarAggregatorHistoricalMode:
     def setup(self):
         # Fixture Setup
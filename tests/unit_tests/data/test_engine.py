@@ -5231,6 +5231,178 @@ class TestDataEngine:
         assert bars_1_received[-1] == expected_last_1_minute_bar
         assert bars_2_received[-1] == expected_last_2_minute_bar
 
+    @pytest.mark.parametrize(
+        ("filename", "request_cls", "price_type"),
+        [
+            ["futures_mbp-1_2024-07-01T23-58_2024-07-02T00-02.dbn.zst", RequestQuoteTicks, "BID"],
+            ["futures_trades_2024-07-01T23-58_2024-07-02T00-02.dbn.zst", RequestTradeTicks, "LAST"],
+        ],
+    )
+    def test_request_aggregated_bars_vectorized_matches_tick_by_tick(
+        self,
+        tmp_path,
+        filename,
+        request_cls,
+        price_type,
+    ):
+        # Arrange
+        loader = DatabentoDataLoader()
+        loader.set_price_precision("ESU4", 2)
+        loader.set_price_precision("NQU4", 2)
+
+        catalog_dir = TEST_DATA_DIR / "databento" / "historical_bars_catalog" / "databento"
+        data = loader.from_dbn_file(catalog_dir / filename, as_legacy_cython=True)
+        definition = loader.from_dbn_file(
+            catalog_dir / "futures_definition.dbn.zst",
+            as_legacy_cython=True,
+        )
+
+        utc_now = pd.Timestamp("2024-07-02T00:00:01")
+        bar_types = (
+            BarType.from_str(f"ESU4.GLBX-1-MINUTE-{price_type}-INTERNAL"),
+            BarType.from_str(f"ESU4.GLBX-10-TICK-{price_type}-INTERNAL"),
+            BarType.from_str(f"ESU4.GLBX-2-MINUTE-{price_type}-INTERNAL@1-MINUTE-INTERNAL"),
+        )
+
+        def request_bars(vectorized: bool) -> dict[BarType, list[Bar]]:
+            clock = TestClock()
+            clock.advance_time(utc_now.value)
+            msgbus = MessageBus(trader_id=self.trader_id, clock=clock)
+            data_engine = DataEngine(
+                msgbus=msgbus,
+                cache=TestComponentStubs.cache(),
+                clock=clock,
+                config=DataEngineConfig(vectorized_bar_aggregation=vectorized),
+            )
+
+            catalog = setup_catalog(protocol="file", path=tmp_path / f"catalog_{vectorized}")
+            catalog.write_data(data)
+            catalog.write_data(definition)
+            data_engine.register_catalog(catalog)
+            data_engine.process(definition[0])
+
+            received: dict[BarType, list[Bar]] = {bar_type: [] for bar_type in bar_types}
+            for bar_type, bars in received.items():
+                msgbus.subscribe(
+                    topic=f"historical.data.bars.{bar_type.standard()}",
+                    handler=bars.append,
+                )
+
+            request = request_cls(
+                instrument_id=bar_types[0].instrument_id,
+                start=utc_now - pd.Timedelta(minutes=2, seconds=1),
+                end=utc_now,
+                limit=0,
+                client_id=None,
+                venue=bar_types[0].instrument_id.venue,
+                callback=lambda response: None,
+                request_id=UUID4(),
+                ts_init=clock.timestamp_ns(),
+                params={
+                    "bar_type": bar_types[0].composite(),
+                    "bar_types": bar_types,
+                    "include_external_data": False,
+                    "update_subscriptions": False,
+                    "update_catalog": False,
+                },
+            )
+            msgbus.request(endpoint="DataEngine.request", request=request)
+
+            return received
+
+        # Act
+        expected = request_bars(vectorized=False)
+        result = request_bars(vectorized=True)
+
+        # Assert
+        assert expected[bar_types[0]]
+        assert expected[bar_types[1]]
+        assert result == expected
+
+    def test_subscribe_time_bars_with_cascade_matches_independent_aggregation(self):
+        # Arrange
+        bar_types = [
+            BarType.from_str(f"{ETHUSDT_BINANCE.id}-{step}-MINUTE-LAST-INTERNAL")
+            for step in (5, 1, 15)
+        ]
+
+        def subscribe_bars(cascade: bool) -> tuple[DataEngine, dict[BarType, list[Bar]]]:
+            clock = TestClock()
+            clock.set_time(1_000_000_000)
+            msgbus = MessageBus(trader_id=self.trader_id, clock=clock)
+            cache = TestComponentStubs.cache()
+            cache.add_instrument(ETHUSDT_BINANCE)
+            data_engine = DataEngine(
+                msgbus=msgbus,
+                cache=cache,
+                clock=clock,
+                config=DataEngineConfig(time_bars_cascade=cascade),
+            )
+            client = BacktestMarketDataClient(
+                client_id=ClientId(BINANCE.value),
+                msgbus=msgbus,
+                cache=cache,
+                clock=clock,
+            )
+            data_engine.register_client(client)
+            client.start()
+
+            received: dict[BarType, list[Bar]] = {bar_type: [] for bar_type in bar_types}
+            for bar_type, bars in received.items():
+                msgbus.subscribe(topic=f"data.bars.{bar_type}", handler=bars.append)
+
+            for i in range(1_200):  # 20 minutes of trades
+                if i in (0, 100):
+                    # Subscribe 5-minute then 1-minute bars, and 15-minute bars mid-interval
+                    for bar_type in bar_types[:2] if i == 0 else bar_types[2:]:
+                        data_engine.execute(
+                            SubscribeBars(
+                                client_id=None,
+                                venue=BINANCE,
+                                bar_type=bar_type,
+                                command_id=UUID4(),
+                                ts_init=clock.timestamp_ns(),
+                            ),
+                        )
+                elif i == 700:
+                    data_engine.execute(
+                        UnsubscribeBars(
+                            client_id=None,
+                            venue=BINANCE,
+                            bar_type=bar_types[1],
+                            command_id=UUID4(),
+                            ts_init=clock.timestamp_ns(),
+                        ),
+                    )
+
+                ts = 1_000_000_000 + i * 1_000_000_000 + 500_000_000
+                for event in clock.advance_time(ts):
+                    event.handle()
+
+                data_engine.process(
+                    TestDataStubs.trade_tick(
+                        instrument=ETHUSDT_BINANCE,
+                        price=1000.00 + (i * 37) % 23,
+                        size=((i * 13) % 7 + 1) * 0.1,
+                        ts_event=ts,
+                        ts_init=ts,
+                    ),
+                )
+
+            return data_engine, received
+
+        # Act
+        _, expected = subscribe_bars(cascade=False)
+        data_engine, result = subscribe_bars(cascade=True)
+
+        # Assert
+        aggregators = data_engine._cascadable_bar_aggregators
+        assert aggregators[bar_types[0]].cascade_parent is None
+        assert aggregators[bar_types[2]].cascade_parent is aggregators[bar_types[0]]
+        assert len(expected[bar_types[1]]) == 11
+        assert len(expected[bar_types[2]]) == 1
+        assert result == expected
+
     def test_request_aggregated_bars_does_not_pollute_subscription_aggregator(self):
         # Test that requesting aggregated bars (with update_subscriptions=False) for the same
         # bar type as an active subscription does not pollute/interfere with the subscription aggregator.
@@ -0,0 +1,240 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pandas as pd
+import pytest
+
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.data.aggregation import TickBarAggregator
+from nautilus_trader.data.aggregation import TimeBarAggregator
+from nautilus_trader.data.aggregation import ValueBarAggregator
+from nautilus_trader.data.aggregation import VolumeBarAggregator
+from nautilus_trader.data.vectorized import aggregate_bars
+from nautilus_trader.data.vectorized import aggregate_catalog_bars
+from nautilus_trader.data.vectorized import is_vectorizable
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
+from nautilus_trader.persistence.wranglers import TradeTickDataWrangler
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+from nautilus_trader.test_kit.mocks.data import load_catalog_with_stub_quote_ticks_audusd
+from nautilus_trader.test_kit.mocks.data import setup_catalog
+from nautilus_trader.test_kit.providers import TestDataProvider
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
+
+
+@pytest.fixture(name="quotes", scope="module")
+def fixture_quotes() -> list[QuoteTick]:
+    wrangler = QuoteTickDataWrangler(AUDUSD_SIM)
+    ticks = wrangler.process(TestDataProvider().read_csv_ticks("truefx/audusd-ticks.csv")[:20_000])
+    ticks.sort(key=lambda x: x.ts_init)  # CAUTION: data was not originally sorted
+    return ticks
+
+
+@pytest.fixture(name="trades", scope="module")
+def fixture_trades() -> list[TradeTick]:
+    wrangler = TradeTickDataWrangler(instrument=ETHUSDT_BINANCE)
+    return wrangler.process(TestDataProvider().read_csv_ticks("binance/ethusdt-trades.csv"))
+
+
+def _streaming_bars(
+    ticks: list[QuoteTick] | list[TradeTick],
+    instrument: Instrument,
+    bar_type: BarType,
+    **kwargs,
+) -> list[Bar]:
+    handler: list[Bar] = []
+    aggregation = bar_type.spec.aggregation
+    if aggregation == BarAggregation.TICK:
+        aggregator = TickBarAggregator(instrument, bar_type, handler.append)
+    elif aggregation == BarAggregation.VOLUME:
+        aggregator = VolumeBarAggregator(instrument, bar_type, handler.append)
+    elif aggregation == BarAggregation.VALUE:
+        aggregator = ValueBarAggregator(instrument, bar_type, handler.append)
+    else:
+        aggregator = TimeBarAggregator(
+            instrument=instrument,
+            bar_type=bar_type,
+            handler=handler.append,
+            clock=TestClock(),
+            **kwargs,
+        )
+        aggregator.set_historical_mode(True, handler.append)
+
+    for tick in ticks:
+        if isinstance(tick, QuoteTick):
+            aggregator.handle_quote_tick(tick)
+        else:
+            aggregator.handle_trade_tick(tick)
+
+    return handler
+
+
+@pytest.mark.parametrize(
+    ("bar_type", "expected"),
+    [
+        ["AUD/USD.SIM-1-MINUTE-BID-INTERNAL", True],
+        ["AUD/USD.SIM-100-TICK-MID-INTERNAL", True],
+        ["AUD/USD.SIM-1000-VOLUME-ASK-INTERNAL", True],
+        ["AUD/USD.SIM-1000-VALUE-ASK-INTERNAL", True],
+        ["AUD/USD.SIM-1-MONTH-BID-INTERNAL", False],
+        ["AUD/USD.SIM-100-TICK_IMBALANCE-BID-INTERNAL", False],
+        ["AUD/USD.SIM-5-MINUTE-BID-INTERNAL@1-MINUTE-EXTERNAL", False],
+    ],
+)
+def test_is_vectorizable(bar_type: str, expected: bool) -> None:
+    # Arrange, Act, Assert
+    assert is_vectorizable(BarType.from_str(bar_type)) == expected
+
+
+def test_aggregate_bars_with_empty_table_returns_empty_list(quotes: list[QuoteTick]) -> None:
+    # Arrange
+    table = ArrowSerializer.serialize_batch(quotes[:10], QuoteTick).slice(0, 0)
+    bar_type = BarType.from_str("AUD/USD.SIM-1-MINUTE-BID-INTERNAL")
+
+    # Act
+    bars = aggregate_bars(table, AUDUSD_SIM, bar_type)
+
+    # Assert
+    assert bars == []
+
+
+def test_aggregate_bars_with_unsorted_table_raises(quotes: list[QuoteTick]) -> None:
+    # Arrange
+    table = ArrowSerializer.serialize_batch(list(reversed(quotes[:10])), QuoteTick)
+    bar_type = BarType.from_str("AUD/USD.SIM-1-MINUTE-BID-INTERNAL")
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        aggregate_bars(table, AUDUSD_SIM, bar_type)
+
+
+def test_aggregate_bars_with_non_vectorizable_bar_type_raises(quotes: list[QuoteTick]) -> None:
+    # Arrange
+    table = ArrowSerializer.serialize_batch(quotes[:10], QuoteTick)
+    bar_type = BarType.from_str("AUD/USD.SIM-100-TICK_RUNS-BID-INTERNAL")
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        aggregate_bars(table, AUDUSD_SIM, bar_type)
+
+
+@pytest.mark.parametrize(
+    "bar_type",
+    [
+        "AUD/USD.SIM-15-SECOND-BID-INTERNAL",
+        "AUD/USD.SIM-1-MINUTE-MID-INTERNAL",
+        "AUD/USD.SIM-100-TICK-ASK-INTERNAL",
+        "AUD/USD.SIM-99-TICK-MID-INTERNAL",
+        "AUD/USD.SIM-10000000-VOLUME-BID-INTERNAL",
+        "AUD/USD.SIM-25000000-VOLUME-MID-INTERNAL",
+        "AUD/USD.SIM-5000000-VALUE-ASK-INTERNAL",
+        "AUD/USD.SIM-3333333-VALUE-MID-INTERNAL",
+    ],
+)
+def test_aggregate_quote_bars_matches_streaming_aggregator(
+    quotes: list[QuoteTick],
+    bar_type: str,
+) -> None:
+    # Arrange
+    bar_type = BarType.from_str(bar_type)
+    table = ArrowSerializer.serialize_batch(quotes, QuoteTick)
+    expected = _streaming_bars(quotes, AUDUSD_SIM, bar_type)
+
+    # Act
+    bars = aggregate_bars(table, AUDUSD_SIM, bar_type)
+
+    # Assert
+    assert len(expected) > 10
+    assert bars == expected
+
+
+@pytest.mark.parametrize(
+    "bar_type",
+    [
+        "ETHUSDT.BINANCE-1-MINUTE-LAST-INTERNAL",
+        "ETHUSDT.BINANCE-250-MILLISECOND-LAST-INTERNAL",
+        "ETHUSDT.BINANCE-1000-TICK-LAST-INTERNAL",
+        "ETHUSDT.BINANCE-1000-VOLUME-LAST-INTERNAL",
+        "ETHUSDT.BINANCE-100000-VALUE-LAST-INTERNAL",
+    ],
+)
+def test_aggregate_trade_bars_matches_streaming_aggregator(
+    trades: list[TradeTick],
+    bar_type: str,
+) -> None:
+    # Arrange
+    bar_type = BarType.from_str(bar_type)
+    table = ArrowSerializer.serialize_batch(trades, TradeTick)
+    expected = _streaming_bars(trades, ETHUSDT_BINANCE, bar_type)
+
+    # Act
+    bars = aggregate_bars(table, ETHUSDT_BINANCE, bar_type)
+
+    # Assert
+    assert len(expected) > 10
+    assert bars == expected
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"interval_type": "right-open"},
+        {"timestamp_on_close": False},
+        {"skip_first_non_full_bar": True},
+        {"build_with_no_updates": False},
+        {"time_bars_origin_offset": pd.Timedelta(seconds=20)},
+        {"bar_build_delay": 15},
+    ],
+)
+def test_aggregate_time_bars_with_options_matches_streaming_aggregator(
+    trades: list[TradeTick],
+    kwargs: dict,
+) -> None:
+    # Arrange
+    bar_type = BarType.from_str("ETHUSDT.BINANCE-5-SECOND-LAST-INTERNAL")
+    table = ArrowSerializer.serialize_batch(trades, TradeTick)
+    expected = _streaming_bars(trades, ETHUSDT_BINANCE, bar_type, **kwargs)
+
+    # Act
+    bars = aggregate_bars(table, ETHUSDT_BINANCE, bar_type, **kwargs)
+
+    # Assert
+    assert len(expected) > 10
+    assert bars == expected
+
+
+def test_aggregate_catalog_bars_writes_bars_to_catalog(tmp_path) -> None:
+    # Arrange
+    catalog = setup_catalog(protocol="file", path=tmp_path / "catalog")
+    load_catalog_with_stub_quote_ticks_audusd(catalog)
+    bar_type = BarType.from_str("AUD/USD.SIM-1-MINUTE-BID-INTERNAL")
+    quotes = catalog.quote_ticks(instrument_ids=[AUDUSD_SIM.id.value])
+    expected = _streaming_bars(quotes, AUDUSD_SIM, bar_type)
+
+    # Act
+    bars = aggregate_catalog_bars(catalog, bar_type)
+
+    # Assert
+    assert bars == expected
+    assert catalog.bars(bar_types=[str(bar_type)]) == expected
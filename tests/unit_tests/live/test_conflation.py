@@ -0,0 +1,169 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.live.conflation import ConflationSlot
+from nautilus_trader.live.conflation import DataConflator
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+def _conflator() -> DataConflator:
+    return DataConflator(
+        policies={"QuoteTick": "latest", "OrderBookDeltas": "merge"},
+        maxsize=10,
+        threshold=0.5,
+    )
+
+
+@pytest.mark.parametrize(
+    "policies",
+    [
+        {"TradeTick": "latest"},
+        {"QuoteTick": "merge"},
+        {"OrderBookDeltas": "latest"},
+        {"QuoteTick": "newest"},
+    ],
+)
+def test_invalid_policies_raise(policies: dict[str, str]) -> None:
+    # Arrange, Act, Assert
+    with pytest.raises(ValueError):
+        DataConflator(policies=policies, maxsize=10, threshold=0.5)
+
+
+def test_conflate_below_threshold_returns_data() -> None:
+    # Arrange
+    conflator = _conflator()
+    quote = TestDataStubs.quote_tick()
+
+    # Act
+    item = conflator.conflate(quote, qsize=4)
+
+    # Assert
+    assert item is quote
+    assert conflator.counts() == {}
+
+
+def test_conflate_data_type_without_policy_returns_data() -> None:
+    # Arrange
+    conflator = _conflator()
+    trade = TestDataStubs.trade_tick()
+
+    # Act
+    item = conflator.conflate(trade, qsize=10)
+
+    # Assert
+    assert item is trade
+    assert not conflator.is_conflated(trade)
+
+
+def test_conflate_latest_keeps_newest_per_instrument() -> None:
+    # Arrange
+    conflator = _conflator()
+    quote1 = TestDataStubs.quote_tick(bid_price=1.0, ts_init=1)
+    quote2 = TestDataStubs.quote_tick(bid_price=2.0, ts_init=2)
+    quote3 = TestDataStubs.quote_tick(bid_price=3.0, ts_init=3)
+
+    # Act
+    slot = conflator.conflate(quote1, qsize=5)
+    item2 = conflator.conflate(quote2, qsize=6)
+    item3 = conflator.conflate(quote3, qsize=7)
+
+    # Assert
+    assert isinstance(slot, ConflationSlot)
+    assert item2 is None
+    assert item3 is None
+    assert conflator.pending_count() == 1
+    assert conflator.take(slot) == quote3
+    assert conflator.pending_count() == 0
+    assert conflator.counts() == {"QuoteTick": 2}
+
+
+def test_conflate_merge_combines_pending_deltas() -> None:
+    # Arrange
+    conflator = _conflator()
+    deltas1 = TestDataStubs.order_book_deltas()
+    deltas2 = TestDataStubs.order_book_deltas()
+
+    # Act
+    slot = conflator.conflate(deltas1, qsize=5)
+    conflator.conflate(deltas2, qsize=5)
+    merged = conflator.take(slot)
+
+    # Assert
+    assert isinstance(merged, OrderBookDeltas)
+    assert merged.instrument_id == deltas1.instrument_id
+    assert merged.deltas == deltas1.deltas + deltas2.deltas
+    assert conflator.counts() == {"OrderBookDeltas": 1}
+
+
+def test_conflate_after_take_creates_new_slot() -> None:
+    # Arrange
+    conflator = _conflator()
+    quote1 = TestDataStubs.quote_tick(ts_init=1)
+    quote2 = TestDataStubs.quote_tick(ts_init=2)
+    slot1 = conflator.conflate(quote1, qsize=5)
+    conflator.take(slot1)
+
+    # Act
+    slot2 = conflator.conflate(quote2, qsize=5)
+
+    # Assert
+    assert isinstance(slot2, ConflationSlot)
+    assert slot2 is not slot1
+    assert conflator.take(slot2) == quote2
+
+
+def test_conflate_pending_slot_absorbs_data_below_threshold() -> None:
+    # Arrange
+    conflator = _conflator()
+    quote1 = TestDataStubs.quote_tick(bid_price=1.0, ts_init=1)
+    quote2 = TestDataStubs.quote_tick(bid_price=2.0, ts_init=2)
+    quote3 = TestDataStubs.quote_tick(bid_price=3.0, ts_init=3)
+
+    # Act
+    slot = conflator.conflate(quote1, qsize=5)  # Above threshold
+    item2 = conflator.conflate(quote2, qsize=2)  # Below threshold while slot pending
+    item3 = conflator.conflate(quote3, qsize=6)  # Above threshold again
+
+    # Assert
+    assert isinstance(slot, ConflationSlot)
+    assert item2 is None  # Not queued behind the pending slot
+    assert item3 is None
+    assert conflator.take(slot) == quote3
+    assert conflator.counts() == {"QuoteTick": 2}
+
+
+def test_conflate_merge_keeps_delta_order_across_threshold() -> None:
+    # Arrange
+    conflator = _conflator()
+    deltas1 = TestDataStubs.order_book_deltas()
+    deltas2 = TestDataStubs.order_book_deltas()
+    deltas3 = TestDataStubs.order_book_deltas()
+
+    # Act
+    slot = conflator.conflate(deltas1, qsize=5)
+    item2 = conflator.conflate(deltas2, qsize=1)
+    item3 = conflator.conflate(deltas3, qsize=9)
+    merged = conflator.take(slot)
+
+    # Assert
+    assert item2 is None
+    assert item3 is None
+    assert merged.deltas == deltas1.deltas + deltas2.deltas + deltas3.deltas
+
+    # Below threshold with no pending slot, data is queued as is again
+    assert conflator.conflate(deltas1, qsize=1) is deltas1
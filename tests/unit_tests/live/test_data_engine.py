@@ -371,6 +371,86 @@ class TestLiveDataEngine:
         # Tear Down
         self.engine.stop()
 
+    @pytest.mark.asyncio
+    async def test_process_data_with_ring_buffer_queues_processes_data(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+        self.msgbus.deregister(
+            endpoint="DataEngine.process_historical",
+            handler=self.engine.process_historical,
+        )
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=LiveDataEngineConfig(
+                use_ring_buffer_queues=True,
+                queue_batch_size=10,
+                queue_latency_histograms=True,
+            ),
+        )
+        self.engine.start()
+
+        # Act
+        for _ in range(25):
+            self.engine.process(TestDataStubs.trade_tick())
+
+        # Assert
+        await eventually(lambda: self.engine.data_count == 25)
+        assert self.engine.data_qsize() == 0
+        assert self.engine.queue_high_water_marks()["data_queue"] >= 1
+        assert sum(self.engine.queue_latency_histograms()["data_queue"].values()) == 25
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_data_with_conflation_under_backpressure(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+        self.msgbus.deregister(
+            endpoint="DataEngine.process_historical",
+            handler=self.engine.process_historical,
+        )
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=LiveDataEngineConfig(
+                qsize=10,
+                use_ring_buffer_queues=True,
+                conflation_policies={"QuoteTick": "latest"},
+                conflation_threshold=0.5,
+            ),
+        )
+
+        # Act (engine not running so the queue fills)
+        for i in range(5):
+            self.engine.process(TestDataStubs.trade_tick(ts_init=i))
+        for i in range(100):
+            self.engine.process(TestDataStubs.quote_tick(ts_init=i))
+        self.engine.process(TestDataStubs.trade_tick(ts_init=100))
+
+        # Assert
+        assert self.engine.data_qsize() == 7  # Trades never conflated
+        assert self.engine.conflation_counts() == {"QuoteTick": 99}
+
+        self.engine.start()
+        await eventually(lambda: self.engine.data_count == 7)
+
+        # Tear Down
+        self.engine.stop()
+
     @pytest.mark.asyncio
     async def test_graceful_shutdown_on_exception_enabled_calls_shutdown_system(self):
         """
@@ -20,6 +20,7 @@ import pytest
 
 from nautilus_trader.common.component import Logger
 from nautilus_trader.common.component import TestClock
+from nautilus_trader.live.enqueue import RingBufferQueue
 from nautilus_trader.live.enqueue import ThrottledEnqueuer
 from nautilus_trader.test_kit.functions import eventually
 
@@ -102,3 +103,118 @@ async def test_enqueue_when_queue_is_full(event_loop, clock, logger):
 
     # Assert: check queue is still size=1
     assert queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_ring_buffer_get_batch_drains_up_to_batch_size(event_loop):
+    # Arrange
+    queue = RingBufferQueue(maxsize=100, loop=event_loop, batch_size=3)
+    for i in range(5):
+        queue.put_nowait(i)
+
+    # Act
+    batch1 = await queue.get_batch()
+    batch2 = await queue.get_batch()
+
+    # Assert
+    assert batch1 == [0, 1, 2]
+    assert batch2 == [3, 4]
+    assert queue.empty()
+    assert queue.high_water_mark == 5
+
+
+@pytest.mark.asyncio
+async def test_ring_buffer_get_batch_ends_at_sentinel(event_loop):
+    # Arrange
+    queue = RingBufferQueue(maxsize=100, loop=event_loop)
+    queue.put_nowait("message1")
+    queue.put_nowait(None)
+    queue.put_nowait("message2")
+
+    # Act
+    batch = await queue.get_batch()
+
+    # Assert
+    assert batch == ["message1", None]
+    assert queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_ring_buffer_put_nowait_when_full_raises(event_loop):
+    # Arrange
+    queue = RingBufferQueue(maxsize=1, loop=event_loop)
+    queue.put_nowait("message1")
+
+    # Act, Assert
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait("message2")
+
+
+@pytest.mark.asyncio
+async def test_ring_buffer_waiting_consumer_woken_by_producer(event_loop):
+    # Arrange
+    queue = RingBufferQueue(maxsize=100, loop=event_loop)
+    task = event_loop.create_task(queue.get_batch())
+    await asyncio.sleep(0)  # Consumer now waiting
+
+    # Act
+    queue.put_nowait("message1")
+    queue.put_nowait("message2")
+    batch = await asyncio.wait_for(task, timeout=1.0)
+
+    # Assert
+    assert batch == ["message1", "message2"]
+
+
+@pytest.mark.asyncio
+async def test_ring_buffer_put_waits_for_capacity(event_loop):
+    # Arrange
+    queue = RingBufferQueue(maxsize=1, loop=event_loop)
+    queue.put_nowait("message1")
+    task = event_loop.create_task(queue.put("message2"))
+    await asyncio.sleep(0)
+
+    # Act
+    first = queue.get_nowait()
+    await asyncio.wait_for(task, timeout=1.0)
+
+    # Assert
+    assert first == "message1"
+    assert queue.get_nowait() == "message2"
+
+
+@pytest.mark.asyncio
+async def test_ring_buffer_latency_histogram_counts_messages(event_loop):
+    # Arrange
+    queue = RingBufferQueue(maxsize=100, loop=event_loop, latency_histogram=True)
+    queue.put_nowait("message1")
+    queue.put_nowait("message2")
+
+    # Act
+    await queue.get_batch()
+    histogram = queue.latency_histogram()
+
+    # Assert
+    assert sum(histogram.values()) == 2
+    assert min(histogram) == 1_024
+
+
+@pytest.mark.asyncio
+async def test_enqueue_with_ring_buffer_queue(event_loop, clock, logger):
+    # Arrange
+    queue = RingBufferQueue(maxsize=10, loop=event_loop)
+    enqueuer = ThrottledEnqueuer(
+        qname="test_queue",
+        queue=queue,
+        loop=event_loop,
+        clock=clock,
+        logger=logger,
+    )
+
+    # Act
+    enqueuer.enqueue("message1")
+
+    # Assert
+    assert queue.get_nowait() == "message1"
+    assert enqueuer.high_water_mark == 1
+    assert enqueuer.latency_histogram() == {}
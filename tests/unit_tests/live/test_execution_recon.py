@@ -4074,6 +4074,82 @@ async def test_query_and_find_missing_fills_no_missing(
     assert not had_fill_query_errors
 
 
+@pytest.mark.asyncio
+async def test_query_and_find_missing_fills_with_trimmed_fills_no_missing(
+    live_exec_engine,
+    exec_client,
+    cache,
+    account_id,
+):
+    """
+    Test _query_and_find_missing_fills treats fills trimmed from a bounded event history
+    as cached.
+    """
+    # Arrange
+    live_exec_engine.register_client(exec_client)
+
+    order = TestExecStubs.limit_order(instrument=AUDUSD_SIM)
+    order.set_event_history_limit(1)
+    cache.add_order(order)
+
+    submitted = TestEventStubs.order_submitted(order, account_id=account_id)
+    order.apply(submitted)
+    live_exec_engine.process(submitted)
+
+    accepted = TestEventStubs.order_accepted(
+        order,
+        account_id=account_id,
+        venue_order_id=VenueOrderId("V-1"),
+    )
+    order.apply(accepted)
+    live_exec_engine.process(accepted)
+
+    current_ns = live_exec_engine._clock.timestamp_ns()
+    fill_reports = []
+    for i in range(2):
+        filled = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            last_qty=Quantity.from_int(50),
+            trade_id=TradeId(f"T-{i}"),
+        )
+        order.apply(filled)
+        live_exec_engine.process(filled)
+        fill_reports.append(
+            FillReport(
+                account_id=account_id,
+                instrument_id=AUDUSD_SIM.id,
+                client_order_id=order.client_order_id,
+                venue_order_id=VenueOrderId("V-1"),
+                venue_position_id=None,
+                trade_id=TradeId(f"T-{i}"),
+                order_side=OrderSide.BUY,
+                last_qty=Quantity.from_int(50),
+                last_px=Price.from_str("1.00000"),
+                commission=Money("1.00", USD),
+                liquidity_side=LiquiditySide.TAKER,
+                report_id=UUID4(),
+                ts_event=current_ns + i,
+                ts_init=current_ns + i,
+            ),
+        )
+
+    cache.update_order(order)
+    exec_client.add_fill_reports(VenueOrderId("V-1"), fill_reports)
+
+    # Act
+    missing_fills, had_fill_query_errors = await live_exec_engine._query_and_find_missing_fills(
+        AUDUSD_SIM.id,
+        live_exec_engine._clients.values(),
+    )
+
+    # Assert
+    assert TradeId("T-0") not in order.trade_ids
+    assert len(missing_fills) == 0
+    assert not had_fill_query_errors
+    assert live_exec_engine._check_and_skip_duplicate_fill(order, fill_reports[0]) is True
+
+
 # Tests for _reconcile_missing_fills
 
 
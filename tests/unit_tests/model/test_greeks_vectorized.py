@@ -0,0 +1,198 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from nautilus_trader.core.nautilus_pyo3 import black_scholes_greeks
+from nautilus_trader.core.nautilus_pyo3 import imply_vol
+from nautilus_trader.model.greeks_vectorized import black_scholes_greeks_vectorized
+from nautilus_trader.model.greeks_vectorized import imply_vol_and_greeks_vectorized
+from nautilus_trader.model.greeks_vectorized import imply_vol_vectorized
+from nautilus_trader.model.greeks_vectorized import modify_greeks_vectorized
+
+
+def _make_chain(count: int = 200, seed: int = 42) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    s = rng.uniform(50.0, 150.0, count)
+    r = rng.uniform(0.0, 0.08, count)
+    return {
+        "s": s,
+        "r": r,
+        "b": r - rng.uniform(0.0, 0.03, count),
+        "vol": rng.uniform(0.1, 0.8, count),
+        "is_call": rng.random(count) < 0.5,
+        "k": s * rng.uniform(0.9, 1.1, count),
+        "t": rng.uniform(30.0, 365.0, count) / 365.25,
+    }
+
+
+def test_black_scholes_greeks_vectorized_matches_scalar():
+    # Arrange
+    chain = _make_chain()
+
+    # Act
+    result = black_scholes_greeks_vectorized(**chain)
+
+    # Assert
+    for i in range(len(chain["s"])):
+        expected = black_scholes_greeks(
+            chain["s"][i],
+            chain["r"][i],
+            chain["b"][i],
+            chain["vol"][i],
+            bool(chain["is_call"][i]),
+            chain["k"][i],
+            chain["t"][i],
+        )
+        assert result.price[i] == pytest.approx(expected.price, rel=1e-3, abs=1e-3)
+        assert result.delta[i] == pytest.approx(expected.delta, abs=1e-4)
+        assert result.gamma[i] == pytest.approx(expected.gamma, rel=1e-3, abs=1e-6)
+        assert result.vega[i] == pytest.approx(expected.vega, rel=1e-3, abs=1e-5)
+        assert result.theta[i] == pytest.approx(expected.theta, rel=1e-3, abs=1e-5)
+        assert result.itm_prob[i] == pytest.approx(expected.itm_prob, abs=1e-4)
+
+
+def test_imply_vol_vectorized_recovers_volatility():
+    # Arrange
+    chain = _make_chain()
+    prices = black_scholes_greeks_vectorized(**chain).price
+    vol = chain.pop("vol")
+
+    # Act
+    result = imply_vol_vectorized(price=prices, **chain)
+
+    # Assert
+    np.testing.assert_allclose(result, vol, atol=1e-6)
+
+
+def test_imply_vol_vectorized_matches_scalar():
+    # Arrange
+    chain = _make_chain(count=50)
+    prices = black_scholes_greeks_vectorized(**chain).price
+    chain.pop("vol")
+
+    # Act
+    result = imply_vol_vectorized(price=prices, **chain)
+
+    # Assert
+    for i in range(len(prices)):
+        expected = imply_vol(
+            chain["s"][i],
+            chain["r"][i],
+            chain["b"][i],
+            bool(chain["is_call"][i]),
+            chain["k"][i],
+            chain["t"][i],
+            prices[i],
+        )
+        assert result[i] == pytest.approx(expected, abs=1e-5)
+
+
+def test_imply_vol_vectorized_with_initial_vol():
+    # Arrange
+    chain = _make_chain()
+    prices = black_scholes_greeks_vectorized(**chain).price
+    vol = chain.pop("vol")
+
+    # Act
+    result = imply_vol_vectorized(price=prices, initial_vol=vol * 1.2, **chain)
+
+    # Assert
+    np.testing.assert_allclose(result, vol, atol=1e-6)
+
+
+def test_imply_vol_vectorized_returns_zero_outside_arbitrage_bounds():
+    # Arrange, Act
+    result = imply_vol_vectorized(
+        s=100.0,
+        r=0.0,
+        b=0.0,
+        is_call=[True, True, False],
+        k=100.0,
+        t=0.5,
+        price=[-1.0, 101.0, 5.0],
+    )
+
+    # Assert
+    assert result[0] == 0.0
+    assert result[1] == 0.0
+    assert result[2] > 0.0
+
+
+def test_imply_vol_and_greeks_vectorized_floors_failed_vol():
+    # Arrange, Act
+    result = imply_vol_and_greeks_vectorized(
+        s=100.0,
+        r=0.0,
+        b=0.0,
+        is_call=True,
+        k=100.0,
+        t=0.5,
+        price=-1.0,
+    )
+
+    # Assert
+    assert result.vol == pytest.approx(1e-8)
+    assert np.isfinite(result.delta)
+
+
+@pytest.mark.parametrize("percent_greeks", [False, True])
+def test_modify_greeks_vectorized_beta_weighting(percent_greeks: bool):
+    # Arrange
+    delta = np.array([0.5, -0.25])
+    gamma = np.array([0.02, 0.01])
+    underlying_price = np.array([100.0, 200.0])
+    beta = np.array([1.5, 0.5])
+
+    # Act
+    result_delta, result_gamma, _ = modify_greeks_vectorized(
+        delta,
+        gamma,
+        underlying_price,
+        underlying_price,
+        percent_greeks,
+        index_price=4000.0,
+        beta=beta,
+    )
+
+    # Assert
+    multiplier = beta * underlying_price / 4000.0
+    scale = 40.0 if percent_greeks else 1.0
+    np.testing.assert_allclose(result_delta, delta * multiplier * scale)
+    np.testing.assert_allclose(result_gamma, gamma * multiplier**2 * scale**2)
+
+
+def test_modify_greeks_vectorized_vol_index_weighting():
+    # Arrange
+    vega = np.array([0.16, 0.08])
+    vol = np.array([0.3, 0.2])
+
+    # Act
+    _, _, result_vega = modify_greeks_vectorized(
+        np.zeros(2),
+        np.zeros(2),
+        np.full(2, 100.0),
+        np.full(2, 100.0),
+        False,
+        vega_input=vega,
+        vol=vol,
+        unshocked_vol=vol,
+        vol_index_price=25.0,
+        vega_beta=np.array([0.75, 1.0]),
+    )
+
+    # Assert
+    np.testing.assert_allclose(result_vega, vega * np.array([0.75, 1.0]) * vol / 0.25)
@@ -689,6 +689,170 @@ def test_deltas_from_pyo3_list():
     assert isinstance(deltas[0], OrderBookDelta)
 
 
+@pytest.mark.parametrize(
+    ("prices", "sizes", "price_precision", "size_precision"),
+    [
+        (["1.00000", "1.00010"], ["100000", "0"], -1, -1),
+        ([1.0, 1.0001], [100_000.0, 0.0], 5, 0),
+        (
+            [convert_to_raw_int(1.0, 5), convert_to_raw_int(1.0001, 5)],
+            [convert_to_raw_int(100_000, 0), 0],
+            5,
+            0,
+        ),
+    ],
+)
+def test_deltas_from_arrays(
+    prices: list,
+    sizes: list,
+    price_precision: int,
+    size_precision: int,
+) -> None:
+    # Arrange
+    expected = [
+        OrderBookDelta(
+            instrument_id=AUDUSD,
+            action=BookAction.UPDATE,
+            order=BookOrder(
+                OrderSide.BUY, Price.from_str("1.00000"), Quantity.from_int(100_000), 0
+            ),
+            flags=0,
+            sequence=3,
+            ts_event=1,
+            ts_init=2,
+        ),
+        OrderBookDelta(
+            instrument_id=AUDUSD,
+            action=BookAction.DELETE,
+            order=BookOrder(OrderSide.SELL, Price.from_str("1.00010"), Quantity.from_int(0), 0),
+            flags=RecordFlag.F_LAST,
+            sequence=3,
+            ts_event=1,
+            ts_init=2,
+        ),
+    ]
+
+    # Act
+    deltas = OrderBookDeltas.from_arrays(
+        instrument_id=AUDUSD,
+        prices=prices,
+        sizes=sizes,
+        sides=[OrderSide.BUY, OrderSide.SELL],
+        sequence=3,
+        ts_event=1,
+        ts_init=2,
+        price_precision=price_precision,
+        size_precision=size_precision,
+    )
+
+    # Assert
+    assert deltas.instrument_id == AUDUSD
+    assert deltas.deltas == expected
+    assert deltas.sequence == 3
+    assert deltas.ts_event == 1
+    assert deltas.ts_init == 2
+
+
+def test_deltas_from_arrays_parses_strings_exactly() -> None:
+    # Arrange
+    price = "123456789.123456789"  # Not exactly representable as a float
+    size = "1234567.123456789"
+
+    # Act
+    deltas = OrderBookDeltas.from_arrays(
+        instrument_id=AUDUSD,
+        prices=[price],
+        sizes=[size],
+        sides=[OrderSide.BUY],
+        sequence=0,
+        ts_event=0,
+        ts_init=0,
+    )
+
+    # Assert
+    order = deltas.deltas[0].order
+    assert order.price == Price.from_str(price)
+    assert order.size == Quantity.from_str(size)
+    assert order.price.raw == Price.from_str(price).raw
+    assert order.size.raw == Quantity.from_str(size).raw
+
+
+def test_deltas_from_arrays_snapshot_prepends_clear() -> None:
+    # Arrange, Act
+    deltas = OrderBookDeltas.from_arrays(
+        instrument_id=AUDUSD,
+        prices=["1.00000", "1.00010"],
+        sizes=["100000", "200000"],
+        sides=[OrderSide.BUY, OrderSide.SELL],
+        sequence=3,
+        ts_event=1,
+        ts_init=2,
+        action=BookAction.ADD,
+        flags=RecordFlag.F_SNAPSHOT,
+        snapshot=True,
+    )
+
+    # Assert
+    result = deltas.deltas
+    assert deltas.is_snapshot
+    assert len(result) == 3
+    assert result[0].action == BookAction.CLEAR
+    assert result[0].flags == RecordFlag.F_SNAPSHOT
+    assert all(delta.action == BookAction.ADD for delta in result[1:])
+    assert result[2].flags == RecordFlag.F_SNAPSHOT | RecordFlag.F_LAST
+
+
+def test_deltas_from_arrays_empty_snapshot_returns_clear() -> None:
+    # Arrange, Act
+    deltas = OrderBookDeltas.from_arrays(
+        instrument_id=AUDUSD,
+        prices=[],
+        sizes=[],
+        sides=[],
+        sequence=3,
+        ts_event=1,
+        ts_init=2,
+        snapshot=True,
+    )
+
+    # Assert
+    assert len(deltas.deltas) == 1
+    assert deltas.deltas[0].action == BookAction.CLEAR
+    assert deltas.flags == RecordFlag.F_LAST
+
+
+@pytest.mark.parametrize(
+    ("prices", "sizes", "sides", "price_precision"),
+    [
+        ([], [], [], -1),  # Empty without snapshot
+        (["1.0"], ["1", "2"], [OrderSide.BUY], -1),  # Mismatched lengths
+        (["1.0"], ["1"], [OrderSide.BUY, OrderSide.SELL], -1),  # Mismatched lengths
+        ([1.0], ["1"], [OrderSide.BUY], -1),  # Float without precision
+        ([1_000_000_000], ["1"], [OrderSide.BUY], -1),  # Raw without precision
+        ([float("nan")], ["1"], [OrderSide.BUY], 2),  # Invalid price
+        (["1.0"], ["-1"], [OrderSide.BUY], -1),  # Negative size
+    ],
+)
+def test_deltas_from_arrays_with_invalid_input_raises(
+    prices: list,
+    sizes: list,
+    sides: list,
+    price_precision: int,
+) -> None:
+    # Arrange, Act, Assert
+    with pytest.raises(ValueError):
+        OrderBookDeltas.from_arrays(
+            instrument_id=AUDUSD,
+            prices=prices,
+            sizes=sizes,
+            sides=sides,
+            sequence=0,
+            ts_event=0,
+            ts_init=0,
+            price_precision=price_precision,
+        )
+
+
 def test_depth10_fully_qualified_name() -> None:
     # Arrange, Act, Assert
     assert OrderBookDepth10.fully_qualified_name() == "nautilus_trader.model.data:OrderBookDepth10"
@@ -2920,3 +2920,173 @@ class TestOrders:
 
         # Assert
         assert result is False
+
+    def test_set_event_history_limit_with_negative_limit_raises_value_error(self) -> None:
+        # Arrange
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            order.set_event_history_limit(-1)
+
+    def test_event_history_limit_retains_init_and_recent_events(self) -> None:
+        # Arrange
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order.set_event_history_limit(2)
+
+        order.apply(TestEventStubs.order_submitted(order))
+        order.apply(TestEventStubs.order_accepted(order))
+
+        fills = [
+            TestEventStubs.order_filled(
+                order,
+                instrument=AUDUSD_SIM,
+                trade_id=TradeId(str(i)),
+                last_px=Price.from_str(f"1.0000{i}"),
+                last_qty=Quantity.from_int(25_000),
+            )
+            for i in range(1, 5)
+        ]
+
+        # Act
+        for fill in fills:
+            order.apply(fill)
+
+        # Assert
+        assert order.status == OrderStatus.FILLED
+        assert order.event_count == 7
+        assert order.events == [order.init_event, fills[2], fills[3]]
+        assert order.last_event == fills[3]
+        assert order.trade_ids == [TradeId("3"), TradeId("4")]
+        assert order.last_trade_id == TradeId("4")
+        assert order.filled_qty == Quantity.from_int(100_000)
+        assert order.avg_px == pytest.approx(1.000025, rel=1e-9)
+        assert order.commissions() == [Money(8.0, USD)]
+
+    def test_event_history_limit_still_rejects_trimmed_duplicate_trade_id(self) -> None:
+        # Arrange
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order.set_event_history_limit(1)
+
+        order.apply(TestEventStubs.order_submitted(order))
+        order.apply(TestEventStubs.order_accepted(order))
+
+        fill1 = TestEventStubs.order_filled(
+            order,
+            AUDUSD_SIM,
+            last_qty=Quantity.from_int(25_000),
+            trade_id=TradeId("TRADE-001"),
+        )
+        fill2 = TestEventStubs.order_filled(
+            order,
+            AUDUSD_SIM,
+            last_qty=Quantity.from_int(25_000),
+            trade_id=TradeId("TRADE-002"),
+        )
+        order.apply(fill1)
+        order.apply(fill2)
+
+        # Act, Assert
+        assert fill1 not in order.events
+        with pytest.raises(KeyError):
+            order.apply(fill1)
+
+        assert order.filled_qty == Quantity.from_int(50_000)
+
+    def test_event_history_limit_detects_trimmed_duplicate_fill(self) -> None:
+        # Arrange
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order.set_event_history_limit(1)
+
+        order.apply(TestEventStubs.order_submitted(order))
+        order.apply(TestEventStubs.order_accepted(order))
+
+        fill1 = TestEventStubs.order_filled(
+            order,
+            AUDUSD_SIM,
+            last_qty=Quantity.from_int(25_000),
+            trade_id=TradeId("TRADE-001"),
+        )
+        fill2 = TestEventStubs.order_filled(
+            order,
+            AUDUSD_SIM,
+            last_qty=Quantity.from_int(25_000),
+            trade_id=TradeId("TRADE-002"),
+        )
+        order.apply(fill1)
+        order.apply(fill2)
+
+        redelivered = TestEventStubs.order_filled(
+            order,
+            AUDUSD_SIM,
+            last_qty=Quantity.from_int(25_000),
+            trade_id=TradeId("TRADE-001"),
+        )
+        collision = TestEventStubs.order_filled(
+            order,
+            AUDUSD_SIM,
+            last_qty=Quantity.from_int(10_000),
+            trade_id=TradeId("TRADE-002"),
+        )
+
+        # Act, Assert
+        assert fill1 not in order.events
+        assert TradeId("TRADE-001") not in order.trade_ids
+        assert order.has_trade_id(TradeId("TRADE-001"))
+        assert not order.has_trade_id(TradeId("TRADE-003"))
+        assert order.is_duplicate_fill(redelivered)
+        assert not order.is_duplicate_fill(collision)  # Retained fill with other details
+
+    def test_event_history_limit_matches_trimmed_fill_by_trade_id_only(self) -> None:
+        # Arrange
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order.set_event_history_limit(1)
+
+        order.apply(TestEventStubs.order_submitted(order))
+        order.apply(TestEventStubs.order_accepted(order))
+        order.apply(
+            TestEventStubs.order_filled(
+                order,
+                AUDUSD_SIM,
+                last_qty=Quantity.from_int(25_000),
+                trade_id=TradeId("TRADE-001"),
+            ),
+        )
+        order.apply(
+            TestEventStubs.order_filled(
+                order,
+                AUDUSD_SIM,
+                last_qty=Quantity.from_int(25_000),
+                trade_id=TradeId("TRADE-002"),
+            ),
+        )
+
+        collision = TestEventStubs.order_filled(
+            order,
+            AUDUSD_SIM,
+            last_qty=Quantity.from_int(10_000),
+            trade_id=TradeId("TRADE-001"),
+        )
+
+        # Act, Assert
+        assert order.is_duplicate_fill(collision)
@@ -3580,3 +3580,117 @@ class TestPosition:
         commissions = position.commissions()
         assert len(commissions) == 1
         assert abs(commissions[0].as_double() - 0.001) < 1e-9
+
+    def test_event_history_limit_retains_recent_fills_and_aggregates(self) -> None:
+        # Arrange
+        orders = [
+            self.order_factory.market(
+                AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100_000),
+            )
+            for _ in range(4)
+        ]
+        fills = [
+            TestEventStubs.order_filled(
+                order,
+                instrument=AUDUSD_SIM,
+                position_id=PositionId("P-123456"),
+                strategy_id=TestIdStubs.strategy_id(),
+                last_px=Price.from_str(f"1.0000{i}"),
+            )
+            for i, order in enumerate(orders)
+        ]
+
+        position = Position(instrument=AUDUSD_SIM, fill=fills[0])
+        position.set_event_history_limit(2)
+
+        # Act
+        for fill in fills[1:]:
+            position.apply(fill)
+
+        # Assert
+        assert position.events == fills[2:]
+        assert position.trade_ids == [fills[2].trade_id, fills[3].trade_id]
+        assert position.last_event == fills[3]
+        assert position.last_trade_id == fills[3].trade_id
+        assert position.event_count == 4
+        assert position.has_trade_id(fills[0].trade_id)
+        assert position.client_order_ids == sorted(order.client_order_id for order in orders)
+        assert position.quantity == Quantity.from_int(400_000)
+        assert position.avg_px_open == pytest.approx(1.000015, rel=1e-9)
+        assert position.commissions() == [Money(8.00, USD)]
+
+    def test_event_history_limit_resets_on_reopen(self) -> None:
+        # Arrange
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order2 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+        order3 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        fill1, fill2, fill3 = (
+            TestEventStubs.order_filled(
+                order,
+                instrument=AUDUSD_SIM,
+                position_id=PositionId("P-123456"),
+                strategy_id=TestIdStubs.strategy_id(),
+            )
+            for order in (order1, order2, order3)
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill1)
+        position.set_event_history_limit(1)
+        position.apply(fill2)
+
+        # Act
+        position.apply(fill3)
+
+        # Assert
+        assert position.is_long
+        assert position.events == [fill3]
+        assert position.event_count == 1
+        assert position.client_order_ids == [order3.client_order_id]
+        assert not position.has_trade_id(fill1.trade_id)
+
+    def test_purge_order_events_when_history_trimmed_keeps_aggregates(self) -> None:
+        # Arrange
+        orders = [
+            self.order_factory.market(
+                AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100_000),
+            )
+            for _ in range(3)
+        ]
+        fills = [
+            TestEventStubs.order_filled(
+                order,
+                instrument=AUDUSD_SIM,
+                position_id=PositionId("P-123456"),
+                strategy_id=TestIdStubs.strategy_id(),
+            )
+            for order in orders
+        ]
+
+        position = Position(instrument=AUDUSD_SIM, fill=fills[0])
+        position.set_event_history_limit(2)
+        position.apply(fills[1])
+        position.apply(fills[2])
+
+        # Act
+        position.purge_events_for_order(orders[2].client_order_id)
+
+        # Assert
+        assert position.events == [fills[1]]
+        assert orders[2].client_order_id not in position.client_order_ids
+        assert position.quantity == Quantity.from_int(300_000)
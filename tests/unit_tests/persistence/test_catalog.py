@@ -22,6 +22,7 @@ from unittest.mock import patch
 import pandas as pd
 import pyarrow as pa
 import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import pytest
 
 from nautilus_trader import TEST_DATA_DIR
@@ -2040,6 +2041,390 @@ def test_consolidate_catalog_by_period_skips_unknown_directory(
     assert len(final_files) == 1
 
 
+def _make_hourly_bars(symbol: str, hours: list[int]) -> list[Bar]:
+    instrument = TestInstrumentProvider.default_fx_ccy(symbol, venue=Venue("SIM"))
+    bar_type = BarType(instrument.id, BarSpecification(1, BarAggregation.HOUR, PriceType.MID))
+    base = dt_to_unix_nanos(pd.Timestamp("2024-01-01", tz="UTC"))
+    hour = int(pd.Timedelta(hours=1).total_seconds() * 1e9)
+
+    return [
+        Bar(
+            bar_type=bar_type,
+            open=Price.from_str("1.00000"),
+            high=Price.from_str("1.00010"),
+            low=Price.from_str("0.99990"),
+            close=Price.from_str("1.00005"),
+            volume=Quantity.from_str("1000"),
+            ts_event=base + h * hour,
+            ts_init=base + h * hour,
+        )
+        for h in hours
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_consolidate_catalog_with_max_workers(
+    catalog: ParquetDataCatalog,
+    max_workers: int,
+) -> None:
+    # Arrange: one leaf directory per bar type, each with one file per bar
+    symbols = ["EUR/USD", "GBP/USD", "AUD/USD", "USD/JPY"]
+    for symbol in symbols:
+        for bar in _make_hourly_bars(symbol, list(range(12))):
+            catalog.write_data([bar], skip_disjoint_check=True)
+
+    expected = sorted((str(bar.bar_type), bar.ts_init) for bar in catalog.bars())
+
+    # Act
+    stats = catalog.consolidate_catalog(ensure_contiguous_files=False, max_workers=max_workers)
+
+    # Assert
+    assert [s.directory for s in stats] == catalog._find_leaf_data_directories()
+    assert [s.file_count for s in stats] == [12] * len(symbols)
+    assert [s.row_count for s in stats] == [12] * len(symbols)
+    for directory in catalog._find_leaf_data_directories():
+        assert len(catalog.fs.glob(f"{directory}/*.parquet")) == 1
+
+    bars = catalog.bars()
+    assert len(bars) == 12 * len(symbols)
+    assert sorted((str(bar.bar_type), bar.ts_init) for bar in bars) == expected
+
+
+def test_consolidate_catalog_deduplicates_overlapping_files(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange: overlapping files which repeat some of the same bars
+    catalog.max_rows_per_group = 2  # Force the merge across many small row groups
+    catalog.write_data(_make_hourly_bars("EUR/USD", [0, 1, 2, 3, 5, 8]))
+    catalog.write_data(_make_hourly_bars("EUR/USD", [2, 3, 4, 6, 7]), skip_disjoint_check=True)
+    catalog.write_data(_make_hourly_bars("EUR/USD", [7, 8, 9]), skip_disjoint_check=True)
+
+    # Act
+    catalog.consolidate_catalog(ensure_contiguous_files=False, deduplicate=True)
+
+    # Assert
+    bars = catalog.bars()
+    expected = [bar.ts_init for bar in _make_hourly_bars("EUR/USD", list(range(10)))]
+    assert [bar.ts_init for bar in bars] == expected
+
+
+def test_consolidate_catalog_with_conflicting_metadata_keeps_source_files(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    bars = _make_hourly_bars("EUR/USD", [0, 1])
+    catalog.write_data(bars[:1])
+    catalog.write_data(
+        [
+            Bar(
+                bar_type=bars[1].bar_type,
+                open=Price.from_str("1.000000"),
+                high=Price.from_str("1.000100"),
+                low=Price.from_str("0.999900"),
+                close=Price.from_str("1.000050"),
+                volume=Quantity.from_str("1000"),
+                ts_event=bars[1].ts_event,
+                ts_init=bars[1].ts_init,
+            ),
+        ],
+    )
+    directory = catalog._make_path(Bar, str(bars[0].bar_type))
+    initial_files = sorted(catalog.fs.glob(f"{directory}/*"))
+
+    # Act
+    with pytest.raises(ValueError, match="conflicting metadata"):
+        catalog.consolidate_catalog(ensure_contiguous_files=False)
+
+    # Assert: no partial or temporary file was left behind
+    assert sorted(catalog.fs.glob(f"{directory}/*")) == initial_files
+
+
+def test_consolidate_catalog_with_invalid_max_workers_raises(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange, Act, Assert
+    with pytest.raises(ValueError):
+        catalog.consolidate_catalog(max_workers=0)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_consolidate_catalog_by_period_with_max_workers(
+    catalog: ParquetDataCatalog,
+    max_workers: int,
+) -> None:
+    # Arrange: 48 hourly files per bar type spanning two days
+    symbols = ["EUR/USD", "GBP/USD", "AUD/USD"]
+    for symbol in symbols:
+        for bar in _make_hourly_bars(symbol, list(range(48))):
+            catalog.write_data([bar], skip_disjoint_check=True)
+
+    # Act
+    stats = catalog.consolidate_catalog_by_period(
+        period=pd.Timedelta(days=1),
+        ensure_contiguous_files=False,
+        max_workers=max_workers,
+    )
+
+    # Assert
+    assert [s.file_count for s in stats] == [48] * len(symbols)
+    assert [s.row_count for s in stats] == [48] * len(symbols)
+    for directory in catalog._find_leaf_data_directories():
+        assert len(catalog.fs.glob(f"{directory}/*.parquet")) == 2
+
+    assert len(catalog.bars()) == 48 * len(symbols)
+
+
+def test_consolidate_data_by_period_failed_write_keeps_unconsolidated_files(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange: 48 hourly files spanning two days, failing the write of the second day
+    bars = _make_hourly_bars("EUR/USD", list(range(48)))
+    for bar in bars:
+        catalog.write_data([bar], skip_disjoint_check=True)
+
+    directory = catalog._make_path(Bar, str(bars[0].bar_type))
+    second_day_files = sorted(catalog.fs.glob(f"{directory}/*.parquet"))[24:]
+    write_table = pq.ParquetWriter.write_table
+    calls: list[int] = []
+
+    def fail_second_write(self: pq.ParquetWriter, *args: Any, **kwargs: Any) -> None:
+        calls.append(1)
+        if len(calls) > 1:
+            raise OSError("disk full")
+        write_table(self, *args, **kwargs)
+
+    # Act
+    with (
+        patch.object(pq.ParquetWriter, "write_table", fail_second_write),
+        pytest.raises(OSError, match="disk full"),
+    ):
+        catalog.consolidate_data_by_period(
+            data_cls=Bar,
+            identifier=str(bars[0].bar_type),
+            period=pd.Timedelta(days=1),
+            ensure_contiguous_files=False,
+        )
+
+    # Assert: the first day was consolidated, while the second day kept its files
+    # and no partial or temporary file was left behind
+    files = sorted(catalog.fs.glob(f"{directory}/*.parquet"))
+    assert len(files) == 25
+    assert files[1:] == second_day_files
+    assert catalog.fs.glob(f"{directory}/*.tmp") == []
+    assert [bar.ts_init for bar in catalog.bars()] == [bar.ts_init for bar in bars]
+
+
+def test_write_data_indexes_row_groups(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    catalog.max_rows_per_group = 4
+    bars = _make_hourly_bars("EUR/USD", list(range(10)))
+
+    # Act
+    catalog.write_data(bars)
+
+    # Assert
+    directory = catalog._make_path(Bar, str(bars[0].bar_type))
+    index = catalog._get_row_group_index(directory)
+    assert len(index) == 1
+    row_groups = next(iter(index.values()))
+    assert [rg.num_rows for rg in row_groups] == [4, 4, 2]
+    assert [(rg.ts_min, rg.ts_max) for rg in row_groups] == [
+        (bars[0].ts_init, bars[3].ts_init),
+        (bars[4].ts_init, bars[7].ts_init),
+        (bars[8].ts_init, bars[9].ts_init),
+    ]
+    assert row_groups[0].offset < row_groups[1].offset < row_groups[2].offset
+
+
+def test_filter_files_prunes_files_with_no_row_groups_in_range(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange: widen the file name well beyond the data it holds
+    bars = _make_hourly_bars("EUR/USD", [0, 1, 2])
+    bar_type_str = str(bars[0].bar_type)
+    catalog.write_data(bars)
+    hour = int(pd.Timedelta(hours=1).total_seconds() * 1e9)
+    catalog.extend_file_name(
+        Bar,
+        bar_type_str,
+        start=bars[-1].ts_init + 1,
+        end=bars[-1].ts_init + 8 * hour,
+    )
+    files = catalog.get_file_list_from_data_cls(Bar)
+
+    # Act
+    in_range = catalog.filter_files(
+        Bar,
+        files,
+        start=bars[1].ts_init,
+        end=bars[1].ts_init,
+    )
+    out_of_range = catalog.filter_files(
+        Bar,
+        files,
+        start=bars[-1].ts_init + 3 * hour,
+        end=bars[-1].ts_init + 4 * hour,
+    )
+
+    # Assert
+    assert in_range == files
+    assert out_of_range == []
+
+
+def test_query_time_range_reads_overlapping_row_groups(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    catalog.max_rows_per_group = 3
+    bars = _make_hourly_bars("EUR/USD", list(range(24)))
+    catalog.write_data(bars[:12])
+    catalog.write_data(bars[12:])
+    files = catalog.get_file_list_from_data_cls(Bar)
+
+    # Act
+    result = catalog.query(Bar, files=files, start=bars[5].ts_init, end=bars[13].ts_init)
+
+    # Assert
+    assert [bar.ts_init for bar in result] == [bar.ts_init for bar in bars[5:14]]
+
+
+def test_consolidate_catalog_reindexes_consolidated_file(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    bars = _make_hourly_bars("EUR/USD", list(range(6)))
+    for bar in bars:
+        catalog.write_data([bar], skip_disjoint_check=True)
+
+    # Act
+    catalog.consolidate_catalog(ensure_contiguous_files=False)
+
+    # Assert
+    directory = catalog._make_path(Bar, str(bars[0].bar_type))
+    index = catalog._get_row_group_index(directory)
+    assert list(index) == catalog.fs.glob(f"{directory}/*.parquet")
+    assert sum(rg.num_rows for rg in next(iter(index.values()))) == 6
+    assert len(catalog._read_row_group_index(directory)) == 1
+
+
+def test_get_row_count(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    catalog.write_data(_make_hourly_bars("EUR/USD", list(range(5))))
+    catalog.write_data(_make_hourly_bars("EUR/USD", list(range(5, 8))))
+    catalog.write_data(_make_hourly_bars("GBP/USD", list(range(4))))
+    eurusd = str(_make_hourly_bars("EUR/USD", [0])[0].bar_type)
+
+    # Act, Assert
+    assert catalog.get_row_count(Bar, eurusd) == 8
+    assert catalog.get_row_count(Bar) == 12
+
+
+def test_index_catalog_rebuilds_missing_index(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    bars = _make_hourly_bars("EUR/USD", list(range(5)))
+    catalog.write_data(bars)
+    directory = catalog._make_path(Bar, str(bars[0].bar_type))
+    catalog.fs.rm(f"{directory}/_row_groups.json")
+    assert list(catalog._get_row_group_index(directory).values()) == [None]
+
+    # Act
+    catalog.index_catalog()
+
+    # Assert
+    row_groups = next(iter(catalog._get_row_group_index(directory).values()))
+    assert row_groups is not None
+    assert sum(rg.num_rows for rg in row_groups) == 5
+    assert catalog.get_row_count(Bar, str(bars[0].bar_type)) == 5
+
+
+def test_row_group_index_ignores_file_rewritten_outside_catalog(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange: overwrite the file in place with more rows than were indexed
+    bars = _make_hourly_bars("EUR/USD", list(range(10)))
+    catalog.write_data(bars[:2])
+    [file] = catalog.get_file_list_from_data_cls(Bar)
+    table = catalog._objects_to_table(bars, data_cls=Bar)
+    pq.write_table(table, file, filesystem=catalog.fs)
+
+    # Act
+    directory = catalog._make_path(Bar, str(bars[0].bar_type))
+    index = catalog._get_row_group_index(directory)
+
+    # Assert: the stale entry is not trusted, so nothing is pruned
+    assert index == {file: None}
+    assert catalog.get_row_count(Bar, str(bars[0].bar_type)) == 10
+    assert len(catalog.query(Bar, files=[file], start=bars[1].ts_init)) == 9
+
+
+def _write_interleaved_quotes(catalog: ParquetDataCatalog, venues: int, files: int) -> None:
+    # Each venue's quotes are split over several files and interleave in time across venues
+    for i in range(venues):
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD", Venue(f"SIM{i}"))
+        for j in range(files):
+            catalog.write_data(
+                [
+                    TestDataStubs.quote_tick(instrument=instrument, ts_event=ts, ts_init=ts)
+                    for ts in range(j * 100 + i, (j + 1) * 100, venues)
+                ],
+            )
+
+
+@pytest.mark.parametrize("batch_size", [None, 7])
+def test_query_fan_out_matches_serial_query(catalog: ParquetDataCatalog, batch_size) -> None:
+    # Arrange
+    _write_interleaved_quotes(catalog, venues=5, files=3)
+    expected = catalog.quote_ticks()
+
+    # Act
+    result = catalog.quote_ticks(max_workers=4, batch_size=batch_size)
+
+    # Assert
+    assert len(result) == len(expected) == 300
+    assert [q.ts_init for q in result] == sorted(q.ts_init for q in expected)
+    assert sorted(result, key=lambda q: (q.ts_init, str(q.instrument_id))) == sorted(
+        expected,
+        key=lambda q: (q.ts_init, str(q.instrument_id)),
+    )
+
+
+def test_query_fan_out_with_identifiers_and_time_range(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    _write_interleaved_quotes(catalog, venues=4, files=2)
+    instrument_ids = ["AUD/USD.SIM1", "AUD/USD.SIM3"]
+
+    # Act
+    result = catalog.quote_ticks(instrument_ids=instrument_ids, start=50, end=149, max_workers=2)
+
+    # Assert
+    assert {str(q.instrument_id) for q in result} == set(instrument_ids)
+    assert [q.ts_init for q in result] == [ts for ts in range(50, 150) if ts % 4 in (1, 3)]
+
+
+def test_query_fan_out_with_no_matching_files_returns_empty(catalog: ParquetDataCatalog) -> None:
+    # Arrange, Act
+    result = catalog.quote_ticks(max_workers=4)
+
+    # Assert
+    assert result == []
+
+
+@pytest.mark.parametrize(
+    ("max_workers", "batch_size"),
+    [
+        (0, None),
+        (2, 0),
+    ],
+)
+def test_query_fan_out_with_invalid_limits_raises(
+    catalog: ParquetDataCatalog,
+    max_workers: int,
+    batch_size: int | None,
+) -> None:
+    # Arrange
+    _write_interleaved_quotes(catalog, venues=1, files=1)
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        catalog.quote_ticks(max_workers=max_workers, batch_size=batch_size)
+
+
 def test_extract_data_cls_and_identifier_from_path(catalog: ParquetDataCatalog) -> None:
     # Arrange
     quote = TestDataStubs.quote_tick()
@@ -0,0 +1,155 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import os
+
+import pyarrow.parquet as pq
+import pytest
+
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.enums import RecordFlag
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.replay import MemoryMappedReplaySource
+from nautilus_trader.persistence.replay import replay_sidecar_path
+from nautilus_trader.persistence.replay import write_replay_sidecar
+from nautilus_trader.test_kit.mocks.data import load_catalog_with_stub_quote_ticks_audusd
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+@pytest.fixture(name="quotes_catalog")
+def fixture_quotes_catalog(catalog: ParquetDataCatalog) -> ParquetDataCatalog:
+    load_catalog_with_stub_quote_ticks_audusd(catalog)
+    return catalog
+
+
+def test_write_replay_sidecar_writes_file_alongside_parquet(
+    quotes_catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    path = quotes_catalog.get_file_list_from_data_cls(QuoteTick)[0]
+
+    # Act
+    sidecar_path = write_replay_sidecar(path)
+
+    # Assert
+    assert sidecar_path == replay_sidecar_path(path)
+    assert os.path.exists(sidecar_path)
+    assert not os.path.exists(f"{sidecar_path}.tmp")
+
+
+@pytest.mark.parametrize("write_sidecars", [False, True])
+def test_replay_source_after_parquet_file_rewritten_ignores_stale_sidecar(
+    quotes_catalog: ParquetDataCatalog,
+    write_sidecars: bool,
+) -> None:
+    # Arrange
+    path = quotes_catalog.get_file_list_from_data_cls(QuoteTick)[0]
+    write_replay_sidecar(path)
+    pq.write_table(pq.read_table(path).slice(0, 100), path)
+
+    # Act
+    source = MemoryMappedReplaySource.from_catalog(
+        catalog=quotes_catalog,
+        data_cls=QuoteTick,
+        write_sidecars=write_sidecars,
+    )
+
+    # Assert
+    assert source.paths == [replay_sidecar_path(path) if write_sidecars else path]
+    assert [q for chunk in source for q in chunk] == quotes_catalog.quote_ticks()
+
+
+@pytest.mark.parametrize("write_sidecars", [False, True])
+def test_replay_source_yields_same_data_as_query(
+    quotes_catalog: ParquetDataCatalog,
+    write_sidecars: bool,
+) -> None:
+    # Arrange
+    expected = quotes_catalog.quote_ticks()
+    source = MemoryMappedReplaySource.from_catalog(
+        catalog=quotes_catalog,
+        data_cls=QuoteTick,
+        chunk_size=7_000,
+        write_sidecars=write_sidecars,
+    )
+
+    # Act
+    chunks = list(source.iter_chunks())
+
+    # Assert
+    assert all(len(chunk) <= 7_000 for chunk in chunks)
+    assert [q for chunk in chunks for q in chunk] == expected
+    assert source.row_count == len(expected)
+
+
+def test_replay_source_filters_to_time_range(quotes_catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    all_quotes = quotes_catalog.quote_ticks()
+    start = all_quotes[100].ts_init
+    end = all_quotes[200].ts_init
+    source = MemoryMappedReplaySource.from_catalog(
+        catalog=quotes_catalog,
+        data_cls=QuoteTick,
+        start=start,
+        end=end,
+        write_sidecars=True,
+    )
+
+    # Act
+    quotes = [q for chunk in source for q in chunk]
+
+    # Assert
+    assert quotes == [q for q in all_quotes if start <= q.ts_init <= end]
+
+
+def test_replay_source_from_memory_catalog_raises(catalog_memory: ParquetDataCatalog) -> None:
+    # Arrange, Act, Assert
+    with pytest.raises(ValueError):
+        MemoryMappedReplaySource.from_catalog(catalog=catalog_memory, data_cls=QuoteTick)
+
+
+@pytest.mark.parametrize("write_sidecars", [False, True])
+def test_replay_source_batches_deltas_across_chunk_boundaries(
+    catalog: ParquetDataCatalog,
+    write_sidecars: bool,
+) -> None:
+    # Arrange
+    deltas = [
+        TestDataStubs.order_book_delta(
+            flags=RecordFlag.F_LAST if i % 3 == 2 else 0,
+            sequence=i,
+            ts_event=i // 3,
+            ts_init=i // 3,
+        )
+        for i in range(9)
+    ]
+    catalog.write_data(deltas)
+    source = MemoryMappedReplaySource.from_catalog(
+        catalog=catalog,
+        data_cls=OrderBookDeltas,
+        chunk_size=2,  # Splits the batches of three deltas
+        write_sidecars=write_sidecars,
+    )
+
+    # Act
+    batches = [batch for chunk in source for batch in chunk]
+
+    # Assert
+    assert [[delta.sequence for delta in batch.deltas] for batch in batches] == [
+        [0, 1, 2],
+        [3, 4, 5],
+        [6, 7, 8],
+    ]
@@ -0,0 +1,237 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2026 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pyarrow.parquet as pq
+import pytest
+
+from nautilus_trader.backtest.config import BacktestDataConfig
+from nautilus_trader.backtest.config import BacktestEngineConfig
+from nautilus_trader.backtest.config import BacktestRunConfig
+from nautilus_trader.backtest.config import BacktestVenueConfig
+from nautilus_trader.backtest.node import BacktestNode
+from nautilus_trader.config import InvalidConfiguration
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.shared import SharedDataStore
+from nautilus_trader.test_kit.mocks.data import load_catalog_with_stub_quote_ticks_audusd
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+AUDUSD_ID = "AUD/USD.SIM"
+
+
+@pytest.fixture(name="quotes_catalog")
+def fixture_quotes_catalog(catalog: ParquetDataCatalog) -> ParquetDataCatalog:
+    load_catalog_with_stub_quote_ticks_audusd(catalog)
+    return catalog
+
+
+def test_attach_when_store_not_created_raises(tmp_path) -> None:
+    # Arrange, Act, Assert
+    with pytest.raises(FileNotFoundError):
+        SharedDataStore.attach("missing", root=str(tmp_path))
+
+
+def test_publish_then_attach_queries_same_data_as_catalog(
+    quotes_catalog: ParquetDataCatalog,
+    tmp_path,
+) -> None:
+    # Arrange
+    store = SharedDataStore.create("test", root=str(tmp_path / "shm"))
+    published = store.publish(quotes_catalog, QuoteTick, identifiers=[AUDUSD_ID])
+    store.publish_instruments(quotes_catalog)
+
+    # Act
+    attached = SharedDataStore.attach("test", root=str(tmp_path / "shm"))
+    quotes = attached.query(QuoteTick, identifiers=[AUDUSD_ID])
+    instruments = attached.instruments()
+
+    # Assert
+    assert attached.files(QuoteTick) == published
+    assert quotes == quotes_catalog.quote_ticks(instrument_ids=[AUDUSD_ID])
+    assert [i.id.value for i in instruments] == [AUDUSD_ID]
+
+
+def test_publish_is_idempotent(quotes_catalog: ParquetDataCatalog, tmp_path) -> None:
+    # Arrange
+    store = SharedDataStore.create("test", root=str(tmp_path))
+
+    # Act
+    first = store.publish(quotes_catalog, QuoteTick)
+    second = store.publish(quotes_catalog, QuoteTick)
+
+    # Assert
+    assert first == second
+    assert len(store.files(QuoteTick)) == len(first)
+
+
+def test_publish_after_catalog_file_rewritten_republishes_file(
+    quotes_catalog: ParquetDataCatalog,
+    tmp_path,
+) -> None:
+    # Arrange
+    store = SharedDataStore.create("test", root=str(tmp_path / "shm"))
+    store.publish(quotes_catalog, QuoteTick)
+
+    # Rewrite the catalog file in place (same file name) with fewer rows
+    path = quotes_catalog.get_file_list_from_data_cls(QuoteTick)[0]
+    pq.write_table(pq.read_table(path).slice(0, 100), path)
+
+    # Act
+    published = store.publish(quotes_catalog, QuoteTick)
+
+    # Assert
+    assert store.files(QuoteTick) == published
+    assert store.query(QuoteTick) == quotes_catalog.quote_ticks()
+    assert len(store.query(QuoteTick)) == 100
+
+
+def test_publish_after_catalog_consolidation_removes_stale_files(
+    catalog: ParquetDataCatalog,
+    tmp_path,
+) -> None:
+    # Arrange
+    quotes = TestDataStubs.quote_ticks_usdjpy()[:1_000]
+    catalog.write_data(quotes[:500])
+    catalog.write_data(quotes[500:])
+    store = SharedDataStore.create("test", root=str(tmp_path / "shm"))
+    assert len(store.publish(catalog, QuoteTick)) == 2
+
+    # Act
+    catalog.consolidate_data(QuoteTick, ensure_contiguous_files=False)
+    published = store.publish(catalog, QuoteTick)
+
+    # Assert
+    assert len(published) == 1
+    assert store.files(QuoteTick) == published
+    assert store.query(QuoteTick) == quotes
+
+
+def test_unlink_removes_store(quotes_catalog: ParquetDataCatalog, tmp_path) -> None:
+    # Arrange
+    store = SharedDataStore.create("test", root=str(tmp_path))
+    store.publish(quotes_catalog, QuoteTick)
+
+    # Act
+    store.unlink()
+
+    # Assert
+    assert not store.exists
+
+
+def test_backtest_node_loads_data_config_from_shared_store(
+    quotes_catalog: ParquetDataCatalog,
+    tmp_path,
+) -> None:
+    # Arrange
+    config = BacktestDataConfig(
+        catalog_path=quotes_catalog.path,
+        catalog_fs_protocol="file",
+        data_cls=QuoteTick,
+        instrument_id=InstrumentId.from_str(AUDUSD_ID),
+        shared_store="node",
+        shared_store_root=str(tmp_path / "shm"),
+    )
+
+    # Act
+    result = BacktestNode.load_data_config(config)
+
+    # Assert
+    assert result.data == quotes_catalog.quote_ticks(instrument_ids=[AUDUSD_ID])
+    assert result.instruments is not None
+    assert len(result.instruments) == 1
+    assert SharedDataStore.attach("node", root=str(tmp_path / "shm")).files(QuoteTick)
+
+
+def test_backtest_node_build_publishes_instruments_only(
+    quotes_catalog: ParquetDataCatalog,
+    tmp_path,
+) -> None:
+    # Arrange
+    config = BacktestRunConfig(
+        engine=BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)),
+        venues=[
+            BacktestVenueConfig(
+                name="SIM",
+                oms_type="HEDGING",
+                account_type="MARGIN",
+                base_currency="USD",
+                starting_balances=["1000000 USD"],
+            ),
+        ],
+        data=[
+            BacktestDataConfig(
+                catalog_path=quotes_catalog.path,
+                catalog_fs_protocol="file",
+                data_cls=QuoteTick,
+                instrument_id=InstrumentId.from_str(AUDUSD_ID),
+                shared_store="node",
+                shared_store_root=str(tmp_path / "shm"),
+            ),
+        ],
+        chunk_size=100,
+    )
+    node = BacktestNode(configs=[config])
+
+    # Act
+    node.build()
+
+    # Assert
+    store = SharedDataStore.attach("node", root=str(tmp_path / "shm"))
+    assert [i.id.value for i in store.instruments()] == [AUDUSD_ID]
+    assert store.files(QuoteTick) == []  # Data only published when read from the store
+    node.dispose()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"filter_expr": "field('bid_price') > 0"},
+        {"metadata": {"key": "value"}},
+    ],
+)
+def test_backtest_node_with_shared_store_and_unsupported_query_raises(
+    quotes_catalog: ParquetDataCatalog,
+    tmp_path,
+    kwargs: dict,
+) -> None:
+    # Arrange
+    config = BacktestRunConfig(
+        venues=[
+            BacktestVenueConfig(
+                name="SIM",
+                oms_type="HEDGING",
+                account_type="MARGIN",
+                base_currency="USD",
+                starting_balances=["1000000 USD"],
+            ),
+        ],
+        data=[
+            BacktestDataConfig(
+                catalog_path=quotes_catalog.path,
+                data_cls=QuoteTick,
+                instrument_id=InstrumentId.from_str(AUDUSD_ID),
+                shared_store="node",
+                shared_store_root=str(tmp_path / "shm"),
+                **kwargs,
+            ),
+        ],
+    )
+
+    # Act, Assert
+    with pytest.raises(InvalidConfiguration):
+        BacktestNode(configs=[config])
@@ -1322,3 +1322,279 @@ class TestGreeksCalculator:
 
         assert greeks is not None
         assert greeks.pnl == greeks.price - position.avg_px_open
+
+    def _add_quote(self, instrument_id: InstrumentId, price: str) -> None:
+        self.cache.add_quote_tick(
+            QuoteTick(
+                instrument_id=instrument_id,
+                bid_price=Price.from_str(price),
+                ask_price=Price.from_str(price),
+                bid_size=Quantity.from_int(100),
+                ask_size=Quantity.from_int(100),
+                ts_event=self.clock.timestamp_ns(),
+                ts_init=self.clock.timestamp_ns(),
+            ),
+        )
+
+    def _add_option_chain(self, strikes: list[int]) -> list[InstrumentId]:
+        instrument_ids = []
+        for strike in strikes:
+            for option_kind in (OptionKind.CALL, OptionKind.PUT):
+                kind = "C" if option_kind == OptionKind.CALL else "P"
+                symbol = Symbol(f"AAPL240315{kind}00{strike}000")
+                option = OptionContract(
+                    instrument_id=InstrumentId(symbol, Venue("XNAS")),
+                    raw_symbol=symbol,
+                    asset_class=AssetClass.EQUITY,
+                    currency=Currency.from_str("USD"),
+                    price_precision=2,
+                    price_increment=Price.from_str("0.01"),
+                    multiplier=Quantity.from_int(100),
+                    lot_size=Quantity.from_int(1),
+                    underlying="AAPL",
+                    option_kind=option_kind,
+                    activation_ns=0,
+                    expiration_ns=self.option.expiration_ns,
+                    strike_price=Price.from_str(f"{strike}.00"),
+                    ts_event=0,
+                    ts_init=0,
+                )
+                self.cache.add_instrument(option)
+                instrument_ids.append(option.id)
+
+        return instrument_ids
+
+    def test_instrument_greeks_batch_matches_instrument_greeks(self):
+        # Arrange
+        instrument_ids = self._add_option_chain([145, 150, 155])
+        self._add_quote(self.underlying_id, "152.00")
+        for instrument_id, price in zip(
+            instrument_ids,
+            ["9.80", "2.90", "6.60", "4.60", "4.00", "7.40"],
+            strict=True,
+        ):
+            self._add_quote(instrument_id, price)
+
+        # Act
+        batch_greeks = self.greeks_calculator.instrument_greeks_batch(
+            [*instrument_ids, self.underlying_id],
+            ts_event=self.clock.timestamp_ns(),
+        )
+
+        # Assert
+        assert list(batch_greeks) == [*instrument_ids, self.underlying_id]
+        for instrument_id, greeks in batch_greeks.items():
+            expected = self.greeks_calculator.instrument_greeks(
+                instrument_id,
+                ts_event=self.clock.timestamp_ns(),
+            )
+            assert greeks.expiry_in_days == expected.expiry_in_days
+            assert greeks.vol == pytest.approx(expected.vol, abs=1e-5)
+            assert greeks.price == pytest.approx(expected.price, abs=1e-3)
+            assert greeks.delta == pytest.approx(expected.delta, abs=1e-4)
+            assert greeks.gamma == pytest.approx(expected.gamma, abs=1e-4)
+            assert greeks.vega == pytest.approx(expected.vega, abs=1e-4)
+            assert greeks.theta == pytest.approx(expected.theta, abs=1e-4)
+
+    @pytest.mark.parametrize(
+        ("spot_shock", "vol_shock", "time_to_expiry_shock"),
+        [
+            (5.0, 0.0, 0.0),
+            (0.0, 0.05, 0.0),
+            (0.0, 0.0, 7 / 365.25),
+            (-5.0, 0.02, 1 / 365.25),
+        ],
+    )
+    def test_instrument_greeks_batch_applies_shocks(
+        self,
+        spot_shock: float,
+        vol_shock: float,
+        time_to_expiry_shock: float,
+    ):
+        # Arrange
+        self._add_quote(self.underlying_id, "155.00")
+        self._add_quote(self.option_id, "8.50")
+
+        # Act
+        batch_greeks = self.greeks_calculator.instrument_greeks_batch(
+            [self.option_id],
+            spot_shock=spot_shock,
+            vol_shock=vol_shock,
+            time_to_expiry_shock=time_to_expiry_shock,
+            percent_greeks=True,
+            ts_event=self.clock.timestamp_ns(),
+        )
+
+        # Assert
+        expected = self.greeks_calculator.instrument_greeks(
+            self.option_id,
+            spot_shock=spot_shock,
+            vol_shock=vol_shock,
+            time_to_expiry_shock=time_to_expiry_shock,
+            percent_greeks=True,
+            ts_event=self.clock.timestamp_ns(),
+        )
+        greeks = batch_greeks[self.option_id]
+        assert greeks.underlying_price == expected.underlying_price
+        assert greeks.expiry_in_days == expected.expiry_in_days
+        assert greeks.vol == pytest.approx(expected.vol, abs=1e-5)
+        assert greeks.price == pytest.approx(expected.price, abs=1e-3)
+        assert greeks.delta == pytest.approx(expected.delta, abs=1e-3)
+        assert greeks.gamma == pytest.approx(expected.gamma, abs=1e-3)
+        assert greeks.vega == pytest.approx(expected.vega, abs=1e-4)
+
+    def test_instrument_greeks_batch_reuses_solved_greeks_within_price_bucket(self):
+        # Arrange
+        self._add_quote(self.underlying_id, "155.00")
+        self._add_quote(self.option_id, "8.50")
+        first = self.greeks_calculator.instrument_greeks_batch(
+            [self.option_id],
+            ts_event=self.clock.timestamp_ns(),
+            price_bucket_size=1.0,
+        )
+
+        # Act
+        self._add_quote(self.underlying_id, "155.10")
+        same_bucket = self.greeks_calculator.instrument_greeks_batch(
+            [self.option_id],
+            ts_event=self.clock.timestamp_ns(),
+            price_bucket_size=1.0,
+        )
+        self._add_quote(self.underlying_id, "157.00")
+        new_bucket = self.greeks_calculator.instrument_greeks_batch(
+            [self.option_id],
+            ts_event=self.clock.timestamp_ns(),
+            price_bucket_size=1.0,
+        )
+
+        # Assert
+        assert same_bucket[self.option_id].underlying_price == 155.0
+        assert same_bucket[self.option_id].vol == first[self.option_id].vol
+        assert new_bucket[self.option_id].underlying_price == 157.0
+        assert new_bucket[self.option_id].vol != first[self.option_id].vol
+
+    def test_instrument_greeks_batch_resolves_again_at_new_timestamp(self):
+        # Arrange
+        self._add_quote(self.underlying_id, "155.00")
+        self._add_quote(self.option_id, "8.50")
+        first = self.greeks_calculator.instrument_greeks_batch(
+            [self.option_id],
+            price_bucket_size=1.0,
+        )
+
+        # Act
+        self.clock.set_time(self.clock.timestamp_ns() + 86_400_000_000_000)
+        second = self.greeks_calculator.instrument_greeks_batch(
+            [self.option_id],
+            price_bucket_size=1.0,
+        )
+
+        # Assert
+        assert second[self.option_id].expiry_in_days == first[self.option_id].expiry_in_days - 1
+        assert second[self.option_id].ts_event == self.clock.timestamp_ns()
+
+    def test_instrument_greeks_batch_resolves_again_with_new_rate_at_same_timestamp(self):
+        # Arrange
+        self._add_quote(self.underlying_id, "155.00")
+        self._add_quote(self.option_id, "8.50")
+        first = self.greeks_calculator.instrument_greeks_batch(
+            [self.option_id],
+            flat_interest_rate=0.0425,
+            ts_event=self.clock.timestamp_ns(),
+        )
+
+        # Act
+        second = self.greeks_calculator.instrument_greeks_batch(
+            [self.option_id],
+            flat_interest_rate=0.06,
+            ts_event=self.clock.timestamp_ns(),
+        )
+
+        # Assert
+        expected = self.greeks_calculator.instrument_greeks(
+            self.option_id,
+            flat_interest_rate=0.06,
+            ts_event=self.clock.timestamp_ns(),
+        )
+        assert first[self.option_id].interest_rate == 0.0425
+        assert second[self.option_id].interest_rate == 0.06
+        assert second[self.option_id].vol == pytest.approx(expected.vol, abs=1e-5)
+        assert second[self.option_id].vol != first[self.option_id].vol
+
+    def test_instrument_greeks_batch_omits_instruments_without_greeks(self):
+        # Arrange
+        unknown_id = InstrumentId(Symbol("UNKNOWN"), Venue("XNAS"))
+        instrument_ids = self._add_option_chain([150])
+        self._add_quote(self.underlying_id, "155.00")
+        self._add_quote(instrument_ids[0], "8.50")
+
+        # Act
+        batch_greeks = self.greeks_calculator.instrument_greeks_batch(
+            [unknown_id, *instrument_ids],
+            ts_event=self.clock.timestamp_ns(),
+        )
+
+        # Assert
+        assert list(batch_greeks) == [instrument_ids[0]]
+
+    def test_instrument_greeks_batch_caches_greeks(self):
+        # Arrange
+        self._add_quote(self.underlying_id, "155.00")
+        self._add_quote(self.option_id, "8.50")
+
+        # Act
+        batch_greeks = self.greeks_calculator.instrument_greeks_batch(
+            [self.option_id],
+            cache_greeks=True,
+            ts_event=self.clock.timestamp_ns(),
+        )
+
+        # Assert
+        assert self.cache.greeks(self.option_id) is batch_greeks[self.option_id]
+
+    def test_instrument_greeks_batch_with_negative_price_bucket_size_raises(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.greeks_calculator.instrument_greeks_batch(
+                [self.option_id],
+                price_bucket_size=-1.0,
+            )
+
+    @pytest.mark.parametrize("spot_shock", [0.0, 5.0])
+    def test_portfolio_greeks_vectorized_matches_serial(self, spot_shock: float):
+        # Arrange
+        instrument_ids = self._add_option_chain([145, 155])
+        self._add_quote(self.underlying_id, "152.00")
+        for instrument_id, price in zip(
+            instrument_ids, ["9.80", "2.90", "4.00", "7.40"], strict=True
+        ):
+            self._add_quote(instrument_id, price)
+
+        for i, instrument_id in enumerate(instrument_ids):
+            instrument = self.cache.instrument(instrument_id)
+            order = self.order_factory.market(
+                instrument_id,
+                OrderSide.BUY if i % 2 == 0 else OrderSide.SELL,
+                Quantity.from_int(i + 1),
+            )
+            position_id = PositionId(f"P-{i}")
+            self.cache.add_order(order, position_id)
+            fill = TestEventStubs.order_filled(
+                order,
+                instrument=instrument,
+                position_id=position_id,
+                last_px=Price.from_str("5.00"),
+            )
+            self.cache.add_position(Position(instrument=instrument, fill=fill), OmsType.HEDGING)
+
+        # Act
+        serial = self.greeks_calculator.portfolio_greeks(spot_shock=spot_shock)
+        vectorized = self.greeks_calculator.portfolio_greeks(spot_shock=spot_shock, vectorized=True)
+
+        # Assert
+        assert vectorized.pnl == pytest.approx(serial.pnl, abs=1e-1)
+        assert vectorized.price == pytest.approx(serial.price, abs=1e-1)
+        assert vectorized.delta == pytest.approx(serial.delta, abs=1e-1)
+        assert vectorized.gamma == pytest.approx(serial.gamma, abs=1e-2)
+        assert vectorized.vega == pytest.approx(serial.vega, abs=1e-1)
+        assert vectorized.theta == pytest.approx(serial.theta, abs=1e-1)